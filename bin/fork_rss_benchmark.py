@@ -0,0 +1,141 @@
+"""
+Measures the memory of N workers forked from a process which cooked an
+engine, as a prefork server does.
+
+The parent cooks an engine over a generated SDL, warms it by executing the
+query once, then forks the workers. Each worker executes the query and runs
+a full collection of the garbage collector (as it would eventually do under
+load), then reports its RSS, PSS & private memory read from `/proc` (Linux
+only).
+The memory written by a worker after the fork is its private memory: the
+lower, the more the baked schema is shared between the workers.
+
+    python bin/fork_rss_benchmark.py --workers 16 --types 300 [--gc-freeze]
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+
+from tartiflette import Resolver, create_engine
+
+_QUERY = """
+query {
+  t0 {
+    id
+    f0(a: 2) { id color }
+    f1 { id f2 { id } }
+  }
+  __schema { types { name fields { name } } }
+}
+"""
+
+_MEMORY_FIELDS = {
+    "Rss": "rss",
+    "Pss": "pss",
+    "Private_Clean": "private_clean",
+    "Private_Dirty": "private_dirty",
+}
+
+
+def _build_sdl(nb_types, nb_fields):
+    parts = ["interface Node { id: ID! }", "enum Color { RED GREEN BLUE }"]
+    for i in range(nb_types):
+        fields = "\n".join(
+            '  "doc %d" f%d(a: Int = 1, b: [String!], c: In%d): [T%d!]'
+            % (j, j, i, (i + j) % nb_types)
+            for j in range(nb_fields)
+        )
+        parts.append(
+            "type T%d implements Node {\n  id: ID!\n  color: Color\n%s\n}"
+            % (i, fields)
+        )
+        parts.append('input In%d { x: Int, y: String = "a", z: [Color] }' % i)
+    parts.append("type Query { t0: T0 node(id: ID!): Node }")
+    return "\n".join(parts)
+
+
+def _read_memory():
+    memory = {}
+    with open("/proc/self/smaps_rollup") as smaps:
+        for line in smaps:
+            key, _, value = line.partition(":")
+            if key in _MEMORY_FIELDS:
+                memory[_MEMORY_FIELDS[key]] = int(value.split()[0])
+    return memory
+
+
+def _worker(engine, nb_queries, write_fd):
+    loop = asyncio.new_event_loop()
+    for _ in range(nb_queries):
+        loop.run_until_complete(engine.execute(_QUERY))
+
+    gc.collect()
+    with os.fdopen(write_fd, "w") as pipe:
+        pipe.write(json.dumps(_read_memory()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--types", type=int, default=300)
+    parser.add_argument("--fields", type=int, default=15)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--gc-freeze", action="store_true")
+    args = parser.parse_args()
+
+    @Resolver("Query.t0", schema_name="fork_rss_benchmark")
+    async def resolve_t0(*_args, **_kwargs):
+        return {"id": 0, "color": "RED"}
+
+    loop = asyncio.get_event_loop()
+    engine = loop.run_until_complete(
+        create_engine(
+            _build_sdl(args.types, args.fields),
+            schema_name="fork_rss_benchmark",
+            gc_freeze=args.gc_freeze,
+        )
+    )
+    loop.run_until_complete(engine.execute(_QUERY))
+    parent = _read_memory()
+
+    workers = []
+    for _ in range(args.workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            try:
+                _worker(engine, args.queries, write_fd)
+            finally:
+                os._exit(0)  # pylint: disable=protected-access
+        os.close(write_fd)
+        workers.append((pid, read_fd))
+
+    results = []
+    for pid, read_fd in workers:
+        with os.fdopen(read_fd) as pipe:
+            results.append(json.loads(pipe.read()))
+        os.waitpid(pid, 0)
+
+    print("parent: rss=%(rss)d kB" % parent)
+    for key in ("rss", "pss", "private_dirty"):
+        values = [result[key] for result in results]
+        print(
+            "%d workers: %s total=%d kB, mean=%d kB"
+            % (len(values), key, sum(values), sum(values) / len(values))
+        )
+    print(
+        "%d workers: memory used (parent + private memory of the workers)"
+        "=%d kB"
+        % (
+            len(results),
+            parent["rss"] + sum(result["private_dirty"] for result in results),
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
+import importlib.util
 import os
 import subprocess
 import sys
 
-from setuptools import find_packages, setup
+from setuptools import Command, find_packages, setup
 from setuptools.command.build_ext import build_ext
 from setuptools.command.build_py import build_py
 
@@ -35,6 +36,40 @@ def _build_libgraphqlparser():
     )
 
 
+_LARK_GRAMMARS = [
+    "tartiflette/sdl/grammar/graphql_sdl_grammar.lark",
+    "tartiflette/language/parsers/lark/graphql_sdl_grammar.lark",
+]
+
+
+class BuildLarkParsersCmd(Command):
+    description = "prebuild the Lark parsers of the SDL grammars"
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        # Loaded on its own since the package can't be imported yet
+        spec = importlib.util.spec_from_file_location(
+            "lark_parser", "tartiflette/utils/lark_parser.py"
+        )
+        lark_parser = importlib.util.module_from_spec(spec)
+        try:
+            spec.loader.exec_module(lark_parser)
+        except ImportError:
+            print("Lark isn't installed, the SDL parsers can't be prebuilt")
+            return
+
+        for grammar_path in _LARK_GRAMMARS:
+            print(
+                "Prebuilding %s" % lark_parser.dump_lark_parser(grammar_path)
+            )
+
+
 class BuildExtCmd(build_ext):
     def run(self):
         _build_libgraphqlparser()
@@ -44,6 +79,7 @@ class BuildExtCmd(build_ext):
 class BuildPyCmd(build_py):
     def run(self):
         _build_libgraphqlparser()
+        self.run_command("build_lark_parsers")
         build_py.run(self)
 
 
@@ -89,8 +125,13 @@ setup(
     keywords="api graphql protocol api rest relay tartiflette dailymotion",
     packages=_PACKAGES,
     install_requires=["cffi>=1.0.0,<2.0.0", "lark-parser==0.6.4", "pytz"],
+    setup_requires=["lark-parser==0.6.4"],
     tests_require=_TEST_REQUIRE,
     extras_require={"test": _TEST_REQUIRE, "benchmark": _BENCHMARK_REQUIRE},
-    cmdclass={"build_ext": BuildExtCmd, "build_py": BuildPyCmd},
+    cmdclass={
+        "build_ext": BuildExtCmd,
+        "build_py": BuildPyCmd,
+        "build_lark_parsers": BuildLarkParsersCmd,
+    },
     include_package_data=True,
 )
@@ -1,13 +1,19 @@
-from typing import Callable, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 from tartiflette.resolver import Resolver, ResolverExecutorFactory
 from tartiflette.subscription import Subscription
+from tartiflette.type_resolver import TypeResolver
 from tartiflette.sdl import build_graphql_schema_from_sdl
-from tartiflette.engine import Engine
+from tartiflette.engine import DEFAULT_QUERY_CACHE_SIZE, Engine
 from tartiflette.scalar import Scalar
 from tartiflette.directive import Directive
+from tartiflette.dataloader import DataLoader
+from tartiflette.tracing import ApolloTracer, Tracer
+from tartiflette.cost import CostAnalyzer
 from tartiflette.types.exceptions import TartifletteError
 
+__version__ = "0.11.1"
+
 
 async def create_engine(
     sdl: Union[str, List[str]],
@@ -15,6 +21,16 @@ async def create_engine(
     error_coercer: Callable[[Exception], dict] = None,
     custom_default_resolver: Optional[Callable] = None,
     modules: Optional[Union[str, List[str]]] = None,
+    query_cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
+    persisted_queries: Optional[Union[Dict[str, str], List[str]]] = None,
+    strict_persisted_queries: bool = False,
+    execution_strategy: str = "depth_first",
+    max_concurrency: Optional[int] = None,
+    tracer: Optional[Tracer] = None,
+    schema_snapshot: Optional[str] = None,
+    gc_freeze: bool = False,
+    incremental_delivery: bool = False,
+    cost_analyzer: Optional[CostAnalyzer] = None,
 ) -> Engine:
     """
     Create an engine by analyzing the SDL and connecting it with the imported Resolver, Mutation,
@@ -30,6 +46,16 @@ async def create_engine(
         error_coercer {Callable[[Exception, dict], dict]} -- An optional callable in charge of transforming a couple Exception/error into an error dict (default: {default_error_coercer})
         custom_default_resolver {Optional[Callable]} -- An optional callable that will replace the tartiflette default_resolver (Will be called like a resolver for each UNDECORATED field) (default: {None})
         modules {Optional[Union[str, List[str]]]} -- An optional list of string containing the name of the modules you want the engine to import, usually this modules contains your Resolvers, Directives, Scalar or Subscription code (default: {None})
+        query_cache_size {int} -- The maximum number of parsed & validated queries kept by the engine, 0 disables the cache (default: {1024})
+        persisted_queries {Optional[Union[Dict[str, str], List[str]]]} -- Queries parsed & validated at cooking time which could be executed through `execute_persisted`. Either a dict of queries keyed by their identifier or a list of queries, keyed by their SHA-256 (default: {None})
+        strict_persisted_queries {bool} -- Whether or not to reject every query which isn't one of the `persisted_queries` (default: {False})
+        execution_strategy {str} -- How the fields of a query are walked through: "depth_first" or "breadth_first" (default: {"depth_first"})
+        max_concurrency {Optional[int]} -- The maximum number of resolvers awaited at the same time, over all the requests executed by the engine (default: {None})
+        tracer {Optional[Tracer]} -- A Tracer whose hooks are called around the parsing, the validation, the execution and the resolution of each field of the requests (default: {None})
+        schema_snapshot {Optional[str]} -- Path of a file where the schema built from the SDL is snapshotted once baked, processes baking the same SDL load it instead of parsing & validating the SDL again (default: {None})
+        gc_freeze {bool} -- Whether or not to move every object tracked by the garbage collector (the baked schema included) to a permanent generation once the engine is cooked, so that the processes forked afterwards share them instead of copying them on write (Python 3.7+) (default: {False})
+        incremental_delivery {bool} -- Whether or not to add the `@defer` & `@stream` directives to the schema, whose fields are then delivered in subsequent payloads by `execute_incremental` (default: {False})
+        cost_analyzer {Optional[CostAnalyzer]} -- A CostAnalyzer computing the cost of the operations from their plan before their execution, which rejects the ones exceeding its maximum depth, number of fields or cost and reports the cost in the `extensions` of the response, the `@cost` directive is added to the schema along with it (default: {None})
 
     Returns:
         a Cooked Engine instance
@@ -42,6 +68,16 @@ async def create_engine(
         custom_default_resolver=custom_default_resolver,
         modules=modules,
         schema_name=schema_name,
+        query_cache_size=query_cache_size,
+        persisted_queries=persisted_queries,
+        strict_persisted_queries=strict_persisted_queries,
+        execution_strategy=execution_strategy,
+        max_concurrency=max_concurrency,
+        tracer=tracer,
+        schema_snapshot=schema_snapshot,
+        gc_freeze=gc_freeze,
+        incremental_delivery=incremental_delivery,
+        cost_analyzer=cost_analyzer,
     )
 
     return e
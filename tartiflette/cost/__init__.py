@@ -0,0 +1,3 @@
+from .analyzer import CostAnalyzer, QueryCost
+
+__all__ = ["CostAnalyzer", "QueryCost"]
@@ -0,0 +1,198 @@
+from collections import namedtuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from tartiflette.types.exceptions.tartiflette import QueryTooExpensive
+from tartiflette.utils.arguments import UNDEFINED_VALUE
+from tartiflette.utils.variables import bind_variables
+
+QueryCost = namedtuple("QueryCost", ["depth", "nodes", "cost"])
+
+_NO_COST = QueryCost(0, 0, 0)
+
+
+def _sum_costs(costs: Iterable[QueryCost]) -> QueryCost:
+    depth = nodes = cost = 0
+    for query_cost in costs:
+        depth = max(depth, query_cost.depth)
+        nodes += query_cost.nodes
+        cost += query_cost.cost
+    return QueryCost(depth, nodes, cost)
+
+
+def _max_costs(costs: Iterable[QueryCost]) -> QueryCost:
+    depth = nodes = cost = 0
+    for query_cost in costs:
+        depth = max(depth, query_cost.depth)
+        nodes = max(nodes, query_cost.nodes)
+        cost = max(cost, query_cost.cost)
+    return QueryCost(depth, nodes, cost)
+
+
+def _is_skipped(node: "NodeField", variables: Dict[str, Any]) -> bool:
+    for directive in node.execution_directives:
+        name = directive.get("name")
+        if name in ["skip", "include"]:
+            condition = bind_variables(directive["args"], variables).get("if")
+            if condition is (name == "skip"):
+                return True
+    return False
+
+
+class CostAnalyzer:
+    """
+    Computes the cost of an operation from its plan, before it's executed,
+    and rejects the operations exceeding the limits it's given.
+
+    The cost of a field is its weight plus the cost of its children, times
+    its multiplier: the value of the first of its multiplier arguments
+    (e.g `first` or `limit`) given to it, else `default_list_size` for a
+    list field, else 1. Weights & multiplier arguments are set per field
+    through the `@cost` directive or the `cost` option of `@Resolver`.
+    The children selected for different object types (through fragments
+    on an abstract type) are counted for the most expensive type only.
+    The number of fields doesn't depend on the multipliers.
+    """
+
+    def __init__(
+        self,
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        max_cost: Optional[int] = None,
+        default_weight: int = 1,
+        default_list_size: int = 1,
+        multiplier_arguments: Optional[List[str]] = None,
+        report: bool = True,
+    ) -> None:
+        # pylint: disable=too-many-arguments
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.max_cost = max_cost
+        self.default_weight = default_weight
+        self.default_list_size = default_list_size
+        self.multiplier_arguments = (
+            multiplier_arguments
+            if multiplier_arguments is not None
+            else ["first", "last", "limit"]
+        )
+        self.report = report
+
+    def _get_field_cost(
+        self, field_executor: "_ResolverExecutor"
+    ) -> Tuple[int, List[str]]:
+        weight, multipliers = field_executor.cost, None
+        for directive in field_executor.schema_field.directives or []:
+            if directive.get("name") == "cost":
+                if weight is None:
+                    weight = directive["args"].get("weight")
+                multipliers = directive["args"].get("multipliers")
+                break
+
+        return (
+            weight if weight is not None else self.default_weight,
+            multipliers
+            if multipliers is not None
+            else self.multiplier_arguments,
+        )
+
+    def _get_multiplier(
+        self,
+        node: "NodeField",
+        multipliers: List[str],
+        variables: Dict[str, Any],
+    ) -> int:
+        arguments = node.field_executor.schema_field.arguments
+        for name in multipliers:
+            if name not in arguments:
+                continue
+
+            try:
+                value = bind_variables(node.arguments[name].value, variables)
+            except KeyError:
+                value = UNDEFINED_VALUE
+            if value is UNDEFINED_VALUE:
+                value = arguments[name].default_value
+
+            if isinstance(value, int) and not isinstance(value, bool):
+                return max(value, 0)
+
+        return self.default_list_size if node.shall_produce_list else 1
+
+    def _analyze_field(
+        self, node: "NodeField", variables: Dict[str, Any]
+    ) -> QueryCost:
+        if _is_skipped(node, variables):
+            return _NO_COST
+
+        children_by_typename, children = node.get_children_by_typename()
+        children_cost = _max_costs(
+            _sum_costs(
+                self._analyze_field(child, variables)
+                for child in type_children
+            )
+            for type_children in [children, *children_by_typename.values()]
+        )
+
+        weight, multipliers = self._get_field_cost(node.field_executor)
+        multiplier = self._get_multiplier(node, multipliers, variables)
+        return QueryCost(
+            children_cost.depth + 1,
+            children_cost.nodes + 1,
+            (weight + children_cost.cost) * multiplier,
+        )
+
+    def analyze(
+        self,
+        operation: "NodeOperationDefinition",
+        variables: Optional[Dict[str, Any]],
+    ) -> QueryCost:
+        """
+        Computes the cost of an operation.
+        :param operation: the operation to analyze
+        :param variables: the coerced variables of the request
+        :return: the depth, the number of fields & the cost of the operation
+        """
+        return _sum_costs(
+            self._analyze_field(node, variables or {})
+            for node in operation.children
+        )
+
+    def check(self, query_cost: QueryCost) -> List[Exception]:
+        """
+        Returns the errors of an operation whose cost exceeds the limits.
+        :param query_cost: the cost of the operation
+        :return: a list of QueryTooExpensive errors
+        """
+        errors = []
+        for message, value, limit in [
+            (
+                "Query depth of %d exceeds the maximum depth of %d.",
+                query_cost.depth,
+                self.max_depth,
+            ),
+            (
+                "Query selects %d fields, more than the maximum of %d.",
+                query_cost.nodes,
+                self.max_nodes,
+            ),
+            (
+                "Query cost of %d exceeds the maximum cost of %d.",
+                query_cost.cost,
+                self.max_cost,
+            ),
+        ]:
+            if limit is not None and value > limit:
+                errors.append(
+                    QueryTooExpensive(
+                        message % (value, limit),
+                        extensions={"cost": dict(query_cost._asdict())},
+                    )
+                )
+        return errors
+
+    def extensions(self, query_cost: QueryCost) -> Optional[Dict[str, Any]]:
+        """
+        Returns the entries to add to the `extensions` of the response.
+        """
+        if not self.report:
+            return None
+        return {"cost": dict(query_cost._asdict())}
@@ -0,0 +1,3 @@
+from .dataloader import DataLoader, DataLoaderInfo
+
+__all__ = ["DataLoader", "DataLoaderInfo"]
@@ -0,0 +1,179 @@
+import asyncio
+
+from collections import namedtuple
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+DataLoaderInfo = namedtuple(
+    "DataLoaderInfo",
+    ["loads", "cache_hits", "dispatches", "keys", "max_batch_size"],
+)
+
+# Number of event loop iterations the dispatch of a batch can be postponed
+# while new keys keep being queued.
+_MAX_DISPATCH_DELAY = 16
+
+
+class DataLoader:
+    """
+    Coalesces the `load(key)` calls made while the executor schedules a level
+    of the query into a single call of a batch loading function, and memoizes
+    the loaded values.
+
+    A DataLoader is meant to live as long as a request, use
+    `info.execution_ctx.get_dataloader()` to get the one of the current
+    request:
+
+        async def load_users(keys):
+            users = await database.fetch_users(ids=keys)
+            return [users.get(key) for key in keys]
+
+        @Resolver("Post.author")
+        async def resolve_post_author(parent, args, ctx, info):
+            return await info.execution_ctx.get_dataloader(load_users).load(
+                parent["author_id"]
+            )
+
+    The batch loading function takes the list of the keys to load and returns
+    a list of values in the same order. Values being an exception are raised
+    to the caller of the related `load`.
+    """
+
+    def __init__(
+        self,
+        batch_load_fn: Optional[Callable[[List[Any]], Awaitable[List]]] = None,
+        max_batch_size: Optional[int] = None,
+        cache: bool = True,
+    ) -> None:
+        self._batch_load_fn = batch_load_fn
+        self._max_batch_size = max_batch_size
+        self._cache = cache
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self._queue: List[Any] = []
+        self._queue_futures: List[asyncio.Future] = []
+        self._dispatch_scheduled = False
+        self._loads = 0
+        self._cache_hits = 0
+        self._dispatches = 0
+        self._keys = 0
+        self._largest_batch = 0
+
+    async def batch_load(self, keys: List[Any]) -> List[Any]:
+        if self._batch_load_fn is not None:
+            return await self._batch_load_fn(keys)
+        raise NotImplementedError(
+            "A DataLoader needs either a `batch_load_fn` or to implement "
+            "the `batch_load` method."
+        )
+
+    def load(self, key: Hashable) -> asyncio.Future:
+        """
+        Queues a key to be loaded by the next batch.
+        :param key: the key to load
+        :return: a future resolved with the loaded value
+        """
+        self._loads += 1
+
+        if self._cache:
+            try:
+                future = self._futures[key]
+            except KeyError:
+                pass
+            else:
+                self._cache_hits += 1
+                return future
+
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        if self._cache:
+            self._futures[key] = future
+
+        self._queue.append(key)
+        self._queue_futures.append(future)
+
+        if self._max_batch_size and len(self._queue) >= self._max_batch_size:
+            self._dispatch()
+        elif not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            loop.call_soon(self._wait_for_quiescence, len(self._queue), 0)
+
+        return future
+
+    def load_many(self, keys: List[Hashable]) -> Awaitable[List[Any]]:
+        return asyncio.gather(*[self.load(key) for key in keys])
+
+    def prime(self, key: Hashable, value: Any) -> None:
+        if not self._cache or key in self._futures:
+            return
+
+        future = asyncio.get_event_loop().create_future()
+        future.set_result(value)
+        self._futures[key] = future
+
+    def clear(self, key: Hashable) -> None:
+        self._futures.pop(key, None)
+
+    def clear_all(self) -> None:
+        self._futures.clear()
+
+    def info(self) -> DataLoaderInfo:
+        return DataLoaderInfo(
+            self._loads,
+            self._cache_hits,
+            self._dispatches,
+            self._keys,
+            self._largest_batch,
+        )
+
+    def _wait_for_quiescence(self, queue_size: int, delay: int) -> None:
+        # Sibling fields are scheduled as distinct tasks, so the keys of a
+        # level are queued over several loop iterations. The batch is
+        # dispatched once an iteration went by without any new key.
+        if not self._dispatch_scheduled:
+            return
+
+        if len(self._queue) != queue_size and delay < _MAX_DISPATCH_DELAY:
+            asyncio.get_event_loop().call_soon(
+                self._wait_for_quiescence, len(self._queue), delay + 1
+            )
+            return
+
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        keys, futures = self._queue, self._queue_futures
+        self._queue, self._queue_futures = [], []
+        self._dispatch_scheduled = False
+
+        if not keys:
+            return
+
+        self._dispatches += 1
+        self._keys += len(keys)
+        self._largest_batch = max(self._largest_batch, len(keys))
+
+        asyncio.ensure_future(self._load_batch(keys, futures))
+
+    async def _load_batch(
+        self, keys: List[Any], futures: List[asyncio.Future]
+    ) -> None:
+        try:
+            values = await self.batch_load(keys)
+            if len(values) != len(keys):
+                raise ValueError(
+                    "The batch loading function of < %s > returned %d values "
+                    "for %d keys." % (repr(self), len(values), len(keys))
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            for key, future in zip(keys, futures):
+                self._futures.pop(key, None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for value, future in zip(values, futures):
+            if future.done():
+                continue
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
@@ -0,0 +1,21 @@
+from tartiflette import Directive
+
+
+class Cost:
+    """
+    Sets the weight & the multiplier arguments of a field for the
+    `CostAnalyzer` of the engine, which reads them from the schema.
+    """
+
+
+def bake(schema_name, _config):
+    sdl = """
+    directive @cost(
+        weight: Int
+        multipliers: [String!]
+    ) on FIELD_DEFINITION
+    """
+
+    Directive(name="cost", schema_name=schema_name)(Cost())
+
+    return sdl
@@ -0,0 +1,24 @@
+from tartiflette import Directive
+
+
+class Defer:
+    """
+    The fields of a fragment marked with `@defer` are released by the
+    executor in a subsequent payload of `Engine.execute_incremental`, they're
+    executed along with the other ones otherwise.
+    """
+
+    incremental = "defer"
+
+
+def bake(schema_name, _config):
+    sdl = """
+    directive @defer(
+        label: String
+        if: Boolean = true
+    ) on FRAGMENT_SPREAD | INLINE_FRAGMENT
+    """
+
+    Directive(name="defer", schema_name=schema_name)(Defer())
+
+    return sdl
@@ -0,0 +1,26 @@
+from tartiflette import Directive
+
+
+class Stream:
+    """
+    The items of a list field marked with `@stream` past `initialCount` are
+    released by the executor one by one in the subsequent payloads of
+    `Engine.execute_incremental`, they're executed along with the first ones
+    otherwise.
+    """
+
+    incremental = "stream"
+
+
+def bake(schema_name, _config):
+    sdl = """
+    directive @stream(
+        label: String
+        initialCount: Int = 0
+        if: Boolean = true
+    ) on FIELD
+    """
+
+    Directive(name="stream", schema_name=schema_name)(Stream())
+
+    return sdl
@@ -1,25 +1,60 @@
+import gc
+import hashlib
+import json
 import logging
+import sys
 
 from importlib import import_module, invalidate_caches
+from importlib import reload as reload_module
 from inspect import isawaitable
-from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Union
-
-from tartiflette.executors.basic import (
-    execute as basic_execute,
-    subscribe as basic_subscribe,
+from time import perf_counter
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
 )
+
+from tartiflette.cost import CostAnalyzer, QueryCost
+from tartiflette.executors import basic, breadth_first
+from tartiflette.executors.basic import get_operation
+from tartiflette.executors.scheduler import Scheduler, SchedulerInfo
 from tartiflette.parser import TartifletteRequestParser
 from tartiflette.resolver.factory import (
     default_error_coercer,
     error_coercer_factory,
 )
 from tartiflette.schema.bakery import SchemaBakery
+from tartiflette.schema.diff import (
+    SchemaChanges,
+    diff_schemas,
+    get_implementations,
+    get_operations_dependencies,
+)
+from tartiflette.schema.introspection import is_static_introspection
 from tartiflette.schema.registry import SchemaRegistry
+from tartiflette.schema.snapshot import SchemaSnapshot
+from tartiflette.tracing import Tracer
 from tartiflette.types.exceptions.tartiflette import (
     GraphQLError,
     ImproperlyConfigured,
+    InvalidPersistedQuery,
+    UnknownPersistedQuery,
 )
+from tartiflette.utils.cache import CacheInfo, LRUCache
 from tartiflette.utils.errors import to_graphql_error
+from tartiflette.utils.json_stream import (
+    DEFAULT_CHUNK_SIZE,
+    ChunkBuffer,
+    encode_key,
+    iter_encode,
+    iter_encode_members,
+)
+from tartiflette.utils.variables import coerce_variables
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +74,31 @@ _BUILTINS_MODULES = [
     "tartiflette.schema.builtins.introspection",
 ]
 
+# Only added to the schemas of the engines delivering responses
+# incrementally, so that they don't clash with directives of the same name
+# defined by the SDL of the other ones
+_INCREMENTAL_DELIVERY_MODULES = [
+    "tartiflette.directive.builtins.defer",
+    "tartiflette.directive.builtins.stream",
+]
+
+# Only added to the schemas of the engines analyzing the cost of the queries
+_COST_ANALYSIS_MODULES = ["tartiflette.directive.builtins.cost"]
+
+DEFAULT_QUERY_CACHE_SIZE = 1024
+
+_EXECUTION_STRATEGIES = {"depth_first": basic, "breadth_first": breadth_first}
+
+
+def persisted_query_id(query: str) -> str:
+    """
+    Computes the identifier under which a query given as a list to the
+    `persisted_queries` parameter is registered: the hex SHA-256 of the query.
+    :param query: the GraphQL request / query as UTF8-encoded string
+    :return: the hex SHA-256 of the query
+    """
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
 
 async def _bake_module(module, schema_name, config=None):
     msdl = module.bake(schema_name, config)
@@ -48,8 +108,10 @@ async def _bake_module(module, schema_name, config=None):
     return msdl
 
 
-async def _import_builtins(imported_modules, sdl, schema_name):
-    for module in _BUILTINS_MODULES:
+async def _import_builtins(
+    imported_modules, sdl, schema_name, builtins_modules=None
+):
+    for module in builtins_modules or _BUILTINS_MODULES:
         try:
             module = import_module(module)
             sdl = "{sdl}\n{msdl}".format(
@@ -62,7 +124,9 @@ async def _import_builtins(imported_modules, sdl, schema_name):
     return imported_modules, sdl
 
 
-async def _import_modules(modules, schema_name):
+async def _import_modules(
+    modules, schema_name, reload=False, builtins_modules=None
+):
     imported_modules = []
     sdl = ""
 
@@ -73,7 +137,10 @@ async def _import_modules(modules, schema_name):
             module = {"name": module, "config": {}}
 
         config = module["config"]
-        module = import_module(module["name"])
+        if reload and module["name"] in sys.modules:
+            module = reload_module(sys.modules[module["name"]])
+        else:
+            module = import_module(module["name"])
 
         if callable(getattr(module, "bake", None)):
             sdl = "{sdl}\n{msdl}".format(
@@ -83,7 +150,20 @@ async def _import_modules(modules, schema_name):
 
         imported_modules.append(module)
 
-    return await _import_builtins(imported_modules, sdl, schema_name)
+    return await _import_builtins(
+        imported_modules, sdl, schema_name, builtins_modules
+    )
+
+
+def _freeze_gc() -> None:
+    try:
+        freeze = gc.freeze
+    except AttributeError:
+        logger.warning("< gc_freeze > requires Python 3.7 or later.")
+        return
+
+    gc.collect()
+    freeze()
 
 
 class Engine:
@@ -100,8 +180,21 @@ class Engine:
         """
         self._error_coercer = None
         self._modules = None
+        self._module_definitions = []
+        self._schema_name = None
+        self._custom_default_resolver = None
         self._parser = TartifletteRequestParser()
         self._schema = None
+        self._query_cache = LRUCache(DEFAULT_QUERY_CACHE_SIZE)
+        self._introspection_results = LRUCache(DEFAULT_QUERY_CACHE_SIZE)
+        self._persisted_queries = {}
+        self._persisted_operations = {}
+        self._strict_persisted_queries = False
+        self._executor = basic
+        self._scheduler = None
+        self._tracer = None
+        self._cost_analyzer = None
+        self._builtins_modules = _BUILTINS_MODULES
 
         if (
             sdl
@@ -141,6 +234,16 @@ class Engine:
         custom_default_resolver: Optional[Callable] = None,
         modules: Optional[Union[str, List[str]]] = None,
         schema_name: str = "default",
+        query_cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
+        persisted_queries: Optional[Union[Dict[str, str], List[str]]] = None,
+        strict_persisted_queries: bool = False,
+        execution_strategy: str = "depth_first",
+        max_concurrency: Optional[int] = None,
+        tracer: Optional[Tracer] = None,
+        schema_snapshot: Optional[str] = None,
+        gc_freeze: bool = False,
+        incremental_delivery: bool = False,
+        cost_analyzer: Optional[CostAnalyzer] = None,
     ):
         """
         Cook the tartiflette, basicly prepare the engine by binding it to given modules using the schema_name as a key.
@@ -154,8 +257,26 @@ class Engine:
             error_coercer {Callable[[Exception, dict], dict]} -- An optional callable in charge of transforming a couple Exception/error into an error dict (default: {default_error_coercer})
             custom_default_resolver {Optional[Callable]} -- An optional callable that will replace the tartiflette default_resolver (Will be called like a resolver for each UNDECORATED field) (default: {None})
             modules {Optional[Union[str, List[str]]]} -- An optional list of string containing the name of the modules you want the engine to import, usually this modules contains your Resolvers, Directives, Scalar or Subscription code (default: {None})
+            query_cache_size {int} -- The maximum number of parsed & validated queries kept by the engine, 0 disables the cache (default: {1024})
+            persisted_queries {Optional[Union[Dict[str, str], List[str]]]} -- Queries parsed & validated at cooking time which could be executed through `execute_persisted`. Either a dict of queries keyed by their identifier or a list of queries, keyed by their SHA-256 (default: {None})
+            strict_persisted_queries {bool} -- Whether or not to reject every query which isn't one of the `persisted_queries` (default: {False})
+            execution_strategy {str} -- How the fields of a query are walked through: "depth_first" or "breadth_first" (default: {"depth_first"})
+            max_concurrency {Optional[int]} -- The maximum number of resolvers awaited at the same time, over all the requests executed by the engine (default: {None})
+            tracer {Optional[Tracer]} -- A Tracer whose hooks are called around the parsing, the validation, the execution and the resolution of each field of the requests (default: {None})
+            schema_snapshot {Optional[str]} -- Path of a file where the schema built from the SDL is snapshotted once baked, processes baking the same SDL load it instead of parsing & validating the SDL again (default: {None})
+            gc_freeze {bool} -- Whether or not to move every object tracked by the garbage collector (the baked schema included) to a permanent generation once the engine is cooked, so that the processes forked afterwards share them instead of copying them on write (Python 3.7+) (default: {False})
+            incremental_delivery {bool} -- Whether or not to add the `@defer` & `@stream` directives to the schema, whose fields are then delivered in subsequent payloads by `execute_incremental` (default: {False})
+            cost_analyzer {Optional[CostAnalyzer]} -- A CostAnalyzer computing the cost of the operations from their plan before their execution, which rejects the ones exceeding its maximum depth, number of fields or cost and reports the cost in the `extensions` of the response, the `@cost` directive is added to the schema along with it (default: {None})
         """
 
+        try:
+            self._executor = _EXECUTION_STRATEGIES[execution_strategy]
+        except KeyError:
+            raise ImproperlyConfigured(
+                "Unknown execution strategy < %s >, should be one of: %s."
+                % (execution_strategy, ", ".join(_EXECUTION_STRATEGIES))
+            )
+
         if not modules:
             modules = []
 
@@ -165,11 +286,201 @@ class Engine:
         self._error_coercer = error_coercer_factory(
             error_coercer or default_error_coercer
         )
+        self._builtins_modules = (
+            _BUILTINS_MODULES
+            + (_INCREMENTAL_DELIVERY_MODULES if incremental_delivery else [])
+            + (_COST_ANALYSIS_MODULES if cost_analyzer else [])
+        )
         self._modules, modules_sdl = await _import_modules(
-            modules, schema_name
+            modules, schema_name, builtins_modules=self._builtins_modules
         )
+        self._module_definitions = modules
+        self._schema_name = schema_name
+        self._custom_default_resolver = custom_default_resolver
         SchemaRegistry.register_sdl(schema_name, sdl, modules_sdl)
-        self._schema = SchemaBakery.bake(schema_name, custom_default_resolver)
+        self._schema = SchemaBakery.bake(
+            schema_name,
+            custom_default_resolver,
+            snapshot=SchemaSnapshot(schema_snapshot)
+            if schema_snapshot
+            else None,
+        )
+        self._query_cache = LRUCache(query_cache_size)
+        self._introspection_results = LRUCache(query_cache_size)
+        self._register_persisted_queries(persisted_queries)
+        self._strict_persisted_queries = strict_persisted_queries
+        self._scheduler = (
+            Scheduler(max_concurrency) if max_concurrency else None
+        )
+        self._tracer = tracer
+        self._cost_analyzer = cost_analyzer
+
+        if gc_freeze:
+            _freeze_gc()
+
+    def _register_persisted_queries(
+        self, persisted_queries: Optional[Union[Dict[str, str], List[str]]]
+    ) -> None:
+        if not persisted_queries:
+            return
+
+        if not isinstance(persisted_queries, dict):
+            persisted_queries = {
+                persisted_query_id(query): query for query in persisted_queries
+            }
+
+        self._persisted_operations.update(
+            self._build_persisted_operations(persisted_queries, self._schema)
+        )
+        self._persisted_queries.update(persisted_queries)
+
+    def _build_persisted_operations(
+        self, persisted_queries: Dict[str, str], schema: "GraphQLSchema"
+    ) -> Dict[str, Dict[Optional[str], "NodeOperationDefinition"]]:
+        persisted_operations = {}
+        for query_id, query in persisted_queries.items():
+            operations, errors = self._build_operations(query, schema=schema)
+            if errors:
+                raise InvalidPersistedQuery(
+                    "Persisted query < %s > is invalid: %s"
+                    % (query_id, ", ".join(str(error) for error in errors))
+                )
+
+            persisted_operations[query] = operations
+        return persisted_operations
+
+    async def reload(self, sdl: Union[str, List[str]]) -> SchemaChanges:
+        """
+        Replaces the schema of a cooked engine by the one built from a new
+        SDL. The modules given at cooking time are reloaded, then the
+        directives, resolvers, scalars & subscriptions registered for the
+        schema are bound to the new schema, which is baked aside of the
+        current one: requests being executed finish with the current schema.
+
+        Once the new schema is baked (and the persisted queries are validated
+        against it), it replaces the current one. The cached queries depending
+        on a type which has been added, removed or changed (in the SDL or in
+        its implementation) are evicted from the query cache, the other ones
+        are planned again against the new schema, since their plans point at
+        the fields of the current one. If anything fails, the engine keeps
+        the current schema.
+        :param sdl: the new SDL
+        :return: the names of the added, removed & changed types & directives
+        """
+        schema_info = SchemaRegistry.find_schema_info(self._schema_name)
+        backup = {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in schema_info.items()
+        }
+        old_implementations = get_implementations(schema_info)
+
+        try:
+            SchemaRegistry.unregister_modules(
+                self._schema_name,
+                [
+                    module["name"] if isinstance(module, dict) else module
+                    for module in self._module_definitions
+                ]
+                + self._builtins_modules,
+            )
+            del schema_info["inst"]
+
+            modules, modules_sdl = await _import_modules(
+                self._module_definitions,
+                self._schema_name,
+                reload=True,
+                builtins_modules=self._builtins_modules,
+            )
+            SchemaRegistry.register_sdl(self._schema_name, sdl, modules_sdl)
+            schema = SchemaBakery.bake(
+                self._schema_name, self._custom_default_resolver
+            )
+            persisted_operations = self._build_persisted_operations(
+                self._persisted_queries, schema
+            )
+        except Exception:
+            schema_info.clear()
+            schema_info.update(backup)
+            raise
+
+        changes = diff_schemas(
+            self._schema,
+            schema,
+            old_implementations,
+            get_implementations(schema_info),
+        )
+
+        cached_operations = self._replan_cached_queries(changes, schema)
+
+        for query, operations in cached_operations:
+            if operations is None:
+                self._query_cache.discard(query)
+            else:
+                self._query_cache.set(query, operations)
+        self._introspection_results.clear()
+        self._schema = schema
+        self._modules = modules
+        self._persisted_operations = persisted_operations
+        return changes
+
+    def _replan_cached_queries(
+        self, changes: SchemaChanges, schema: "GraphQLSchema"
+    ) -> List[
+        Tuple[str, Optional[Dict[Optional[str], "NodeOperationDefinition"]]]
+    ]:
+        """
+        Plans the cached queries against a new schema, in the order of the
+        cache, unless they depend on a type or a directive touched by the
+        changes.
+        :param changes: the changes between the current schema & the new one
+        :param schema: the new schema
+        :return: the cached queries along with their new operations, None for
+        the evicted ones
+        """
+        touched_types = (
+            changes.added_types | changes.removed_types | changes.changed_types
+        )
+
+        cached_operations = []
+        for query, operations in self._query_cache.items():
+            dependencies = (
+                get_operations_dependencies(self._schema, operations)
+                if not changes.changed_directives
+                else None
+            )
+            if dependencies is None or not dependencies.isdisjoint(
+                touched_types
+            ):
+                cached_operations.append((query, None))
+                continue
+
+            operations, errors = self._build_operations(query, schema=schema)
+            cached_operations.append((query, None if errors else operations))
+        return cached_operations
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the statistics of the parsed query cache.
+        :return: a CacheInfo(hits, misses, evictions, maxsize, currsize)
+        """
+        return self._query_cache.info()
+
+    def scheduler_info(self) -> Optional[SchedulerInfo]:
+        """
+        Returns the statistics of the scheduler bounding the number of
+        resolvers in flight, if a `max_concurrency` was given.
+        :return: a SchedulerInfo or None
+        """
+        if self._scheduler is None:
+            return None
+        return self._scheduler.info()
+
+    def _get_scheduler(
+        self, max_concurrency: Optional[int]
+    ) -> Optional[Scheduler]:
+        if not max_concurrency:
+            return self._scheduler
+        return Scheduler(max_concurrency, parent=self._scheduler)
 
     async def execute(
         self,
@@ -178,6 +489,7 @@ class Engine:
         context: Optional[Dict[str, Any]] = None,
         variables: Optional[Dict[str, Any]] = None,
         initial_value: Optional[Any] = None,
+        max_concurrency: Optional[int] = None,
     ) -> dict:
         """
         Parse and execute a GraphQL request (as string).
@@ -186,21 +498,404 @@ class Engine:
         :param context: a dict containing anything you need
         :param variables: the variables used in the GraphQL request
         :param initial_value: an initial value corresponding to the root type being executed
+        :param max_concurrency: the maximum number of resolvers of this request awaited at the same time
         :return: a GraphQL response (as dict)
         """
-        operations, errors = self._parse_query_to_operations(query, variables)
+        trace = (
+            self._tracer.create_trace(query, operation_name, context)
+            if self._tracer is not None
+            else None
+        )
+
+        if trace is None:
+            return await self._execute(
+                query,
+                operation_name,
+                context,
+                variables,
+                initial_value,
+                max_concurrency,
+            )
+
+        trace.start()
+        try:
+            result = await self._execute(
+                query,
+                operation_name,
+                context,
+                variables,
+                initial_value,
+                max_concurrency,
+                trace=trace,
+            )
+        finally:
+            trace.end()
+
+        extensions = trace.extensions()
+        if extensions:
+            result.setdefault("extensions", {}).update(extensions)
+        return result
+
+    async def _execute(
+        self,
+        query: str,
+        operation_name: Optional[str],
+        context: Optional[Dict[str, Any]],
+        variables: Optional[Dict[str, Any]],
+        initial_value: Optional[Any],
+        max_concurrency: Optional[int],
+        trace: Optional["Trace"] = None,
+    ) -> dict:
+        # pylint: disable=too-many-arguments
+        is_cacheable = trace is None and not variables
+        if is_cacheable:
+            cached = self._introspection_results.get((query, operation_name))
+            if cached is not None:
+                # Only the root of the result is copied, its data is shared
+                # by the executions of the query & mustn't be mutated
+                return dict(cached[0])
+
+        operations, errors = self._parse_query_to_operations(query, trace)
 
         if errors:
             return errors
 
-        return await basic_execute(
+        query_cost, errors = self._analyze_cost(
+            operations, operation_name, variables
+        )
+
+        if errors:
+            return errors
+
+        if trace is not None:
+            start_time = perf_counter()
+
+        result = await self._executor.execute(
             operations,
             operation_name,
             request_ctx=context,
             initial_value=initial_value,
             error_coercer=self._error_coercer,
+            variables=variables,
+            scheduler=self._get_scheduler(max_concurrency),
+            trace=trace,
+        )
+
+        extensions = self._get_cost_extensions(query_cost)
+        if extensions:
+            result.setdefault("extensions", {}).update(extensions)
+
+        if trace is not None:
+            trace.on_execution(start_time, perf_counter())
+        elif is_cacheable:
+            self._cache_introspection_result(
+                query, operation_name, operations, result
+            )
+        return result
+
+    def _analyze_cost(
+        self,
+        operations: Dict[Optional[str], "NodeOperationDefinition"],
+        operation_name: Optional[str],
+        variables: Optional[Dict[str, Any]],
+    ) -> Tuple[Optional[QueryCost], Optional[dict]]:
+        """
+        Computes the cost of the executed operation, with the cost analyzer
+        of the engine if it has one, before the operation is executed.
+        :param operations: the operations built from the request
+        :param operation_name: the name of the executed operation
+        :param variables: the variables of the request
+        :return: the cost of the operation and the response rejecting it if
+        it exceeds the limits of the cost analyzer
+        """
+        if self._cost_analyzer is None:
+            return None, None
+
+        operation, errors = get_operation(operations, operation_name)
+        if not errors:
+            variables, errors = coerce_variables(operation, variables)
+
+        if errors:
+            # Reported by the executor
+            return None, None
+
+        query_cost = self._cost_analyzer.analyze(operation, variables)
+        errors = self._cost_analyzer.check(query_cost)
+
+        if errors:
+            return (
+                query_cost,
+                {
+                    "data": None,
+                    "errors": [self._error_coercer(err) for err in errors],
+                },
+            )
+        return query_cost, None
+
+    def _get_cost_extensions(
+        self, query_cost: Optional[QueryCost]
+    ) -> Optional[Dict[str, Any]]:
+        if query_cost is None:
+            return None
+        return self._cost_analyzer.extensions(query_cost)
+
+    def _is_static_introspection(
+        self,
+        operations: Dict[Optional[str], "NodeOperationDefinition"],
+        operation_name: Optional[str],
+    ) -> bool:
+        operation, errors = get_operation(operations, operation_name)
+        return (
+            not errors
+            # The schema may have been reloaded since the operations were built
+            and operation.children[0].schema is self._schema
+            and is_static_introspection(self._schema, operation)
+        )
+
+    def _cache_introspection_result(
+        self,
+        query: str,
+        operation_name: Optional[str],
+        operations: Dict[Optional[str], "NodeOperationDefinition"],
+        result: dict,
+    ) -> None:
+        """
+        Caches the result of an operation, along with its JSON encoding, if it
+        only introspects the schema: the baked schema being immutable, the
+        next executions of the operation are replaced by a lookup.
+        :param query: the GraphQL request
+        :param operation_name: the name of the executed operation
+        :param operations: the operations built from the request
+        :param result: the result of the operation
+        """
+        if "errors" not in result and self._is_static_introspection(
+            operations, operation_name
+        ):
+            encoded = "".join(iter_encode(result))
+            # Decoded back so that the cached result doesn't share anything
+            # with the one returned to the caller
+            self._introspection_results.set(
+                (query, operation_name), (json.loads(encoded), encoded)
+            )
+
+    async def execute_persisted(
+        self,
+        query_id: str,
+        operation_name: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> dict:
+        """
+        Execute a GraphQL request registered through the `persisted_queries`
+        parameter at cooking time.
+        :param query_id: the identifier of the persisted query
+        :param operation_name: the operation name to execute
+        :param context: a dict containing anything you need
+        :param variables: the variables used in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type being executed
+        :param max_concurrency: the maximum number of resolvers of this request awaited at the same time
+        :return: a GraphQL response (as dict)
+        """
+        try:
+            query = self._persisted_queries[query_id]
+        except KeyError:
+            return {
+                "data": None,
+                "errors": [
+                    self._error_coercer(
+                        UnknownPersistedQuery(
+                            "Unknown persisted query < %s >." % query_id
+                        )
+                    )
+                ],
+            }
+
+        return await self.execute(
+            query,
+            operation_name=operation_name,
+            context=context,
+            variables=variables,
+            initial_value=initial_value,
+            max_concurrency=max_concurrency,
         )
 
+    async def execute_stream(
+        self,
+        query: str,
+        operation_name: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        max_concurrency: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterable[bytes]:
+        """
+        Parse and execute a GraphQL request (as string), the GraphQL response
+        is yielded encoded in JSON as the root fields are completed.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param operation_name: the operation name to execute
+        :param context: a dict containing anything you need
+        :param variables: the variables used in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type being executed
+        :param max_concurrency: the maximum number of resolvers of this request awaited at the same time
+        :param chunk_size: the minimum size of the yielded chunks (except the last one)
+        :return: the chunks of the GraphQL response (as UTF-8 encoded JSON)
+        """
+        buffer = ChunkBuffer(chunk_size)
+        async for piece in self._execute_stream(  # pylint: disable=not-an-iterable
+            query,
+            operation_name,
+            context,
+            variables,
+            initial_value,
+            max_concurrency,
+        ):
+            chunk = buffer.write(piece)
+            if chunk is not None:
+                yield chunk
+
+        chunk = buffer.flush()
+        if chunk is not None:
+            yield chunk
+
+    async def _execute_stream(
+        self,
+        query: str,
+        operation_name: Optional[str],
+        context: Optional[Dict[str, Any]],
+        variables: Optional[Dict[str, Any]],
+        initial_value: Optional[Any],
+        max_concurrency: Optional[int],
+    ) -> AsyncIterable[str]:
+        # pylint: disable=too-many-arguments
+        trace = (
+            self._tracer.create_trace(query, operation_name, context)
+            if self._tracer is not None
+            else None
+        )
+
+        if trace is not None:
+            trace.start()
+        elif not variables:
+            cached = self._introspection_results.get((query, operation_name))
+            if cached is not None:
+                yield cached[1]
+                return
+
+        query_cost = None
+        try:
+            operations, errors = self._parse_query_to_operations(query, trace)
+
+            if not errors:
+                query_cost, errors = self._analyze_cost(
+                    operations, operation_name, variables
+                )
+
+            if errors:
+                yield "{"
+                for piece in iter_encode_members(errors):
+                    yield piece
+            elif (
+                trace is None
+                and not variables
+                and self._is_static_introspection(operations, operation_name)
+            ):
+                # Executed as a whole so that its result is cached, along
+                # with its extensions
+                query_cost = None
+                result = await self._execute(
+                    query,
+                    operation_name,
+                    context,
+                    variables,
+                    initial_value,
+                    max_concurrency,
+                )
+                yield "{"
+                for piece in iter_encode_members(result):
+                    yield piece
+            else:
+                if trace is not None:
+                    start_time = perf_counter()
+
+                yield "{"
+                async for piece in self._executor.execute_stream(  # pylint: disable=not-an-iterable
+                    operations,
+                    operation_name,
+                    request_ctx=context,
+                    initial_value=initial_value,
+                    error_coercer=self._error_coercer,
+                    variables=variables,
+                    scheduler=self._get_scheduler(max_concurrency),
+                    trace=trace,
+                ):
+                    yield piece
+
+                if trace is not None:
+                    trace.on_execution(start_time, perf_counter())
+        finally:
+            if trace is not None:
+                trace.end()
+
+        extensions = dict(self._get_cost_extensions(query_cost) or {})
+        if trace is not None:
+            extensions.update(trace.extensions() or {})
+        if extensions:
+            yield "," + encode_key("extensions")
+            for piece in iter_encode(extensions):
+                yield piece
+        yield "}"
+
+    async def execute_incremental(
+        self,
+        query: str,
+        operation_name: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterable[Dict[str, Any]]:
+        """
+        Parse and execute a GraphQL request (as string), the fragments marked
+        with `@defer` and the items of the lists marked with `@stream` are
+        delivered in subsequent payloads.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param operation_name: the operation name to execute
+        :param context: a dict containing anything you need
+        :param variables: the variables used in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type being executed
+        :param max_concurrency: the maximum number of resolvers of this request awaited at the same time
+        :return: the initial GraphQL response (as dict) followed by the subsequent payloads, until one of them has `hasNext` set to False
+        """
+        operations, errors = self._parse_query_to_operations(query)
+
+        query_cost = None
+        if not errors:
+            query_cost, errors = self._analyze_cost(
+                operations, operation_name, variables
+            )
+
+        if errors:
+            yield {**errors, "hasNext": False}
+        else:
+            extensions = self._get_cost_extensions(query_cost)
+            async for payload in self._executor.execute_incremental(  # pylint: disable=not-an-iterable
+                operations,
+                operation_name,
+                request_ctx=context,
+                initial_value=initial_value,
+                error_coercer=self._error_coercer,
+                variables=variables,
+                scheduler=self._get_scheduler(max_concurrency),
+            ):
+                if extensions:
+                    # Reported in the initial payload
+                    payload.setdefault("extensions", {}).update(extensions)
+                    extensions = None
+                yield payload
+
     async def subscribe(
         self,
         query: str,
@@ -208,6 +903,7 @@ class Engine:
         context: Optional[Dict[str, Any]] = None,
         variables: Optional[Dict[str, Any]] = None,
         initial_value: Optional[Any] = None,
+        max_concurrency: Optional[int] = None,
     ) -> AsyncIterable[Dict[str, Any]]:
         """
         Parse and execute a GraphQL request (as string).
@@ -216,35 +912,72 @@ class Engine:
         :param context: a dict containing anything you need
         :param variables: the variables used in the GraphQL request
         :param initial_value: an initial value corresponding to the root type being executed
+        :param max_concurrency: the maximum number of resolvers of this request awaited at the same time
         :return: a GraphQL response (as dict)
         """
-        operations, errors = self._parse_query_to_operations(query, variables)
+        operations, errors = self._parse_query_to_operations(query)
+
+        if not errors:
+            _, errors = self._analyze_cost(
+                operations, operation_name, variables
+            )
 
         if errors:
             yield errors
         else:
-            async for result in basic_subscribe(  # pylint: disable=not-an-iterable
+            async for result in self._executor.subscribe(  # pylint: disable=not-an-iterable
                 operations,
                 operation_name,
                 request_ctx=context,
                 initial_value=initial_value,
                 error_coercer=self._error_coercer,
+                variables=variables,
+                scheduler=self._get_scheduler(max_concurrency),
             ):
                 yield result
 
-    def _parse_query_to_operations(self, query, variables):
+    def _build_operations(self, query, trace=None, schema=None):
         try:
-            operations, errors = self._parser.parse_and_tartify(
-                self._schema,
-                query,
-                variables=dict(variables) if variables else variables,
+            return self._parser.parse_and_tartify(
+                schema or self._schema, query, trace=trace
             )
         except GraphQLError as e:
-            errors = [e]
+            return None, [e]
         except Exception as e:  # pylint: disable=broad-except
-            errors = [
-                to_graphql_error(e, message="Server encountered an error.")
-            ]
+            return (
+                None,
+                [to_graphql_error(e, message="Server encountered an error.")],
+            )
+
+    def _parse_query_to_operations(self, query, trace=None):
+        try:
+            return self._persisted_operations[query], None
+        except KeyError:
+            pass
+
+        if self._strict_persisted_queries:
+            return (
+                None,
+                {
+                    "data": None,
+                    "errors": [
+                        self._error_coercer(
+                            UnknownPersistedQuery(
+                                "Only persisted queries are allowed."
+                            )
+                        )
+                    ],
+                },
+            )
+
+        # The operations built by the visitor don't depend on the variables
+        # nor on the executed operation, thus they can be shared between
+        # every requests using the same query.
+        operations = self._query_cache.get(query)
+        if operations is not None:
+            return operations, None
+
+        operations, errors = self._build_operations(query, trace)
 
         if errors:
             return (
@@ -254,4 +987,6 @@ class Engine:
                     "errors": [self._error_coercer(err) for err in errors],
                 },
             )
+
+        self._query_cache.set(query, operations)
         return operations, None
@@ -2,11 +2,20 @@ import asyncio
 
 from typing import Any, AsyncIterable, Callable, Dict, List, Optional
 
+from tartiflette.executors.incremental import IncrementalDelivery
+from tartiflette.executors.scheduler import Scheduler
+from tartiflette.executors.stream import ResponseStream
 from tartiflette.executors.types import ExecutionContext
 from tartiflette.types.exceptions.tartiflette import (
     UnknownAnonymousdOperation,
     UnknownNamedOperation,
 )
+from tartiflette.utils.json_stream import (
+    encode_key,
+    iter_encode,
+    iter_encode_members,
+)
+from tartiflette.utils.variables import coerce_variables
 
 
 async def _execute(
@@ -15,31 +24,33 @@ async def _execute(
     request_ctx: Optional[Dict[str, Any]],
     initial_value: Optional[Any],
     allow_parallelization: bool,
-) -> None:
+) -> List["FieldResult"]:
     if not allow_parallelization:
+        field_results = []
         for resolver in root_resolvers:
-            await resolver(
-                execution_ctx, request_ctx, parent_result=initial_value
-            )
-    else:
-        await asyncio.gather(
-            *[
-                resolver(
+            field_results.append(
+                await resolver(
                     execution_ctx, request_ctx, parent_result=initial_value
                 )
-                for resolver in root_resolvers
-            ],
-            return_exceptions=False,
-        )
+            )
+        return field_results
 
+    return await asyncio.gather(
+        *[
+            resolver(execution_ctx, request_ctx, parent_result=initial_value)
+            for resolver in root_resolvers
+        ],
+        return_exceptions=False,
+    )
 
-def _get_datas(root_nodes: List["NodeField"]) -> Optional[dict]:
+
+def _get_datas(field_results: List["FieldResult"]) -> Optional[dict]:
     data = {}
-    for node in root_nodes:
-        if node.cant_be_null and node.marshalled is None:
+    for field_result in field_results:
+        if field_result.cant_be_null and field_result.marshalled is None:
             return None
-        if not node.is_execution_stopped:
-            data[node.alias] = node.marshalled
+        if not field_result.is_execution_stopped:
+            data[field_result.alias] = field_result.marshalled
 
     return data or None
 
@@ -68,16 +79,27 @@ async def execute(
     request_ctx: Optional[Dict[str, Any]],
     initial_value: Optional[Any],
     error_coercer: Callable[[Exception], dict],
+    variables: Optional[Dict[str, Any]] = None,
+    fields_executor: Optional[Callable] = None,
+    scheduler: Optional[Scheduler] = None,
+    trace: Optional["Trace"] = None,
 ) -> dict:
     # pylint: disable=too-many-locals
-    execution_ctx = ExecutionContext()
-
     operation, errors = get_operation(operations, operation_name)
 
     if errors:
         return {"data": None, "errors": [error_coercer(err) for err in errors]}
 
-    return await execute_fields(
+    variables, errors = coerce_variables(operation, variables)
+
+    if errors:
+        return {"data": None, "errors": [error_coercer(err) for err in errors]}
+
+    execution_ctx = ExecutionContext(
+        variables, scheduler=scheduler, trace=trace
+    )
+
+    return await (fields_executor or execute_fields)(
         operation.children,
         execution_ctx,
         request_ctx,
@@ -87,31 +109,153 @@ async def execute(
     )
 
 
-async def subscribe(
+async def execute_stream(
     operations: Dict[Optional[str], List["NodeOperationDefinition"]],
     operation_name: Optional[str],
     request_ctx: Optional[Dict[str, Any]],
     initial_value: Optional[Any],
     error_coercer: Callable[[Exception], dict],
+    variables: Optional[Dict[str, Any]] = None,
+    fields_executor: Optional[Callable] = None,
+    scheduler: Optional[Scheduler] = None,
+    trace: Optional["Trace"] = None,
+) -> AsyncIterable[str]:
+    """
+    Executes an operation like `execute`, but yields the members of the
+    response (without its enclosing braces) encoded in JSON, piece by piece.
+    """
+    # pylint: disable=too-many-locals
+    operation, errors = get_operation(operations, operation_name)
+
+    if not errors:
+        variables, errors = coerce_variables(operation, variables)
+
+    if errors:
+        for piece in iter_encode_members(
+            {"data": None, "errors": [error_coercer(err) for err in errors]}
+        ):
+            yield piece
+        return
+
+    execution_ctx = ExecutionContext(
+        variables, scheduler=scheduler, trace=trace
+    )
+
+    if fields_executor is not None or not operation.allow_parallelization:
+        # Mutations & breadth first executions are encoded once executed
+        for piece in iter_encode_members(
+            await (fields_executor or execute_fields)(
+                operation.children,
+                execution_ctx,
+                request_ctx,
+                initial_value=initial_value,
+                error_coercer=error_coercer,
+                allow_parallelization=operation.allow_parallelization,
+            )
+        ):
+            yield piece
+        return
+
+    async for piece in stream_fields(  # pylint: disable=not-an-iterable
+        operation.children,
+        execution_ctx,
+        request_ctx,
+        initial_value=initial_value,
+        error_coercer=error_coercer,
+    ):
+        yield piece
+
+
+async def execute_incremental(
+    operations: Dict[Optional[str], List["NodeOperationDefinition"]],
+    operation_name: Optional[str],
+    request_ctx: Optional[Dict[str, Any]],
+    initial_value: Optional[Any],
+    error_coercer: Callable[[Exception], dict],
+    variables: Optional[Dict[str, Any]] = None,
+    fields_executor: Optional[Callable] = None,
+    scheduler: Optional[Scheduler] = None,
+    trace: Optional["Trace"] = None,
 ) -> AsyncIterable[Dict[str, Any]]:
+    """
+    Executes an operation like `execute`, but yields its result as soon as
+    the fields which aren't released by `@defer` & `@stream` are completed,
+    followed by the payloads of the released ones.
+    """
     # pylint: disable=too-many-locals
-    execution_ctx = ExecutionContext()
+    operation, errors = get_operation(operations, operation_name)
+
+    if not errors:
+        variables, errors = coerce_variables(operation, variables)
+
+    if errors:
+        yield {
+            "data": None,
+            "errors": [error_coercer(err) for err in errors],
+            "hasNext": False,
+        }
+        return
+
+    execution_ctx = ExecutionContext(
+        variables, scheduler=scheduler, trace=trace
+    )
+    if fields_executor is None:
+        # Only the depth first executor releases fields
+        execution_ctx.incremental = IncrementalDelivery(error_coercer)
+
+    result = await (fields_executor or execute_fields)(
+        operation.children,
+        execution_ctx,
+        request_ctx,
+        initial_value=initial_value,
+        error_coercer=error_coercer,
+        allow_parallelization=operation.allow_parallelization,
+    )
+
+    incremental = execution_ctx.incremental
+    result["hasNext"] = incremental is not None and incremental.has_next
+    yield result
+
+    if result["hasNext"]:
+        async for payload in incremental.payloads():
+            yield payload
 
+
+async def subscribe(
+    operations: Dict[Optional[str], List["NodeOperationDefinition"]],
+    operation_name: Optional[str],
+    request_ctx: Optional[Dict[str, Any]],
+    initial_value: Optional[Any],
+    error_coercer: Callable[[Exception], dict],
+    variables: Optional[Dict[str, Any]] = None,
+    fields_executor: Optional[Callable] = None,
+    scheduler: Optional[Scheduler] = None,
+    trace: Optional["Trace"] = None,
+) -> AsyncIterable[Dict[str, Any]]:
+    # pylint: disable=too-many-locals
     operation, errors = get_operation(operations, operation_name)
 
+    if not errors:
+        variables, errors = coerce_variables(operation, variables)
+
     if errors:
         yield {"data": None, "errors": [error_coercer(err) for err in errors]}
+        return
 
     root_nodes = operation.children
 
     source_event_stream = await root_nodes[0].create_source_event_stream(
-        execution_ctx, request_ctx, parent_result=initial_value
+        ExecutionContext(variables, scheduler=scheduler, trace=trace),
+        request_ctx,
+        parent_result=initial_value,
     )
 
     async for message in source_event_stream:
-        yield await execute_fields(
+        # Each message is executed as a request of its own, with its own
+        # errors, DataLoaders & memoized results
+        yield await (fields_executor or execute_fields)(
             root_nodes,
-            execution_ctx,
+            ExecutionContext(variables, scheduler=scheduler, trace=trace),
             request_ctx,
             initial_value=message,
             error_coercer=error_coercer,
@@ -127,7 +271,7 @@ async def execute_fields(
     error_coercer,
     allow_parallelization=True,
 ):
-    await _execute(
+    field_results = await _execute(
         fields,
         execution_ctx,
         request_ctx,
@@ -136,7 +280,7 @@ async def execute_fields(
     )
 
     results = {
-        "data": _get_datas(fields),
+        "data": _get_datas(field_results),
         "errors": [error_coercer(err) for err in execution_ctx.errors if err],
     }
 
@@ -144,3 +288,28 @@ async def execute_fields(
         del results["errors"]
 
     return results
+
+
+async def stream_fields(
+    fields, execution_ctx, request_ctx, initial_value, error_coercer
+):
+    """
+    Executes the fields in parallel like `execute_fields`, but yields the
+    members of the response encoded in JSON as the fields are completed, in
+    their order (see `ResponseStream`).
+    """
+    response_stream = ResponseStream(execution_ctx, request_ctx)
+    try:
+        async for piece in response_stream.iter_encode_data(  # pylint: disable=not-an-iterable
+            fields, initial_value
+        ):
+            yield piece
+    finally:
+        # The response may not be entirely consumed
+        response_stream.cancel()
+
+    errors = [error_coercer(err) for err in execution_ctx.errors if err]
+    if errors:
+        yield "," + encode_key("errors")
+        for piece in iter_encode(errors):
+            yield piece
@@ -0,0 +1,261 @@
+import asyncio
+
+from functools import partial
+from inspect import isawaitable
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from tartiflette.executors.basic import _get_datas
+from tartiflette.executors.basic import execute as basic_execute
+from tartiflette.executors.basic import (
+    execute_incremental as basic_execute_incremental,
+)
+from tartiflette.executors.basic import execute_stream as basic_execute_stream
+from tartiflette.executors.basic import subscribe as basic_subscribe
+from tartiflette.executors.types import ExecutionContext, FieldResult
+
+# A field to resolve: the NodeField, its parent result, the container to
+# marshall it into and the FieldResult of its parent.
+_Execution = Tuple["NodeField", Any, Any, Optional[FieldResult]]
+
+# Maximum number of fields of a level being resolved at the same time, the
+# next ones are started as the previous ones complete
+_LEVEL_CONCURRENCY = 1024
+
+
+async def _gather_bounded(
+    jobs: List[Callable[[], Awaitable]], limit: int
+) -> List[Any]:
+    """
+    Awaits the awaitables created by the jobs, with at most `limit` of them
+    in flight, and returns their results in the order of the jobs.
+    """
+    if len(jobs) <= limit:
+        return await asyncio.gather(*[job() for job in jobs])
+
+    results = [None] * len(jobs)
+    jobs_iterator = enumerate(jobs)
+    pending = {
+        asyncio.ensure_future(job()): index
+        for index, job in islice(jobs_iterator, limit)
+    }
+    try:
+        while pending:
+            done, _ = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                results[pending.pop(future)] = future.result()
+            for index, job in islice(jobs_iterator, len(done)):
+                pending[asyncio.ensure_future(job())] = index
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        raise
+    return results
+
+
+def _identity(awaitable: Awaitable) -> Awaitable:
+    return awaitable
+
+
+async def _resolve_batch(
+    node: "NodeField",
+    executions: List[_Execution],
+    execution_ctx: ExecutionContext,
+    request_ctx: Optional[Dict[str, Any]],
+) -> List[Tuple[FieldResult, Any, Any]]:
+    return await node.resolve_batch(
+        execution_ctx,
+        request_ctx,
+        [
+            (result, container, parent)
+            for _, result, container, parent in executions
+        ],
+    )
+
+
+async def _execute_level(
+    executions: List[_Execution],
+    execution_ctx: ExecutionContext,
+    request_ctx: Optional[Dict[str, Any]],
+) -> List[Tuple[FieldResult, Any, Any]]:
+    results = []
+    jobs = []
+    batches = {}
+    for execution in executions:
+        node, result, container, parent = execution
+        if node.is_batch:
+            # Fields with a batch resolver are resolved once for all the
+            # parents of the level, the job is added on first use to keep
+            # the order of the fields
+            try:
+                batches[node].append(execution)
+            except KeyError:
+                batches[node] = [execution]
+                jobs.append(
+                    partial(
+                        _resolve_batch,
+                        node,
+                        batches[node],
+                        execution_ctx,
+                        request_ctx,
+                    )
+                )
+                results.append(None)
+            continue
+
+        resolved = node.resolve_inline(
+            execution_ctx,
+            request_ctx,
+            parent_result=result,
+            parent_marshalled=container,
+            parent_field_result=parent,
+        )
+        if resolved is not None and not isawaitable(resolved):
+            results.append(resolved)
+            continue
+
+        jobs.append(
+            partial(
+                node.resolve,
+                execution_ctx,
+                request_ctx,
+                parent_result=result,
+                parent_marshalled=container,
+                parent_field_result=parent,
+            )
+            if resolved is None
+            else partial(_identity, resolved)
+        )
+        results.append(None)
+
+    if jobs:
+        jobs_results = iter(await _gather_bounded(jobs, _LEVEL_CONCURRENCY))
+        results = [
+            result if result is not None else next(jobs_results)
+            for result in results
+        ]
+
+    resolved = []
+    for result in results:
+        if isinstance(result, list):
+            resolved.extend(result)
+        else:
+            resolved.append(result)
+    return resolved
+
+
+def _get_next_level(
+    resolved: List[Tuple[FieldResult, Any, Any]],
+    execution_ctx: ExecutionContext,
+    request_ctx: Optional[Dict[str, Any]],
+) -> List[_Execution]:
+    executions = []
+    for field_result, raw, coerced in resolved:
+        node = field_result.node
+        if not node.children or raw is None or isinstance(raw, Exception):
+            continue
+
+        executions.extend(
+            (child, child_raw, child_coerced, field_result)
+            for child, child_raw, child_coerced in node.iter_children(
+                raw, coerced, execution_ctx, request_ctx
+            )
+        )
+    return executions
+
+
+async def _execute_tree(
+    executions: List[_Execution],
+    execution_ctx: ExecutionContext,
+    request_ctx: Optional[Dict[str, Any]],
+) -> List[FieldResult]:
+    resolved = await _execute_level(executions, execution_ctx, request_ctx)
+    field_results = [field_result for field_result, _, _ in resolved]
+
+    executions = _get_next_level(resolved, execution_ctx, request_ctx)
+    while executions:
+        resolved = await _execute_level(executions, execution_ctx, request_ctx)
+        executions = _get_next_level(resolved, execution_ctx, request_ctx)
+
+    return field_results
+
+
+async def execute_fields(
+    fields,
+    execution_ctx,
+    request_ctx,
+    initial_value,
+    error_coercer,
+    allow_parallelization=True,
+):
+    """
+    Executes the fields one depth level at a time: every field of a level
+    (for every parent object) is resolved before moving to the next level.
+    The fields of a mutation are executed one after the other, each of them
+    along with its whole selection set.
+    """
+    if allow_parallelization:
+        field_results = await _execute_tree(
+            [(field, initial_value, None, None) for field in fields],
+            execution_ctx,
+            request_ctx,
+        )
+    else:
+        field_results = []
+        for field in fields:
+            field_results.extend(
+                await _execute_tree(
+                    [(field, initial_value, None, None)],
+                    execution_ctx,
+                    request_ctx,
+                )
+            )
+
+    results = {
+        "data": _get_datas(field_results),
+        "errors": [error_coercer(err) for err in execution_ctx.errors if err],
+    }
+
+    if not results["errors"]:
+        del results["errors"]
+
+    return results
+
+
+async def execute(*args, **kwargs) -> dict:
+    return await basic_execute(*args, fields_executor=execute_fields, **kwargs)
+
+
+async def execute_stream(*args, **kwargs) -> AsyncIterable[str]:
+    async for piece in basic_execute_stream(  # pylint: disable=not-an-iterable
+        *args, fields_executor=execute_fields, **kwargs
+    ):
+        yield piece
+
+
+async def execute_incremental(
+    *args, **kwargs
+) -> AsyncIterable[Dict[str, Any]]:
+    # The fields are resolved level by level, none of them is released
+    async for payload in basic_execute_incremental(  # pylint: disable=not-an-iterable
+        *args, fields_executor=execute_fields, **kwargs
+    ):
+        yield payload
+
+
+async def subscribe(*args, **kwargs) -> AsyncIterable[Dict[str, Any]]:
+    async for result in basic_subscribe(  # pylint: disable=not-an-iterable
+        *args, fields_executor=execute_fields, **kwargs
+    ):
+        yield result
@@ -0,0 +1,308 @@
+import asyncio
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
+
+from tartiflette.executors.types import ExecutionContext, FieldResult
+from tartiflette.utils.errors import to_graphql_error
+
+
+class PatchResult:
+    """
+    Parent of the fields executed for a subsequent payload: the errors of
+    their non-null fields bubble up to the data of the payload instead of
+    the fields already delivered.
+    """
+
+    __slots__ = ("path", "data")
+
+    def __init__(self, path: List[Union[str, int]], data: Any) -> None:
+        self.path = path
+        self.data = data
+
+    def bubble_error(self) -> None:
+        self.data = None
+
+
+def _find_item(items: List[Any], value: Any) -> Optional[List[int]]:
+    for index, item in enumerate(items):
+        if item is value:
+            return [index]
+        if isinstance(item, list):
+            indexes = _find_item(item, value)
+            if indexes is not None:
+                return [index] + indexes
+    return None
+
+
+def get_response_path(
+    field_result: Optional[Union[FieldResult, PatchResult]], value: Any
+) -> List[Union[str, int]]:
+    """
+    Returns the path of a value within the response, list indexes included.
+    :param field_result: the FieldResult of the field whose value (or an
+    item of whose value) is looked for
+    :param value: the value of the field or one of its items
+    :return: the path of the value
+    """
+    path = []
+    while isinstance(field_result, FieldResult):
+        if isinstance(field_result.marshalled, list):
+            path.extend(
+                reversed(_find_item(field_result.marshalled, value) or [])
+            )
+        path.append(field_result.alias)
+        value = field_result.container
+        field_result = field_result.parent
+    path.reverse()
+
+    if field_result is None:
+        return path
+    return field_result.path + path
+
+
+async def _complete(
+    execution: Coroutine,
+    patch: PatchResult,
+    execution_ctx: ExecutionContext,
+) -> None:
+    try:
+        await execution
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:  # pylint: disable=broad-except
+        patch.bubble_error()
+        execution_ctx.add_error(
+            to_graphql_error(e, message="Server encountered an error.")
+        )
+
+
+class _DeferredFragment:
+    __slots__ = ("patch", "label", "execution_ctx", "container", "nb_fields")
+
+    def __init__(
+        self,
+        path: List[Union[str, int]],
+        label: Optional[str],
+        execution_ctx: ExecutionContext,
+        container: Any,
+    ) -> None:
+        self.patch = PatchResult(path, {})
+        self.label = label
+        self.execution_ctx = execution_ctx
+        # Keeps the parent object alive, its id is part of the key
+        self.container = container
+        self.nb_fields = 0
+
+
+class IncrementalDelivery:
+    """
+    Executes the fields released by `@defer` & `@stream` once the initial
+    payload is completed, and gathers their results into subsequent
+    payloads.
+    """
+
+    def __init__(self, error_coercer: Callable[[Exception], dict]) -> None:
+        self._error_coercer = error_coercer
+        self._payloads = asyncio.Queue()
+        self._pending = 0
+        self._fragments: Dict[tuple, _DeferredFragment] = {}
+        self._tasks = set()
+
+    @property
+    def has_next(self) -> bool:
+        # The released fields may have been delivered already
+        return self._pending > 0 or not self._payloads.empty()
+
+    def _schedule(self, coroutine: Coroutine) -> None:
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _publish(
+        self, payload: Dict[str, Any], execution_ctx: ExecutionContext
+    ) -> None:
+        errors = [
+            self._error_coercer(err) for err in execution_ctx.errors if err
+        ]
+        if errors:
+            payload["errors"] = errors
+
+        self._pending -= 1
+        payload["hasNext"] = self._pending > 0
+        self._payloads.put_nowait(payload)
+
+    def defer(
+        self,
+        node: "NodeField",
+        directive: Dict[str, Any],
+        label: Optional[str],
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+        parent_result: Any,
+        parent_marshalled: Any,
+        parent_field_result: Optional[Union[FieldResult, PatchResult]],
+    ) -> None:
+        """
+        Releases a field of a deferred fragment. The fields of the same
+        fragment spread on the same object are delivered in the same payload.
+        :param node: the field to release
+        :param directive: the `@defer` directive of the field
+        :param label: the label of the fragment
+        :param execution_ctx: the context of the execution of the parent
+        :param request_ctx: the context of the request
+        :param parent_result: the result of the parent of the field
+        :param parent_marshalled: the object the field belongs to
+        :param parent_field_result: the FieldResult of the parent of the field
+        """
+        # pylint: disable=too-many-arguments
+        key = (id(directive), id(parent_marshalled))
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            fragment = _DeferredFragment(
+                get_response_path(parent_field_result, parent_marshalled),
+                label,
+                execution_ctx.fork(),
+                parent_marshalled,
+            )
+            self._fragments[key] = fragment
+            self._pending += 1
+
+        fragment.nb_fields += 1
+        self._schedule(
+            self._execute_deferred(
+                key, fragment, node, request_ctx, parent_result
+            )
+        )
+
+    async def _execute_deferred(
+        self,
+        key: tuple,
+        fragment: _DeferredFragment,
+        node: "NodeField",
+        request_ctx: Optional[Dict[str, Any]],
+        parent_result: Any,
+    ) -> None:
+        try:
+            await _complete(
+                node.execute(
+                    fragment.execution_ctx,
+                    request_ctx,
+                    parent_result=parent_result,
+                    parent_marshalled=fragment.patch.data,
+                    parent_field_result=fragment.patch,
+                ),
+                fragment.patch,
+                fragment.execution_ctx,
+            )
+        finally:
+            fragment.nb_fields -= 1
+            if not fragment.nb_fields:
+                del self._fragments[key]
+
+                payload = {
+                    "data": fragment.patch.data,
+                    "path": fragment.patch.path,
+                }
+                if fragment.label is not None:
+                    payload["label"] = fragment.label
+                self._publish(payload, fragment.execution_ctx)
+
+    def stream(
+        self,
+        node: "NodeField",
+        label: Optional[str],
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+        field_result: FieldResult,
+        items: List[Any],
+        coerced_items: List[Any],
+    ) -> None:
+        """
+        Releases the items of a streamed list field which aren't part of its
+        initial value, each of them is delivered in its own payload, in
+        order.
+        :param node: the streamed field
+        :param label: the label of the field
+        :param execution_ctx: the context of the execution of the field
+        :param request_ctx: the context of the request
+        :param field_result: the FieldResult of the field, whose value is
+        the initial items of the list
+        :param items: the results of the released items
+        :param coerced_items: the coerced released items
+        """
+        # pylint: disable=too-many-arguments
+        path = get_response_path(field_result, field_result.marshalled)
+        start = len(field_result.marshalled)
+
+        self._pending += len(items)
+        self._schedule(
+            self._execute_streamed(
+                node,
+                label,
+                [
+                    (
+                        item,
+                        PatchResult(path + [start + index], [coerced]),
+                        execution_ctx.fork(),
+                    )
+                    for index, (item, coerced) in enumerate(
+                        zip(items, coerced_items)
+                    )
+                ],
+                request_ctx,
+            )
+        )
+
+    async def _execute_streamed(
+        self,
+        node: "NodeField",
+        label: Optional[str],
+        items: List[tuple],
+        request_ctx: Optional[Dict[str, Any]],
+    ) -> None:
+        executions = [
+            asyncio.ensure_future(
+                node.execute_item(
+                    item_ctx,
+                    request_ctx,
+                    item,
+                    patch.data[0],
+                    parent_field_result=patch,
+                )
+            )
+            for item, patch, item_ctx in items
+        ]
+
+        try:
+            for execution, (_, patch, item_ctx) in zip(executions, items):
+                await _complete(execution, patch, item_ctx)
+
+                payload = {"items": patch.data, "path": patch.path}
+                if label is not None:
+                    payload["label"] = label
+                self._publish(payload, item_ctx)
+        finally:
+            for execution in executions:
+                execution.cancel()
+
+    async def payloads(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields the subsequent payloads as soon as they're completed, until
+        the last one.
+        """
+        try:
+            while self._pending or not self._payloads.empty():
+                yield await self._payloads.get()
+        finally:
+            # The payloads may not be entirely consumed
+            for task in list(self._tasks):
+                task.cancel()
@@ -0,0 +1,120 @@
+import asyncio
+
+from collections import namedtuple
+from typing import Any, Awaitable, Callable, Optional
+
+SchedulerInfo = namedtuple(
+    "SchedulerInfo",
+    [
+        "max_concurrency",
+        "in_flight",
+        "max_in_flight",
+        "scheduled",
+        "queued",
+        "waiting",
+        "total_wait_time",
+        "max_wait_time",
+    ],
+)
+
+
+class Scheduler:
+    """
+    Bounds the number of resolvers awaited at the same time. Resolvers
+    scheduled while `max_concurrency` of them are in flight wait for a slot
+    to be released, in the order they were scheduled. Only the calls of the
+    resolvers are bounded, not the executions of the fields awaiting them.
+
+    A scheduler can be given a `parent`, in which case a slot of the parent
+    is also required (e.g a per-request limit within a per-engine one).
+    """
+
+    def __init__(
+        self, max_concurrency: int, parent: Optional["Scheduler"] = None
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(
+                "< max_concurrency > should be a positive integer, got < %r >."
+                % max_concurrency
+            )
+
+        self._max_concurrency = max_concurrency
+        self._parent = parent
+        # Created on first use, to be bound to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._scheduled = 0
+        self._queued = 0
+        self._waiting = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def parent(self) -> Optional["Scheduler"]:
+        return self._parent
+
+    async def _acquire(self) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        self._scheduled += 1
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            return
+
+        loop = asyncio.get_event_loop()
+        queued_at = loop.time()
+        self._queued += 1
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        wait_time = loop.time() - queued_at
+        self._total_wait_time += wait_time
+        self._max_wait_time = max(self._max_wait_time, wait_time)
+
+    async def call(self, func: Callable[..., Awaitable], *args) -> Any:
+        """
+        Calls the given function once a slot is available and awaits its
+        result, the awaitable isn't created while waiting for the slot.
+        :param func: the resolver to call
+        :param args: the arguments of the resolver
+        :return: the result of the resolver
+        """
+        await self._acquire()
+        self._in_flight += 1
+        self._max_in_flight = max(self._max_in_flight, self._in_flight)
+        try:
+            if self._parent is not None:
+                return await self._parent.call(func, *args)
+            return await func(*args)
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    async def run(self, awaitable: Awaitable) -> Any:
+        """
+        Awaits the given awaitable once a slot is available.
+        :param awaitable: the resolver call to schedule
+        :return: the result of the awaitable
+        """
+        return await self.call(lambda: awaitable)
+
+    def info(self) -> SchedulerInfo:
+        return SchedulerInfo(
+            self._max_concurrency,
+            self._in_flight,
+            self._max_in_flight,
+            self._scheduled,
+            self._queued,
+            self._waiting,
+            self._total_wait_time,
+            self._max_wait_time,
+        )
@@ -0,0 +1,302 @@
+import asyncio
+import weakref
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from tartiflette.executors.types import ExecutionContext, FieldResult
+from tartiflette.utils.json_stream import encode_key, iter_encode
+
+# The container of an object value, along with the executions of its
+# children (None for the children executed inline), or None if they're all
+# executed inline
+_ObjectExecution = Tuple[
+    Optional[Dict[str, Any]],
+    Optional[List[Tuple["NodeField", Optional[asyncio.Future]]]],
+]
+
+
+def _is_streamed(field: "NodeField") -> bool:
+    """
+    Whether the subtree of a field can be encoded while it's executed: the
+    field can be null and none of its children can, so that no error can
+    bubble up to it once some of its members are encoded. Children resolved
+    in batch are resolved for the whole list at once.
+    """
+    return (
+        bool(field.children)
+        and not field.cant_be_null
+        and not any(
+            child.cant_be_null or child.is_batch for child in field.children
+        )
+    )
+
+
+class ResponseStream:
+    """
+    Executes the root fields of an operation in parallel and encodes their
+    results in JSON as they're completed, in their order. The subtree of a
+    field is itself encoded member by member (item by item for a list
+    field) as its children are completed, and released once encoded, unless
+    an error of one of its children could null it: such subtrees are
+    encoded once completed.
+    """
+
+    def __init__(
+        self,
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+    ) -> None:
+        self._execution_ctx = execution_ctx
+        self._request_ctx = request_ctx
+        # Only the executions which aren't encoded yet are referenced
+        self._executions = weakref.WeakSet()
+
+    def _start(self, awaitable: Awaitable) -> asyncio.Future:
+        execution = asyncio.ensure_future(awaitable)
+        self._executions.add(execution)
+        return execution
+
+    def cancel(self) -> None:
+        """
+        Cancels the executions which aren't completed yet, e.g. when the
+        response isn't entirely consumed.
+        """
+        for execution in list(self._executions):
+            execution.cancel()
+
+    def _execute_children(
+        self,
+        children: List["NodeField"],
+        result: Any,
+        container: Optional[Dict[str, Any]],
+        field_result: Optional[FieldResult],
+    ) -> List[Tuple["NodeField", Optional[asyncio.Future]]]:
+        executions = []
+        for child in children:
+            if _is_streamed(child):
+                execution = self._start(
+                    self._execute_streamed(
+                        child, result, container, field_result
+                    )
+                )
+            else:
+                awaitable = child.execute_inline(
+                    self._execution_ctx,
+                    self._request_ctx,
+                    parent_result=result,
+                    parent_marshalled=container,
+                    parent_field_result=field_result,
+                )
+                execution = (
+                    self._start(awaitable) if awaitable is not None else None
+                )
+            executions.append((child, execution))
+        return executions
+
+    def _execute_object(
+        self,
+        field: "NodeField",
+        result: Any,
+        container: Optional[Dict[str, Any]],
+        field_result: FieldResult,
+    ) -> _ObjectExecution:
+        executions = self._execute_children(
+            field.get_children(result, self._execution_ctx, self._request_ctx),
+            result,
+            container,
+            field_result,
+        )
+        if not any(execution for _, execution in executions):
+            return container, None
+        return container, executions
+
+    async def _execute_streamed(
+        self,
+        field: "NodeField",
+        parent_result: Optional[Any] = None,
+        parent_marshalled: Optional[Dict[str, Any]] = None,
+        parent_field_result: Optional[FieldResult] = None,
+    ) -> Tuple[FieldResult, Optional[Any]]:
+        """
+        Resolves a field whose subtree is streamed, then starts the
+        execution of its children.
+        :return: the FieldResult of the field, along with the execution of
+        its value (of each of its items for a list field), None if it has no
+        children to execute
+        """
+        field_result, raw, coerced = await field.resolve(
+            self._execution_ctx,
+            self._request_ctx,
+            parent_result=parent_result,
+            parent_marshalled=parent_marshalled,
+            parent_field_result=parent_field_result,
+        )
+
+        if raw is None or isinstance(raw, Exception):
+            return field_result, None
+
+        if not field.shall_produce_list:
+            return (
+                field_result,
+                self._execute_object(field, raw, coerced, field_result),
+            )
+
+        if not isinstance(raw, list) or not isinstance(coerced, list):
+            return field_result, None
+
+        item_executions = [
+            self._execute_object(field, item, coerced[index], field_result)
+            for index, item in enumerate(raw)
+        ]
+        if all(executions is None for _, executions in item_executions):
+            # The items are already completed
+            return field_result, None
+        return field_result, item_executions
+
+    async def iter_encode_data(
+        self, fields: List["NodeField"], initial_value: Optional[Any]
+    ) -> AsyncIterator[str]:
+        """
+        Executes the root fields and encodes the `data` member of the
+        response. The fields which can't be null are completed first, since
+        `data` is null if one of them is.
+        :param fields: the root fields
+        :param initial_value: the parent result of the root fields
+        :return: the pieces of the encoded `data` member
+        """
+        data = {}
+        executions = self._execute_children(fields, initial_value, data, None)
+
+        await asyncio.gather(
+            *[
+                execution
+                for field, execution in executions
+                if field.cant_be_null and execution is not None
+            ]
+        )
+
+        members = self._iter_encode_members(executions, data)
+        if any(
+            data.get(field.alias) is None
+            for field in fields
+            if field.cant_be_null
+        ):
+            async for _ in members:  # pylint: disable=not-an-iterable
+                pass
+            yield encode_key("data") + "null"
+            return
+
+        has_data = False
+        async for piece in members:  # pylint: disable=not-an-iterable
+            if not has_data:
+                yield encode_key("data") + "{"
+                has_data = True
+            yield piece
+
+        yield "}" if has_data else encode_key("data") + "null"
+
+    async def _iter_encode_object(
+        self, object_execution: _ObjectExecution
+    ) -> AsyncIterator[str]:
+        container, executions = object_execution
+        if executions is None:
+            for piece in iter_encode(container):
+                yield piece
+            return
+
+        if container is None:
+            # The children are still awaited for their errors
+            async for _ in self._iter_encode_members(  # pylint: disable=not-an-iterable
+                executions, {}
+            ):
+                pass
+            yield "null"
+            return
+
+        yield "{"
+        async for piece in self._iter_encode_members(  # pylint: disable=not-an-iterable
+            executions, container
+        ):
+            yield piece
+        yield "}"
+
+    async def _iter_encode_members(
+        self,
+        executions: List[Tuple["NodeField", Optional[asyncio.Future]]],
+        container: Dict[str, Any],
+    ) -> AsyncIterator[str]:
+        """
+        Encodes the members of an object, without its braces, in the order
+        of its children. The encoded values are released.
+        """
+        aliases = set()
+        for index, (child, execution) in enumerate(executions):
+            executions[index] = None
+
+            if not _is_streamed(child):
+                if execution is not None:
+                    await execution
+                if child.alias in aliases or child.alias not in container:
+                    continue
+
+                yield ("," if aliases else "") + encode_key(child.alias)
+                aliases.add(child.alias)
+                for piece in iter_encode(container[child.alias]):
+                    yield piece
+                container[child.alias] = None
+                continue
+
+            field_result, value_execution = await execution
+            pieces = self._iter_encode_value(
+                child, field_result, value_execution
+            )
+            if field_result.is_execution_stopped or child.alias in aliases:
+                async for _ in pieces:  # pylint: disable=not-an-iterable
+                    pass
+                continue
+
+            yield ("," if aliases else "") + encode_key(child.alias)
+            aliases.add(child.alias)
+            async for piece in pieces:  # pylint: disable=not-an-iterable
+                yield piece
+            field_result.set_marshalled(None)
+
+    async def _iter_encode_value(
+        self,
+        field: "NodeField",
+        field_result: FieldResult,
+        value_execution: Optional[Any],
+    ) -> AsyncIterator[str]:
+        if value_execution is None:
+            for piece in iter_encode(field_result.marshalled):
+                yield piece
+            return
+
+        if not field.shall_produce_list:
+            async for piece in self._iter_encode_object(  # pylint: disable=not-an-iterable
+                value_execution
+            ):
+                yield piece
+            return
+
+        items = field_result.marshalled
+        yield "["
+        for index, object_execution in enumerate(value_execution):
+            # The item is released once encoded
+            value_execution[index] = None
+            if index:
+                yield ","
+            async for piece in self._iter_encode_object(  # pylint: disable=not-an-iterable
+                object_execution
+            ):
+                yield piece
+            items[index] = None
+        yield "]"
@@ -1,11 +1,54 @@
-from typing import Any, List
+import asyncio
+
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from tartiflette.dataloader import DataLoader
+from tartiflette.executors.scheduler import Scheduler
 
 
 class ExecutionContext:
     # See if we should keep it here or move it to the visitor ?
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        variables: Optional[Dict[str, Any]] = None,
+        scheduler: Optional[Scheduler] = None,
+        trace: Optional["Trace"] = None,
+    ) -> None:
         self._errors: List[Exception] = []
         self.is_introspection: bool = False
+        self.variables: Dict[str, Any] = variables or {}
+        self.scheduler = scheduler
+        self.trace = trace
+        self._dataloaders: Dict[Any, DataLoader] = {}
+        self._memoized: Dict[Hashable, Tuple[Any, asyncio.Future]] = {}
+        # Set when the fields marked with `@defer` & `@stream` are released
+        self.incremental: Optional["IncrementalDelivery"] = None
+
+    def fork(self) -> "ExecutionContext":
+        """
+        Returns a context sharing everything with this one but the errors,
+        for the fields delivered in a subsequent payload.
+        :return: the forked context
+        """
+        execution_ctx = ExecutionContext(
+            self.variables, scheduler=self.scheduler, trace=self.trace
+        )
+        execution_ctx.is_introspection = self.is_introspection
+        execution_ctx.incremental = self.incremental
+        # pylint: disable=protected-access
+        execution_ctx._dataloaders = self._dataloaders
+        execution_ctx._memoized = self._memoized
+        return execution_ctx
 
     @property
     def errors(self) -> List[Exception]:
@@ -14,6 +57,113 @@ class ExecutionContext:
     def add_error(self, error: Exception) -> None:
         self._errors.append(error)
 
+    @property
+    def dataloaders(self) -> Dict[Any, DataLoader]:
+        return self._dataloaders
+
+    def get_dataloader(
+        self, loader: Union[Callable, type], **kwargs
+    ) -> DataLoader:
+        """
+        Returns the DataLoader of the current request for the given batch
+        loading function (or DataLoader subclass), creating it on first use.
+        :param loader: a batch loading function or a DataLoader subclass
+        :param kwargs: parameters used to create the DataLoader
+        :return: the DataLoader of the current request
+        """
+        try:
+            return self._dataloaders[loader]
+        except KeyError:
+            pass
+
+        if isinstance(loader, type) and issubclass(loader, DataLoader):
+            dataloader = loader(**kwargs)
+        else:
+            dataloader = DataLoader(loader, **kwargs)
+
+        self._dataloaders[loader] = dataloader
+        return dataloader
+
+    def memoize(
+        self,
+        key: Hashable,
+        parent_result: Any,
+        func: Callable[[], Awaitable],
+    ) -> Awaitable:
+        """
+        Returns the result of `func` memoized for the current request: the
+        calls made with the same key share a single in-flight future.
+        :param key: the key of the call, computed from the identity of the
+        parent result
+        :param parent_result: the parent result, kept alive along with the
+        memoized result so that its identity isn't reused
+        :param func: the function called on the first call
+        :return: an awaitable of the result of `func`
+        """
+        try:
+            _, future = self._memoized[key]
+        except KeyError:
+            future = asyncio.ensure_future(func())
+            self._memoized[key] = (parent_result, future)
+        # Cancelling a call doesn't cancel the other ones
+        return asyncio.shield(future)
+
+
+class FieldResult:
+    """
+    Per-request state of a NodeField execution. The NodeField tree is an
+    execution plan shared between concurrent requests, so everything computed
+    while executing a field (its result, whether its execution has been
+    stopped...) has to live here.
+    """
+
+    __slots__ = (
+        "node",
+        "parent",
+        "container",
+        "marshalled",
+        "is_execution_stopped",
+    )
+
+    def __init__(
+        self,
+        node: "NodeField",
+        parent: Optional["FieldResult"] = None,
+        container: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.node = node
+        self.parent = parent
+        self.container = container
+        self.marshalled: Any = None
+        self.is_execution_stopped: bool = False
+
+    def __repr__(self) -> str:
+        return "{}(node={!r}, marshalled={!r})".format(
+            self.__class__.__name__, self.node, self.marshalled
+        )
+
+    @property
+    def alias(self) -> str:
+        return self.node.alias
+
+    @property
+    def cant_be_null(self) -> bool:
+        return self.node.cant_be_null
+
+    def set_marshalled(self, marshalled: Any) -> None:
+        self.marshalled = marshalled
+        if self.container is not None:
+            self.container[self.alias] = marshalled
+
+    def bubble_error(self) -> None:
+        if not self.cant_be_null:
+            # mean i can be null
+            self.set_marshalled(None)
+        elif self.parent is not None:
+            self.parent.bubble_error()
+        else:
+            self.set_marshalled(None)
+
 
 class Info:
     def __init__(
@@ -2,19 +2,14 @@ import os
 
 from typing import Union
 
-from lark import Lark
-
 from tartiflette.language.parsers.lark.transformers import (
     NodeTransformer,
     TokenTransformer,
 )
+from tartiflette.utils.lark_parser import get_lark_parser
 
-_LARK_PARSER = Lark.open(
-    os.path.join(os.path.dirname(__file__), "graphql_sdl_grammar.lark"),
-    start="document",
-    parser="lalr",
-    lexer="contextual",
-    propagate_positions=True,
+_LARK_PARSER = get_lark_parser(
+    os.path.join(os.path.dirname(__file__), "graphql_sdl_grammar.lark")
 )
 
 
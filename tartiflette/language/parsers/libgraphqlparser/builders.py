@@ -0,0 +1,537 @@
+from typing import Any, Callable, List, Optional, Tuple
+
+from tartiflette.language.ast import (
+    ArgumentNode,
+    BooleanValueNode,
+    DirectiveNode,
+    DocumentNode,
+    EnumValueNode,
+    FieldNode,
+    FloatValueNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    IntValueNode,
+    ListTypeNode,
+    ListValueNode,
+    Location,
+    NamedTypeNode,
+    NameNode,
+    NonNullTypeNode,
+    NullValueNode,
+    ObjectFieldNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    StringValueNode,
+    VariableDefinitionNode,
+    VariableNode,
+)
+from tartiflette.types.exceptions.tartiflette import GraphQLSyntaxError
+
+# Definitions which aren't part of an executable document, rejected by the
+# builder (their children aren't visited).
+_UNSUPPORTED_DEFINITIONS = [
+    ("SchemaDefinition", "schema_definition"),
+    ("ScalarTypeDefinition", "scalar_type_definition"),
+    ("ObjectTypeDefinition", "object_type_definition"),
+    ("InterfaceTypeDefinition", "interface_type_definition"),
+    ("UnionTypeDefinition", "union_type_definition"),
+    ("EnumTypeDefinition", "enum_type_definition"),
+    ("InputObjectTypeDefinition", "input_object_type_definition"),
+    ("TypeExtensionDefinition", "type_extension_definition"),
+    ("DirectiveDefinition", "directive_definition"),
+]
+
+
+class _BuildContext:
+    """
+    State of the build of a document: the nodes built so far and not yet
+    attached to their parent, and a location struct reused by every node.
+    """
+
+    __slots__ = ("nodes", "location", "unsupported_definition")
+
+    def __init__(self, c_location: "CData") -> None:
+        self.nodes: List[Any] = []
+        self.location = c_location
+        # Kind & location of the first unsupported definition of the document
+        self.unsupported_definition: Optional[Tuple[str, Location]] = None
+
+
+def _pop(nodes: List[Any], count: int) -> List[Any]:
+    """
+    Removes and returns the `count` last nodes of the list.
+    :param nodes: nodes built and not yet attached to their parent
+    :param count: number of nodes to pop
+    :type nodes: List[Any]
+    :type count: int
+    :return: the `count` last nodes of the list
+    :rtype: List[Any]
+    """
+    if not count:
+        return []
+    popped = nodes[-count:]
+    del nodes[-count:]
+    return popped
+
+
+class DocumentBuilder:
+    """
+    Builds a DocumentNode straight from the tree parsed by the libgraphqlparser
+    library, in a single visit of the tree.
+
+    Nodes are built once all their children have been visited: children are
+    pushed on a stack which is popped by their parent, the number of children
+    to pop being given by the accessors of the libgraphqlparser library.
+    """
+
+    def __init__(self, ffi: "FFI", lib: "FFILibrary") -> None:
+        """
+        :param ffi: FFI instance bound to the libgraphqlparser library
+        :param lib: the loaded libgraphqlparser library
+        :type ffi: FFI
+        :type lib: FFILibrary
+        """
+        self._ffi = ffi
+        self._lib = lib
+        self._c_callbacks = ffi.new("struct GraphQLAstVisitorCallbacks *")
+        # Keeps the C callbacks alive as long as the builder
+        self._c_functions = []
+
+        for libgraphql_type, struct_name, end_visit in [
+            ("Name", "name", self._end_visit_name),
+            ("NamedType", "named_type", self._end_visit_named_type),
+            ("ListType", "list_type", self._end_visit_list_type),
+            ("NonNullType", "non_null_type", self._end_visit_non_null_type),
+            ("Variable", "variable", self._end_visit_variable),
+            ("IntValue", "int_value", self._end_visit_int_value),
+            ("FloatValue", "float_value", self._end_visit_float_value),
+            ("StringValue", "string_value", self._end_visit_string_value),
+            ("BooleanValue", "boolean_value", self._end_visit_boolean_value),
+            ("NullValue", "null_value", self._end_visit_null_value),
+            ("EnumValue", "enum_value", self._end_visit_enum_value),
+            ("ListValue", "list_value", self._end_visit_list_value),
+            ("ObjectField", "object_field", self._end_visit_object_field),
+            ("ObjectValue", "object_value", self._end_visit_object_value),
+            ("Argument", "argument", self._end_visit_argument),
+            ("Directive", "directive", self._end_visit_directive),
+            ("Field", "field", self._end_visit_field),
+            (
+                "FragmentSpread",
+                "fragment_spread",
+                self._end_visit_fragment_spread,
+            ),
+            (
+                "InlineFragment",
+                "inline_fragment",
+                self._end_visit_inline_fragment,
+            ),
+            ("SelectionSet", "selection_set", self._end_visit_selection_set),
+            (
+                "FragmentDefinition",
+                "fragment_definition",
+                self._end_visit_fragment_definition,
+            ),
+            (
+                "VariableDefinition",
+                "variable_definition",
+                self._end_visit_variable_definition,
+            ),
+            (
+                "OperationDefinition",
+                "operation_definition",
+                self._end_visit_operation_definition,
+            ),
+            ("Document", "document", self._end_visit_document),
+        ]:
+            self._set_callback(
+                "void(struct GraphQLAst%s *, void *)" % libgraphql_type,
+                self._wrap(end_visit),
+                "end_visit_%s" % struct_name,
+            )
+
+        for libgraphql_type, struct_name in _UNSUPPORTED_DEFINITIONS:
+            self._set_callback(
+                "int(struct GraphQLAst%s *, void *)" % libgraphql_type,
+                self._reject(libgraphql_type),
+                "visit_%s" % struct_name,
+            )
+
+    def _set_callback(self, proto: str, func: Callable, attr: str) -> None:
+        c_func = self._ffi.callback(proto)(func)
+        self._c_functions.append(c_func)
+        setattr(self._c_callbacks, attr, c_func)
+
+    def _wrap(
+        self, end_visit: Callable[[Any, "_BuildContext"], Any]
+    ) -> Callable[[Any, Any], None]:
+        from_handle = self._ffi.from_handle
+
+        def _callback(c_node: "CData", user_data: "CData") -> None:
+            context = from_handle(user_data)
+            context.nodes.append(end_visit(c_node, context))
+
+        return _callback
+
+    def _reject(self, kind: str) -> Callable[[Any, Any], int]:
+        # Exceptions can't be raised through the visit, the definition is
+        # recorded and reported once the document has been visited
+        from_handle = self._ffi.from_handle
+
+        def _callback(c_node: "CData", user_data: "CData") -> int:
+            context = from_handle(user_data)
+            if context.unsupported_definition is None:
+                context.unsupported_definition = (
+                    kind,
+                    self._get_location(c_node, context),
+                )
+            return 0
+
+        return _callback
+
+    def build(self, c_document: "CData") -> "DocumentNode":
+        """
+        Builds the DocumentNode of a tree parsed by the libgraphqlparser
+        library.
+        :param c_document: struct GraphQLAstNode * of the parsed document
+        :type c_document: CData
+        :return: a DocumentNode representing the parsed document
+        :rtype: DocumentNode
+        :raises GraphQLSyntaxError: raised when the document contains a type
+        system definition
+        """
+        context = _BuildContext(self._ffi.new("struct GraphQLAstLocation *"))
+        self._lib.graphql_node_visit(
+            c_document, self._c_callbacks, self._ffi.new_handle(context)
+        )
+
+        if context.unsupported_definition is not None:
+            kind, location = context.unsupported_definition
+            raise GraphQLSyntaxError(
+                "Unsupported definition < %s > at line %d, column %d: only "
+                "operations & fragments can be defined in a query."
+                % (kind, location.line, location.column)
+            )
+
+        return context.nodes[0]
+
+    def _get_location(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "Location":
+        c_location = context.location
+        self._lib.graphql_node_get_location(
+            self._ffi.cast("struct GraphQLAstNode *", c_node), c_location
+        )
+        return Location(
+            line=c_location.beginLine,
+            column=c_location.beginColumn,
+            line_end=c_location.endLine,
+            column_end=c_location.endColumn,
+        )
+
+    def _get_string(self, c_value: "CData") -> str:
+        return self._ffi.string(c_value).decode("UTF-8", "replace")
+
+    def _end_visit_name(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "NameNode":
+        return NameNode(
+            value=self._get_string(self._lib.GraphQLAstName_get_value(c_node)),
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_named_type(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "NamedTypeNode":
+        return NamedTypeNode(
+            name=context.nodes.pop(),
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_list_type(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "ListTypeNode":
+        return ListTypeNode(
+            type=context.nodes.pop(),
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_non_null_type(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "NonNullTypeNode":
+        return NonNullTypeNode(
+            type=context.nodes.pop(),
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_variable(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "VariableNode":
+        return VariableNode(
+            name=context.nodes.pop(),
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_int_value(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "IntValueNode":
+        return IntValueNode(
+            value=int(
+                self._ffi.string(
+                    self._lib.GraphQLAstIntValue_get_value(c_node)
+                )
+            ),
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_float_value(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "FloatValueNode":
+        return FloatValueNode(
+            value=float(
+                self._ffi.string(
+                    self._lib.GraphQLAstFloatValue_get_value(c_node)
+                )
+            ),
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_string_value(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "StringValueNode":
+        return StringValueNode(
+            value=self._get_string(
+                self._lib.GraphQLAstStringValue_get_value(c_node)
+            ),
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_boolean_value(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "BooleanValueNode":
+        return BooleanValueNode(
+            value=bool(self._lib.GraphQLAstBooleanValue_get_value(c_node)),
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_null_value(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "NullValueNode":
+        return NullValueNode(location=self._get_location(c_node, context))
+
+    def _end_visit_enum_value(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "EnumValueNode":
+        return EnumValueNode(
+            value=self._get_string(
+                self._lib.GraphQLAstEnumValue_get_value(c_node)
+            ),
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_list_value(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "ListValueNode":
+        return ListValueNode(
+            values=_pop(
+                context.nodes,
+                self._lib.GraphQLAstListValue_get_values_size(c_node),
+            ),
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_object_field(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "ObjectFieldNode":
+        value = context.nodes.pop()
+        return ObjectFieldNode(
+            name=context.nodes.pop(),
+            value=value,
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_object_value(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "ObjectValueNode":
+        return ObjectValueNode(
+            fields=_pop(
+                context.nodes,
+                self._lib.GraphQLAstObjectValue_get_fields_size(c_node),
+            ),
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_argument(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "ArgumentNode":
+        value = context.nodes.pop()
+        return ArgumentNode(
+            name=context.nodes.pop(),
+            value=value,
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_directive(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "DirectiveNode":
+        arguments = _pop(
+            context.nodes,
+            self._lib.GraphQLAstDirective_get_arguments_size(c_node),
+        )
+        return DirectiveNode(
+            name=context.nodes.pop(),
+            arguments=arguments,
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_field(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "FieldNode":
+        lib = self._lib
+        nodes = context.nodes
+        selection_set = (
+            nodes.pop()
+            if lib.GraphQLAstField_get_selection_set(c_node) != self._ffi.NULL
+            else None
+        )
+        directives = _pop(
+            nodes, lib.GraphQLAstField_get_directives_size(c_node)
+        )
+        arguments = _pop(nodes, lib.GraphQLAstField_get_arguments_size(c_node))
+        name = nodes.pop()
+        return FieldNode(
+            alias=(
+                nodes.pop()
+                if lib.GraphQLAstField_get_alias(c_node) != self._ffi.NULL
+                else None
+            ),
+            name=name,
+            arguments=arguments,
+            directives=directives,
+            selection_set=selection_set,
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_fragment_spread(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "FragmentSpreadNode":
+        directives = _pop(
+            context.nodes,
+            self._lib.GraphQLAstFragmentSpread_get_directives_size(c_node),
+        )
+        return FragmentSpreadNode(
+            name=context.nodes.pop(),
+            directives=directives,
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_inline_fragment(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "InlineFragmentNode":
+        lib = self._lib
+        nodes = context.nodes
+        selection_set = nodes.pop()
+        directives = _pop(
+            nodes, lib.GraphQLAstInlineFragment_get_directives_size(c_node)
+        )
+        return InlineFragmentNode(
+            type_condition=(
+                nodes.pop()
+                if lib.GraphQLAstInlineFragment_get_type_condition(c_node)
+                != self._ffi.NULL
+                else None
+            ),
+            directives=directives,
+            selection_set=selection_set,
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_selection_set(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "SelectionSetNode":
+        return SelectionSetNode(
+            selections=_pop(
+                context.nodes,
+                self._lib.GraphQLAstSelectionSet_get_selections_size(c_node),
+            ),
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_fragment_definition(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "FragmentDefinitionNode":
+        nodes = context.nodes
+        selection_set = nodes.pop()
+        directives = _pop(
+            nodes,
+            self._lib.GraphQLAstFragmentDefinition_get_directives_size(c_node),
+        )
+        type_condition = nodes.pop()
+        return FragmentDefinitionNode(
+            name=nodes.pop(),
+            type_condition=type_condition,
+            directives=directives,
+            selection_set=selection_set,
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_variable_definition(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "VariableDefinitionNode":
+        nodes = context.nodes
+        default_value = (
+            nodes.pop()
+            if self._lib.GraphQLAstVariableDefinition_get_default_value(c_node)
+            != self._ffi.NULL
+            else None
+        )
+        type_node = nodes.pop()
+        return VariableDefinitionNode(
+            variable=nodes.pop(),
+            type=type_node,
+            default_value=default_value,
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_operation_definition(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "OperationDefinitionNode":
+        lib = self._lib
+        nodes = context.nodes
+        selection_set = nodes.pop()
+        directives = _pop(
+            nodes,
+            lib.GraphQLAstOperationDefinition_get_directives_size(c_node),
+        )
+        variable_definitions = _pop(
+            nodes,
+            lib.GraphQLAstOperationDefinition_get_variable_definitions_size(
+                c_node
+            ),
+        )
+        return OperationDefinitionNode(
+            operation_type=self._get_string(
+                lib.GraphQLAstOperationDefinition_get_operation(c_node)
+            ),
+            name=(
+                nodes.pop()
+                if lib.GraphQLAstOperationDefinition_get_name(c_node)
+                != self._ffi.NULL
+                else None
+            ),
+            variable_definitions=variable_definitions,
+            directives=directives,
+            selection_set=selection_set,
+            location=self._get_location(c_node, context),
+        )
+
+    def _end_visit_document(
+        self, c_node: "CData", context: "_BuildContext"
+    ) -> "DocumentNode":
+        definitions = context.nodes[:]
+        del context.nodes[:]
+        return DocumentNode(
+            definitions=definitions,
+            location=self._get_location(c_node, context),
+        )
@@ -1,4 +1,3 @@
-import json
 import os
 
 from types import TracebackType
@@ -6,26 +5,17 @@ from typing import Optional, Type, Union
 
 from cffi import FFI
 
-from tartiflette.language.parsers.libgraphqlparser.transformers import (
-    document_from_ast_json,
+from tartiflette.language.parsers.libgraphqlparser.builders import (
+    DocumentBuilder,
 )
+from tartiflette.parser.cffi import CDEFS_LIBGRAPHQL
 from tartiflette.types.exceptions.tartiflette import GraphQLSyntaxError
 
-# TODO: automatize read from headers files
 _FFI = FFI()
+_FFI.cdef(CDEFS_LIBGRAPHQL)
 _FFI.cdef(
     """
-struct GraphQLAstNode *graphql_parse_string(
-    const char *text, const char **error);
-
-struct GraphQLAstNode *graphql_parse_string_with_experimental_schema_support(
-    const char *text, const char **error);
-
-void graphql_error_free(const char *error);
-
-void graphql_node_free(struct GraphQLAstNode *node);
-
-const char *graphql_ast_to_json(const struct GraphQLAstNode *node);
+void free(void *ptr);
 """
 )
 
@@ -42,6 +32,12 @@ try:
 except OSError:
     _LIB = _FFI.dlopen(f"{_LIBGRAPHQLPARSER_DIR}/libgraphqlparser.dylib")
 
+# The JSON representation returned by the libgraphqlparser library is
+# allocated with `malloc` and has to be freed by the caller
+_LIBC = _FFI.dlopen(None)
+
+_DOCUMENT_BUILDER = DocumentBuilder(_FFI, _LIB)
+
 
 class ParsedData:
     """
@@ -131,7 +127,11 @@ def _parse_to_json_ast(query: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
     with _parse_context_manager(query) as parsed:
-        return _FFI.string(_LIB.graphql_ast_to_json(parsed))
+        c_json = _LIB.graphql_ast_to_json(parsed)
+        try:
+            return _FFI.string(c_json)
+        finally:
+            _LIBC.free(_FFI.cast("void *", c_json))
 
 
 def parse_to_document(query: Union[str, bytes]) -> "DocumentNode":
@@ -157,4 +157,5 @@ def parse_to_document(query: Union[str, bytes]) -> "DocumentNode":
     >>>   }
     >>> }''')
     """
-    return document_from_ast_json(json.loads(_parse_to_json_ast(query)))
+    with _parse_context_manager(query) as parsed:
+        return _DOCUMENT_BUILDER.build(parsed)
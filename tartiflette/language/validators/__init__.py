@@ -0,0 +1,3 @@
+from .validator import DocumentValidator, validate_document
+
+__all__ = ["DocumentValidator", "validate_document"]
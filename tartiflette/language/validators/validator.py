@@ -0,0 +1,638 @@
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from tartiflette.language.ast import (
+    FieldNode,
+    FragmentDefinitionNode,
+    InlineFragmentNode,
+    ListValueNode,
+    NamedTypeNode,
+    ObjectValueNode,
+    VariableNode,
+)
+from tartiflette.types.exceptions.tartiflette import (
+    AlreadyDefined,
+    FragmentCycle,
+    GraphQLError,
+    ImpossibleFragmentSpread,
+    MissingRequiredArgument,
+    MultipleRootNodeOnSubscriptionOperation,
+    NotALeafType,
+    NotAnObjectType,
+    NotLoneAnonymousOperation,
+    NotUniqueOperationName,
+    UndefinedDirectiveArgument,
+    UndefinedFieldArgument,
+    UndefinedFragment,
+    UniqueArgumentNames,
+    UnknownDirectiveDefinition,
+    UnknownSchemaFieldResolver,
+    UnknownTypeDefinition,
+    UnknownVariableException,
+    UnusedFragment,
+)
+from tartiflette.types.helpers.reduce_type import reduce_type
+from tartiflette.types.interface import GraphQLInterfaceType
+from tartiflette.types.location import Location
+from tartiflette.types.object import GraphQLObjectType
+from tartiflette.types.union import GraphQLUnionType
+
+
+def _to_location(node: "Node") -> Optional[Location]:
+    """
+    Converts the location of an AST node into the one used by the errors.
+    :param node: AST node to locate
+    :type node: Node
+    :return: the location of the node
+    :rtype: Optional[Location]
+    """
+    location = node.location
+    if location is None:
+        return None
+    return Location(
+        location.line,
+        location.column,
+        location.line_end,
+        location.column_end,
+    )
+
+
+def _get_named_type_name(type_node: "TypeNode") -> str:
+    """
+    Returns the name of the named type wrapped by a type node.
+    :param type_node: a NamedTypeNode, ListTypeNode or NonNullTypeNode
+    :type type_node: TypeNode
+    :return: the name of the wrapped named type
+    :rtype: str
+    """
+    while not isinstance(type_node, NamedTypeNode):
+        type_node = type_node.type
+    return type_node.name.value
+
+
+class _FragmentResult:
+    """
+    What is learnt by validating a fragment definition: the errors of its
+    own selection set, the fragments it spreads (along with their first
+    spread) & the variables it uses.
+    """
+
+    __slots__ = ("errors", "spreads", "variables")
+
+    def __init__(self) -> None:
+        self.errors: List[GraphQLError] = []
+        self.spreads: Dict[str, "FragmentSpreadNode"] = {}
+        self.variables: Dict[str, "VariableNode"] = {}
+
+
+class DocumentValidator:
+    """
+    Validates a `DocumentNode` against a schema, in a single traversal of the
+    document which applies every rule to each node.
+
+    Each fragment definition is validated once, whatever the number of times
+    it is spread, and whether a fragment can be spread within a parent type
+    is computed once per (fragment, parent type). A validator can be reused
+    for the documents of a same schema.
+    """
+
+    def __init__(self, schema: "GraphQLSchema") -> None:
+        """
+        :param schema: the schema to validate the documents against
+        :type schema: GraphQLSchema
+        """
+        self._schema = schema
+        self._possible_types: Dict[str, FrozenSet[str]] = {}
+
+    def validate(self, document: "DocumentNode") -> List[GraphQLError]:
+        """
+        Returns the errors of the document, an empty list if it's valid.
+        :param document: the document to validate
+        :type document: DocumentNode
+        :return: the errors of the document
+        :rtype: List[GraphQLError]
+        """
+        return _DocumentValidation(self, document).run()
+
+    def get_possible_types(self, type_name: str) -> FrozenSet[str]:
+        """
+        Returns the names of the object types a value of the given type can
+        be of.
+        :param type_name: name of the type
+        :type type_name: str
+        :return: the names of the possible object types
+        :rtype: FrozenSet[str]
+        """
+        try:
+            return self._possible_types[type_name]
+        except KeyError:
+            pass
+
+        gql_type = self._schema.find_type(type_name)
+        if isinstance(gql_type, GraphQLUnionType):
+            possible_types = frozenset(gql_type.gql_types)
+        elif isinstance(gql_type, GraphQLInterfaceType):
+            possible_types = frozenset(
+                name
+                for name, object_type in self._schema.gql_types.items()
+                if isinstance(object_type, GraphQLObjectType)
+                and type_name in object_type.interfaces_names
+            )
+        else:
+            possible_types = frozenset([type_name])
+
+        self._possible_types[type_name] = possible_types
+        return possible_types
+
+
+class _DocumentValidation:
+    """
+    State of the validation of a document.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self, validator: DocumentValidator, document: "DocumentNode"
+    ) -> None:
+        self._validator = validator
+        self._schema = validator._schema  # pylint: disable=protected-access
+        self._document = document
+        self._errors: List[GraphQLError] = []
+        self._fragments: Dict[str, "FragmentDefinitionNode"] = {}
+        self._fragment_results: Dict[str, _FragmentResult] = {}
+        self._spreadable: Dict[Tuple[str, str], bool] = {}
+        self._used_fragments: Set[str] = set()
+        # Collects the spreads & variables of the definition being validated
+        self._current: Optional[_FragmentResult] = None
+
+    def run(self) -> List[GraphQLError]:
+        operations = []
+        for definition in self._document.definitions:
+            if isinstance(definition, FragmentDefinitionNode):
+                self._add_fragment(definition)
+            else:
+                operations.append(definition)
+
+        self._validate_operation_names(operations)
+        for operation in operations:
+            self._validate_operation(operation)
+
+        for name, fragment in self._fragments.items():
+            if name not in self._used_fragments:
+                self._errors.append(
+                    UnusedFragment(
+                        "Fragment < %s > is never used." % name,
+                        locations=[_to_location(fragment)],
+                    )
+                )
+            # Fragments never reached from an operation are validated too
+            self._get_fragment_result(name)
+
+        self._validate_fragment_cycles()
+        return self._errors
+
+    def _validate_fragment_cycles(self) -> None:
+        visited = set()
+        for name in self._fragments:
+            self._detect_fragment_cycles(name, visited, [], {})
+
+    def _detect_fragment_cycles(
+        self,
+        name: str,
+        visited: Set[str],
+        spread_path: List["FragmentSpreadNode"],
+        spread_path_indexes: Dict[str, Optional[int]],
+    ) -> None:
+        """
+        Walks through the fragments spread by a fragment, depth first, and
+        reports each cycle once, at the spreads it's made of.
+        """
+        if name in visited:
+            return
+        visited.add(name)
+
+        spreads = self._fragment_results[name].spreads
+        if not spreads:
+            return
+
+        spread_path_indexes[name] = len(spread_path)
+        for spread_name, fragment_spread in spreads.items():
+            cycle_index = spread_path_indexes.get(spread_name)
+            spread_path.append(fragment_spread)
+            if cycle_index is None:
+                if spread_name in self._fragments:
+                    self._detect_fragment_cycles(
+                        spread_name, visited, spread_path, spread_path_indexes
+                    )
+            else:
+                cycle_path = spread_path[cycle_index:]
+                via = ", ".join(
+                    "< %s >" % spread.name.value for spread in cycle_path[:-1]
+                )
+                self._errors.append(
+                    FragmentCycle(
+                        "Cannot spread fragment < %s > within itself%s."
+                        % (spread_name, " via %s" % via if via else ""),
+                        locations=[
+                            _to_location(spread) for spread in cycle_path
+                        ],
+                    )
+                )
+            spread_path.pop()
+        spread_path_indexes[name] = None
+
+    def _add_fragment(self, fragment: "FragmentDefinitionNode") -> None:
+        name = fragment.name.value
+        if name in self._fragments:
+            self._errors.append(
+                AlreadyDefined(
+                    "Fragment < %s > already defined" % name,
+                    locations=[_to_location(fragment)],
+                )
+            )
+            return
+        self._fragments[name] = fragment
+
+    def _validate_operation_names(
+        self, operations: List["OperationDefinitionNode"]
+    ) -> None:
+        names = set()
+        for operation in operations:
+            if operation.name is None:
+                if len(operations) > 1:
+                    self._errors.append(
+                        NotLoneAnonymousOperation(
+                            "Anonymous operation must be the only defined "
+                            "operation.",
+                            locations=[_to_location(operation)],
+                        )
+                    )
+                continue
+
+            if operation.name.value in names:
+                self._errors.append(
+                    NotUniqueOperationName(
+                        "Operation name < %s > should be unique."
+                        % operation.name.value,
+                        locations=[_to_location(operation)],
+                    )
+                )
+            names.add(operation.name.value)
+
+    def _validate_operation(
+        self, operation: "OperationDefinitionNode"
+    ) -> None:
+        self._current = _FragmentResult()
+
+        defined_variables = set()
+        for variable_definition in operation.variable_definitions or []:
+            defined_variables.add(variable_definition.variable.name.value)
+            type_name = _get_named_type_name(variable_definition.type)
+            if not self._schema.has_type(type_name):
+                self._errors.append(
+                    UnknownTypeDefinition(
+                        "Unknown type < %s >." % type_name,
+                        locations=[_to_location(variable_definition)],
+                    )
+                )
+
+        self._validate_directives(operation.directives)
+
+        root_type_name = self._schema.get_operation_type(
+            operation.operation_type.capitalize()
+        )
+        if root_type_name is None or not self._schema.has_type(root_type_name):
+            self._errors.append(
+                UnknownTypeDefinition(
+                    "Unknown operation type < %s >."
+                    % operation.operation_type,
+                    locations=[_to_location(operation)],
+                )
+            )
+            return
+
+        if (
+            operation.operation_type == "subscription"
+            and len(operation.selection_set.selections) > 1
+        ):
+            self._errors.append(
+                MultipleRootNodeOnSubscriptionOperation(
+                    "Subscription operations must have exactly one root "
+                    "field.",
+                    locations=[_to_location(operation)],
+                )
+            )
+
+        self._validate_selection_set(
+            operation.selection_set, root_type_name, []
+        )
+
+        for name, variable in self._get_used_variables(self._current).items():
+            if name not in defined_variables:
+                error = UnknownVariableException(name)
+                error.locations = [_to_location(variable)]
+                self._errors.append(error)
+
+    def _get_used_variables(
+        self, result: _FragmentResult
+    ) -> Dict[str, "VariableNode"]:
+        variables = dict(result.variables)
+        visited = set()
+        to_visit = list(result.spreads)
+        while to_visit:
+            name = to_visit.pop()
+            if name in visited or name not in self._fragments:
+                continue
+            visited.add(name)
+            fragment_result = self._get_fragment_result(name)
+            for variable_name, variable in fragment_result.variables.items():
+                variables.setdefault(variable_name, variable)
+            to_visit.extend(fragment_result.spreads)
+        return variables
+
+    def _get_fragment_result(self, name: str) -> _FragmentResult:
+        try:
+            return self._fragment_results[name]
+        except KeyError:
+            pass
+
+        fragment = self._fragments[name]
+        result = _FragmentResult()
+        # Registered before the validation, so that a fragment spreading
+        # itself doesn't recurse
+        self._fragment_results[name] = result
+
+        previous, self._current = self._current, result
+        errors, self._errors = self._errors, result.errors
+        try:
+            self._validate_directives(fragment.directives)
+            type_name = fragment.type_condition.name.value
+            if not self._schema.has_type(type_name):
+                self._errors.append(
+                    UnknownTypeDefinition(
+                        "Unknown type < %s >." % type_name,
+                        locations=[_to_location(fragment)],
+                    )
+                )
+            else:
+                self._validate_selection_set(
+                    fragment.selection_set, type_name, []
+                )
+        finally:
+            self._current = previous
+            self._errors = errors
+
+        self._errors.extend(result.errors)
+        return result
+
+    def _validate_selection_set(
+        self,
+        selection_set: "SelectionSetNode",
+        parent_type_name: str,
+        path: List[str],
+    ) -> None:
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                self._validate_field(selection, parent_type_name, path)
+            elif isinstance(selection, InlineFragmentNode):
+                self._validate_inline_fragment(
+                    selection, parent_type_name, path
+                )
+            else:
+                self._validate_fragment_spread(selection, parent_type_name)
+
+    def _validate_field(
+        self, field: "FieldNode", parent_type_name: str, path: List[str]
+    ) -> None:
+        name = field.name.value
+        field_path = path + [name]
+
+        try:
+            field_definition = self._schema.find_type(
+                parent_type_name
+            ).find_field(name)
+        except (AttributeError, KeyError):
+            self._errors.append(
+                UnknownSchemaFieldResolver(
+                    "field `%s.%s` was not found in GraphQL schema."
+                    % (parent_type_name, name),
+                    path=field_path,
+                    locations=[_to_location(field)],
+                )
+            )
+            return
+
+        if field_definition.is_leaf and field.selection_set:
+            self._errors.append(
+                NotAnObjectType(
+                    message="field < %s > is a leaf and thus can't have a "
+                    "selection set" % name,
+                    path=field_path,
+                    locations=[_to_location(field)],
+                )
+            )
+            return
+
+        if not field_definition.is_leaf and not field.selection_set:
+            self._errors.append(
+                NotALeafType(
+                    message="field < %s > is not a leaf and thus must have a "
+                    "selection set" % name,
+                    path=field_path,
+                    locations=[_to_location(field)],
+                )
+            )
+            return
+
+        self._validate_arguments(
+            field.arguments,
+            field_definition.arguments,
+            lambda argument_name: UndefinedFieldArgument(
+                "Undefined argument < %s > on field < %s > of type < %s >."
+                % (argument_name, name, parent_type_name),
+                locations=[_to_location(field)],
+            ),
+            lambda argument_name: MissingRequiredArgument(
+                "Missing required < %s > argument on < %s > field."
+                % (argument_name, name),
+                locations=[_to_location(field)],
+            ),
+        )
+        self._validate_directives(field.directives)
+
+        if field.selection_set:
+            self._validate_selection_set(
+                field.selection_set,
+                str(reduce_type(field_definition.gql_type)),
+                field_path,
+            )
+
+    def _validate_inline_fragment(
+        self,
+        inline_fragment: "InlineFragmentNode",
+        parent_type_name: str,
+        path: List[str],
+    ) -> None:
+        self._validate_directives(inline_fragment.directives)
+
+        type_name = parent_type_name
+        if inline_fragment.type_condition:
+            type_name = inline_fragment.type_condition.name.value
+            if not self._schema.has_type(type_name):
+                self._errors.append(
+                    UnknownTypeDefinition(
+                        "Unknown type < %s >." % type_name,
+                        locations=[_to_location(inline_fragment)],
+                    )
+                )
+                return
+
+        self._validate_selection_set(
+            inline_fragment.selection_set, type_name, path
+        )
+
+    def _validate_fragment_spread(
+        self, fragment_spread: "FragmentSpreadNode", parent_type_name: str
+    ) -> None:
+        self._validate_directives(fragment_spread.directives)
+
+        name = fragment_spread.name.value
+        self._used_fragments.add(name)
+        self._current.spreads.setdefault(name, fragment_spread)
+
+        if name not in self._fragments:
+            self._errors.append(
+                UndefinedFragment(
+                    "Undefined fragment < %s >." % name,
+                    locations=[_to_location(fragment_spread)],
+                )
+            )
+            return
+
+        self._get_fragment_result(name)
+
+        if not self._is_spreadable(name, parent_type_name):
+            self._errors.append(
+                ImpossibleFragmentSpread(
+                    "Fragment < %s > cannot be spread here as objects of type "
+                    "< %s > can never be of type < %s >."
+                    % (
+                        name,
+                        parent_type_name,
+                        self._fragments[name].type_condition.name.value,
+                    ),
+                    locations=[_to_location(fragment_spread)],
+                )
+            )
+
+    def _is_spreadable(self, name: str, parent_type_name: str) -> bool:
+        key = (name, parent_type_name)
+        try:
+            return self._spreadable[key]
+        except KeyError:
+            pass
+
+        type_name = self._fragments[name].type_condition.name.value
+        spreadable = not self._schema.has_type(type_name) or bool(
+            self._validator.get_possible_types(type_name)
+            & self._validator.get_possible_types(parent_type_name)
+        )
+        self._spreadable[key] = spreadable
+        return spreadable
+
+    def _validate_directives(
+        self, directives: Optional[List["DirectiveNode"]]
+    ) -> None:
+        for directive in directives or []:
+            name = directive.name.value
+            try:
+                directive_definition = self._schema.find_directive(name)
+            except KeyError:
+                self._errors.append(
+                    UnknownDirectiveDefinition(
+                        "Unknown directive < @%s >." % name,
+                        locations=[_to_location(directive)],
+                    )
+                )
+                continue
+
+            self._validate_arguments(
+                directive.arguments,
+                directive_definition.arguments,
+                lambda argument_name, directive=directive: (
+                    UndefinedDirectiveArgument(
+                        "Undefined argument < %s > on directive < @%s >."
+                        % (argument_name, directive.name.value),
+                        locations=[_to_location(directive)],
+                    )
+                ),
+                lambda argument_name, directive=directive: (
+                    MissingRequiredArgument(
+                        "Missing required < %s > argument on < @%s > "
+                        "directive." % (argument_name, directive.name.value),
+                        locations=[_to_location(directive)],
+                    )
+                ),
+            )
+
+    def _validate_arguments(
+        self,
+        arguments: Optional[List["ArgumentNode"]],
+        argument_definitions: Dict[str, "GraphQLArgument"],
+        undefined_error: Callable[[str], GraphQLError],
+        missing_error: Callable[[str], GraphQLError],
+    ) -> None:
+        names = set()
+        for argument in arguments or []:
+            name = argument.name.value
+            if name not in argument_definitions:
+                self._errors.append(undefined_error(name))
+            elif name in names:
+                self._errors.append(
+                    UniqueArgumentNames(
+                        "There can be only one argument named < %s >." % name,
+                        locations=[_to_location(argument)],
+                    )
+                )
+            names.add(name)
+            self._collect_variables(argument.value)
+
+        for name, argument_definition in argument_definitions.items():
+            if argument_definition.is_required and name not in names:
+                self._errors.append(missing_error(name))
+
+    def _collect_variables(self, value: "ValueNode") -> None:
+        if isinstance(value, VariableNode):
+            self._current.variables.setdefault(value.name.value, value)
+        elif isinstance(value, ListValueNode):
+            for item in value.values:
+                self._collect_variables(item)
+        elif isinstance(value, ObjectValueNode):
+            for field in value.fields:
+                self._collect_variables(field.value)
+
+
+def validate_document(
+    schema: "GraphQLSchema", document: "DocumentNode"
+) -> List[GraphQLError]:
+    """
+    Returns the errors of a document against a schema, an empty list if it's
+    valid.
+    :param schema: the schema to validate the document against
+    :param document: the document to validate
+    :type schema: GraphQLSchema
+    :type document: DocumentNode
+    :return: the errors of the document
+    :rtype: List[GraphQLError]
+
+    :Example:
+
+    >>> from tartiflette.language.parsers.libgraphqlparser import (
+    >>>     parse_to_document
+    >>> )
+    >>> from tartiflette.language.validators import validate_document
+    >>>
+    >>>
+    >>> errors = validate_document(schema, parse_to_document("{ dogs }"))
+    """
+    return DocumentValidator(schema).validate(document)
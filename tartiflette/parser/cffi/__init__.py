@@ -1,6 +1,7 @@
 import os
 
 from functools import partial
+from time import perf_counter
 from typing import Optional, Any, Union, Callable
 
 from cffi import FFI
@@ -313,6 +314,15 @@ struct GraphQLAstVisitorCallbacks {
 
 CDEFS_LIBGRAPHQL = CDEFS_LIBGRAPHQL + _CDEF_LIBGRAPHQL_CALLBACK_STRUCTS
 
+# Types whose nodes have a name, the other ones don't need to call into C
+# to find it out
+_NAMED_TYPES = {
+    typ[0]
+    for typ in TYPES_LIBGRAPHQL
+    if typ[0] == "Name"
+    or "GraphQLAst%s_get_name(" % typ[0] in CDEFS_LIBGRAPHQL
+}
+
 
 class _ParsedData:
     def __init__(self, c_parsed: "CData", destroy_cb: "CData") -> None:
@@ -348,16 +358,15 @@ class _VisitorElement:
         self._ffi = ffi
         self._internal_element = internal_element
         self.libgraphql_type = libgraphql_type
-        self.name = None
-        try:
-            self.name = self._get_name()
-        except AttributeError:
-            pass
+        self.name = (
+            self._get_name() if libgraphql_type in _NAMED_TYPES else None
+        )
+        self._location = None
 
     def _get_name_object(self) -> "CData":
         if self._internal_element != self._ffi.NULL:
-            return self._lib.__getattr__(
-                "GraphQLAst%s_get_name" % self.libgraphql_type
+            return getattr(
+                self._lib, "GraphQLAst%s_get_name" % self.libgraphql_type
             )(self._internal_element)
         return self._ffi.NULL
 
@@ -378,17 +387,21 @@ class _VisitorElement:
         return self._get_name_string(element)
 
     def get_location(self) -> Location:
-        location = self._ffi.new("struct GraphQLAstLocation *")
-        self._lib.graphql_node_get_location(
-            self._ffi.cast("struct GraphQLAstNode *", self._internal_element),
-            location,
-        )
-        return Location(
-            location.beginLine,
-            location.beginColumn,
-            location.endLine,
-            location.endColumn,
-        )
+        if self._location is None:
+            location = self._ffi.new("struct GraphQLAstLocation *")
+            self._lib.graphql_node_get_location(
+                self._ffi.cast(
+                    "struct GraphQLAstNode *", self._internal_element
+                ),
+                location,
+            )
+            self._location = Location(
+                location.beginLine,
+                location.beginColumn,
+                location.endLine,
+                location.endColumn,
+            )
+        return self._location
 
 
 class _VisitorElementIntValue(_VisitorElement):
@@ -577,6 +590,20 @@ except OSError:
     _LIB = _FFI.dlopen("%s/libgraphqlparser.dylib" % _LIB_DIR)
 
 
+class _VisitContext:
+    """
+    State of a visit: the visitor and the elements being visited, from the
+    root to the current one, so that the element created when entering a node
+    is reused when leaving it.
+    """
+
+    __slots__ = ("visitor", "elements")
+
+    def __init__(self, visitor: Visitor) -> None:
+        self.visitor = visitor
+        self.elements = []
+
+
 class LibGraphqlParser:
     def __init__(self):
         self._ffi = _FFI
@@ -593,34 +620,32 @@ class LibGraphqlParser:
     def _create_visitor_element(
         self, libgraphql_type: str, element: "CData"
     ) -> _VisitorElement:
-        try:
-            return _LIBGRAPHQL_TYPE_TO_CLASS[libgraphql_type](
-                self._lib, self._ffi, element
-            )
-        except KeyError:
-            pass
+        element_class = _LIBGRAPHQL_TYPE_TO_CLASS.get(libgraphql_type)
+        if element_class is not None:
+            return element_class(self._lib, self._ffi, element)
         return _VisitorElement(self._lib, self._ffi, libgraphql_type, element)
 
     def _callback_enter(
         self, libgraphql_type: str, element: "CData", udata: "CData"
     ) -> int:
         context = self._ffi.from_handle(udata)
-        context.update(
-            Visitor.IN, self._create_visitor_element(libgraphql_type, element)
+        visitor_element = self._create_visitor_element(
+            libgraphql_type, element
         )
-        return context.continue_child
+        context.elements.append(visitor_element)
+        context.visitor.update(Visitor.IN, visitor_element)
+        return context.visitor.continue_child
 
     def _callback_exit(
         self, libgraphql_type: str, element: "CData", udata: "CData"
     ) -> None:
+        # pylint: disable=unused-argument
         context = self._ffi.from_handle(udata)
-        if context.continue_child:
-            context.update(
-                Visitor.OUT,
-                self._create_visitor_element(libgraphql_type, element),
-            )
+        visitor_element = context.elements.pop()
+        if context.visitor.continue_child:
+            context.visitor.update(Visitor.OUT, visitor_element)
         else:
-            context.continue_child = 1
+            context.visitor.continue_child = 1
 
     def _set_callback(self, proto: str, func: Callable, attr: str) -> None:
         c_func = self._ffi.callback(proto)(func)
@@ -677,15 +702,28 @@ class LibGraphqlParser:
         self,
         query: Union[str, bytes],
         visitor: Optional["TartifletteVisitor"] = None,
+        trace: Optional["Trace"] = None,
     ) -> None:
         if not visitor:
             visitor = self._default_visitor_cls()
 
+        if trace is not None:
+            parsing_start_time = perf_counter()
+
         with self._parse(query) as parsed:
+            if trace is not None:
+                validation_start_time = perf_counter()
+                trace.on_parsing(parsing_start_time, validation_start_time)
+
             self._lib.graphql_node_visit(
-                parsed, self._lib_callbacks, self._ffi.new_handle(visitor)
+                parsed,
+                self._lib_callbacks,
+                self._ffi.new_handle(_VisitContext(visitor)),
             )
 
+            if trace is not None:
+                trace.on_validation(validation_start_time, perf_counter())
+
     def parse_and_jsonify(self, query: Union[str, bytes]) -> bytes:
         with self._parse(query) as parsed:
             return self._ffi.string(self._lib.graphql_ast_to_json(parsed))
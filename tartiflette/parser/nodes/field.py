@@ -1,19 +1,38 @@
 import asyncio
 
+from copy import copy
 from functools import partial
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
+from inspect import isawaitable
+from time import perf_counter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from tartiflette.executors.types import ExecutionContext, Info
+from tartiflette.executors.types import ExecutionContext, FieldResult, Info
 from tartiflette.schema import GraphQLSchema
 from tartiflette.types.exceptions.tartiflette import (
     GraphQLError,
     MultipleException,
     SkipExecution,
 )
-from tartiflette.types.helpers import get_typename
+from tartiflette.types.helpers import reduce_type
 from tartiflette.types.location import Location
 from tartiflette.utils.arguments import coerce_arguments
 from tartiflette.utils.errors import is_coercible_exception
+from tartiflette.utils.variables import (
+    bind_arguments,
+    bind_directives,
+    bind_variables,
+    has_variables,
+)
 
 from .node import Node
 
@@ -37,11 +56,14 @@ class NodeField(Node):
         self.field_executor = field_executor
         self.arguments: Dict[str, Any] = {}
         self.type_condition = type_condition
-        self.marshalled: Dict[str, Any] = {}
         self.alias = alias or self.name
         self.subscribe = subscribe
-        self.is_execution_stopped = False
         self.execution_directives = []
+        # Computed by `freeze` once the query is planned
+        self._has_variables = None
+        self._result_type = None
+        self._children_by_typename = None
+        self._incremental_directives = None
 
     @property
     def cant_be_null(self) -> bool:
@@ -55,23 +77,210 @@ class NodeField(Node):
     def shall_produce_list(self) -> bool:
         return self.field_executor.shall_produce_list
 
+    @property
+    def is_batch(self) -> bool:
+        return self.field_executor.is_batch
+
     def add_directive(
         self, directive: Dict[str, Union["Directive", Dict[str, Any]]]
     ):
         self.execution_directives.append(directive)
 
-    def bubble_error(self) -> None:
-        if self.cant_be_null is False:
-            # mean i can be null
-            if self.parent and self.parent.marshalled is not None:
-                self.parent.marshalled[self.alias] = None
-            else:
-                self.marshalled = None
-        else:
-            if self.parent:
-                self.parent.bubble_error()
-            else:
-                self.marshalled = None
+    def clone(
+        self,
+        parent: Optional["NodeField"],
+        path: List[str],
+        execution_directives: Optional[List[Dict[str, Any]]] = None,
+    ) -> "NodeField":
+        """
+        Returns a copy of this field & of its children, attached to `parent`
+        at `path`. Arguments & directives are shared with the copied nodes.
+        The copy isn't frozen.
+        :param parent: the parent of the copy
+        :param path: the path of the copy
+        :param execution_directives: overrides the directives of the copy
+        :return: the copy of this field
+        """
+        node = copy(self)
+        node.path = path
+        node.parent = parent
+        # pylint: disable=protected-access
+        node._has_variables = None
+        node._result_type = None
+        node._children_by_typename = None
+        node._incremental_directives = None
+        if execution_directives is not None:
+            node.execution_directives = execution_directives
+
+        depth = len(self.path)
+        node.children = [
+            child.clone(node, path + child.path[depth:])
+            for child in self.children
+        ]
+        return node
+
+    def freeze(self) -> None:
+        """
+        Computes what the execution of this field & of its children depends
+        on, once the query is planned, so that the plan isn't modified while
+        it's executed (possibly by concurrent requests).
+        """
+        self._has_variables = any(
+            has_variables(argument) for argument in self.arguments.values()
+        ) or any(
+            has_variables(directive["args"])
+            for directive in self.execution_directives
+        )
+
+        parent_directives = (
+            self.parent.execution_directives if self.parent else []
+        )
+        self._incremental_directives = {
+            directive["incremental"]: directive
+            for directive in self.execution_directives
+            if directive.get("incremental")
+            and not any(
+                directive is parent_directive
+                for parent_directive in parent_directives
+            )
+        }
+
+        typenames = set()
+        for child in self.children:
+            if child.type_condition:
+                typenames.add(child.type_condition)
+                typenames.update(
+                    self.schema.get_possible_types(child.type_condition)
+                )
+
+        self._children_by_typename = (
+            {typename: self._get_children(typename) for typename in typenames},
+            [child for child in self.children if not child.type_condition],
+        )
+
+        self._result_type = (
+            self.schema.find_type(
+                reduce_type(self.field_executor.schema_field.gql_type)
+            )
+            if typenames
+            else None
+        )
+
+        for child in self.children:
+            child.freeze()
+
+    @property
+    def has_variables(self) -> bool:
+        return self._has_variables
+
+    def _bind_variables(
+        self, execution_ctx: ExecutionContext
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        if not self.has_variables:
+            return self.arguments, self.execution_directives
+
+        return (
+            bind_arguments(self.arguments, execution_ctx.variables),
+            bind_directives(
+                self.execution_directives, execution_ctx.variables
+            ),
+        )
+
+    def _get_incremental_directives(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the `@defer` & `@stream` directives of this field, by name.
+        The directives of an inline fragment are also added to the fields
+        nested within it, only the outermost ones release their subtree.
+        """
+        return self._incremental_directives
+
+    def _get_children(self, raw_typename: str) -> List["NodeField"]:
+        return [
+            child
+            for child in self.children
+            if not child.type_condition
+            or child.type_condition == raw_typename
+            or raw_typename
+            in self.schema.get_possible_types(child.type_condition)
+        ]
+
+    def get_children_by_typename(
+        self
+    ) -> Tuple[Dict[str, List["NodeField"]], List["NodeField"]]:
+        """
+        Returns the children grouped by the object types they're executed
+        for: the children whose type condition is an abstract type are
+        executed for each of its possible types. The children without type
+        condition are executed for any other type.
+        :return: the children to execute by object type name, and the
+        children to execute for the other types
+        """
+        return self._children_by_typename
+
+    def _get_typename_children(
+        self, raw_typename: Optional[str]
+    ) -> List["NodeField"]:
+        children_by_typename, children = self.get_children_by_typename()
+        return children_by_typename.get(raw_typename, children)
+
+    def _resolve_typename(
+        self,
+        result: Optional[Any],
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+    ) -> Optional[str]:
+        """
+        Returns the name of the object type of a value of this field (the
+        type of the field itself unless it's an abstract type), or None if
+        the children of the field don't depend on it, i.e none of them has a
+        type condition.
+        """
+        if result is None or self._result_type is None:
+            return None
+
+        if self._result_type.type_resolver is None:
+            return self._result_type.resolve_type(result)
+        return self._result_type.type_resolver(
+            result, request_ctx, self._get_info(execution_ctx)
+        )
+
+    def get_children(
+        self,
+        result: Optional[Any],
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+    ) -> List["NodeField"]:
+        """
+        Returns the children fields to execute for a value of this field (an
+        item of its value for a list field).
+        """
+        return self._get_typename_children(
+            self._resolve_typename(result, execution_ctx, request_ctx)
+        )
+
+    def iter_children(
+        self,
+        result: Optional[Any],
+        coerced: Optional[Any],
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+    ) -> Iterator[Tuple["NodeField", Any, Any]]:
+        """
+        Yields the children fields to execute for the result of this field,
+        along with their parent result & the container to marshall them into.
+        """
+        if self.shall_produce_list:
+            # TODO Better manage of None values here. (Should be transformed by coerce)
+            if isinstance(result, list) and isinstance(coerced, list):
+                for index, raw in enumerate(result):
+                    for child in self.get_children(
+                        raw, execution_ctx, request_ctx
+                    ):
+                        yield child, raw, coerced[index]
+            return
+
+        for child in self.get_children(result, execution_ctx, request_ctx):
+            yield child, result, coerced
 
     def _get_coroutz_from_child(
         self,
@@ -80,18 +289,20 @@ class NodeField(Node):
         result: Optional[Any],
         coerced: Optional[Any],
         raw_typename: str,
-    ) -> List[Coroutine]:
-        return [
-            child(
+        field_result: Optional[FieldResult] = None,
+    ) -> List[Awaitable]:
+        coroutz = []
+        for child in self._get_typename_children(raw_typename):
+            awaitable = child.execute_inline(
                 execution_ctx,
                 request_ctx,
                 parent_result=result,
                 parent_marshalled=coerced,
+                parent_field_result=field_result,
             )
-            for child in self.children
-            if (child.type_condition and child.type_condition == raw_typename)
-            or not child.type_condition
-        ]
+            if awaitable is not None:
+                coroutz.append(awaitable)
+        return coroutz
 
     async def _execute_children(
         self,
@@ -99,27 +310,51 @@ class NodeField(Node):
         request_ctx: Optional[Dict[str, Any]],
         result: Optional[Any],
         coerced: Optional[Any],
+        field_result: Optional[FieldResult] = None,
     ) -> None:
         coroutz = []
         if self.shall_produce_list:
-            # TODO Better manage of None values here. (Should be transformed by coerce)
-            if isinstance(result, list) and isinstance(coerced, list):
-                for index, raw in enumerate(result):
-                    raw_typename = get_typename(raw)
-                    coroutz = coroutz + self._get_coroutz_from_child(
-                        execution_ctx,
-                        request_ctx,
-                        raw,
-                        coerced[index],
-                        raw_typename,
+            # Children with a batch resolver are resolved once for every
+            # item of the list
+            batches = {}
+            for child, raw, coerced_item in self.iter_children(
+                result, coerced, execution_ctx, request_ctx
+            ):
+                if child.is_batch:
+                    batches.setdefault(child, []).append(
+                        (raw, coerced_item, field_result)
                     )
+                    continue
+
+                awaitable = child.execute_inline(
+                    execution_ctx,
+                    request_ctx,
+                    parent_result=raw,
+                    parent_marshalled=coerced_item,
+                    parent_field_result=field_result,
+                )
+                if awaitable is not None:
+                    coroutz.append(awaitable)
+
+            coroutz.extend(
+                child.execute_batch(execution_ctx, request_ctx, parents)
+                for child, parents in batches.items()
+            )
         else:
-            raw_typename = get_typename(result)
+            raw_typename = self._resolve_typename(
+                result, execution_ctx, request_ctx
+            )
             coroutz = self._get_coroutz_from_child(
-                execution_ctx, request_ctx, result, coerced, raw_typename
+                execution_ctx,
+                request_ctx,
+                result,
+                coerced,
+                raw_typename,
+                field_result,
             )
 
-        await asyncio.gather(*coroutz, return_exceptions=False)
+        if coroutz:
+            await asyncio.gather(*coroutz, return_exceptions=False)
 
     async def create_source_event_stream(
         self,
@@ -133,20 +368,15 @@ class NodeField(Node):
                 "provide a source event stream with < @Subscription >."
             )
 
-        info = Info(
-            query_field=self,
-            schema_field=self.field_executor.schema_field,
-            schema=self.schema,
-            path=self.path,
-            location=self.location,
-            execution_ctx=execution_ctx,
-        )
+        info = self._get_info(execution_ctx)
+
+        arguments, _ = self._bind_variables(execution_ctx)
 
         return self.subscribe(
             parent_result,
             await coerce_arguments(
                 self.field_executor.schema_field.arguments,
-                self.arguments,
+                arguments,
                 request_ctx,
                 info,
             ),
@@ -154,53 +384,410 @@ class NodeField(Node):
             info,
         )
 
-    async def __call__(
+    def _get_info(self, execution_ctx: ExecutionContext) -> Info:
+        return Info(
+            query_field=self,
+            schema_field=self.field_executor.schema_field,
+            schema=self.schema,
+            path=self.path,
+            location=self.location,
+            execution_ctx=execution_ctx,
+        )
+
+    def _set_result(
+        self,
+        execution_ctx: ExecutionContext,
+        field_result: FieldResult,
+        raw: Any,
+        coerced: Any,
+    ) -> Tuple[FieldResult, Any, Any]:
+        field_result.set_marshalled(coerced)
+
+        if isinstance(raw, Exception):
+            if self.cant_be_null and field_result.parent is not None:
+                field_result.parent.bubble_error()
+
+            _add_errors_to_execution_context(
+                execution_ctx, raw, self.path, self.location
+            )
+
+        return field_result, raw, coerced
+
+    async def _set_awaited_result(
+        self,
+        execution_ctx: ExecutionContext,
+        field_result: FieldResult,
+        info: Info,
+        start_time: Optional[float],
+        awaitable: Awaitable,
+    ) -> Tuple[FieldResult, Any, Any]:
+        try:
+            raw, coerced = await awaitable
+        except SkipExecution:
+            field_result.is_execution_stopped = True
+            return field_result, None, None
+
+        if start_time is not None:
+            execution_ctx.trace.on_field(
+                info, field_result, start_time, perf_counter()
+            )
+
+        return self._set_result(execution_ctx, field_result, raw, coerced)
+
+    def resolve_inline(
         self,
         execution_ctx: ExecutionContext,
         request_ctx: Optional[Dict[str, Any]],
         parent_result: Optional[Any] = None,
         parent_marshalled: Optional[Any] = None,
-    ) -> None:
+        parent_field_result: Optional[FieldResult] = None,
+    ) -> Optional[Union[Tuple[FieldResult, Any, Any], Awaitable]]:
+        """
+        Resolves & marshalls this field without awaiting anything, when its
+        resolver is called inline and its output coerced synchronously.
+        :return: the FieldResult of the field with its raw & coerced
+        results, an awaitable of them if the resolver returned an awaitable,
+        or None if the field can't be resolved inline
+        """
+        if not self.field_executor.is_inline:
+            return None
+
+        arguments, execution_directives = self._bind_variables(execution_ctx)
+        info = self._get_info(execution_ctx)
+
+        start_time = None
+        if execution_ctx.trace is not None:
+            start_time = perf_counter()
+
+        field_result = FieldResult(
+            self, parent=parent_field_result, container=parent_marshalled
+        )
+
+        try:
+            resolved = self.field_executor.resolve_inline(
+                parent_result,
+                arguments,
+                request_ctx,
+                info,
+                execution_directives,
+            )
+        except SkipExecution:
+            field_result.is_execution_stopped = True
+            return field_result, None, None
+
+        if resolved is None:
+            return None
+
+        if isawaitable(resolved):
+            return self._set_awaited_result(
+                execution_ctx, field_result, info, start_time, resolved
+            )
+
+        if start_time is not None:
+            execution_ctx.trace.on_field(
+                info, field_result, start_time, perf_counter()
+            )
+
+        return self._set_result(execution_ctx, field_result, *resolved)
+
+    async def resolve(
+        self,
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+        parent_result: Optional[Any] = None,
+        parent_marshalled: Optional[Any] = None,
+        parent_field_result: Optional[FieldResult] = None,
+    ) -> Tuple[FieldResult, Any, Any]:
+        """
+        Resolves & marshalls this field without executing its children.
+        :return: the FieldResult of the field with its raw & coerced results
+        """
+        resolved = self.resolve_inline(
+            execution_ctx,
+            request_ctx,
+            parent_result=parent_result,
+            parent_marshalled=parent_marshalled,
+            parent_field_result=parent_field_result,
+        )
+        if resolved is not None:
+            return await resolved if isawaitable(resolved) else resolved
+
+        field_result = FieldResult(
+            self, parent=parent_field_result, container=parent_marshalled
+        )
+        arguments, execution_directives = self._bind_variables(execution_ctx)
+        info = self._get_info(execution_ctx)
+
+        trace = execution_ctx.trace
+        if trace is not None:
+            start_time = perf_counter()
+
         try:
             raw, coerced = await self.field_executor(
                 parent_result,
-                self.arguments,
+                arguments,
+                request_ctx,
+                info,
+                execution_directives=execution_directives,
+            )
+        except SkipExecution:
+            # field_executor asked execution to be stopped for this branch
+            field_result.is_execution_stopped = True
+            return field_result, None, None
+
+        if trace is not None:
+            trace.on_field(info, field_result, start_time, perf_counter())
+
+        return self._set_result(execution_ctx, field_result, raw, coerced)
+
+    async def resolve_batch(
+        self,
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+        parents: List[Tuple[Any, Any, Optional[FieldResult]]],
+    ) -> List[Tuple[FieldResult, Any, Any]]:
+        """
+        Resolves & marshalls this field for several parents at once, with a
+        single call of its batch resolver.
+        :param parents: (parent_result, parent_marshalled,
+        parent_field_result) tuples
+        :return: the FieldResult of the field with its raw & coerced results
+        for each parent
+        """
+        field_results = [
+            FieldResult(self, parent=parent_field_result, container=container)
+            for _, container, parent_field_result in parents
+        ]
+        arguments, execution_directives = self._bind_variables(execution_ctx)
+        info = self._get_info(execution_ctx)
+
+        trace = execution_ctx.trace
+        if trace is not None:
+            start_time = perf_counter()
+
+        try:
+            results = await self.field_executor.batch_call(
+                [parent_result for parent_result, _, _ in parents],
+                arguments,
                 request_ctx,
-                Info(
-                    query_field=self,
-                    schema_field=self.field_executor.schema_field,
-                    schema=self.schema,
-                    path=self.path,
-                    location=self.location,
-                    execution_ctx=execution_ctx,
-                ),
-                execution_directives=self.execution_directives,
+                info,
+                execution_directives=execution_directives,
             )
         except SkipExecution:
-            self.is_execution_stopped = True
-            return  # field_executor asked execution to be stopped for this branch
+            for field_result in field_results:
+                field_result.is_execution_stopped = True
+            return [
+                (field_result, None, None) for field_result in field_results
+            ]
 
-        if parent_marshalled is not None:
-            parent_marshalled[self.alias] = coerced
-        else:
-            self.marshalled = coerced
+        if trace is not None:
+            end_time = perf_counter()
+            for field_result in field_results:
+                trace.on_field(info, field_result, start_time, end_time)
 
-        if isinstance(raw, Exception):
-            if (
-                (self.cant_be_null or self.contains_not_null)
-                and self.parent
-                and self.cant_be_null
-            ):
-                self.parent.bubble_error()
+        return [
+            self._set_result(execution_ctx, field_result, raw, coerced)
+            for field_result, (raw, coerced) in zip(field_results, results)
+        ]
 
-            _add_errors_to_execution_context(
-                execution_ctx, raw, self.path, self.location
+    async def execute_batch(
+        self,
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+        parents: List[Tuple[Any, Any, Optional[FieldResult]]],
+    ) -> List[FieldResult]:
+        resolved = await self.resolve_batch(
+            execution_ctx, request_ctx, parents
+        )
+
+        if self.children:
+            await asyncio.gather(
+                *[
+                    self._execute_children(
+                        execution_ctx,
+                        request_ctx,
+                        result=raw,
+                        coerced=coerced,
+                        field_result=field_result,
+                    )
+                    for field_result, raw, coerced in resolved
+                    if raw is not None and not isinstance(raw, Exception)
+                ]
+            )
+
+        return [field_result for field_result, _, _ in resolved]
+
+    def _get_incremental_args(
+        self, name: str, execution_ctx: ExecutionContext
+    ) -> Optional[Dict[str, Any]]:
+        if execution_ctx.incremental is None:
+            return None
+
+        try:
+            directive = self._get_incremental_directives()[name]
+        except KeyError:
+            return None
+
+        args = bind_variables(directive["args"], execution_ctx.variables)
+        return args if args.get("if", True) else None
+
+    async def execute_item(
+        self,
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+        raw: Any,
+        coerced: Any,
+        parent_field_result: Optional[FieldResult] = None,
+    ) -> None:
+        """
+        Executes the children of this list field for one of its items.
+        :param raw: the result of the item
+        :param coerced: the coerced item
+        :param parent_field_result: the FieldResult the errors of the
+        children bubble up to
+        """
+        if not self.children or raw is None or isinstance(raw, Exception):
+            return
+
+        await asyncio.gather(
+            *self._get_coroutz_from_child(
+                execution_ctx,
+                request_ctx,
+                raw,
+                coerced,
+                self._resolve_typename(raw, execution_ctx, request_ctx),
+                parent_field_result,
             )
-        elif self.children and raw is not None:
+        )
+
+    async def execute(
+        self,
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+        parent_result: Optional[Any] = None,
+        parent_marshalled: Optional[Any] = None,
+        parent_field_result: Optional[FieldResult] = None,
+    ) -> FieldResult:
+        """
+        Resolves & marshalls this field, then executes its children. The
+        items of a list field marked with `@stream` past its `initialCount`
+        are released.
+        :return: the FieldResult of the field
+        """
+        field_result, raw, coerced = await self.resolve(
+            execution_ctx,
+            request_ctx,
+            parent_result=parent_result,
+            parent_marshalled=parent_marshalled,
+            parent_field_result=parent_field_result,
+        )
+
+        stream_args = self._get_incremental_args("stream", execution_ctx)
+        if (
+            stream_args is not None
+            and isinstance(raw, list)
+            and isinstance(coerced, list)
+        ):
+            initial_count = max(stream_args.get("initialCount") or 0, 0)
+            if len(coerced) > initial_count:
+                field_result.set_marshalled(coerced[:initial_count])
+                execution_ctx.incremental.stream(
+                    self,
+                    stream_args.get("label"),
+                    execution_ctx,
+                    request_ctx,
+                    field_result,
+                    raw[initial_count:],
+                    coerced[initial_count:],
+                )
+                raw, coerced = raw[:initial_count], field_result.marshalled
+
+        if (
+            self.children
+            and raw is not None
+            and not isinstance(raw, Exception)
+        ):
             await self._execute_children(
-                execution_ctx, request_ctx, result=raw, coerced=coerced
+                execution_ctx,
+                request_ctx,
+                result=raw,
+                coerced=coerced,
+                field_result=field_result,
             )
 
+        return field_result
+
+    def execute_inline(
+        self,
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+        parent_result: Optional[Any] = None,
+        parent_marshalled: Optional[Any] = None,
+        parent_field_result: Optional[FieldResult] = None,
+    ) -> Optional[Awaitable]:
+        """
+        Executes this field right away when it's a leaf which can be resolved
+        inline, so that no coroutine is created for it.
+        :return: None if the field has been executed, else an awaitable
+        executing it
+        """
+        if not self.children and (
+            execution_ctx.incremental is None
+            or not self._get_incremental_directives()
+        ):
+            resolved = self.resolve_inline(
+                execution_ctx,
+                request_ctx,
+                parent_result=parent_result,
+                parent_marshalled=parent_marshalled,
+                parent_field_result=parent_field_result,
+            )
+            if resolved is not None:
+                return resolved if isawaitable(resolved) else None
+
+        return self(
+            execution_ctx,
+            request_ctx,
+            parent_result=parent_result,
+            parent_marshalled=parent_marshalled,
+            parent_field_result=parent_field_result,
+        )
+
+    async def __call__(
+        self,
+        execution_ctx: ExecutionContext,
+        request_ctx: Optional[Dict[str, Any]],
+        parent_result: Optional[Any] = None,
+        parent_marshalled: Optional[Any] = None,
+        parent_field_result: Optional[FieldResult] = None,
+    ) -> FieldResult:
+        defer_args = self._get_incremental_args("defer", execution_ctx)
+        if defer_args is None:
+            return await self.execute(
+                execution_ctx,
+                request_ctx,
+                parent_result=parent_result,
+                parent_marshalled=parent_marshalled,
+                parent_field_result=parent_field_result,
+            )
+
+        # The field is left out of the current payload
+        execution_ctx.incremental.defer(
+            self,
+            self._get_incremental_directives()["defer"],
+            defer_args.get("label"),
+            execution_ctx,
+            request_ctx,
+            parent_result,
+            parent_marshalled,
+            parent_field_result,
+        )
+        field_result = FieldResult(
+            self, parent=parent_field_result, container=parent_marshalled
+        )
+        field_result.is_execution_stopped = True
+        return field_result
+
 
 def _add_errors_to_execution_context(
     execution_context: ExecutionContext,
@@ -1,3 +1,5 @@
+from typing import Callable
+
 from .definition import NodeDefinition
 
 
@@ -7,7 +9,23 @@ class NodeOperationDefinition(NodeDefinition):
     ) -> None:
         super().__init__(path, "OperationDefinition", location, name)
         self.type = operation_type
+        self.variable_definitions = []
+        self.variable_usages = set()
+        self.required_variables = []
 
     @property
     def allow_parallelization(self) -> bool:
         return self.type != "Mutation"
+
+    def add_variable_definition(
+        self, variable_definition: "NodeVariableDefinition"
+    ) -> None:
+        self.variable_definitions.append(variable_definition)
+
+    def add_variable_usage(self, name: str) -> None:
+        self.variable_usages.add(name)
+
+    def add_required_variable(
+        self, name: str, error_factory: Callable[[], Exception]
+    ) -> None:
+        self.required_variables.append((name, error_factory))
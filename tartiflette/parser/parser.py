@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from tartiflette.parser.cffi import LibGraphqlParser
 from tartiflette.parser.visitor import TartifletteVisitor
@@ -10,12 +10,12 @@ class TartifletteRequestParser(LibGraphqlParser):
         self,
         schema: GraphQLSchema,
         query: str,
-        variables: Optional[Dict[str, Any]] = None,
+        trace: Optional["Trace"] = None,
     ) -> Tuple[
         Optional[Dict[str, List["NodeField"]]], Optional[List[Exception]]
     ]:
-        visitor = TartifletteVisitor(schema, variables)
-        self.parse_and_visit(query, visitor)
+        visitor = TartifletteVisitor(schema)
+        self.parse_and_visit(query, visitor, trace=trace)
         if visitor.exceptions:
             return None, visitor.exceptions  # pylint: disable=raising-bad-type
         return visitor.operations, None
@@ -1,5 +1,5 @@
 from functools import partial
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from tartiflette.parser.cffi import (
     Visitor,
@@ -30,7 +30,7 @@ from tartiflette.parser.visitor.visitor_context import InternalVisitorContext
 from tartiflette.schema import GraphQLSchema
 from tartiflette.types.exceptions.tartiflette import (
     AlreadyDefined,
-    InvalidType,
+    FragmentCycle,
     MissingRequiredArgument,
     MultipleRootNodeOnSubscriptionOperation,
     NotALeafType,
@@ -43,11 +43,11 @@ from tartiflette.types.exceptions.tartiflette import (
     UniqueArgumentNames,
     UnknownSchemaFieldResolver,
     UnknownTypeDefinition,
-    UnknownVariableException,
     UnusedFragment,
 )
 from tartiflette.types.helpers import reduce_type, transform_directive
 from tartiflette.utils.arguments import UNDEFINED_VALUE
+from tartiflette.utils.variables import VariableValue
 
 
 class FragmentData:
@@ -60,12 +60,61 @@ class FragmentData:
         self.directives.append(directive)
 
 
+class FragmentPlan:
+    """
+    Fields planned by the first expansion of a fragment spread, copied for
+    the next spreads of the fragment on the same parent type instead of
+    replaying the fragment.
+    """
+
+    def __init__(
+        self,
+        nodes: List[NodeField],
+        depth: int,
+        directives: List[Dict[str, Any]],
+        required_variables: List[Any],
+    ) -> None:
+        self.nodes = nodes
+        self.depth = depth
+        self.required_variables = required_variables
+        # Where the directives of the spread have been added to each field
+        self.directive_indexes = [
+            [
+                index
+                for index, directive in enumerate(node.execution_directives)
+                if any(directive is spread for spread in directives)
+            ]
+            for node in nodes
+        ]
+
+    def clone(
+        self,
+        parent: Optional[NodeField],
+        field_path: List[str],
+        directives: List[Dict[str, Any]],
+    ) -> List[NodeField]:
+        nodes = []
+        for node, indexes in zip(self.nodes, self.directive_indexes):
+            execution_directives = None
+            if indexes:
+                execution_directives = list(node.execution_directives)
+                for index, directive in zip(indexes, directives):
+                    execution_directives[index] = directive
+
+            nodes.append(
+                node.clone(
+                    parent,
+                    field_path + node.path[self.depth :],
+                    execution_directives,
+                )
+            )
+        return nodes
+
+
 class TartifletteVisitor(Visitor):
     # pylint: disable=too-many-instance-attributes
 
-    def __init__(
-        self, schema: GraphQLSchema, variables: Optional[Dict[str, Any]] = None
-    ):
+    def __init__(self, schema: GraphQLSchema):
         super().__init__()
         self._events = [
             {
@@ -112,14 +161,17 @@ class TartifletteVisitor(Visitor):
         self.operations = {}
         self._named_operations = {}
         self._anonymous_operations = []
-        self._vars = variables or {}
         self._fragments = {}
+        self._fragment_plans = {}
         self._used_fragments = set()
         self.schema: GraphQLSchema = schema
         self.exceptions: List[Exception] = []
         self._to_call_later = []
         self._internal_ctx = InternalVisitorContext()
         self._in_fragment_spread_context = False
+        self._in_fragment_plan_context = False
+        # Names of the fragments being expanded, outermost first
+        self._expanding_fragments: Tuple[str, ...] = ()
         self._error_path = None
 
     def _add_exception(self, exception: Exception) -> None:
@@ -238,13 +290,17 @@ class TartifletteVisitor(Visitor):
                 continue
 
             value = self._internal_ctx.directive.arguments.get(argument.name)
+            error_factory = partial(
+                MissingRequiredArgument,
+                "Missing required < %s > argument on < @%s > directive."
+                % (argument.name, directive.name),
+                locations=[element.get_location()],
+            )
             if value is None:
-                self._add_exception(
-                    MissingRequiredArgument(
-                        "Missing required < %s > argument on < @%s > directive."
-                        % (argument.name, directive.name),
-                        locations=[element.get_location()],
-                    )
+                self._add_exception(error_factory())
+            elif isinstance(value.value, VariableValue):
+                self._internal_ctx.operation.add_required_variable(
+                    value.value.name, error_factory
                 )
 
         destination = (
@@ -343,19 +399,17 @@ class TartifletteVisitor(Visitor):
             self._internal_ctx.node.var_name = element.name
             return
 
-        var_name = element.name
-        try:
-            if self._internal_ctx.current_object_value is not None:
-                self._internal_ctx.current_object_value.set_value(
-                    self._vars[var_name]
-                )
-                return
+        # Variables are bound at execution time, so that the resulting plan
+        # doesn't depend on the variables of the request and can be reused.
+        self._internal_ctx.operation.add_variable_usage(element.name)
+        value = VariableValue(element.name)
 
-            self._internal_ctx.argument.value = self._vars[var_name]
-            self._add_argument_to_parent()
+        if self._internal_ctx.current_object_value is not None:
+            self._internal_ctx.current_object_value.set_value(value)
+            return
 
-        except KeyError:
-            self._add_exception(UnknownVariableException(var_name))
+        self._internal_ctx.argument.value = value
+        self._add_argument_to_parent()
 
     def _on_field_in(
         self,
@@ -369,22 +423,21 @@ class TartifletteVisitor(Visitor):
         type_cond = self._internal_ctx.compute_type_cond(type_cond_depth)
         parent_type = self._get_parent_type(self._internal_ctx.node)
 
-        try:
-            field = self.schema.get_field_by_name(
-                str(parent_type) + "." + element.name
-            )
-        except UnknownSchemaFieldResolver as e:
-            try:
-                if type_cond is None:
-                    raise
-                field = self.schema.get_field_by_name(
-                    str(type_cond) + "." + element.name
+        field = self.schema.find_field(str(parent_type), element.name)
+        if field is None and type_cond is not None:
+            parent_type = type_cond
+            field = self.schema.find_field(type_cond, element.name)
+
+        if field is None:
+            self._add_exception(
+                UnknownSchemaFieldResolver(
+                    "field `%s.%s` was not found in GraphQL schema."
+                    % (parent_type, element.name),
+                    path=self._internal_ctx.field_path[:] + [element.name],
+                    locations=[element.get_location()],
                 )
-            except UnknownSchemaFieldResolver as e:
-                e.path = self._internal_ctx.field_path[:] + [element.name]
-                e.locations = [element.get_location()]
-                self._add_exception(e)
-                return
+            )
+            return
 
         if field.is_leaf and element.get_selection_set_size() > 0:
             self._add_exception(
@@ -446,13 +499,17 @@ class TartifletteVisitor(Visitor):
                 continue
 
             value = self._internal_ctx.node.arguments.get(argument.name)
+            error_factory = partial(
+                MissingRequiredArgument,
+                "Missing required < %s > argument on < %s > field."
+                % (argument.name, self._internal_ctx.node.name),
+                locations=[self._internal_ctx.node.location],
+            )
             if value is None:
-                self._add_exception(
-                    MissingRequiredArgument(
-                        "Missing required < %s > argument on < %s > field."
-                        % (argument.name, self._internal_ctx.node.name),
-                        locations=[self._internal_ctx.node.location],
-                    )
+                self._add_exception(error_factory())
+            elif isinstance(value.value, VariableValue):
+                self._internal_ctx.operation.add_required_variable(
+                    value.value.name, error_factory
                 )
         self._internal_ctx.move_out_field()
 
@@ -465,65 +522,10 @@ class TartifletteVisitor(Visitor):
         node.set_parent(self._internal_ctx.node)
         self._internal_ctx.node = node
 
-    def _validate_type(
-        self, varname: str, a_value: Any, a_type: Any, is_nullable: bool
-    ) -> None:
-        if is_nullable and a_value is None:
-            return
-
-        try:
-            if not isinstance(a_value, a_type):
-                self._add_exception(
-                    InvalidType(
-                        "Given value for < %s > is not type < %s >"
-                        % (varname, a_type),
-                        path=self._internal_ctx.field_path[:],
-                        locations=[self._internal_ctx.node.location],
-                    )
-                )
-        except TypeError:
-            # TODO remove this, and handle the case it's an InputValue
-            # (look at registered input values and compare fields)
-            pass
-
-    def _validates_vars(self) -> None:
-        # validate given var are okay
-        name = self._internal_ctx.node.var_name
-        if name not in self._vars:
-            default_values = self._internal_ctx.node.default_value
-            if (
-                default_values is None or default_values is UNDEFINED_VALUE
-            ) and not self._internal_ctx.node.is_nullable:
-                self._add_exception(UnknownVariableException(name))
-                return
-
-            self._vars[name] = default_values
-            return
-
-        a_type = self._internal_ctx.node.var_type
-        is_nullable = self._internal_ctx.node.is_nullable
-        a_value = self._vars[name]
-
-        if self._internal_ctx.node.is_list:
-            if not isinstance(a_value, list):
-                self._add_exception(
-                    InvalidType(
-                        "Expecting List for < %s > values" % name,
-                        path=self._internal_ctx.field_path[:],
-                        locations=[self._internal_ctx.node.location],
-                    )
-                )
-                return
-
-            for val in a_value:
-                self._validate_type(name, val, a_type, is_nullable)
-            return
-
-        self._validate_type(name, a_value, a_type, is_nullable)
-        return
-
     def _on_variable_definition_out(self, *_args, **_kwargs) -> None:
-        self._validates_vars()
+        self._internal_ctx.operation.add_variable_definition(
+            self._internal_ctx.node
+        )
         # now the VariableDefinition Node is useless so kill it
         self._internal_ctx.node = self._internal_ctx.node.parent
 
@@ -580,15 +582,58 @@ class TartifletteVisitor(Visitor):
     def _on_fragment_definition_out(self, *_args, **_kwargs) -> None:
         self._internal_ctx.fragment_definition = None
 
+    def _replay_fragment(
+        self,
+        ctx: InternalVisitorContext,
+        cfd: NodeFragmentDefinition,
+        directives: [Dict[str, Any]],
+    ) -> None:
+        _ctx = self._internal_ctx
+        self._internal_ctx = ctx
+
+        depth = self._internal_ctx.depth
+        self._internal_ctx.type_condition = cfd.type_condition
+
+        in_fragment_spread_context = self._in_fragment_spread_context
+        continue_child = self.continue_child
+        error_path = self._error_path
+
+        self._in_fragment_spread_context = True
+        kwargs = {"type_cond_depth": depth}
+        for saved_callback in cfd.callbacks:
+            kwargs["directives"] = None
+            if depth == self._internal_ctx.depth:
+                kwargs["directives"] = directives
+
+            saved_callback(**kwargs)  # Simulate calling a the right place.
+
+        self._in_fragment_spread_context = in_fragment_spread_context
+        self.continue_child = continue_child
+        self._error_path = error_path
+
+        self._internal_ctx.type_condition = None
+        self._internal_ctx = _ctx
+
     def _fragment_spread(
         self,
         ctx: InternalVisitorContext,
         element: _VisitorElement,
         directives: [Dict[str, Any]],
+        expanding_fragments: Tuple[str, ...],
     ) -> None:
         _ctx = self._internal_ctx
+        _expanding_fragments = self._expanding_fragments
         self._internal_ctx = ctx
+        self._expanding_fragments = expanding_fragments
+        try:
+            self._expand_fragment_spread(element, directives)
+        finally:
+            self._internal_ctx = _ctx
+            self._expanding_fragments = _expanding_fragments
 
+    def _expand_fragment_spread(
+        self, element: _VisitorElement, directives: [Dict[str, Any]]
+    ) -> None:
         self._used_fragments.add(element.name)
         try:
             cfd = self._fragments[element.name]
@@ -601,22 +646,92 @@ class TartifletteVisitor(Visitor):
             )
             return
 
-        depth = self._internal_ctx.depth
-        self._internal_ctx.type_condition = cfd.type_condition
+        if element.name in self._expanding_fragments:
+            via = ", ".join(
+                "< %s >" % name
+                for name in self._expanding_fragments[
+                    self._expanding_fragments.index(element.name) + 1 :
+                ]
+            )
+            self._add_exception(
+                FragmentCycle(
+                    "Cannot spread fragment < %s > within itself%s."
+                    % (element.name, " via %s" % via if via else ""),
+                    locations=[element.get_location()],
+                )
+            )
+            return
 
-        self._in_fragment_spread_context = True
-        kwargs = {"type_cond_depth": depth}
-        for saved_callback in cfd.callbacks:
-            kwargs["directives"] = None
-            if depth == self._internal_ctx.depth:
-                kwargs["directives"] = directives
+        expanding_fragments = self._expanding_fragments
+        self._expanding_fragments = expanding_fragments + (element.name,)
+        try:
+            self._expand_fragment_plan(element, cfd, directives)
+        finally:
+            self._expanding_fragments = expanding_fragments
 
-            saved_callback(**kwargs)  # Simulate calling a the right place.
+    def _expand_fragment_plan(
+        self,
+        element: _VisitorElement,
+        cfd: NodeFragmentDefinition,
+        directives: [Dict[str, Any]],
+    ) -> None:
+        ctx = self._internal_ctx
 
-        self._in_fragment_spread_context = False
+        # Directives of an enclosing inline fragment are added to the fields
+        # of the fragment, those spreads can't reuse a plan.
+        plan_key = None
+        if not ctx.inline_fragment_info:
+            plan_key = (
+                element.name,
+                ctx.operation,
+                str(self._get_parent_type(ctx.node)),
+                len(directives),
+            )
 
-        self._internal_ctx.type_condition = None
-        self._internal_ctx = _ctx
+        container = (
+            ctx.node.children
+            if ctx.node
+            else self.operations[ctx.operation.name].children
+        )
+        required_variables = ctx.operation.required_variables
+
+        plan = self._fragment_plans.get(plan_key)
+        if plan is not None:
+            container.extend(plan.clone(ctx.node, ctx.field_path, directives))
+            required_variables.extend(plan.required_variables)
+            return
+
+        nb_nodes = len(container)
+        nb_exceptions = len(self.exceptions)
+        nb_required_variables = len(required_variables)
+
+        # The spreads within the fragment are expanded along with it, so
+        # that its plan is complete once it has been expanded.
+        in_fragment_plan_context = self._in_fragment_plan_context
+        self._in_fragment_plan_context = True
+        self._replay_fragment(ctx.clone(), cfd, directives)
+        self._in_fragment_plan_context = in_fragment_plan_context
+
+        if len(self.exceptions) == nb_exceptions:
+            if plan_key is not None:
+                self._fragment_plans[plan_key] = FragmentPlan(
+                    container[nb_nodes:],
+                    ctx.depth,
+                    directives,
+                    required_variables[nb_required_variables:],
+                )
+            return
+
+        if in_fragment_plan_context:
+            return
+
+        # Fragments with errors are replayed the way they've always been,
+        # nested spreads being expanded last, to report errors in the same
+        # order.
+        del container[nb_nodes:]
+        del self.exceptions[nb_exceptions:]
+        del required_variables[nb_required_variables:]
+        self._replay_fragment(ctx, cfd, directives)
 
     def _on_fragment_spread_in(self, _: _VisitorElement, *_args, **_kwargs):
         self._internal_ctx.fragment_spread = FragmentData(None, None)
@@ -624,16 +739,20 @@ class TartifletteVisitor(Visitor):
     def _on_fragment_spread_out(
         self, element: _VisitorElement, *_args, **_kwargs
     ) -> None:
-        self._to_call_later.append(
-            partial(
-                self._fragment_spread,
-                self._internal_ctx.clone(),
-                element,
-                self._internal_ctx.fragment_spread.directives,
-            )
+        fragment_spread = partial(
+            self._fragment_spread,
+            self._internal_ctx.clone(),
+            element,
+            self._internal_ctx.fragment_spread.directives,
+            self._expanding_fragments,
         )
         self._internal_ctx.fragment_spread = None
 
+        if self._in_fragment_plan_context:
+            fragment_spread()
+        else:
+            self._to_call_later.append(fragment_spread)
+
     def _on_operation_definition_in(
         self, element: _VisitorElementOperationDefinition, *_args, **_kwargs
     ) -> None:
@@ -706,6 +825,11 @@ class TartifletteVisitor(Visitor):
                     )
                 )
 
+        if not self.exceptions:
+            for operation in self.operations.values():
+                for node in operation.children:
+                    node.freeze()
+
     def _on_selection_set_in(
         self, element: _VisitorElementSelectionSet, *_args, **_kwargs
     ) -> None:
@@ -738,12 +862,9 @@ class TartifletteVisitor(Visitor):
             self._reset_error_path_and_continue_child()
 
         self._internal_ctx.move_in(element)
-        try:
-            self._events[self.IN][element.libgraphql_type](
-                element, *args, **kwargs
-            )
-        except KeyError:
-            pass
+        callback = self._events[self.IN].get(element.libgraphql_type)
+        if callback is not None:
+            callback(element, *args, **kwargs)
 
     def _out(self, element: _VisitorElement, *args, **kwargs) -> None:
         # While spreading out a fragment we execute all callbacks whether they
@@ -761,12 +882,10 @@ class TartifletteVisitor(Visitor):
                 return
             self._reset_error_path_and_continue_child()
 
+        callback = self._events[self.OUT].get(element.libgraphql_type)
         try:
-            self._events[self.OUT][element.libgraphql_type](
-                element, *args, **kwargs
-            )
-        except KeyError:
-            pass
+            if callback is not None:
+                callback(element, *args, **kwargs)
         finally:
             self._internal_ctx.move_out()
 
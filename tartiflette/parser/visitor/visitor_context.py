@@ -165,7 +165,7 @@ class InternalVisitorContext:
         )
 
     def move_out(self) -> None:
-        self._path = "/".join(self._path.split("/")[:-1])
+        self._path = self._path[: self._path.rfind("/")]
 
     def move_in_field(
         self, element: "_VisitorElement", field: "GraphQLField"
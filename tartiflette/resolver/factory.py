@@ -1,9 +1,26 @@
-from typing import Any, Callable, Dict, List, Optional, Union
-
-from tartiflette.types.exceptions.tartiflette import SkipExecution
+import asyncio
+
+from functools import partial
+from inspect import isawaitable, iscoroutinefunction
+from time import perf_counter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from tartiflette.types.exceptions.tartiflette import (
+    GraphQLError,
+    SkipExecution,
+)
 from tartiflette.types.helpers import wraps_with_directives
 from tartiflette.utils.arguments import coerce_arguments
-from tartiflette.utils.coercer import get_coercer
+from tartiflette.utils.coercer import get_coercer, get_sync_coercer
 
 
 async def _execute_introspection_directives(
@@ -37,13 +54,120 @@ def _shall_return_a_list(field_type: Union[str, "GraphQLType"]) -> bool:
     return False
 
 
+async def _await(awaitable: Awaitable) -> Any:
+    return await awaitable
+
+
+async def _schedule(
+    func: Callable[..., Awaitable], args: Tuple, info: "Info"
+) -> Any:
+    # Resolvers are called through the scheduler of the request, if any,
+    # which bounds the number of them in flight
+    scheduler = info.execution_ctx.scheduler
+    if scheduler is not None:
+        awaitable = scheduler.call(func, *args)
+    else:
+        awaitable = func(*args)
+
+    trace = info.execution_ctx.trace
+    if trace is None:
+        return await awaitable
+
+    start_time = perf_counter()
+    try:
+        return await awaitable
+    finally:
+        trace.on_resolver(info, start_time, perf_counter())
+
+
+def _call_traced(
+    func: Callable, args: Tuple, info: "Info", trace: "Trace"
+) -> Any:
+    # Resolvers which aren't coroutine functions are traced around their
+    # call, unless they return an awaitable, which is traced by `_schedule`
+    start_time = perf_counter()
+    result = None
+    try:
+        result = func(*args)
+        return result
+    finally:
+        if not isawaitable(result):
+            trace.on_resolver(info, start_time, perf_counter())
+
+
+def _ensure_coroutine_function(func: Callable) -> Callable:
+    # Directives & memoization await the function they wrap, resolvers
+    # which aren't coroutine functions are adapted to them
+    if iscoroutinefunction(func):
+        return func
+
+    async def wrapper(
+        parent_result: Optional[Any],
+        args: Dict[str, Any],
+        ctx: Optional[Dict[str, Any]],
+        info: "Info",
+    ) -> Any:
+        result = func(parent_result, args, ctx, info)
+        if isawaitable(result):
+            return await result
+        return result
+
+    return wrapper
+
+
+def _wraps_execution(
+    execution_directives: Optional[List[Dict[str, Any]]]
+) -> bool:
+    return bool(execution_directives) and any(
+        "on_field_execution" in directive["callables"]
+        for directive in execution_directives
+    )
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return (
+            dict,
+            tuple((key, _freeze(item)) for key, item in value.items()),
+        )
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    return value
+
+
+def _memoize_resolver(func: Callable) -> Callable:
+    async def memoized(
+        parent_result: Optional[Any],
+        args: Dict[str, Any],
+        ctx: Optional[Dict[str, Any]],
+        info: "Info",
+    ) -> Any:
+        key = (id(parent_result), id(info.schema_field), _freeze(args))
+        try:
+            hash(key)
+        except TypeError:
+            # Arguments which can't be compared aren't memoized
+            return await func(parent_result, args, ctx, info)
+
+        return await info.execution_ctx.memoize(
+            key, parent_result, partial(func, parent_result, args, ctx, info)
+        )
+
+    return memoized
+
+
 class _ResolverExecutor:
     def __init__(self, func: Callable, schema_field: "GraphQLField") -> None:
         self._raw_func = func
         self._directivated_func = func
         self._schema_field = schema_field
         self._coercer = get_coercer(schema_field)
+        self._sync_coercer = get_sync_coercer(schema_field)
+        self._sync_func = None
         self._shall_produce_list = _shall_return_a_list(schema_field.gql_type)
+        self._is_batch = False
+        self._cost = None
+        self._memoize = False
 
     async def _introspection(self, element: Any, ctx, info) -> Optional[Any]:
         if isinstance(element, list):
@@ -58,6 +182,122 @@ class _ResolverExecutor:
             pass
         return None
 
+    async def _coerce(
+        self, result: Any, ctx: Optional[Dict[str, Any]], info: "Info"
+    ) -> Any:
+        if self._sync_coercer is not None:
+            return self._sync_coercer(result, self._schema_field, ctx, info)
+        return await self._coercer(result, self._schema_field, ctx, info)
+
+    async def _coerce_result(
+        self, result: Any, ctx: Optional[Dict[str, Any]], info: "Info"
+    ) -> (Any, Any):
+        try:
+            if isinstance(result, Exception):
+                return result, None
+
+            if info.execution_ctx.is_introspection:
+                result = await self._introspection(result, ctx, info)
+
+            return result, await self._coerce(result, ctx, info)
+        except Exception as e:  # pylint: disable=broad-except
+            return e, None
+
+    async def _complete(
+        self, result: Awaitable, ctx: Optional[Dict[str, Any]], info: "Info"
+    ) -> (Any, Any):
+        try:
+            return await self._coerce_result(
+                await _schedule(_await, (result,), info), ctx, info
+            )
+        except SkipExecution as e:
+            raise e
+        except Exception as e:  # pylint: disable=broad-except
+            return e, None
+
+    async def _call_sync_func(
+        self,
+        parent_result: Optional[Any],
+        args: Dict[str, Any],
+        ctx: Optional[Dict[str, Any]],
+        info: "Info",
+    ) -> (Any, Any):
+        try:
+            coerced_args = {}
+            if self._schema_field.arguments:
+                coerced_args = await coerce_arguments(
+                    self._schema_field.arguments, args, ctx, info
+                )
+
+            trace = info.execution_ctx.trace
+            if trace is None:
+                result = self._sync_func(
+                    parent_result, coerced_args, ctx, info
+                )
+            else:
+                result = _call_traced(
+                    self._sync_func,
+                    (parent_result, coerced_args, ctx, info),
+                    info,
+                    trace,
+                )
+
+            if isawaitable(result):
+                result = await _schedule(_await, (result,), info)
+
+            if info.execution_ctx.is_introspection:
+                result = await self._introspection(result, ctx, info)
+
+            return result, await self._coerce(result, ctx, info)
+        except SkipExecution as e:
+            raise e
+        except Exception as e:  # pylint: disable=broad-except
+            return e, None
+
+    def resolve_inline(
+        self,
+        parent_result: Optional[Any],
+        args: Dict[str, Any],
+        ctx: Optional[Dict[str, Any]],
+        info: "Info",
+        execution_directives: Optional[List[Dict[str, Any]]],
+    ) -> Optional[Union[Tuple[Any, Any], Awaitable]]:
+        """
+        Resolves & coerces the field without awaiting anything, when its
+        resolver is called inline and its output is coerced synchronously.
+        :return: the (raw, coerced) results, an awaitable of them if the
+        resolver returned an awaitable, or None if the field can't be
+        resolved inline
+        """
+        if (
+            not self.is_inline
+            or _wraps_execution(execution_directives)
+            or info.execution_ctx.is_introspection
+        ):
+            return None
+
+        try:
+            trace = info.execution_ctx.trace
+            if trace is None:
+                result = self._sync_func(parent_result, {}, ctx, info)
+            else:
+                result = _call_traced(
+                    self._sync_func,
+                    (parent_result, {}, ctx, info),
+                    info,
+                    trace,
+                )
+            if isawaitable(result):
+                return self._complete(result, ctx, info)
+            return (
+                result,
+                self._sync_coercer(result, self._schema_field, ctx, info),
+            )
+        except SkipExecution as e:
+            raise e
+        except Exception as e:  # pylint: disable=broad-except
+            return e, None
+
     async def __call__(
         self,
         parent_result: Optional[Any],
@@ -66,6 +306,17 @@ class _ResolverExecutor:
         info: "Info",
         execution_directives: Optional[List[Dict[str, Any]]],
     ) -> (Any, Any):
+        if self._is_batch:
+            results = await self.batch_call(
+                [parent_result], args, ctx, info, execution_directives
+            )
+            return results[0]
+
+        if self._sync_func is not None and not _wraps_execution(
+            execution_directives
+        ):
+            return await self._call_sync_func(parent_result, args, ctx, info)
+
         try:
             resolver = wraps_with_directives(
                 directives_definition=execution_directives,
@@ -73,32 +324,109 @@ class _ResolverExecutor:
                 func=self._directivated_func,
             )
 
-            result = await resolver(
-                parent_result,
-                await coerce_arguments(
-                    self._schema_field.arguments, args, ctx, info
+            result = await _schedule(
+                resolver,
+                (
+                    parent_result,
+                    await coerce_arguments(
+                        self._schema_field.arguments, args, ctx, info
+                    ),
+                    ctx,
+                    info,
                 ),
-                ctx,
                 info,
             )
 
             if info.execution_ctx.is_introspection:
                 result = await self._introspection(result, ctx, info)
 
-            return (
-                result,
-                await self._coercer(result, self._schema_field, ctx, info),
-            )
+            return result, await self._coerce(result, ctx, info)
         except SkipExecution as e:
             raise e
         except Exception as e:  # pylint: disable=broad-except
             return e, None
 
-    def update_func(self, func: Callable) -> None:
+    async def batch_call(
+        self,
+        parent_results: List[Any],
+        args: Dict[str, Any],
+        ctx: Optional[Dict[str, Any]],
+        info: "Info",
+        execution_directives: Optional[List[Dict[str, Any]]],
+    ) -> List[Tuple[Any, Any]]:
+        """
+        Resolves the field for a list of parent results with a single call
+        of a batch resolver, which returns one result per parent result.
+        :return: a list of (raw, coerced) results in the parents order
+        """
+        try:
+            resolver = wraps_with_directives(
+                directives_definition=execution_directives,
+                directive_hook="on_field_execution",
+                func=self._directivated_func,
+            )
+
+            results = await _schedule(
+                resolver,
+                (
+                    parent_results,
+                    await coerce_arguments(
+                        self._schema_field.arguments, args, ctx, info
+                    ),
+                    ctx,
+                    info,
+                ),
+                info,
+            )
+
+            if not isinstance(results, list) or len(results) != len(
+                parent_results
+            ):
+                raise GraphQLError(
+                    "Batch resolver of < %s > must return a list of %d "
+                    "results." % (info.schema_field.name, len(parent_results))
+                )
+        except SkipExecution as e:
+            raise e
+        except Exception as e:  # pylint: disable=broad-except
+            return [(e, None)] * len(parent_results)
+
+        return await asyncio.gather(
+            *[self._coerce_result(result, ctx, info) for result in results]
+        )
+
+    def update_func(
+        self,
+        func: Callable,
+        is_batch: bool = False,
+        cost: Optional[int] = None,
+        memoize: bool = False,
+    ) -> None:
         self._raw_func = func
+        self._is_batch = is_batch
+        self._cost = cost
+        self._memoize = memoize
 
     def update_coercer(self) -> None:
         self._coercer = get_coercer(self._schema_field)
+        self._sync_coercer = get_sync_coercer(self._schema_field)
+
+    def _get_sync_func(self, func: Callable) -> Optional[Callable]:
+        # Resolvers which aren't coroutine functions, and the default
+        # resolver, are called inline when no directive wraps them
+        if (
+            self._is_batch
+            or self._memoize
+            or self._directivated_func is not func
+        ):
+            return None
+
+        if self._raw_func is default_resolver:
+            return _sync_default_resolver
+
+        if iscoroutinefunction(self._raw_func):
+            return None
+        return self._raw_func
 
     def bake(self, custom_default_resolver: Optional[Callable]) -> None:
         self.update_coercer()
@@ -111,16 +439,49 @@ class _ResolverExecutor:
         if self._schema_field.subscribe and self._raw_func is default_resolver:
             self._raw_func = default_subscription_resolver(self._raw_func)
 
+        func = _ensure_coroutine_function(self._raw_func)
+        if self._memoize:
+            func = _memoize_resolver(func)
+
         self._directivated_func = wraps_with_directives(
             directives_definition=self._schema_field.directives,
             directive_hook="on_field_execution",
-            func=self._raw_func,
+            func=func,
         )
+        self._sync_func = self._get_sync_func(func)
+
+    @property
+    def raw_func(self) -> Callable:
+        return self._raw_func
 
     @property
     def schema_field(self) -> "GraphQLField":
         return self._schema_field
 
+    @property
+    def is_batch(self) -> bool:
+        return self._is_batch
+
+    @property
+    def cost(self) -> Optional[int]:
+        return self._cost
+
+    @property
+    def memoize(self) -> bool:
+        return self._memoize
+
+    @property
+    def is_inline(self) -> bool:
+        """
+        Whether or not the field can be resolved & coerced without awaiting
+        anything, as long as no directive wraps its execution.
+        """
+        return (
+            self._sync_func is not None
+            and self._sync_coercer is not None
+            and not self._schema_field.arguments
+        )
+
     @property
     def shall_produce_list(self) -> bool:
         return self._shall_produce_list
@@ -156,7 +517,7 @@ def default_subscription_resolver(func: Callable):
     return func_wrapper
 
 
-async def default_resolver(
+def _sync_default_resolver(
     parent_result: Optional[Any],
     _args: Dict[str, Any],
     _ctx: Optional[Dict[str, Any]],
@@ -174,6 +535,15 @@ async def default_resolver(
     return None
 
 
+async def default_resolver(
+    parent_result: Optional[Any],
+    args: Dict[str, Any],
+    ctx: Optional[Dict[str, Any]],
+    info: "Info",
+) -> Optional[Any]:
+    return _sync_default_resolver(parent_result, args, ctx, info)
+
+
 def default_error_coercer(exception: Exception, error: dict) -> dict:
     # pylint: disable=unused-argument
     return error
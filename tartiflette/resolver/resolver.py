@@ -1,8 +1,9 @@
 from inspect import iscoroutinefunction
-from typing import Callable
+from typing import Callable, Optional
 
 from tartiflette.schema.registry import SchemaRegistry
 from tartiflette.types.exceptions.tartiflette import (
+    ImproperlyConfigured,
     MissingImplementation,
     NonAwaitableResolver,
     UnknownFieldDefinition,
@@ -25,12 +26,42 @@ class Resolver:
         async def field_resolver(parent, arguments, request_ctx, info):
             do your stuff
             return 42
+
+    With `batch=True`, the resolver is called once with the list of the
+    parent results of every object being resolved at the same time (e.g the
+    items of a list) and must return a list of results in the same order:
+
+        @Resolver("SomeObject.field", batch=True)
+        async def field_resolver(parents, arguments, request_ctx, info):
+            return [parent["value"] for parent in parents]
+
+    `cost` sets the weight of the field for the cost analysis of the
+    queries, in place of the one given by its `@cost` directive.
+
+    With `memoize=True`, the resolver is called once per request for the
+    same parent result & arguments, e.g. a field selected several times
+    through aliases or fragments: the other calls share its result.
     """
 
-    def __init__(self, name: str, schema_name: str = "default") -> None:
+    def __init__(
+        self,
+        name: str,
+        schema_name: str = "default",
+        batch: bool = False,
+        cost: Optional[int] = None,
+        memoize: bool = False,
+    ) -> None:
+        if batch and memoize:
+            raise ImproperlyConfigured(
+                "Batch resolver < %s > can't be memoized." % name
+            )
+
         self._name = name
         self._implementation = None
         self._schema_name = schema_name
+        self._batch = batch
+        self._cost = cost
+        self._memoize = memoize
 
     @property
     def name(self) -> str:
@@ -44,7 +75,12 @@ class Resolver:
 
         try:
             field = schema.get_field_by_name(self._name)
-            field.resolver.update_func(self._implementation)
+            field.resolver.update_func(
+                self._implementation,
+                is_batch=self._batch,
+                cost=self._cost,
+                memoize=self._memoize,
+            )
         except KeyError:
             raise UnknownFieldDefinition(
                 "Unknown Field Definition %s" % self._name
@@ -2,19 +2,42 @@ from typing import Callable, Optional
 
 from tartiflette.schema import GraphQLSchema
 from tartiflette.schema.registry import SchemaRegistry
+from tartiflette.schema.snapshot import SchemaSnapshot
 from tartiflette.sdl.builder import build_graphql_schema_from_sdl
 
-_SCHEMA_OBJECT_IDS = ["directives", "resolvers", "scalars", "subscriptions"]
+_SCHEMA_OBJECT_IDS = [
+    "directives",
+    "resolvers",
+    "scalars",
+    "subscriptions",
+    "type_resolvers",
+]
+
+
+def _has_on_build_directives(schema: GraphQLSchema) -> bool:
+    return any(
+        callable(getattr(directive.implementation, "on_build", None))
+        for directive in schema.directives
+    )
 
 
 class SchemaBakery:
     @staticmethod
-    def _preheat(schema_name: str) -> GraphQLSchema:
+    def _preheat(
+        schema_name: str, snapshot: Optional[SchemaSnapshot] = None
+    ) -> GraphQLSchema:
         schema_info = SchemaRegistry.find_schema_info(schema_name)
-        schema = schema_info.get("inst", GraphQLSchema(name=schema_name))
-
         sdl = schema_info["sdl"]
-        build_graphql_schema_from_sdl(sdl, schema=schema)
+
+        schema = None
+        if snapshot is not None and "inst" not in schema_info:
+            schema = snapshot.load(schema_name, sdl)
+
+        if schema is None:
+            schema = schema_info.get("inst", GraphQLSchema(name=schema_name))
+            build_graphql_schema_from_sdl(sdl, schema=schema)
+            if snapshot is not None:
+                snapshot.prepare(sdl, schema)
 
         for object_ids in _SCHEMA_OBJECT_IDS:
             for obj in schema_info.get(object_ids, {}).values():
@@ -26,8 +49,17 @@ class SchemaBakery:
 
     @staticmethod
     def bake(
-        schema_name: str, custom_default_resolver: Optional[Callable] = None
+        schema_name: str,
+        custom_default_resolver: Optional[Callable] = None,
+        snapshot: Optional[SchemaSnapshot] = None,
     ) -> GraphQLSchema:
-        schema = SchemaBakery._preheat(schema_name)
-        schema.bake(custom_default_resolver)
+        schema = SchemaBakery._preheat(schema_name, snapshot)
+        from_snapshot = snapshot is not None and snapshot.loaded
+        schema.bake(
+            custom_default_resolver,
+            validate_definitions=not from_snapshot
+            or _has_on_build_directives(schema),
+        )
+        if snapshot is not None:
+            snapshot.dump()
         return schema
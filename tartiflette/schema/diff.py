@@ -0,0 +1,270 @@
+from collections import namedtuple
+from inspect import isclass, isfunction
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+from tartiflette.types.helpers import reduce_type
+
+# pylint: disable=protected-access
+
+SchemaChanges = namedtuple(
+    "SchemaChanges",
+    ["added_types", "removed_types", "changed_types", "changed_directives"],
+)
+
+_IMPLEMENTATION_KINDS = [
+    "directives",
+    "resolvers",
+    "scalars",
+    "subscriptions",
+    "type_resolvers",
+]
+
+_INTROSPECTION_FIELDS = ["__schema", "__type"]
+
+
+def _possible_types(gql_type: Any) -> list:
+    try:
+        return gql_type.possibleTypes or []
+    except AttributeError:
+        return []
+
+
+def _get_arguments_signature(arguments: Dict[str, Any]) -> Tuple:
+    return tuple(
+        (
+            argument.name,
+            str(argument.gql_type),
+            repr(argument.default_value),
+            argument.description,
+            repr(argument._directives),
+        )
+        for argument in arguments.values()
+    )
+
+
+def _get_fields_signature(gql_type: Any) -> Tuple:
+    fields = getattr(gql_type, "_fields", None) or {}
+    return tuple(
+        (
+            field.name,
+            str(field.gql_type),
+            field.description,
+            repr(field._directives),
+            # Input fields have a default value, fields have arguments
+            repr(getattr(field, "default_value", None)),
+            _get_arguments_signature(getattr(field, "arguments", None) or {}),
+        )
+        for field in fields.values()
+        if not field.name.startswith("__")
+    )
+
+
+def _get_type_signature(gql_type: Any) -> Hashable:
+    """
+    Returns what defines a type in the SDL: two types with the same signature
+    are built from the same definition. The implementations bound to the
+    type aren't part of it, but the types implementing an interface are.
+    """
+    return (
+        type(gql_type).__name__,
+        gql_type.description,
+        repr(getattr(gql_type, "_directives", None)),
+        _get_fields_signature(gql_type),
+        tuple(getattr(gql_type, "interfaces_names", None) or ()),
+        tuple(getattr(gql_type, "gql_types", None) or ()),
+        tuple(
+            str(possible_type) for possible_type in _possible_types(gql_type)
+        ),
+        tuple(
+            (value.value, value.description, repr(value._directives))
+            for value in getattr(gql_type, "values", None) or ()
+        ),
+    )
+
+
+def _get_directive_signature(directive: Any) -> Hashable:
+    return (
+        tuple(directive.where),
+        directive.description,
+        _get_arguments_signature(directive.arguments),
+    )
+
+
+def _get_function_signature(function: Any) -> Hashable:
+    function = getattr(function, "__func__", function)
+    return (
+        getattr(function, "__code__", function),
+        getattr(function, "__defaults__", None),
+        getattr(function, "__closure__", None),
+    )
+
+
+def _get_implementation_signature(implementation: Any) -> Hashable:
+    # Reloading a module creates new functions & classes, an implementation
+    # is considered unchanged as long as its code is the same.
+    if isfunction(implementation):
+        return _get_function_signature(implementation)
+
+    cls = implementation if isclass(implementation) else type(implementation)
+    return (
+        cls.__module__,
+        cls.__qualname__,
+        tuple(
+            (name, _get_function_signature(attribute))
+            for name, attribute in sorted(vars(cls).items())
+            if callable(getattr(attribute, "__func__", attribute))
+        ),
+    )
+
+
+def get_implementations(schema_info: Dict[str, Any]) -> Dict[Tuple, Any]:
+    """
+    Returns the signatures of the implementations registered for a schema,
+    keyed by their kind & name, e.g `("resolvers", "Query.dog")`.
+    :param schema_info: the registry entry of the schema
+    :return: the signatures of the implementations
+    """
+    return {
+        (kind, name): (
+            _get_implementation_signature(obj._implementation),
+            getattr(obj, "_batch", False),
+        )
+        for kind in _IMPLEMENTATION_KINDS
+        for name, obj in schema_info.get(kind, {}).items()
+    }
+
+
+def _get_implemented_name(kind: str, name: str) -> str:
+    # Resolvers & subscriptions are registered as "Type.field"
+    if kind in ("resolvers", "subscriptions"):
+        return name.split(".")[0]
+    return name
+
+
+def diff_schemas(
+    old_schema: "GraphQLSchema",
+    new_schema: "GraphQLSchema",
+    old_implementations: Dict[Tuple, Any],
+    new_implementations: Dict[Tuple, Any],
+) -> SchemaChanges:
+    """
+    Computes the types & directives which differ between two baked schemas,
+    either in the SDL or in their implementations.
+    :param old_schema: the schema being replaced
+    :param new_schema: the schema replacing it
+    :param old_implementations: the signatures of the implementations bound
+    to the old schema
+    :param new_implementations: the signatures of the implementations bound
+    to the new schema
+    :return: the names of the added, removed & changed types and of the
+    changed directives
+    """
+    old_types = old_schema.gql_types
+    new_types = new_schema.gql_types
+
+    changed_types = {
+        name
+        for name in old_types.keys() & new_types.keys()
+        if _get_type_signature(old_types[name])
+        != _get_type_signature(new_types[name])
+    }
+
+    old_directives = {d.name: d for d in old_schema.directives}
+    new_directives = {d.name: d for d in new_schema.directives}
+    changed_directives = {
+        name
+        for name in old_directives.keys() | new_directives.keys()
+        if name not in old_directives
+        or name not in new_directives
+        or _get_directive_signature(old_directives[name])
+        != _get_directive_signature(new_directives[name])
+    }
+
+    for key in old_implementations.keys() | new_implementations.keys():
+        if old_implementations.get(key) != new_implementations.get(key):
+            kind, name = key
+            if kind == "directives":
+                changed_directives.add(name)
+            else:
+                changed_types.add(_get_implemented_name(kind, name))
+
+    for old_root, new_root in (
+        (old_schema.query_type, new_schema.query_type),
+        (old_schema.mutation_type, new_schema.mutation_type),
+        (old_schema.subscription_type, new_schema.subscription_type),
+    ):
+        if old_root != new_root:
+            changed_types.update((old_root, new_root))
+
+    return SchemaChanges(
+        frozenset(new_types.keys() - old_types.keys()),
+        frozenset(old_types.keys() - new_types.keys()),
+        frozenset(changed_types & (old_types.keys() | new_types.keys())),
+        frozenset(changed_directives),
+    )
+
+
+def _add_type_dependencies(
+    schema: "GraphQLSchema", name: str, dependencies: Set[str]
+) -> None:
+    if name in dependencies:
+        return
+
+    dependencies.add(name)
+    try:
+        gql_type = schema.find_type(name)
+    except KeyError:
+        return
+
+    for possible_type in _possible_types(gql_type):
+        dependencies.add(str(possible_type))
+
+    # The types of the fields of input objects are coerced along with them
+    for input_field in getattr(gql_type, "input_fields", None) or []:
+        _add_type_dependencies(
+            schema, reduce_type(input_field.gql_type), dependencies
+        )
+
+
+def get_operations_dependencies(
+    schema: "GraphQLSchema", operations: Dict[Optional[str], Any]
+) -> Optional[Set[str]]:
+    """
+    Returns the names of the types on which the execution of the operations
+    of a query depends, or None if they introspect the whole schema.
+    :param schema: the schema the operations have been built against
+    :param operations: the operations built from a query
+    :return: the names of the types or None
+    """
+    dependencies = set()
+    for operation in operations.values():
+        for variable_definition in operation.variable_definitions:
+            _add_type_dependencies(
+                schema, variable_definition.var_type, dependencies
+            )
+
+        nodes = list(operation.children)
+        while nodes:
+            node = nodes.pop()
+            nodes.extend(node.children)
+
+            schema_field = node.field_executor.schema_field
+            if schema_field.name in _INTROSPECTION_FIELDS:
+                return None
+
+            if schema_field.parent_type is not None:
+                _add_type_dependencies(
+                    schema, schema_field.parent_type.name, dependencies
+                )
+            if node.type_condition:
+                _add_type_dependencies(
+                    schema, node.type_condition, dependencies
+                )
+            _add_type_dependencies(
+                schema, reduce_type(schema_field.gql_type), dependencies
+            )
+            for argument in schema_field.arguments.values():
+                _add_type_dependencies(
+                    schema, reduce_type(argument.gql_type), dependencies
+                )
+    return dependencies
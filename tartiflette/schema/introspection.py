@@ -1,9 +1,9 @@
 from functools import partial
 from typing import Any, Dict, Optional
 
+from tartiflette.resolver.factory import default_resolver
 from tartiflette.types.argument import GraphQLArgument
 from tartiflette.types.field import GraphQLField
-from tartiflette.types.helpers import get_typename
 from tartiflette.types.non_null import GraphQLNonNull
 
 
@@ -56,14 +56,20 @@ def prepare_type_root_field(schema: "GraphQLSchema") -> "GraphQLField":
 async def __typename_resolver(
     parent_result: Optional[Any],
     _args: Dict[str, Any],
-    _ctx: Optional[Dict[str, Any]],
+    ctx: Optional[Dict[str, Any]],
     info: "Info",
 ) -> "GraphQLType":
+    parent_type = info.schema_field.parent_type
+    if parent_type.type_resolver is None:
+        typename = parent_type.resolve_type(parent_result)
+    else:
+        typename = parent_type.type_resolver(parent_result, ctx, info)
+
     try:
-        return info.schema_field.schema.find_type(get_typename(parent_result))
-    except (AttributeError, KeyError):
+        return info.schema_field.schema.find_type(typename)
+    except KeyError:
         pass
-    return info.schema_field.parent_type
+    return parent_type
 
 
 TYPENAME_ROOT_FIELD_DEFINITION = partial(
@@ -73,3 +79,78 @@ TYPENAME_ROOT_FIELD_DEFINITION = partial(
     arguments=None,
     resolver=__typename_resolver,
 )
+
+
+# Builtin directives whose `on_introspection` doesn't depend on the request
+_STATIC_INTROSPECTION_DIRECTIVES = [
+    "deprecated",
+    "nonIntrospectable",
+    "non_introspectable",
+]
+
+# Builtin directives whose `on_field_execution` only depends on their
+# arguments
+_STATIC_EXECUTION_DIRECTIVES = ["skip", "include"]
+
+
+def _has_static_introspection(schema: "GraphQLSchema") -> bool:
+    return not any(
+        hasattr(directive.implementation, "on_introspection")
+        for directive in schema.directives
+        if directive.name not in _STATIC_INTROSPECTION_DIRECTIVES
+    )
+
+
+def _get_static_callables(schema: "GraphQLSchema") -> list:
+    callables = []
+    for name in _STATIC_EXECUTION_DIRECTIVES:
+        try:
+            implementation = schema.find_directive(name).implementation
+        except KeyError:
+            continue
+        callables.append(getattr(implementation, "on_field_execution", None))
+    return callables
+
+
+def is_static_introspection(
+    schema: "GraphQLSchema", operation: "NodeOperationDefinition"
+) -> bool:
+    """
+    Returns whether or not an operation only introspects the schema, in a way
+    which only depends on the schema: without variables, resolvers other than
+    the builtin ones, nor directives other than `@skip` & `@include`. The
+    result of such an operation doesn't change as long as the schema doesn't.
+    :param schema: the schema the operation has been built against
+    :param operation: the operation
+    :return: whether or not the result of the operation is static
+    """
+    if (
+        operation.type != "Query"
+        or operation.variable_definitions
+        or not operation.children
+        or any(
+            node.name not in ["__schema", "__type", "__typename"]
+            for node in operation.children
+        )
+    ):
+        return False
+
+    static_funcs = [
+        default_resolver,
+        __schema_resolver,
+        __type_resolver,
+        __typename_resolver,
+    ]
+    static_callables = _get_static_callables(schema)
+
+    nodes = list(operation.children)
+    for node in nodes:
+        if node.field_executor.raw_func not in static_funcs or any(
+            directive["callables"].get("on_field_execution")
+            not in static_callables
+            for directive in node.execution_directives
+        ):
+            return False
+
+        nodes.extend(node.children)
+    return _has_static_introspection(schema)
@@ -15,7 +15,13 @@ class SchemaRegistry:
         schema_name: str,
         where: str,
         obj: Optional[
-            Union["Directive", "Resolver", "Scalar", "Subscription"]
+            Union[
+                "Directive",
+                "Resolver",
+                "Scalar",
+                "Subscription",
+                "TypeResolver",
+            ]
         ],
     ) -> None:
         if not obj:
@@ -58,6 +64,37 @@ class SchemaRegistry:
     ) -> None:
         SchemaRegistry._register(schema_name, "subscriptions", subscription)
 
+    @staticmethod
+    def register_type_resolver(
+        schema_name: str = "default",
+        type_resolver: Optional["TypeResolver"] = None,
+    ) -> None:
+        SchemaRegistry._register(schema_name, "type_resolvers", type_resolver)
+
+    @staticmethod
+    def unregister_modules(schema_name: str, module_names: List[str]) -> None:
+        """
+        Unregisters the directives, resolvers, scalars, subscriptions & type
+        resolvers of a schema implemented within the given modules, so that
+        they can be registered again once the modules are reloaded.
+        :param schema_name: name of the schema
+        :param module_names: names of the modules
+        """
+        schema_info = SchemaRegistry._schemas.get(schema_name, {})
+        for where in [
+            "directives",
+            "resolvers",
+            "scalars",
+            "subscriptions",
+            "type_resolvers",
+        ]:
+            objects = schema_info.get(where, {})
+            for name, obj in list(objects.items()):
+                # pylint: disable=protected-access
+                module_name = getattr(obj._implementation, "__module__", None)
+                if module_name in module_names:
+                    del objects[name]
+
     @staticmethod
     def register_sdl(
         schema_name: str,
@@ -1,5 +1,5 @@
 from inspect import iscoroutinefunction
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from tartiflette.schema.introspection import (
     SCHEMA_ROOT_FIELD_DEFINITION,
@@ -74,6 +74,11 @@ class GraphQLSchema:
         self._enums: Dict[str, GraphQLEnumType] = {}
         self._custom_scalars: Dict[str, GraphQLScalarType] = {}
         self._input_types: List[str] = []
+        # Coercers shared by the fields & arguments of the same type
+        self.coercers: Optional[Dict[Tuple[str, Any], Callable]] = None
+        # Lookup tables computed at bake time
+        self._fields_lookup: Dict[str, Dict[str, GraphQLField]] = {}
+        self._possible_types: Dict[str, FrozenSet[str]] = {}
         self.name = name
 
     def __repr__(self) -> str:
@@ -272,11 +277,44 @@ class GraphQLSchema:
                 "field `{}` was not found in GraphQL schema.".format(name)
             )
 
-    def bake(self, custom_default_resolver: Optional[Callable] = None) -> None:
+    def find_field(
+        self, type_name: str, field_name: str
+    ) -> Optional[GraphQLField]:
+        """
+        Returns the field of an object, interface or union type of the baked
+        schema, or None if the type has no such field.
+        :param type_name: name of the type
+        :param field_name: name of the field
+        :return: the field or None
+        """
+        try:
+            return self._fields_lookup[type_name].get(field_name)
+        except KeyError:
+            return None
+
+    def get_possible_types(self, type_name: str) -> FrozenSet[str]:
+        """
+        Returns the names of the object types which could be the runtime type
+        of a type of the baked schema: the type itself for an object type, the
+        types implementing an interface or the members of a union.
+        :param type_name: name of the type
+        :return: the names of the object types
+        """
+        return self._possible_types.get(type_name, frozenset())
+
+    def bake(
+        self,
+        custom_default_resolver: Optional[Callable] = None,
+        validate_definitions: bool = True,
+    ) -> None:
         """
         Bake the final schema (it should not change after this) used for
         execution.
 
+        :param custom_default_resolver: resolver used by fields without one
+        :param validate_definitions: whether the types & directives defined
+        by the SDL should be validated or only their implementations (e.g
+        when they have already been validated before being snapshotted)
         :return: None
         """
         self.inject_introspection()
@@ -287,12 +325,35 @@ class GraphQLSchema:
             pass
             # TODO Change this when we'll have a better idea on what to do with the on_build kind of directive.
 
-        self.validate()  # Revalidate.
+        self.validate(validate_definitions)  # Revalidate.
+        self._build_lookup_tables()
+
+    def _build_lookup_tables(self) -> None:
+        # pylint: disable=protected-access
+        self._fields_lookup = {}
+        self._possible_types = {}
+        for name, gql_type in self._gql_types.items():
+            if isinstance(gql_type, GraphQLObjectType):
+                possible_types = frozenset([name])
+            elif isinstance(gql_type, GraphQLInterfaceType):
+                possible_types = frozenset(
+                    possible_type.name
+                    for possible_type in gql_type.possibleTypes
+                )
+            elif isinstance(gql_type, GraphQLUnionType):
+                possible_types = frozenset(gql_type.gql_types)
+            else:
+                continue
 
-    def validate(self) -> bool:
+            self._fields_lookup[name] = gql_type._fields
+            self._possible_types[name] = possible_types
+
+    def validate(self, validate_definitions: bool = True) -> bool:
         """
         Check that the given schema is valid.
 
+        :param validate_definitions: whether the types & directives defined
+        by the SDL should be validated or only their implementations
         :return: bool
         """
         # TODO: Optimization: most validation functions iterate over
@@ -311,6 +372,12 @@ class GraphQLSchema:
             # TODO: Validate Field: default value must be of given type
             # TODO: Check all objects have resolvers (at least in parent)
         ]
+        if not validate_definitions:
+            validators = [
+                self._validate_all_scalars_have_implementations,
+                self._validate_directive_implementation,
+            ]
+
         errors = []
         for validator in validators:
             errors.extend(validator())
@@ -535,6 +602,8 @@ class GraphQLSchema:
     def bake_types(
         self, custom_default_resolver: Optional[Callable] = None
     ) -> None:
+        self.coercers = None
+
         for gql_type in self._custom_scalars.values():
             gql_type.bake(self)
 
@@ -545,6 +614,8 @@ class GraphQLSchema:
         for directive in self._directives.values():
             directive.bake(self)
 
+        # Every type is baked, the coercers can be shared from now on
+        self.coercers = {}
         for gql_type in self._gql_types.values():
             if isinstance(
                 gql_type,
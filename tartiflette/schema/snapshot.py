@@ -0,0 +1,120 @@
+import hashlib
+import os
+import pickle
+import platform
+import sys
+import tempfile
+
+from typing import Optional, Tuple
+
+from tartiflette.resolver import ResolverExecutorFactory
+from tartiflette.schema.schema import GraphQLSchema
+
+# Bumped whenever the pickled types change in an incompatible way
+_SNAPSHOT_VERSION = 1
+
+# Highest protocol available with python 3.6
+_PICKLE_PROTOCOL = 4
+
+
+_PYTHON_VERSION = "%s %s" % (
+    sys.implementation.name,
+    platform.python_version(),
+)
+
+
+def _get_snapshot_key(sdl: str) -> Tuple[int, str, str, str]:
+    """
+    Returns the key of the snapshot of a schema: the types are only
+    unpickled by the same release of Tartiflette, running on the same
+    version of Python, as the one which pickled them.
+    """
+    # Imported here since the package imports this module
+    from tartiflette import __version__
+
+    return (
+        _SNAPSHOT_VERSION,
+        __version__,
+        _PYTHON_VERSION,
+        hashlib.sha256(sdl.encode("utf-8")).hexdigest(),
+    )
+
+
+class SchemaSnapshot:
+    """
+    File caching the types & directives of a schema as built from its SDL,
+    before any implementation (resolver, directive, scalar, subscription) is
+    bound to it. Processes baking the same SDL (including the SDL of the
+    modules) load it instead of parsing & validating the SDL again.
+
+    The snapshot is only written once the schema has been successfully baked
+    and validated. A snapshot built from another SDL, by another release of
+    Tartiflette or another version of Python, or which can't be read, is
+    ignored and replaced.
+
+    The snapshot is loaded with `pickle`, which can run arbitrary code: it
+    must be written to a path which only trusted processes can write to.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.loaded = False
+        self._pending = None
+
+    def load(self, schema_name: str, sdl: str) -> Optional[GraphQLSchema]:
+        """
+        Loads the schema built from the SDL, if it has been snapshotted.
+        :param schema_name: name of the schema to load
+        :param sdl: the full SDL of the schema
+        :return: the schema, without any implementation bound, or None
+        """
+        try:
+            with open(self.path, "rb") as snapshot_file:
+                # The types are only unpickled if the key matches
+                if pickle.load(snapshot_file) != _get_snapshot_key(sdl):
+                    return None
+                schema = pickle.load(snapshot_file)
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+        if not isinstance(schema, GraphQLSchema):
+            return None
+
+        schema.name = schema_name
+        for gql_type in schema.gql_types.values():
+            for field in getattr(gql_type, "fields", None) or []:
+                field.resolver = ResolverExecutorFactory.get_resolver_executor(
+                    None, field
+                )
+        self.loaded = True
+        return schema
+
+    def prepare(self, sdl: str, schema: GraphQLSchema) -> None:
+        """
+        Serializes the schema built from the SDL, before it gets baked.
+        :param sdl: the full SDL of the schema
+        :param schema: the schema built from the SDL
+        """
+        self._pending = pickle.dumps(
+            _get_snapshot_key(sdl), protocol=_PICKLE_PROTOCOL
+        ) + pickle.dumps(schema, protocol=_PICKLE_PROTOCOL)
+
+    def dump(self) -> None:
+        """
+        Writes the prepared snapshot. The file is replaced atomically so that
+        concurrent processes never read a partially written snapshot.
+        """
+        if self._pending is None:
+            return
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as snapshot_file:
+                snapshot_file.write(self._pending)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+        finally:
+            self._pending = None
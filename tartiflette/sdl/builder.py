@@ -2,13 +2,14 @@ import os
 
 from typing import Optional
 
-from lark import Lark, Tree
+from lark import Tree
 
 from tartiflette.schema import GraphQLSchema
 from tartiflette.sdl.transformers.cleaning_transformer import (
     CleaningTransformer,
 )
 from tartiflette.sdl.transformers.schema_transformer import SchemaTransformer
+from tartiflette.utils.lark_parser import get_lark_parser
 
 _GRAMMAR_FILE_PATH = os.path.join(
     os.path.dirname(__file__), "grammar", "graphql_sdl_grammar.lark"
@@ -37,19 +38,13 @@ def parse_graphql_sdl_to_ast(sdl: str) -> Tree:
     lark library).
 
     We use the LALR(1) parser for fast parsing of huge trees. The
-    grammar is thus a bit less legible but much (much) faster.
+    grammar is thus a bit less legible but much (much) faster. The parser
+    is built once and shared by all the schemas of the process.
 
     :param sdl: Any GraphQL SDL schema string
     :return: a Lark parser `Tree`
     """
-    gqlsdl_parser = Lark.open(
-        _GRAMMAR_FILE_PATH,
-        start="document",
-        parser="lalr",
-        lexer="contextual",
-        propagate_positions=True,
-    )
-    gqlsdl = gqlsdl_parser.parse
+    gqlsdl = get_lark_parser(_GRAMMAR_FILE_PATH).parse
     return gqlsdl(sdl)
 
     # TODO: Improve this as below
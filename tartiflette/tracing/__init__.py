@@ -0,0 +1,4 @@
+from .apollo import ApolloTrace, ApolloTracer
+from .tracer import Trace, Tracer
+
+__all__ = ["ApolloTrace", "ApolloTracer", "Trace", "Tracer"]
@@ -0,0 +1,138 @@
+from datetime import datetime
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Union
+
+from .tracer import Trace, Tracer
+
+
+def _to_ns(seconds: float) -> int:
+    return int(round(seconds * 1e9))
+
+
+def _to_iso(moment: datetime) -> str:
+    return moment.isoformat(timespec="milliseconds") + "Z"
+
+
+def _get_type_name(gql_type: Any) -> Optional[str]:
+    try:
+        return gql_type.name
+    except AttributeError:
+        pass
+    return str(gql_type) if gql_type is not None else None
+
+
+class ApolloTrace(Trace):
+    """
+    Collects the timings of a request in the Apollo Tracing format:
+    https://github.com/apollographql/apollo-tracing
+    """
+
+    def __init__(self) -> None:
+        self._start_time = None
+        self._start_counter = None
+        self._end_time = None
+        self._end_counter = None
+        self._parsing = None
+        self._validation = None
+        self._resolvers: List[tuple] = []
+        # Index of the items of the list fields, by their FieldResult
+        self._item_indexes: Dict["FieldResult", Dict[int, int]] = {}
+
+    def start(self) -> None:
+        self._start_time = datetime.utcnow()
+        self._start_counter = perf_counter()
+
+    def end(self) -> None:
+        self._end_time = datetime.utcnow()
+        self._end_counter = perf_counter()
+
+    def _get_timing(self, start_time: float, end_time: float) -> dict:
+        return {
+            "startOffset": _to_ns(start_time - self._start_counter),
+            "duration": _to_ns(end_time - start_time),
+        }
+
+    def on_parsing(self, start_time: float, end_time: float) -> None:
+        self._parsing = (start_time, end_time)
+
+    def on_validation(self, start_time: float, end_time: float) -> None:
+        self._validation = (start_time, end_time)
+
+    def _get_item_index(
+        self, field_result: "FieldResult", item: Any
+    ) -> Optional[int]:
+        # The items of a list field are indexed once, on the first lookup
+        try:
+            item_indexes = self._item_indexes[field_result]
+        except KeyError:
+            item_indexes = self._item_indexes[field_result] = {
+                id(value): index
+                for index, value in enumerate(field_result.marshalled)
+            }
+        return item_indexes.get(id(item))
+
+    def _get_path(self, field_result: "FieldResult") -> List[Union[str, int]]:
+        """
+        Returns the path of a field in the response, with the index of the
+        list items it belongs to.
+        """
+        path = []
+        while field_result is not None:
+            path.append(field_result.alias)
+            parent = field_result.parent
+            if parent is not None and isinstance(parent.marshalled, list):
+                index = self._get_item_index(parent, field_result.container)
+                if index is not None:
+                    path.append(index)
+            field_result = parent
+        path.reverse()
+        return path
+
+    def on_field(
+        self,
+        info: "Info",
+        field_result: "FieldResult",
+        start_time: float,
+        end_time: float,
+    ) -> None:
+        self._resolvers.append(
+            (info, self._get_path(field_result), start_time, end_time)
+        )
+
+    def _get_resolvers(self) -> List[dict]:
+        resolvers = []
+        for info, path, start_time, end_time in self._resolvers:
+            resolver = {
+                "path": path,
+                "parentType": _get_type_name(info.schema_field.parent_type),
+                "fieldName": info.schema_field.name,
+                "returnType": str(info.schema_field.gql_type),
+            }
+            resolver.update(self._get_timing(start_time, end_time))
+            resolvers.append(resolver)
+        return resolvers
+
+    def extensions(self) -> Optional[Dict[str, Any]]:
+        tracing = {
+            "version": 1,
+            "startTime": _to_iso(self._start_time),
+            "endTime": _to_iso(self._end_time),
+            "duration": _to_ns(self._end_counter - self._start_counter),
+            "execution": {"resolvers": self._get_resolvers()},
+        }
+
+        if self._parsing:
+            tracing["parsing"] = self._get_timing(*self._parsing)
+        if self._validation:
+            tracing["validation"] = self._get_timing(*self._validation)
+
+        return {"tracing": tracing}
+
+
+class ApolloTracer(Tracer):
+    """
+    Adds an Apollo Tracing `extensions.tracing` entry to the responses of
+    the traced requests.
+    """
+
+    trace_class = ApolloTrace
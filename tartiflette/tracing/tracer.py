@@ -0,0 +1,90 @@
+import random
+
+from typing import Any, Dict, Optional
+
+
+class Trace:
+    """
+    Per-request state of a Tracer, whose hooks are called around the steps
+    of the execution of the request. Times are `time.perf_counter()` values.
+
+    Every hook is a no-op, subclasses implement the ones they need.
+    """
+
+    def start(self) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def on_parsing(self, start_time: float, end_time: float) -> None:
+        pass
+
+    def on_validation(self, start_time: float, end_time: float) -> None:
+        pass
+
+    def on_execution(self, start_time: float, end_time: float) -> None:
+        pass
+
+    def on_field(
+        self,
+        info: "Info",
+        field_result: "FieldResult",
+        start_time: float,
+        end_time: float,
+    ) -> None:
+        """
+        Called once a field has been resolved & coerced (without its
+        children), `info` gives its path, parent type & field name and
+        `field_result` its parent results, e.g. to find out its path in the
+        response. A field resolved in batch calls it for each of its parents.
+        """
+
+    def on_resolver(
+        self, info: "Info", start_time: float, end_time: float
+    ) -> None:
+        """
+        Called once the resolver of a field has been called (and awaited if
+        it returned an awaitable), without the coercion of its result.
+        """
+
+    def extensions(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the entries to add to the `extensions` of the response.
+        """
+        return None
+
+
+class Tracer:
+    """
+    Creates a Trace for the requests executed by the engine. With a
+    `sample_rate` lower than 1, only this ratio of the requests is traced,
+    the other ones being executed without any instrumentation overhead.
+    """
+
+    trace_class = Trace
+
+    def __init__(self, sample_rate: float = 1.0) -> None:
+        self._sample_rate = sample_rate
+
+    @property
+    def sample_rate(self) -> float:
+        return self._sample_rate
+
+    def is_sampled(self) -> bool:
+        return self._sample_rate >= 1 or random.random() < self._sample_rate
+
+    def create_trace(
+        self,
+        query: str,
+        operation_name: Optional[str],
+        context: Optional[Dict[str, Any]],
+    ) -> Optional[Trace]:
+        """
+        Creates the Trace of a request or returns None if the request
+        shouldn't be traced.
+        """
+        # pylint: disable=unused-argument
+        if not self.is_sampled():
+            return None
+        return self.trace_class()
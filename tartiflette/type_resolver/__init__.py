@@ -0,0 +1,3 @@
+from .type_resolver import TypeResolver
+
+__all__ = ["TypeResolver"]
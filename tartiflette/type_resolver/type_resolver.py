@@ -0,0 +1,56 @@
+from tartiflette.schema.registry import SchemaRegistry
+from tartiflette.types.exceptions.tartiflette import (
+    MissingImplementation,
+    UnknownTypeDefinition,
+)
+from tartiflette.types.interface import GraphQLInterfaceType
+from tartiflette.types.union import GraphQLUnionType
+
+
+class TypeResolver:
+    """
+    This decorator allows you to link a GraphQL Union or Interface to a
+    function returning the name of the object type of each of its values.
+
+    For example, for the following SDL:
+
+        union Pet = Cat | Dog
+
+    Use the TypeResolver decorator the following way:
+
+        @TypeResolver("Pet")
+        def resolve_pet_type(result, request_ctx, info):
+            return "Cat" if "meow" in result else "Dog"
+
+    Without a TypeResolver, the object type of a value is its `_typename`
+    key or attribute, else the name of its class (or of the first of its
+    base classes which is one of the possible types).
+    """
+
+    def __init__(self, name: str, schema_name: str = "default") -> None:
+        self._name = name
+        self._implementation = None
+        self._schema_name = schema_name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def bake(self, schema: "GraphQLSchema") -> None:
+        if not self._implementation:
+            raise MissingImplementation(
+                "No implementation given for type resolver < %s >" % self._name
+            )
+
+        gql_type = schema.gql_types.get(self._name)
+        if not isinstance(gql_type, (GraphQLInterfaceType, GraphQLUnionType)):
+            raise UnknownTypeDefinition(
+                "Unknown Union or Interface Definition %s" % self._name
+            )
+
+        gql_type.type_resolver = self._implementation
+
+    def __call__(self, implementation):
+        self._implementation = implementation
+        SchemaRegistry.register_type_resolver(self._schema_name, self)
+        return implementation
@@ -19,6 +19,22 @@ class GraphQLArgument:
       - GraphQLInputObject fields
     """
 
+    __slots__ = (
+        "name",
+        "gql_type",
+        "default_value",
+        "description",
+        "_type",
+        "_schema",
+        "_directives",
+        "coercer",
+        "_directives_implementations",
+        "_introspection_directives",
+    )
+
+    # Introspection Attribute
+    _typename = "__InputValue"
+
     def __init__(
         self,
         name: str,
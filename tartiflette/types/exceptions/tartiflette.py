@@ -179,6 +179,14 @@ class NotAnObjectType(GraphQLError):
     pass
 
 
+class ImpossibleFragmentSpread(GraphQLError):
+    pass
+
+
+class FragmentCycle(GraphQLError):
+    pass
+
+
 class NotUniqueOperationName(GraphQLError):
     pass
 
@@ -225,5 +233,17 @@ class UnknownGraphQLType(GraphQLError):
     pass
 
 
+class UnknownPersistedQuery(GraphQLError):
+    pass
+
+
+class QueryTooExpensive(GraphQLError):
+    pass
+
+
+class InvalidPersistedQuery(ImproperlyConfigured):
+    pass
+
+
 class SkipExecution(Exception):
     pass
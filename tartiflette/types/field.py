@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from tartiflette.resolver import ResolverExecutorFactory
 from tartiflette.types.helpers import (
@@ -16,6 +16,28 @@ class GraphQLField:
     A field is used in Object, Interfaces as its constituents.
     """
 
+    __slots__ = (
+        "name",
+        "gql_type",
+        "arguments",
+        "_directives",
+        "_schema",
+        "description",
+        "resolver",
+        "subscribe",
+        "parent_type",
+        "isDeprecated",
+        "deprecationReason",
+        "_directives_implementations",
+        "_is_leaf",
+        "_reduced_type",
+        "_reduced_type_name",
+        "_introspection_directives",
+    )
+
+    # Introspection Attribute
+    _typename = "__Field"
+
     def __init__(
         self,
         name: str,
@@ -42,6 +64,7 @@ class GraphQLField:
 
         # Introspection Attribute
         self.isDeprecated = False  # pylint: disable=invalid-name
+        self.deprecationReason = None  # pylint: disable=invalid-name
         self._directives_implementations = None
         self._is_leaf = False
         self._reduced_type = None
@@ -73,6 +96,22 @@ class GraphQLField:
     def __str__(self) -> str:
         return self.name
 
+    def __getstate__(self) -> Tuple[None, Dict[str, Any]]:
+        # The resolver executor holds compiled closures, it is recreated by
+        # the schema snapshot once unpickled.
+        return (
+            None,
+            {
+                slot: getattr(self, slot)
+                for slot in self.__slots__
+                if slot != "resolver"
+            },
+        )
+
+    def __setstate__(self, state: Tuple[None, Dict[str, Any]]) -> None:
+        for slot, value in state[1].items():
+            setattr(self, slot, value)
+
     def __eq__(self, other: Any) -> bool:
         return self is other or (
             type(self) is type(other)
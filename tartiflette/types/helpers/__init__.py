@@ -1,6 +1,7 @@
 from tartiflette.types.helpers.reduce_type import reduce_type
 from tartiflette.types.helpers.get_typename import get_typename
 from tartiflette.types.helpers.has_typename import has_typename
+from tartiflette.types.helpers.resolve_typename import resolve_typename
 from tartiflette.types.helpers.get_directive_instances import (
     get_directive_instances,
 )
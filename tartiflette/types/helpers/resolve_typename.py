@@ -0,0 +1,40 @@
+from typing import Any, Dict, List
+
+
+def resolve_typename(
+    raw: Any,
+    possible_types: List["GraphQLObjectType"],
+    typenames_by_class: Dict[type, str],
+) -> str:
+    """
+    Resolves the object type of a value of an abstract type: its `_typename`
+    key or attribute, else the name of the first class of its MRO which is
+    one of the possible types, else the name of its class. The typename
+    deduced from a class is memoized in `typenames_by_class`.
+    :param raw: the value
+    :param possible_types: the possible types of the abstract type
+    :param typenames_by_class: the typenames already deduced from classes
+    :return: the name of the object type of the value
+    """
+    if isinstance(raw, dict):
+        typename = raw.get("_typename")
+    else:
+        typename = getattr(raw, "_typename", None)
+    if typename:
+        return typename
+
+    cls = raw.__class__
+    typename = typenames_by_class.get(cls)
+    if typename is None:
+        possible_typenames = {
+            possible_type.name for possible_type in possible_types
+        }
+        typename = typenames_by_class[cls] = next(
+            (
+                klass.__name__
+                for klass in cls.__mro__
+                if klass.__name__ in possible_typenames
+            ),
+            cls.__name__,
+        )
+    return typename
@@ -8,6 +8,8 @@ def _get_callables(implementation):
 
 def transform_directive(directive, args=None):
     return {
+        "name": directive.name,
+        "incremental": getattr(directive.implementation, "incremental", None),
         "callables": _get_callables(directive.implementation),
         "args": {
             arg_name: directive.arguments[arg_name].default_value
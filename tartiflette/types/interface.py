@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 from tartiflette.types.field import GraphQLField
 from tartiflette.types.helpers import (
     get_directive_instances,
+    resolve_typename,
     wraps_with_directives,
 )
 from tartiflette.types.type import GraphQLType
@@ -31,6 +32,7 @@ class GraphQLInterfaceType(GraphQLType):
         super().__init__(name=name, description=description, schema=schema)
         self._fields = fields
         self._possible_types = []
+        self._typenames_by_class = {}
         self._directives = directives
 
     def __repr__(self) -> str:
@@ -46,6 +48,9 @@ class GraphQLInterfaceType(GraphQLType):
     def kind(self) -> str:
         return "INTERFACE"
 
+    def add_field(self, value: GraphQLField) -> None:
+        self._fields[value.name] = value
+
     def find_field(self, name: str) -> GraphQLField:
         return self._fields[name]
 
@@ -61,6 +66,7 @@ class GraphQLInterfaceType(GraphQLType):
 
     def bake(self, schema):
         super().bake(schema)
+        self._typenames_by_class = {}
 
         self._introspection_directives = wraps_with_directives(
             directives_definition=get_directive_instances(
@@ -69,6 +75,11 @@ class GraphQLInterfaceType(GraphQLType):
             directive_hook="on_introspection",
         )
 
+    def resolve_type(self, raw: Any) -> str:
+        return resolve_typename(
+            raw, self._possible_types, self._typenames_by_class
+        )
+
     def bake_fields(self, custom_default_resolver):
         for field in self._fields.values():
             field.bake(self._schema, self, custom_default_resolver)
@@ -10,6 +10,8 @@ class GraphQLList(GraphQLType):
     The type contained will be returned as a list instead of a single item.
     """
 
+    __slots__ = ("gql_type",)
+
     def __init__(
         self,
         gql_type: Union[str, GraphQLType],
@@ -10,6 +10,8 @@ class GraphQLNonNull(GraphQLType):
     The type contained cannot return a null/None value at execution time.
     """
 
+    __slots__ = ("gql_type",)
+
     def __init__(
         self,
         gql_type: Union[str, GraphQLType],
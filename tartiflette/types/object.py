@@ -18,6 +18,14 @@ class GraphQLObjectType(GraphQLType):
     but most importantly describe their fields.
     """
 
+    __slots__ = (
+        "_fields",
+        "interfaces_names",
+        "_interfaces",
+        "_directives",
+        "_directives_implementations",
+    )
+
     def __init__(
         self,
         name: str,
@@ -2,6 +2,24 @@ from typing import Any, Optional
 
 
 class GraphQLType:
+    __slots__ = (
+        "name",
+        "description",
+        "_is_list",
+        "_is_not_null",
+        "_is_enum_value",
+        "_schema",
+        "_introspection_directives",
+    )
+
+    # Introspection Attribute: the types are introspected as `__Type`, the
+    # typename isn't set on each instance once introspected.
+    _typename = "__Type"
+
+    # Resolves the object type of the values of an abstract type, bound by
+    # `@TypeResolver` to unions & interfaces.
+    type_resolver = None
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -35,6 +53,15 @@ class GraphQLType:
     def is_union(self) -> bool:
         return False
 
+    def resolve_type(self, raw: Any) -> str:
+        """
+        Returns the name of the object type of a value of this type.
+        :param raw: the value
+        :return: the name of the object type
+        """
+        # pylint: disable=unused-argument
+        return self.name
+
     @property
     def is_shell(self) -> bool:
         return self.is_list or self.is_not_null
@@ -2,6 +2,7 @@ from typing import Any, Dict, List, Optional
 
 from tartiflette.types.helpers import (
     get_directive_instances,
+    resolve_typename,
     wraps_with_directives,
 )
 from tartiflette.types.type import GraphQLType
@@ -28,6 +29,7 @@ class GraphQLUnionType(GraphQLType):
         super().__init__(name=name, description=description, schema=schema)
         self.gql_types = gql_types
         self._possible_types = []
+        self._typenames_by_class = {}
         self._directives = directives
         self._fields = {}
 
@@ -60,6 +62,7 @@ class GraphQLUnionType(GraphQLType):
 
     def bake(self, schema: "GraphQLSchema") -> None:
         super().bake(schema)
+        self._typenames_by_class = {}
 
         self._possible_types = [
             self._schema.find_type(x) for x in self.gql_types
@@ -72,6 +75,11 @@ class GraphQLUnionType(GraphQLType):
             directive_hook="on_introspection",
         )
 
+    def resolve_type(self, raw: Any) -> str:
+        return resolve_typename(
+            raw, self._possible_types, self._typenames_by_class
+        )
+
     def add_field(self, value: "GraphQLField") -> None:
         if value.name == "__typename":
             self._fields[value.name] = value
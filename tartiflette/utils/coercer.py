@@ -1,28 +1,15 @@
 from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from tartiflette.types.exceptions.tartiflette import InvalidValue, NullError
-from tartiflette.types.helpers import has_typename, reduce_type
+from tartiflette.types.helpers import reduce_type
+from tartiflette.types.helpers.wraps_with_directives import (
+    _default_directive_endpoint,
+)
 
 from .coercer_way import CoercerWay
 
 
-def _set_typename(result: Any, typename: Optional[str]) -> None:
-    if result is None or typename is None or has_typename(result):
-        return
-
-    try:
-        result["_typename"] = typename
-        return
-    except TypeError:
-        pass
-
-    try:
-        setattr(result, "_typename", typename)
-    except AttributeError:
-        pass  # Res is unmutable
-
-
 async def _scalar_coercer(
     func: Callable, val: Optional[Any], *_args, **_kwargs
 ):
@@ -33,12 +20,10 @@ async def _scalar_coercer(
 
 
 async def _object_coercer(
-    raw_type: Optional[str], val: Optional[Any], *_args, **_kwargs
+    val: Optional[Any], *_args, **_kwargs
 ) -> Optional[dict]:
     if val is None:
         return None
-
-    _set_typename(val, raw_type)
     return {}
 
 
@@ -137,14 +122,6 @@ def _is_a_scalar(
     return None
 
 
-def _is_union(reduced_type: str, schema: "GraphQLSchema") -> bool:
-    try:
-        return schema.find_type(reduced_type).is_union
-    except (AttributeError, KeyError):
-        pass
-    return False
-
-
 async def _input_object_coercer(
     input_field_coercers: Dict[str, "GraphQLArgument"],
     values: Dict[Any, Any],
@@ -216,22 +193,11 @@ def _add_directive_runner_partial(func, reduce_type_name, schema, way):
     return func
 
 
-def get_coercer(
-    field: Union["GraphQLField", "GraphQLArgument"],
-    schema=None,
-    way=CoercerWay.OUTPUT,
-) -> Optional[Callable]:
-
-    schema = schema or field.schema
-    if not schema:
-        return None
-
-    field_type = field.gql_type
+def _build_coercer(
+    field_type: Union[str, "GraphQLType"], schema: "GraphQLSchema", way
+) -> Callable:
     reduced_type = reduce_type(field_type)
-    is_union = _is_union(reduced_type, schema)
-    default_coercer = partial(
-        _object_coercer, reduced_type if not is_union else None
-    )
+    default_coercer = _object_coercer
 
     # TODO We can do better here.
     try:
@@ -251,3 +217,231 @@ def get_coercer(
 
     # Manage directives
     return _add_directive_runner_partial(coercer, reduced_type, schema, way)
+
+
+def get_coercer(
+    field: Union["GraphQLField", "GraphQLArgument"],
+    schema=None,
+    way=CoercerWay.OUTPUT,
+) -> Optional[Callable]:
+
+    schema = schema or field.schema
+    if not schema:
+        return None
+
+    # A coercer only depends on the type, the fields & arguments of the same
+    # type share the same one once the types of the schema are baked.
+    coercers = getattr(schema, "coercers", None)
+    if not isinstance(coercers, dict):
+        return _build_coercer(field.gql_type, schema, way)
+
+    key = (str(field.gql_type), way)
+    try:
+        return coercers[key]
+    except KeyError:
+        coercer = coercers[key] = _build_coercer(field.gql_type, schema, way)
+    return coercer
+
+
+# Compiled output coercers
+#
+# A compiled coercer is a single synchronous callable specialised for the
+# shape of a field type (e.g "non-null list of non-null items"), looping over
+# the items of the lists instead of calling a chain of coroutines per value.
+# Like the other coercers, they're kept by the schema once its types are
+# baked, so that the fields of the same type share the same one.
+
+
+def _raise_null_error(val: Any, info: "Info") -> None:
+    raise NullError(val, info)
+
+
+def _get_type_shape(field_type: "GraphQLType") -> Tuple[bool, ...]:
+    """
+    Returns whether each level of the type is non-null, from the outermost
+    level to the named type, each level but the last being a list.
+    """
+    shape = []
+    is_not_null = False
+    current_type = field_type
+    while hasattr(current_type, "gql_type"):
+        if current_type.is_list:
+            shape.append(is_not_null)
+            is_not_null = False
+        if current_type.is_not_null:
+            is_not_null = True
+        current_type = current_type.gql_type
+    shape.append(is_not_null)
+    return tuple(shape)
+
+
+def _get_enum_converter(
+    enum_valid_values: Tuple[str, ...], coerce_output: Callable
+) -> Callable:
+    valid_values = frozenset(enum_valid_values)
+
+    def convert(val: Any, info: "Info") -> Any:
+        if val not in valid_values:
+            raise InvalidValue(val, info)
+        return coerce_output(val)
+
+    return convert
+
+
+def _object_converter(_val: Any) -> dict:
+    return {}
+
+
+def _compile_items_coercer(
+    is_not_null: bool, convert: Callable, takes_info: bool
+) -> Callable:
+    # The hot loop of the coercion of a list of named types, converters
+    # which don't need the `info` (scalars & objects) are called directly.
+    # pylint: disable=function-redefined
+    if takes_info and is_not_null:
+
+        def coerce_items(val, info):
+            return [
+                convert(item, info)
+                if item is not None
+                else _raise_null_error(item, info)
+                for item in val
+            ]
+
+    elif takes_info:
+
+        def coerce_items(val, info):
+            return [
+                convert(item, info) if item is not None else None
+                for item in val
+            ]
+
+    elif is_not_null:
+
+        def coerce_items(val, info):
+            return [
+                convert(item)
+                if item is not None
+                else _raise_null_error(item, info)
+                for item in val
+            ]
+
+    else:
+
+        def coerce_items(val, _info):
+            return [convert(item) if item is not None else None for item in val]
+
+    return coerce_items
+
+
+def _compile_coercer(
+    shape: Tuple[bool, ...], convert: Callable, takes_info: bool = False
+) -> Callable:
+    is_not_null = shape[0]
+
+    if len(shape) == 1:
+
+        def coerce_value(val, _field_definition, _ctx, info):
+            if val is None:
+                if is_not_null:
+                    raise NullError(val, info)
+                return None
+            return convert(val, info) if takes_info else convert(val)
+
+        return coerce_value
+
+    if len(shape) == 2:
+        coerce_items = _compile_items_coercer(shape[1], convert, takes_info)
+    else:
+        coerce_item = _compile_coercer(shape[1:], convert, takes_info)
+
+        def coerce_items(val, info):
+            return [coerce_item(item, None, None, info) for item in val]
+
+    def coerce_list(val, _field_definition, _ctx, info):
+        if val is None:
+            if is_not_null:
+                raise NullError(val, info)
+            return None
+
+        if not isinstance(val, list):
+            val = [val]
+        return coerce_items(val, info)
+
+    return coerce_list
+
+
+def _has_directive_runner(reduced_type: str, schema: "GraphQLSchema", way):
+    try:
+        directives = schema.find_type(reduced_type).directives
+    except (AttributeError, KeyError):
+        return False
+
+    return directives.get(way) is not _default_directive_endpoint
+
+
+def _build_sync_coercer(
+    field_type: "GraphQLType", schema: "GraphQLSchema", way
+) -> Optional[Callable]:
+    reduced_type = reduce_type(field_type)
+    if _has_directive_runner(reduced_type, schema, way):
+        return None
+
+    try:
+        convert = None
+        enum = schema.find_enum(reduced_type)
+        if enum:
+            scalar = schema.find_scalar("String")
+            return _compile_coercer(
+                _get_type_shape(field_type),
+                _get_enum_converter(
+                    tuple(x.value for x in enum.values),
+                    scalar.coerce_output
+                    if way == CoercerWay.OUTPUT
+                    else scalar.coerce_input,
+                ),
+                takes_info=True,
+            )
+
+        scalar = schema.find_scalar(reduced_type)
+        if scalar:
+            convert = (
+                scalar.coerce_output
+                if way == CoercerWay.OUTPUT
+                else scalar.coerce_input
+            )
+        elif _is_an_input_object(reduced_type, schema):
+            return None
+    except AttributeError:
+        pass
+
+    if convert is None:
+        convert = _object_converter
+
+    return _compile_coercer(_get_type_shape(field_type), convert)
+
+
+def get_sync_coercer(
+    field: "GraphQLField", schema=None, way=CoercerWay.OUTPUT
+) -> Optional[Callable]:
+    """
+    Returns the compiled, synchronous, version of the coercer of the field
+    or None if the coercion of its type relies on directives, which are
+    asynchronous.
+    """
+    schema = schema or field.schema
+    if not schema:
+        return None
+
+    coercers = getattr(schema, "coercers", None)
+    if not isinstance(coercers, dict):
+        return _build_sync_coercer(field.gql_type, schema, way)
+
+    key = (str(field.gql_type), way, "sync")
+    try:
+        return coercers[key]
+    except KeyError:
+        coercer = coercers[key] = _build_sync_coercer(
+            field.gql_type, schema, way
+        )
+    return coercer
@@ -0,0 +1,96 @@
+import json
+
+from typing import Any, Dict, Iterator, List, Optional
+
+DEFAULT_CHUNK_SIZE = 65536
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _has_containers(values: Any) -> bool:
+    return any(isinstance(value, (dict, list)) for value in values)
+
+
+def iter_encode(value: Any) -> Iterator[str]:
+    """
+    Encodes a value in JSON piece by piece, the same way as
+    `json.dumps(value, ensure_ascii=False, separators=(",", ":"))`.
+    Lists of objects or lists are walked item by item, so that the encoded
+    string of a large list is never built at once. Any other value (e.g an
+    object without lists or a list of scalars) is encoded in a single piece.
+    :param value: the value to encode
+    :return: the pieces of the encoded value
+    """
+    if isinstance(value, list) and _has_containers(value):
+        yield "["
+        for index, item in enumerate(value):
+            if index:
+                yield ","
+            yield from iter_encode(item)
+        yield "]"
+    elif isinstance(value, dict) and _has_containers(value.values()):
+        yield "{"
+        yield from iter_encode_members(value)
+        yield "}"
+    else:
+        yield _encode(value)
+
+
+def iter_encode_members(value: Dict[str, Any]) -> Iterator[str]:
+    """
+    Encodes the members of an object in JSON piece by piece, without the
+    enclosing braces.
+    :param value: the object whose members are encoded
+    :return: the pieces of the encoded members
+    """
+    for index, (key, item) in enumerate(value.items()):
+        if index:
+            yield ","
+        yield encode_key(key)
+        yield from iter_encode(item)
+
+
+def encode_key(key: str) -> str:
+    """
+    Encodes the key of a member of an object in JSON, followed by a colon.
+    :param key: the key
+    :return: the encoded key
+    """
+    return _encode(key) + ":"
+
+
+class ChunkBuffer:
+    """
+    Gathers the pieces of an encoded response into UTF-8 chunks of at least
+    `chunk_size` characters.
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._chunk_size = chunk_size
+        self._pieces: List[str] = []
+        self._size = 0
+
+    def write(self, piece: str) -> Optional[bytes]:
+        """
+        Adds a piece to the buffer.
+        :param piece: the piece to add
+        :return: a chunk once the buffer is full, otherwise None
+        """
+        self._pieces.append(piece)
+        self._size += len(piece)
+        if self._size < self._chunk_size:
+            return None
+        return self.flush()
+
+    def flush(self) -> Optional[bytes]:
+        """
+        Empties the buffer.
+        :return: the chunk of the buffered pieces, None if there is none
+        """
+        if not self._pieces:
+            return None
+
+        chunk = "".join(self._pieces).encode("utf-8")
+        self._pieces = []
+        self._size = 0
+        return chunk
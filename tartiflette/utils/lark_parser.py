@@ -0,0 +1,103 @@
+import hashlib
+import pickle
+
+from functools import lru_cache
+from typing import Optional
+
+import lark
+
+from lark import Lark
+from lark.parsers.lalr_analysis import Reduce, Shift
+
+# The helpers of this module are also used by `setup.py` to prebuild the
+# parsers, they shouldn't depend on the rest of tartiflette.
+
+_LARK_OPTIONS = {
+    "start": "document",
+    "parser": "lalr",
+    "lexer": "contextual",
+    "propagate_positions": True,
+}
+
+# Highest protocol available with python 3.6
+_PICKLE_PROTOCOL = 4
+
+
+# The actions of the parsing tables are compared by identity, they have to be
+# the same objects once unpickled.
+_ACTIONS = {"Shift": Shift, "Reduce": Reduce}
+
+
+class _Pickler(pickle.Pickler):
+    def persistent_id(self, obj):
+        if obj is Shift or obj is Reduce:
+            return obj.name
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        return _ACTIONS[pid]
+
+
+def _read_grammar(grammar_path: str) -> str:
+    with open(grammar_path) as grammar_file:
+        return grammar_file.read()
+
+
+def _get_signature(grammar: str) -> str:
+    return hashlib.sha256(
+        ("%s\n%r\n%s" % (lark.__version__, _LARK_OPTIONS, grammar)).encode(
+            "utf-8"
+        )
+    ).hexdigest()
+
+
+def get_prebuilt_parser_path(grammar_path: str) -> str:
+    return grammar_path + ".pickle"
+
+
+def dump_lark_parser(grammar_path: str) -> str:
+    """
+    Builds the LALR(1) parser of a grammar and pickles it next to the
+    grammar, along with the signature of the grammar it has been built from.
+    :param grammar_path: path of the Lark grammar file
+    :return: the path of the pickled parser
+    """
+    grammar = _read_grammar(grammar_path)
+    prebuilt_parser_path = get_prebuilt_parser_path(grammar_path)
+    with open(prebuilt_parser_path, "wb") as prebuilt_parser_file:
+        _Pickler(prebuilt_parser_file, protocol=_PICKLE_PROTOCOL).dump(
+            (_get_signature(grammar), Lark(grammar, **_LARK_OPTIONS))
+        )
+    return prebuilt_parser_path
+
+
+def _load_lark_parser(grammar_path: str, grammar: str) -> Optional[Lark]:
+    try:
+        with open(
+            get_prebuilt_parser_path(grammar_path), "rb"
+        ) as prebuilt_parser_file:
+            signature, parser = _Unpickler(prebuilt_parser_file).load()
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+    if signature != _get_signature(grammar) or not isinstance(parser, Lark):
+        return None
+    return parser
+
+
+@lru_cache(maxsize=None)
+def get_lark_parser(grammar_path: str) -> Lark:
+    """
+    Returns the LALR(1) parser of a grammar, built once per process. The
+    parser prebuilt by `dump_lark_parser` is loaded when it has been built
+    from the same grammar with the same version of Lark, which skips the
+    analysis of the grammar and the computation of the parsing tables.
+    :param grammar_path: path of the Lark grammar file
+    :return: the Lark parser of the grammar
+    """
+    grammar = _read_grammar(grammar_path)
+    return _load_lark_parser(grammar_path, grammar) or Lark(
+        grammar, **_LARK_OPTIONS
+    )
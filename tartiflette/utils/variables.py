@@ -0,0 +1,197 @@
+from copy import copy
+from typing import Any, Dict, List, Optional, Tuple
+
+from tartiflette.types.exceptions.tartiflette import (
+    InvalidType,
+    UnknownVariableException,
+)
+from tartiflette.utils.arguments import UNDEFINED_VALUE
+
+
+class VariableValue:
+    """
+    Placeholder left in the query plan where the query references a variable,
+    so that the plan doesn't depend on the variables of a given request.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return "VariableValue(name={!r})".format(self.name)
+
+    def __eq__(self, other: Any) -> bool:
+        return self is other or (
+            type(self) is type(other) and self.name == other.name
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+
+def has_variables(value: Any) -> bool:
+    if isinstance(value, VariableValue):
+        return True
+
+    if isinstance(value, dict):
+        return any(has_variables(x) for x in value.values())
+
+    if isinstance(value, list):
+        return any(has_variables(x) for x in value)
+
+    try:
+        return has_variables(value.value)
+    except AttributeError:
+        pass
+    return False
+
+
+def bind_variables(value: Any, variables: Dict[str, Any]) -> Any:
+    if isinstance(value, VariableValue):
+        return variables.get(value.name, UNDEFINED_VALUE)
+
+    if isinstance(value, dict):
+        bound = {}
+        for key, item in value.items():
+            item = bind_variables(item, variables)
+            if item is not UNDEFINED_VALUE:
+                bound[key] = item
+        return bound
+
+    if isinstance(value, list):
+        return [
+            None if item is UNDEFINED_VALUE else item
+            for item in (bind_variables(x, variables) for x in value)
+        ]
+
+    return value
+
+
+def bind_arguments(
+    arguments: Dict[str, "NodeArgument"], variables: Dict[str, Any]
+) -> Dict[str, "NodeArgument"]:
+    bound = {}
+    for name, argument in arguments.items():
+        if not has_variables(argument.value):
+            bound[name] = argument
+            continue
+
+        value = bind_variables(argument.value, variables)
+        if value is UNDEFINED_VALUE:
+            continue
+
+        bound[name] = copy(argument)
+        bound[name].value = value
+    return bound
+
+
+def bind_directives(
+    directives: List[Dict[str, Any]], variables: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    bound_directives = []
+    for directive in directives:
+        if not has_variables(directive["args"]):
+            bound_directives.append(directive)
+            continue
+
+        bound_directives.append(
+            {
+                **directive,
+                "args": bind_variables(directive["args"], variables),
+            }
+        )
+    return bound_directives
+
+
+def _validate_type(
+    variable_definition: "NodeVariableDefinition",
+    a_value: Any,
+    is_nullable: bool,
+) -> Optional[Exception]:
+    if is_nullable and a_value is None:
+        return None
+
+    try:
+        if not isinstance(a_value, variable_definition.var_type):
+            return InvalidType(
+                "Given value for < %s > is not type < %s >"
+                % (variable_definition.var_name, variable_definition.var_type),
+                locations=[variable_definition.location],
+            )
+    except TypeError:
+        # TODO remove this, and handle the case it's an InputValue
+        # (look at registered input values and compare fields)
+        pass
+    return None
+
+
+def _coerce_variable(
+    variable_definition: "NodeVariableDefinition", variables: Dict[str, Any]
+) -> Tuple[Any, List[Exception]]:
+    name = variable_definition.var_name
+    if name not in variables:
+        default_values = variable_definition.default_value
+        if (
+            default_values is None or default_values is UNDEFINED_VALUE
+        ) and not variable_definition.is_nullable:
+            return UNDEFINED_VALUE, [UnknownVariableException(name)]
+        return default_values, []
+
+    is_nullable = variable_definition.is_nullable
+    a_value = variables[name]
+
+    if variable_definition.is_list:
+        if not isinstance(a_value, list):
+            return (
+                a_value,
+                [
+                    InvalidType(
+                        "Expecting List for < %s > values" % name,
+                        locations=[variable_definition.location],
+                    )
+                ],
+            )
+
+        errors = [
+            _validate_type(variable_definition, val, is_nullable)
+            for val in a_value
+        ]
+        return a_value, [error for error in errors if error]
+
+    error = _validate_type(variable_definition, a_value, is_nullable)
+    return a_value, [error] if error else []
+
+
+def coerce_variables(
+    operation: "NodeOperationDefinition",
+    variables: Optional[Dict[str, Any]],
+) -> Tuple[Dict[str, Any], List[Exception]]:
+    """
+    Validates the variables given for a request against the variable
+    definitions of the executed operation and fills in the default values.
+    This is the only part of the query validation which depends on the
+    request, so it has to be done on every execution of a (cached) plan.
+    """
+    variables = dict(variables) if variables else {}
+    errors = []
+
+    for variable_definition in operation.variable_definitions:
+        value, variable_errors = _coerce_variable(
+            variable_definition, variables
+        )
+        if variable_errors:
+            errors.extend(variable_errors)
+            continue
+        variables[variable_definition.var_name] = value
+
+    for name in operation.variable_usages:
+        if name not in variables:
+            errors.append(UnknownVariableException(name))
+
+    for name, error_factory in operation.required_variables:
+        if variables.get(name) is UNDEFINED_VALUE:
+            errors.append(error_factory())
+
+    return variables, errors
@@ -0,0 +1,152 @@
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+type Product {
+  id: Int!
+  name: String
+  price(currency: String = "EUR"): String!
+}
+
+type Shop {
+  products: [Product]
+}
+
+type Query {
+  shops: [Shop]
+  product: Product
+}
+"""
+
+_QUERY = """
+{
+  shops {
+    products {
+      id
+      name
+      price(currency: "USD")
+    }
+  }
+  product { name }
+}
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "execution_strategy,expected_calls",
+    [
+        (
+            "depth_first",
+            [
+                ("name", [1, 2]),
+                ("name", [3]),
+                ("name", [4]),
+                ("price", [1, 2]),
+                ("price", [3]),
+            ],
+        ),
+        (
+            "breadth_first",
+            [("name", [1, 2, 3]), ("name", [4]), ("price", [1, 2, 3])],
+        ),
+    ],
+)
+async def test_batch_resolver(execution_strategy, expected_calls):
+    schema_name = "test_batch_resolver_%s" % execution_strategy
+    calls = []
+
+    @Resolver("Query.shops", schema_name=schema_name)
+    async def resolve_query_shops(parent, args, ctx, info):
+        return [
+            {"products": [{"id": 1}, {"id": 2}]},
+            {"products": [{"id": 3}]},
+        ]
+
+    @Resolver("Query.product", schema_name=schema_name)
+    async def resolve_query_product(parent, args, ctx, info):
+        return {"id": 4}
+
+    @Resolver("Product.name", schema_name=schema_name, batch=True)
+    async def resolve_product_name(parents, args, ctx, info):
+        calls.append(("name", [parent["id"] for parent in parents]))
+        return [
+            (
+                ValueError("No name for < 2 >")
+                if parent["id"] == 2
+                else "Product %d" % parent["id"]
+            )
+            for parent in parents
+        ]
+
+    @Resolver("Product.price", schema_name=schema_name, batch=True)
+    async def resolve_product_price(parents, args, ctx, info):
+        calls.append(("price", [parent["id"] for parent in parents]))
+        return [
+            "%d %s" % (parent["id"] * 10, args["currency"])
+            for parent in parents
+        ]
+
+    engine = await create_engine(
+        _SDL, schema_name=schema_name, execution_strategy=execution_strategy
+    )
+
+    assert await engine.execute(_QUERY) == {
+        "data": {
+            "shops": [
+                {
+                    "products": [
+                        {"id": 1, "name": "Product 1", "price": "10 USD"},
+                        {"id": 2, "name": None, "price": "20 USD"},
+                    ]
+                },
+                {
+                    "products": [
+                        {"id": 3, "name": "Product 3", "price": "30 USD"}
+                    ]
+                },
+            ],
+            "product": {"name": "Product 4"},
+        },
+        "errors": [
+            {
+                "message": "No name for < 2 >",
+                "path": ["shops", "products", "name"],
+                "locations": [{"line": 6, "column": 7}],
+            }
+        ],
+    }
+    assert sorted(calls) == sorted(expected_calls)
+
+
+@pytest.mark.asyncio
+async def test_batch_resolver_invalid_results():
+    @Resolver("Query.shops", schema_name="test_batch_resolver_invalid_results")
+    async def resolve_query_shops(parent, args, ctx, info):
+        return [{"products": [{"id": 1}, {"id": 2}]}]
+
+    @Resolver(
+        "Product.price",
+        schema_name="test_batch_resolver_invalid_results",
+        batch=True,
+    )
+    async def resolve_product_price(parents, args, ctx, info):
+        return ["10 EUR"]
+
+    engine = await create_engine(
+        _SDL, schema_name="test_batch_resolver_invalid_results"
+    )
+
+    assert await engine.execute("{ shops { products { price } } }") == {
+        "data": {"shops": [{"products": None}]},
+        "errors": [
+            {
+                "message": "Batch resolver of < price > must return a list "
+                "of 2 results.",
+                "path": ["shops", "products", "price"],
+                "locations": [{"line": 1, "column": 22}],
+            }
+        ]
+        * 2,
+    }
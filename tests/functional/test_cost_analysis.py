@@ -0,0 +1,228 @@
+import pytest
+
+from tartiflette import CostAnalyzer, Resolver, create_engine
+
+_SDL = """
+interface Named {
+  name: String
+}
+
+type Post implements Named {
+  name: String
+  comments(limit: Int = 5): [String] @cost(weight: 2)
+}
+
+type User implements Named {
+  name: String
+  friends(first: Int): [User]
+  posts(count: Int): [Post] @cost(multipliers: ["count"])
+}
+
+type Query {
+  user: User
+  users(first: Int, last: Int): [User]
+  named: [Named]
+}
+"""
+
+
+@pytest.fixture(scope="module")
+async def ttftt_engine():
+    @Resolver("Query.user", schema_name="test_cost_analysis")
+    async def resolve_query_user(*_args, **_kwargs):
+        return {"name": "Bob"}
+
+    @Resolver("Query.users", schema_name="test_cost_analysis", cost=10)
+    async def resolve_query_users(*_args, **_kwargs):
+        return [{"name": "Bob"}]
+
+    return await create_engine(
+        _SDL,
+        schema_name="test_cost_analysis",
+        cost_analyzer=CostAnalyzer(max_depth=4, max_nodes=6, max_cost=100),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query,variables,expected",
+    [
+        ("{ user { name } }", None, {"depth": 2, "nodes": 2, "cost": 2}),
+        # (10 + 1) * 3
+        (
+            "{ users(first: 3) { name } }",
+            None,
+            {"depth": 2, "nodes": 2, "cost": 33},
+        ),
+        (
+            "query ($first: Int) { users(first: $first) { name } }",
+            {"first": 4},
+            {"depth": 2, "nodes": 2, "cost": 44},
+        ),
+        # The first multiplier argument given is used
+        (
+            "{ users(last: 2, first: 3) { name } }",
+            None,
+            {"depth": 2, "nodes": 2, "cost": 33},
+        ),
+        # 1 + (1 + 1 + 2 * 5) * 2
+        (
+            "{ user { posts(count: 2) { name comments } } }",
+            None,
+            {"depth": 3, "nodes": 4, "cost": 25},
+        ),
+        # 1 + (1 + 1 + (1 + 1)) * 3
+        (
+            "{ user { friends(first: 3) { name friends { name } } } }",
+            None,
+            {"depth": 4, "nodes": 5, "cost": 13},
+        ),
+        # The most expensive object type is counted
+        (
+            """
+            {
+              named {
+                name
+                ... on User { friends(first: 2) { name } }
+                ... on Post { comments }
+              }
+            }
+            """,
+            None,
+            {"depth": 3, "nodes": 4, "cost": 12},
+        ),
+        (
+            "query ($skip: Boolean!) { user { name friends @skip(if: $skip) { name } } }",
+            {"skip": True},
+            {"depth": 2, "nodes": 2, "cost": 2},
+        ),
+        (
+            "{ user { ... @include(if: false) { friends { name } } name } }",
+            None,
+            {"depth": 2, "nodes": 2, "cost": 2},
+        ),
+    ],
+)
+async def test_cost_analysis(ttftt_engine, query, variables, expected):
+    result = await ttftt_engine.execute(query, variables=variables)
+
+    assert "errors" not in result
+    assert result["extensions"] == {"cost": expected}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query,message",
+    [
+        (
+            "{ user { friends { friends { friends { friends { name } } } } } }",
+            "Query depth of 6 exceeds the maximum depth of 4.",
+        ),
+        (
+            "{ user { n1: name n2: name n3: name n4: name n5: name n6: name } }",
+            "Query selects 7 fields, more than the maximum of 6.",
+        ),
+        (
+            "{ users(first: 10) { name } }",
+            "Query cost of 110 exceeds the maximum cost of 100.",
+        ),
+    ],
+)
+async def test_cost_analysis_rejected(ttftt_engine, query, message):
+    result = await ttftt_engine.execute(query)
+
+    assert result["data"] is None
+    assert [error["message"] for error in result["errors"]] == [message]
+    assert "cost" in result["errors"][0]["extensions"]
+
+
+@pytest.mark.asyncio
+async def test_cost_analysis_entry_points(ttftt_engine):
+    query = "{ users(first: 50) { name } }"
+    message = "Query cost of 550 exceeds the maximum cost of 100."
+
+    chunks = [chunk async for chunk in ttftt_engine.execute_stream(query)]
+    assert message.encode("utf-8") in b"".join(chunks)
+
+    payloads = [
+        payload async for payload in ttftt_engine.execute_incremental(query)
+    ]
+    assert len(payloads) == 1
+    assert payloads[0]["hasNext"] is False
+    assert payloads[0]["errors"][0]["message"] == message
+
+    assert b"".join(
+        [
+            chunk
+            async for chunk in ttftt_engine.execute_stream("{ user { name } }")
+        ]
+    ) == (
+        b'{"data":{"user":{"name":"Bob"}},'
+        b'"extensions":{"cost":{"depth":2,"nodes":2,"cost":2}}}'
+    )
+
+    payloads = [
+        payload
+        async for payload in ttftt_engine.execute_incremental(
+            "{ user { name } }"
+        )
+    ]
+    assert payloads == [
+        {
+            "data": {"user": {"name": "Bob"}},
+            "hasNext": False,
+            "extensions": {"cost": {"depth": 2, "nodes": 2, "cost": 2}},
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cost_analysis_without_report():
+    @Resolver("Query.user", schema_name="test_cost_analysis_without_report")
+    async def resolve_query_user(*_args, **_kwargs):
+        return {"name": "Bob"}
+
+    @Resolver(
+        "Query.users", schema_name="test_cost_analysis_without_report", cost=10
+    )
+    async def resolve_query_users(*_args, **_kwargs):
+        return [{"name": "Bob"}]
+
+    engine = await create_engine(
+        _SDL,
+        schema_name="test_cost_analysis_without_report",
+        cost_analyzer=CostAnalyzer(max_cost=10, report=False),
+    )
+
+    assert await engine.execute("{ user { name } }") == {
+        "data": {"user": {"name": "Bob"}}
+    }
+    assert (await engine.execute("{ users { name } }"))["errors"][0][
+        "message"
+    ] == "Query cost of 11 exceeds the maximum cost of 10."
+
+
+@pytest.mark.asyncio
+async def test_cost_analysis_user_defined_directive():
+    @Resolver("Query.user", schema_name="test_cost_analysis_user_directive")
+    async def resolve_query_user(*_args, **_kwargs):
+        return {"name": "Bob"}
+
+    engine = await create_engine(
+        """
+        directive @cost(value: Float) on FIELD_DEFINITION
+
+        type User {
+          name: String
+        }
+
+        type Query {
+          user: User @cost(value: 1.5)
+        }
+        """,
+        schema_name="test_cost_analysis_user_directive",
+    )
+
+    assert await engine.execute("{ user { name } }") == {
+        "data": {"user": {"name": "Bob"}}
+    }
@@ -0,0 +1,126 @@
+import pytest
+
+from tartiflette import Resolver, Subscription, create_engine
+
+_SDL = """
+type Author {
+  id: Int!
+  name: String
+}
+
+type Post {
+  id: Int!
+  author: Author
+  coAuthor: Author
+}
+
+type Query {
+  posts: [Post]
+}
+"""
+
+_AUTHORS = {i: {"id": i, "name": "Author %d" % i} for i in range(5)}
+
+
+@pytest.fixture(scope="module")
+async def ttftt_engine():
+    batches = []
+
+    async def load_authors(keys):
+        batches.append(keys)
+        return [_AUTHORS.get(key) for key in keys]
+
+    @Resolver("Query.posts", schema_name="test_dataloader")
+    async def resolve_query_posts(parent, args, ctx, info):
+        return [{"id": i, "author_id": i % 5} for i in range(20)]
+
+    @Resolver("Post.author", schema_name="test_dataloader")
+    async def resolve_post_author(parent, args, ctx, info):
+        return await info.execution_ctx.get_dataloader(load_authors).load(
+            parent["author_id"]
+        )
+
+    @Resolver("Post.coAuthor", schema_name="test_dataloader")
+    async def resolve_post_co_author(parent, args, ctx, info):
+        loader = info.execution_ctx.get_dataloader(load_authors)
+        ctx["loader"] = loader
+        return await loader.load((parent["author_id"] + 1) % 6)
+
+    engine = await create_engine(_SDL, schema_name="test_dataloader")
+    engine.batches = batches
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_dataloader_batches_a_level(ttftt_engine):
+    ttftt_engine.batches.clear()
+    ctx = {}
+
+    result = await ttftt_engine.execute(
+        "{ posts { id author { name } coAuthor { id } } }", context=ctx
+    )
+
+    assert len(result["data"]["posts"]) == 20
+    assert result["data"]["posts"][6] == {
+        "id": 6,
+        "author": {"name": "Author 1"},
+        "coAuthor": {"id": 2},
+    }
+    assert result["data"]["posts"][4]["coAuthor"] is None
+
+    assert ttftt_engine.batches == [[0, 1, 2, 3, 4, 5]]
+    assert ctx["loader"].info() == (40, 34, 1, 6, 6)
+
+
+@pytest.mark.asyncio
+async def test_dataloader_is_scoped_to_the_request(ttftt_engine):
+    ttftt_engine.batches.clear()
+
+    await ttftt_engine.execute("{ posts { author { name } } }")
+    await ttftt_engine.execute("{ posts { author { name } } }")
+
+    assert ttftt_engine.batches == [[0, 1, 2, 3, 4], [0, 1, 2, 3, 4]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_is_scoped_to_the_subscription_event():
+    batches = []
+    names = {0: "Author 0"}
+
+    async def load_authors(keys):
+        batches.append(keys)
+        return [{"id": key, "name": names[key]} for key in keys]
+
+    @Subscription(
+        "Subscription.newPost", schema_name="test_dataloader_subscription"
+    )
+    async def subscribe_new_post(*_args, **_kwargs):
+        yield {"id": 1, "author_id": 0}
+        names[0] = "Renamed author 0"
+        yield {"id": 2, "author_id": 0}
+
+    @Resolver("Post.author", schema_name="test_dataloader_subscription")
+    async def resolve_post_author(parent, args, ctx, info):
+        return await info.execution_ctx.get_dataloader(load_authors).load(
+            parent["author_id"]
+        )
+
+    engine = await create_engine(
+        _SDL + "type Subscription { newPost: Post }",
+        schema_name="test_dataloader_subscription",
+    )
+
+    assert [
+        result
+        async for result in engine.subscribe(
+            "subscription { newPost { id author { name } } }"
+        )
+    ] == [
+        {"data": {"newPost": {"id": 1, "author": {"name": "Author 0"}}}},
+        {
+            "data": {
+                "newPost": {"id": 2, "author": {"name": "Renamed author 0"}}
+            }
+        },
+    ]
+    assert batches == [[0], [0]]
@@ -114,3 +114,107 @@ async def test_tartiflette_engine_initialization_with_string_schema(
         clean_registry.find_schema().find_type("Query").find_field("blogs")
         is not None
     )
+
+
+@pytest.mark.asyncio
+async def test_tartiflette_engine_query_cache(clean_registry):
+    from tartiflette import Resolver
+
+    @Resolver("Query.hello")
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "Hello " + args["name"]
+
+    engine = await create_engine(
+        """
+    type Query {
+        hello(name: String!): String
+    }
+    """,
+        query_cache_size=1,
+    )
+
+    query = """
+    query Hello($name: String!) {
+        hello(name: $name)
+    }
+    """
+
+    assert await engine.execute(query, variables={"name": "a"}) == {
+        "data": {"hello": "Hello a"}
+    }
+    assert await engine.execute(query, variables={"name": "b"}) == {
+        "data": {"hello": "Hello b"}
+    }
+    assert await engine.execute(
+        query, operation_name="Hello", variables={}
+    ) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "< name > is not known",
+                "path": None,
+                "locations": [],
+            },
+            {
+                "message": "< name > is not known",
+                "path": None,
+                "locations": [],
+            },
+        ],
+    }
+    assert engine.cache_info() == (2, 1, 0, 1, 1)
+
+    assert await engine.execute('{ hello(name: "c") }') == {
+        "data": {"hello": "Hello c"}
+    }
+    assert await engine.execute("{ unknown }") == {
+        "data": None,
+        "errors": [
+            {
+                "message": "field `Query.unknown` was not found in GraphQL schema.",
+                "path": ["unknown"],
+                "locations": [{"line": 1, "column": 3}],
+            }
+        ],
+    }
+    assert engine.cache_info() == (2, 3, 1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_tartiflette_engine_concurrent_executions(clean_registry):
+    import asyncio
+
+    from tartiflette import Resolver
+
+    @Resolver("Query.items")
+    async def resolve_query_items(parent, args, ctx, info):
+        await asyncio.sleep(0)
+        return [{"id": args["id"] * 10 + i} for i in range(3)]
+
+    engine = await create_engine(
+        """
+    type Item {
+        id: Int!
+    }
+
+    type Query {
+        items(id: Int!): [Item!]
+    }
+    """
+    )
+
+    query = """
+    query Items($id: Int!) {
+        items(id: $id) { id }
+    }
+    """
+
+    results = await asyncio.gather(
+        *[engine.execute(query, variables={"id": i}) for i in range(10)]
+    )
+
+    assert results == [
+        {"data": {"items": [{"id": i * 10 + j} for j in range(3)]}}
+        for i in range(10)
+    ]
+    assert engine.cache_info().misses == 1
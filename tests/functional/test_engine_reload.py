@@ -0,0 +1,163 @@
+import asyncio
+import sys
+
+import pytest
+
+from tartiflette import create_engine
+from tartiflette.types.exceptions.tartiflette import (
+    UnknownSchemaFieldResolver,
+)
+
+_SDL = """
+type Dog {
+  name: String
+}
+
+type Cat {
+  name: String
+}
+
+type Query {
+  dog: Dog
+  cat: Cat
+}
+"""
+
+_MODULE = """
+from tartiflette import Resolver
+
+
+@Resolver("Query.dog", schema_name="test_engine_reload")
+async def resolve_dog(*_args, **_kwargs):
+    return {"name": %r}
+
+
+@Resolver("Query.cat", schema_name="test_engine_reload")
+async def resolve_cat(*_args, **_kwargs):
+    return {"name": "cat", "age": 3}
+
+
+@Resolver("Dog.name", schema_name="test_engine_reload")
+async def resolve_dog_name(parent, _args, ctx, _info):
+    if ctx:
+        ctx["started"].set()
+        await ctx["resume"].wait()
+    return parent["name"]
+"""
+
+_DOG_QUERY = "query { dog { name } }"
+_CAT_QUERY = "query { cat { name } }"
+_INTROSPECTION_QUERY = 'query { __type(name: "Dog") { name } }'
+
+
+@pytest.fixture
+def reload_module(tmpdir):
+    module_path = tmpdir.join("engine_reload_resolvers.py")
+    module_path.write(_MODULE % "rex")
+    sys.path.insert(0, str(tmpdir))
+    sys.dont_write_bytecode, dont_write_bytecode = (
+        True,
+        sys.dont_write_bytecode,
+    )
+    yield module_path
+    sys.dont_write_bytecode = dont_write_bytecode
+    sys.path.remove(str(tmpdir))
+    sys.modules.pop("engine_reload_resolvers", None)
+
+
+@pytest.mark.asyncio
+async def test_engine_reload(clean_registry, reload_module):
+    engine = await create_engine(
+        _SDL,
+        schema_name="test_engine_reload",
+        modules=["engine_reload_resolvers"],
+    )
+
+    for query in (_DOG_QUERY, _CAT_QUERY, _INTROSPECTION_QUERY):
+        await engine.execute(query)
+
+    changes = await engine.reload(
+        _SDL.replace("type Cat {", "type Cat {\n  age: Int")
+    )
+
+    assert changes.added_types == frozenset()
+    assert changes.removed_types == frozenset()
+    assert changes.changed_types == frozenset({"Cat"})
+    assert changes.changed_directives == frozenset()
+    assert _DOG_QUERY in engine._query_cache
+    assert _CAT_QUERY not in engine._query_cache
+    assert _INTROSPECTION_QUERY not in engine._query_cache
+    # The kept queries are planned against the new schema
+    operations = engine._query_cache.get(_DOG_QUERY)
+    assert operations[None].children[0].schema is engine._schema
+
+    assert await engine.execute("query { cat { name age } }") == {
+        "data": {"cat": {"name": "cat", "age": 3}}
+    }
+    assert await engine.execute(_DOG_QUERY) == {
+        "data": {"dog": {"name": "rex"}}
+    }
+
+    reload_module.write(_MODULE % "medor")
+    changes = await engine.reload(
+        _SDL.replace("type Cat {", "type Cat {\n  age: Int")
+        + "type Bird { name: String }"
+    )
+
+    assert changes.added_types == frozenset({"Bird"})
+    assert changes.changed_types == frozenset({"Query"})
+    assert _DOG_QUERY not in engine._query_cache
+    assert await engine.execute(_DOG_QUERY) == {
+        "data": {"dog": {"name": "medor"}}
+    }
+
+
+@pytest.mark.asyncio
+async def test_engine_reload_in_flight(clean_registry, reload_module):
+    reload_module.write(_MODULE % "slow")
+    engine = await create_engine(
+        _SDL,
+        schema_name="test_engine_reload",
+        modules=["engine_reload_resolvers"],
+    )
+
+    ctx = {"started": asyncio.Event(), "resume": asyncio.Event()}
+    in_flight = asyncio.ensure_future(engine.execute(_DOG_QUERY, context=ctx))
+    await ctx["started"].wait()
+
+    reload_module.write(_MODULE % "rex")
+    changes = await engine.reload(
+        _SDL.replace("name: String", "name: String!")
+    )
+    ctx["resume"].set()
+
+    assert changes.changed_types == frozenset({"Query", "Dog", "Cat"})
+    assert await in_flight == {"data": {"dog": {"name": "slow"}}}
+    assert await engine.execute(_DOG_QUERY) == {
+        "data": {"dog": {"name": "rex"}}
+    }
+
+
+@pytest.mark.asyncio
+async def test_engine_reload_error(clean_registry, reload_module):
+    engine = await create_engine(
+        _SDL,
+        schema_name="test_engine_reload",
+        modules=["engine_reload_resolvers"],
+    )
+    schema = engine._schema
+
+    with pytest.raises(UnknownSchemaFieldResolver):
+        await engine.reload(_SDL.replace("  cat: Cat\n", ""))
+
+    assert engine._schema is schema
+    assert clean_registry.find_schema("test_engine_reload") is schema
+    assert await engine.execute(_CAT_QUERY) == {
+        "data": {"cat": {"name": "cat"}}
+    }
+    assert await engine.reload(_SDL) == (
+        frozenset(),
+        frozenset(),
+        frozenset(),
+        frozenset(),
+    )
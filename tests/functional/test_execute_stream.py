@@ -0,0 +1,173 @@
+import asyncio
+import json
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+type Item {
+  id: Int!
+  name: String
+  slow: String
+  next: Item
+  nonNull: Int!
+}
+
+type Query {
+  items(count: Int!): [Item]
+  fast: String
+  slow: String
+  nonNull: Int!
+  nullable: Int
+  error: String
+}
+
+type Mutation {
+  first: String
+  second: String
+}
+"""
+
+
+@pytest.fixture(scope="module")
+async def ttftt_engine(request):
+    # The tests which don't choose a strategy run with the default one
+    execution_strategy = getattr(request, "param", None)
+    schema_name = "test_execute_stream_%s" % (execution_strategy or "default")
+
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(_parent, args, *_args, **_kwargs):
+        return [
+            {"id": index, "name": "Ité%d" % index}
+            for index in range(args["count"])
+        ]
+
+    @Resolver("Item.slow", schema_name=schema_name)
+    async def resolve_item_slow(parent, _args, ctx, _info):
+        if not parent["id"]:
+            return None
+        await ctx["slow_event"].wait()
+        return "slow"
+
+    @Resolver("Item.next", schema_name=schema_name)
+    async def resolve_item_next(parent, *_args, **_kwargs):
+        return {"id": parent["id"] + 1, "name": "Next"}
+
+    @Resolver("Query.fast", schema_name=schema_name)
+    @Resolver("Mutation.first", schema_name=schema_name)
+    @Resolver("Mutation.second", schema_name=schema_name)
+    async def resolve_fast(*_args, **_kwargs):
+        return "fast"
+
+    @Resolver("Query.slow", schema_name=schema_name)
+    async def resolve_query_slow(_parent, _args, ctx, _info):
+        await ctx["slow_event"].wait()
+        return "slow"
+
+    @Resolver("Query.nonNull", schema_name=schema_name)
+    @Resolver("Item.nonNull", schema_name=schema_name)
+    @Resolver("Query.nullable", schema_name=schema_name)
+    async def resolve_null(*_args, **_kwargs):
+        return None
+
+    @Resolver("Query.error", schema_name=schema_name)
+    async def resolve_query_error(*_args, **_kwargs):
+        raise ValueError("Oops")
+
+    return await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        execution_strategy=execution_strategy or "depth_first",
+    )
+
+
+async def _execute_stream(engine, query, **kwargs):
+    return [chunk async for chunk in engine.execute_stream(query, **kwargs)]
+
+
+_QUERIES = [
+    "{ items(count: 3) { id name } fast nullable }",
+    "{ fast items(count: 0) { id } i: items(count: 2) { name } }",
+    "{ fast @skip(if: true) nullable }",
+    "{ fast @skip(if: true) }",
+    "{ fast error nullable }",
+    "{ fast nonNull }",
+    "{ fast unknown }",
+    "{ items(count: 2) { name next { id next { name } } } fast }",
+    "{ items(count: 2) { name nonNull } fast }",
+    "{ items(count: 2) { name next { nonNull } } nonNull }",
+    "{ items(count: 2) { name next { nonNull } } }",
+    "query ($count: Int!) { items(count: $count) { id } }",
+    "query A { fast } query B { nullable }",
+    "mutation { first second }",
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "ttftt_engine", ["depth_first", "breadth_first"], indirect=True
+)
+@pytest.mark.parametrize("query", _QUERIES)
+async def test_execute_stream(ttftt_engine, query):
+    chunks = await _execute_stream(ttftt_engine, query)
+
+    assert len(chunks) == 1
+    assert json.loads(b"".join(chunks)) == await ttftt_engine.execute(query)
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_chunk_size(ttftt_engine):
+    query = "{ items(count: 100) { id name } error }"
+
+    chunks = await _execute_stream(ttftt_engine, query, chunk_size=64)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) >= 64 for chunk in chunks[:-1])
+    assert json.loads(b"".join(chunks)) == await ttftt_engine.execute(query)
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_field_order(ttftt_engine):
+    slow_event = asyncio.Event()
+    stream = ttftt_engine.execute_stream(
+        "{ fast slow }", context={"slow_event": slow_event}, chunk_size=1
+    )
+    chunks = []
+    async for chunk in stream:
+        chunks.append(chunk)
+        # The completed field is yielded before the next one is resolved
+        if chunk == b'"fast"':
+            assert not slow_event.is_set()
+            slow_event.set()
+
+    assert b"".join(chunks) == b'{"data":{"fast":"fast","slow":"slow"}}'
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_list_items(ttftt_engine):
+    slow_event = asyncio.Event()
+    stream = ttftt_engine.execute_stream(
+        "{ items(count: 2) { name slow } }",
+        context={"slow_event": slow_event},
+        chunk_size=1,
+    )
+    chunks = []
+    async for chunk in stream:
+        chunks.append(chunk)
+        # The completed item is yielded before the next one is resolved
+        if b"".join(chunks) == (
+            '{"data":{"items":[{"name":"Ité0","slow":null}'.encode("utf-8")
+        ):
+            assert not slow_event.is_set()
+            slow_event.set()
+
+    assert slow_event.is_set()
+    assert json.loads(b"".join(chunks)) == {
+        "data": {
+            "items": [
+                {"name": "Ité0", "slow": None},
+                {"name": "Ité1", "slow": "slow"},
+            ]
+        }
+    }
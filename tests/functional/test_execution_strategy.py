@@ -0,0 +1,190 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+type Item {
+  id: Int!
+  name: String
+  children: [Item!]
+}
+
+type Query {
+  items: [Item]
+}
+"""
+
+_QUERY = """
+{
+  items {
+    id
+    children {
+      name
+      children { id }
+    }
+  }
+}
+"""
+
+
+_EXPECTED = {
+    "data": {
+        "items": [
+            {
+                "id": 0,
+                "children": [
+                    {"name": "Item 10", "children": []},
+                    {"name": "Item 11", "children": []},
+                ],
+            },
+            {
+                "id": 1,
+                "children": [
+                    {"name": "Item 20", "children": []},
+                    {"name": None, "children": []},
+                ],
+            },
+        ]
+    },
+    "errors": [
+        {
+            "message": "No name for < 21 >",
+            "path": ["items", "children", "name"],
+            "locations": [{"line": 6, "column": 7}],
+        }
+    ],
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "execution_strategy,levels_in_order",
+    [("depth_first", False), ("breadth_first", True)],
+)
+async def test_execution_strategy(execution_strategy, levels_in_order):
+    schema_name = "test_execution_strategy_%s" % execution_strategy
+    calls = []
+
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": i} for i in range(2)]
+
+    @Resolver("Item.children", schema_name=schema_name)
+    async def resolve_item_children(parent, args, ctx, info):
+        calls.append(("children", parent["id"], len(info.path)))
+        if parent["id"] >= 10:
+            return []
+        return [{"id": parent["id"] * 10 + 10 + i} for i in range(2)]
+
+    @Resolver("Item.name", schema_name=schema_name)
+    async def resolve_item_name(parent, args, ctx, info):
+        calls.append(("name", parent["id"], len(info.path)))
+        if parent["id"] == 21:
+            raise Exception("No name for < 21 >")
+        return "Item %d" % parent["id"]
+
+    engine = await create_engine(
+        _SDL, schema_name=schema_name, execution_strategy=execution_strategy
+    )
+
+    assert await engine.execute(_QUERY) == _EXPECTED
+    assert len(calls) == 10
+    if levels_in_order:
+        # Every field of a level is resolved before the next level
+        depths = [depth for _, _, depth in calls]
+        assert depths == sorted(depths)
+
+
+@pytest.mark.asyncio
+async def test_execution_strategy_unknown():
+    with pytest.raises(ImproperlyConfigured):
+        await create_engine(
+            _SDL,
+            schema_name="test_execution_strategy_unknown",
+            execution_strategy="nope",
+        )
+
+
+@pytest.mark.asyncio
+async def test_execution_strategy_breadth_first_mutation():
+    calls = []
+
+    @Resolver(
+        "Mutation.addItem",
+        schema_name="test_execution_strategy_breadth_first_mutation",
+    )
+    async def resolve_mutation_add_item(parent, args, ctx, info):
+        calls.append(("addItem", args["id"]))
+        return {"id": args["id"]}
+
+    @Resolver(
+        "Item.name",
+        schema_name="test_execution_strategy_breadth_first_mutation",
+    )
+    async def resolve_item_name(parent, args, ctx, info):
+        calls.append(("name", parent["id"]))
+        return "Item %d" % parent["id"]
+
+    engine = await create_engine(
+        _SDL + """
+        type Mutation {
+          addItem(id: Int!): Item
+        }
+        """,
+        schema_name="test_execution_strategy_breadth_first_mutation",
+        execution_strategy="breadth_first",
+    )
+
+    assert await engine.execute(
+        "mutation { a: addItem(id: 1) { name } b: addItem(id: 2) { name } }"
+    ) == {"data": {"a": {"name": "Item 1"}, "b": {"name": "Item 2"}}}
+
+    # The selection set of a mutation field is completed before the next one
+    assert calls == [("addItem", 1), ("name", 1), ("addItem", 2), ("name", 2)]
+
+
+@pytest.mark.asyncio
+async def test_execution_strategy_breadth_first_bounded(monkeypatch):
+    from tartiflette.executors import breadth_first
+
+    in_flight = []
+
+    @Resolver("Query.items", schema_name="test_execution_strategy_bounded")
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": i} for i in range(10)]
+
+    @Resolver("Item.name", schema_name="test_execution_strategy_bounded")
+    async def resolve_item_name(parent, args, ctx, info):
+        in_flight.append(parent["id"])
+        await asyncio.sleep(0.001 * (parent["id"] % 3))
+        in_flight.remove(parent["id"])
+        return "Item %d" % parent["id"]
+
+    monkeypatch.setattr(breadth_first, "_LEVEL_CONCURRENCY", 3)
+    engine = await create_engine(
+        _SDL,
+        schema_name="test_execution_strategy_bounded",
+        execution_strategy="breadth_first",
+    )
+
+    max_in_flight = 0
+
+    async def watch():
+        nonlocal max_in_flight
+        while True:
+            max_in_flight = max(max_in_flight, len(in_flight))
+            await asyncio.sleep(0)
+
+    watcher = asyncio.ensure_future(watch())
+    result = await engine.execute("{ items { id name } }")
+    watcher.cancel()
+
+    assert result == {
+        "data": {
+            "items": [{"id": i, "name": "Item %d" % i} for i in range(10)]
+        }
+    }
+    assert 0 < max_in_flight <= 3
@@ -0,0 +1,215 @@
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+type Post {
+  id: Int
+  title: String
+}
+
+type User {
+  id: Int
+  name: String
+  friend: User
+  posts(first: Int): [Post]
+}
+
+type Query {
+  viewer: User
+  user(id: Int!): User
+}
+"""
+
+_QUERY = """
+query ($skip: Boolean!, $first: Int) {
+  viewer {
+    ...UserFields
+    friend {
+      ...UserFields @skip(if: $skip)
+      friend { ...UserFields }
+    }
+  }
+  user(id: 2) { ...UserFields @include(if: true) }
+}
+
+fragment UserFields on User {
+  id
+  name
+  posts(first: $first) { ...PostFields }
+}
+
+fragment PostFields on Post {
+  id
+  title
+}
+"""
+
+
+@pytest.fixture(scope="module")
+async def ttftt_engine():
+    @Resolver("Query.viewer", schema_name="test_fragments")
+    @Resolver("Query.user", schema_name="test_fragments")
+    @Resolver("User.friend", schema_name="test_fragments")
+    async def resolve_user(parent, args, ctx, info):
+        return {"id": len(info.path), "name": "User %d" % len(info.path)}
+
+    @Resolver("User.posts", schema_name="test_fragments")
+    async def resolve_user_posts(parent, args, ctx, info):
+        return [
+            {"id": index, "title": "Post %d" % index}
+            for index in range(args.get("first") or 1)
+        ]
+
+    @Resolver("Post.title", schema_name="test_fragments")
+    async def resolve_post_title(parent, args, ctx, info):
+        if parent["id"]:
+            raise ValueError("No title for < %d >" % parent["id"])
+        return parent["title"]
+
+    return await create_engine(_SDL, schema_name="test_fragments")
+
+
+def _user(depth, first):
+    return {
+        "id": depth,
+        "name": "User %d" % depth,
+        "posts": [{"id": 0, "title": "Post 0"}]
+        + [{"id": index, "title": None} for index in range(1, first)],
+    }
+
+
+@pytest.mark.asyncio
+async def test_fragments_spread_several_times(ttftt_engine):
+    assert await ttftt_engine.execute(
+        _QUERY, variables={"skip": False, "first": 2}
+    ) == {
+        "data": {
+            "viewer": {
+                **_user(1, 2),
+                "friend": {
+                    **_user(2, 2),
+                    "friend": _user(3, 2),
+                },
+            },
+            "user": _user(1, 2),
+        },
+        "errors": [
+            {
+                "message": "No title for < 1 >",
+                "path": path + ["posts", "title"],
+                "locations": [{"line": 21, "column": 3}],
+            }
+            for path in (
+                ["viewer"],
+                ["viewer", "friend"],
+                ["viewer", "friend", "friend"],
+                ["user"],
+            )
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_fragments_spread_several_times_directives(ttftt_engine):
+    assert await ttftt_engine.execute(_QUERY, variables={"skip": True}) == {
+        "data": {
+            "viewer": {**_user(1, 1), "friend": {"friend": _user(3, 1)}},
+            "user": _user(1, 1),
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_fragments_cycle(ttftt_engine):
+    assert await ttftt_engine.execute(
+        """
+        query {
+          viewer { ...UserFields }
+          user(id: 1) { ...SelfFields }
+        }
+
+        fragment UserFields on User {
+          name
+          friend { ...FriendFields }
+        }
+
+        fragment FriendFields on User {
+          friend { ...UserFields }
+        }
+
+        fragment SelfFields on User { ...SelfFields }
+        """
+    ) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Cannot spread fragment < SelfFields > within "
+                "itself.",
+                "path": None,
+                "locations": [{"line": 16, "column": 39}],
+            },
+            {
+                "message": "Cannot spread fragment < UserFields > within "
+                "itself via < FriendFields >.",
+                "path": None,
+                "locations": [{"line": 13, "column": 20}],
+            },
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_fragments_on_interface_within_union():
+    schema_name = "test_fragments_on_interface_within_union"
+
+    @Resolver("Query.pets", schema_name=schema_name)
+    async def resolve_query_pets(*_args, **_kwargs):
+        return [
+            {"_typename": "Cat", "name": "Cat", "meow": "Meow"},
+            {"_typename": "Dog", "name": "Dog"},
+        ]
+
+    engine = await create_engine(
+        """
+        interface Named {
+            name: String
+        }
+
+        type Cat implements Named {
+            name: String
+            meow: String
+        }
+
+        type Dog implements Named {
+            name: String
+        }
+
+        union Pet = Cat | Dog
+
+        type Query {
+            pets: [Pet]
+        }
+        """,
+        schema_name=schema_name,
+    )
+
+    assert (
+        await engine.execute("""
+        query {
+          pets {
+            __typename
+            ... on Named { name }
+            ... on Cat { meow }
+          }
+        }
+        """)
+        == {
+            "data": {
+                "pets": [
+                    {"__typename": "Cat", "name": "Cat", "meow": "Meow"},
+                    {"__typename": "Dog", "name": "Dog"},
+                ]
+            }
+        }
+    )
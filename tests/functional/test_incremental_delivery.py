@@ -0,0 +1,249 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+type Item {
+  id: Int!
+  name: String!
+  slow: String
+}
+
+type Query {
+  fast: String
+  slow: String
+  item: Item
+  items(count: Int = 3): [Item]
+  names: [String]
+}
+"""
+
+
+@pytest.fixture(scope="module")
+async def ttftt_engine(request):
+    # The tests which don't choose a strategy run with the default one
+    execution_strategy = getattr(request, "param", None)
+    schema_name = "test_incremental_delivery_%s" % (
+        execution_strategy or "default"
+    )
+
+    @Resolver("Query.fast", schema_name=schema_name)
+    async def resolve_query_fast(*_args, **_kwargs):
+        return "fast"
+
+    @Resolver("Query.slow", schema_name=schema_name)
+    @Resolver("Item.slow", schema_name=schema_name)
+    async def resolve_slow(*_args, **_kwargs):
+        await asyncio.sleep(0.01)
+        return "slow"
+
+    @Resolver("Query.item", schema_name=schema_name)
+    async def resolve_query_item(*_args, **_kwargs):
+        return {"id": 0, "name": None}
+
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(_parent, args, *_args, **_kwargs):
+        return [
+            {"id": index, "name": "Item %d" % index}
+            for index in range(args["count"])
+        ]
+
+    @Resolver("Query.names", schema_name=schema_name)
+    async def resolve_query_names(*_args, **_kwargs):
+        return ["a", "b", "c"]
+
+    return await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        execution_strategy=execution_strategy or "depth_first",
+        incremental_delivery=True,
+    )
+
+
+async def _execute_incremental(engine, query, **kwargs):
+    return [
+        payload
+        async for payload in engine.execute_incremental(query, **kwargs)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        (
+            '{ fast ... @defer(label: "slow") { slow } }',
+            [
+                {"data": {"fast": "fast"}, "hasNext": True},
+                {
+                    "data": {"slow": "slow"},
+                    "path": [],
+                    "label": "slow",
+                    "hasNext": False,
+                },
+            ],
+        ),
+        (
+            "query { fast ...Slow @defer } fragment Slow on Query { slow }",
+            [
+                {"data": {"fast": "fast"}, "hasNext": True},
+                {"data": {"slow": "slow"}, "path": [], "hasNext": False},
+            ],
+        ),
+        (
+            "{ items(count: 2) { id ... on Item @defer { name slow } } }",
+            [
+                {"data": {"items": [{"id": 0}, {"id": 1}]}, "hasNext": True},
+                {
+                    "data": {"name": "Item 0", "slow": "slow"},
+                    "path": ["items", 0],
+                    "hasNext": True,
+                },
+                {
+                    "data": {"name": "Item 1", "slow": "slow"},
+                    "path": ["items", 1],
+                    "hasNext": False,
+                },
+            ],
+        ),
+        (
+            "{ ... @defer { item { id ... @defer { slow } } } }",
+            [
+                {"data": None, "hasNext": True},
+                {"data": {"item": {"id": 0}}, "path": [], "hasNext": True},
+                {"data": {"slow": "slow"}, "path": ["item"], "hasNext": False},
+            ],
+        ),
+        (
+            "{ fast ... @defer(if: false) { slow } }",
+            [{"data": {"fast": "fast", "slow": "slow"}, "hasNext": False}],
+        ),
+        (
+            '{ items @stream(initialCount: 1, label: "items") { id } }',
+            [
+                {"data": {"items": [{"id": 0}]}, "hasNext": True},
+                {
+                    "items": [{"id": 1}],
+                    "path": ["items", 1],
+                    "label": "items",
+                    "hasNext": True,
+                },
+                {
+                    "items": [{"id": 2}],
+                    "path": ["items", 2],
+                    "label": "items",
+                    "hasNext": False,
+                },
+            ],
+        ),
+        (
+            "{ names @stream(initialCount: 2) }",
+            [
+                {"data": {"names": ["a", "b"]}, "hasNext": True},
+                {"items": ["c"], "path": ["names", 2], "hasNext": False},
+            ],
+        ),
+        (
+            "{ names @stream(initialCount: 5) }",
+            [{"data": {"names": ["a", "b", "c"]}, "hasNext": False}],
+        ),
+        (
+            "{ fast }",
+            [{"data": {"fast": "fast"}, "hasNext": False}],
+        ),
+    ],
+)
+async def test_incremental_delivery(ttftt_engine, query, expected):
+    assert await _execute_incremental(ttftt_engine, query) == expected
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_variables(ttftt_engine):
+    query = """
+    query ($count: Int, $defer: Boolean) {
+      names @stream(initialCount: $count)
+      ... @defer(if: $defer) { fast }
+    }
+    """
+
+    assert await _execute_incremental(
+        ttftt_engine, query, variables={"count": 2, "defer": False}
+    ) == [
+        {"data": {"names": ["a", "b"], "fast": "fast"}, "hasNext": True},
+        {"items": ["c"], "path": ["names", 2], "hasNext": False},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_errors(ttftt_engine):
+    assert await _execute_incremental(
+        ttftt_engine, "{ fast item { id ... @defer { name } } }"
+    ) == [
+        {"data": {"fast": "fast", "item": {"id": 0}}, "hasNext": True},
+        {
+            "data": None,
+            "path": ["item"],
+            "errors": [
+                {
+                    "message": "Invalid value (value: None) for field `name` of type `String!`",
+                    "path": ["item", "name"],
+                    "locations": [{"line": 1, "column": 31}],
+                }
+            ],
+            "hasNext": False,
+        },
+    ]
+
+    payloads = await _execute_incremental(ttftt_engine, "{ unknown }")
+    assert len(payloads) == 1
+    assert payloads[0]["data"] is None
+    assert payloads[0]["hasNext"] is False
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_execute(ttftt_engine):
+    assert await ttftt_engine.execute(
+        "{ items(count: 2) @stream { id ... @defer { slow } } }"
+    ) == {
+        "data": {
+            "items": [{"id": 0, "slow": "slow"}, {"id": 1, "slow": "slow"}]
+        }
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ttftt_engine", ["breadth_first"], indirect=True)
+async def test_incremental_delivery_breadth_first(ttftt_engine):
+    assert await _execute_incremental(
+        ttftt_engine, "{ fast names @stream ... @defer { slow } }"
+    ) == [
+        {
+            "data": {"fast": "fast", "names": ["a", "b", "c"], "slow": "slow"},
+            "hasNext": False,
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_delivery_user_defined_directives():
+    @Resolver("Query.fast", schema_name="test_incremental_delivery_user")
+    async def resolve_query_fast(*_args, **_kwargs):
+        return "fast"
+
+    engine = await create_engine(
+        """
+        directive @defer(reason: String) on FIELD_DEFINITION
+
+        type Query {
+          fast: String @defer(reason: "user")
+        }
+        """,
+        schema_name="test_incremental_delivery_user",
+    )
+
+    assert await engine.execute("{ fast }") == {"data": {"fast": "fast"}}
+    assert await _execute_incremental(engine, "{ ... @defer { fast } }") == [
+        {"data": {"fast": "fast"}, "hasNext": False}
+    ]
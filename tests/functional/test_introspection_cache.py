@@ -0,0 +1,167 @@
+import json
+
+import pytest
+
+from tartiflette import Directive, create_engine
+
+_SDL = """
+type Dog {
+  name: String
+  secret: String
+}
+
+type Query {
+  dog: Dog
+}
+"""
+
+_INTROSPECTION_QUERY = """
+query {
+  __schema {
+    queryType { name }
+    types { name fields { name } }
+  }
+  dog: __type(name: "Dog") {
+    fields { name @include(if: true) }
+  }
+  __typename
+}
+"""
+
+
+class Hidden:
+    async def on_introspection(
+        self, _directive_args, next_directive, introspected_element, ctx, info
+    ):
+        if ctx and ctx.get("admin"):
+            return await next_directive(introspected_element, ctx, info)
+        return None
+
+
+@pytest.mark.asyncio
+async def test_introspection_cache():
+    engine = await create_engine(_SDL, schema_name="test_introspection_cache")
+
+    result = await engine.execute(_INTROSPECTION_QUERY)
+
+    assert engine._introspection_results.info().currsize == 1
+    assert result["data"]["dog"] == {
+        "fields": [{"name": "name"}, {"name": "secret"}]
+    }
+
+    # The cached result doesn't share anything with the first one
+    result["data"]["dog"] = None
+    cached_result = await engine.execute(_INTROSPECTION_QUERY)
+    assert cached_result != result
+
+    # The next executions share the data of the cached result
+    cached_result["extensions"] = {}
+    assert await engine.execute(_INTROSPECTION_QUERY) == {
+        "data": cached_result["data"]
+    }
+    assert (await engine.execute(_INTROSPECTION_QUERY))[
+        "data"
+    ] is cached_result["data"]
+    assert await engine.execute(_INTROSPECTION_QUERY) == await engine.execute(
+        _INTROSPECTION_QUERY, variables={"unused": 1}
+    )
+    assert json.loads(
+        b"".join(
+            [
+                chunk
+                async for chunk in engine.execute_stream(_INTROSPECTION_QUERY)
+            ]
+        )
+    ) == await engine.execute(_INTROSPECTION_QUERY)
+    assert engine._introspection_results.info().hits == 6
+
+
+@pytest.mark.asyncio
+async def test_introspection_cache_stream():
+    engine = await create_engine(
+        _SDL, schema_name="test_introspection_cache_stream"
+    )
+
+    chunks = [
+        chunk async for chunk in engine.execute_stream(_INTROSPECTION_QUERY)
+    ]
+
+    assert engine._introspection_results.info().currsize == 1
+    assert json.loads(b"".join(chunks)) == await engine.execute(
+        _INTROSPECTION_QUERY
+    )
+    assert engine._introspection_results.info().hits == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query,variables",
+    [
+        ("query { __typename dog { name } }", None),
+        (
+            "query ($name: String!) { __type(name: $name) { name } }",
+            {"name": "Dog"},
+        ),
+        ('query { __type(name: "Unknown") { name } }', None),
+        ("mutation { __typename }", None),
+    ],
+)
+async def test_introspection_cache_not_static(query, variables):
+    engine = await create_engine(
+        _SDL + "type Mutation { dog: Dog }",
+        schema_name="test_introspection_cache_not_static_%d" % len(query),
+    )
+
+    await engine.execute(query, variables=variables)
+
+    assert engine._introspection_results.info().currsize == 0
+
+
+@pytest.mark.asyncio
+async def test_introspection_cache_contextual_directive():
+    schema_name = "test_introspection_cache_contextual_directive"
+    Directive("hidden", schema_name=schema_name)(Hidden())
+    engine = await create_engine(
+        "directive @hidden on FIELD_DEFINITION\n"
+        + _SDL.replace("secret: String", "secret: String @hidden"),
+        schema_name=schema_name,
+    )
+    query = 'query { __type(name: "Dog") { fields { name } } }'
+
+    assert await engine.execute(query) == {
+        "data": {"__type": {"fields": [{"name": "name"}]}}
+    }
+    assert await engine.execute(query, context={"admin": True}) == {
+        "data": {"__type": {"fields": [{"name": "name"}, {"name": "secret"}]}}
+    }
+    assert engine._introspection_results.info().currsize == 0
+
+
+@pytest.mark.asyncio
+async def test_introspection_cache_disabled():
+    engine = await create_engine(
+        _SDL,
+        schema_name="test_introspection_cache_disabled",
+        query_cache_size=0,
+    )
+
+    assert await engine.execute(_INTROSPECTION_QUERY) == await engine.execute(
+        _INTROSPECTION_QUERY
+    )
+    assert engine._introspection_results.info().currsize == 0
+
+
+@pytest.mark.asyncio
+async def test_introspection_cache_reload():
+    engine = await create_engine(
+        _SDL, schema_name="test_introspection_cache_reload"
+    )
+    query = 'query { __type(name: "Dog") { fields { name } } }'
+
+    await engine.execute(query)
+    await engine.reload(_SDL.replace("secret: String", ""))
+
+    assert engine._introspection_results.info().currsize == 0
+    assert await engine.execute(query) == {
+        "data": {"__type": {"fields": [{"name": "name"}]}}
+    }
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+type Item {
+  id: Int
+  name: String
+}
+
+type Query {
+  items(count: Int!): [Item]
+}
+"""
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_engine():
+    in_flight = {"current": 0, "max": 0}
+
+    @Resolver("Query.items", schema_name="test_max_concurrency_engine")
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": i} for i in range(args["count"])]
+
+    @Resolver("Item.name", schema_name="test_max_concurrency_engine")
+    async def resolve_item_name(parent, args, ctx, info):
+        in_flight["current"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        await asyncio.sleep(0.001)
+        in_flight["current"] -= 1
+        return "Item %d" % parent["id"]
+
+    engine = await create_engine(
+        _SDL, schema_name="test_max_concurrency_engine", max_concurrency=5
+    )
+
+    results = await asyncio.gather(
+        engine.execute("{ items(count: 20) { id name } }"),
+        engine.execute("{ items(count: 20) { name } }"),
+    )
+
+    assert results[0]["data"]["items"][19] == {"id": 19, "name": "Item 19"}
+    assert results[1]["data"]["items"][0] == {"name": "Item 0"}
+    assert in_flight["max"] == 5
+
+    info = engine.scheduler_info()
+
+    assert info.max_in_flight == 5
+    assert info.scheduled == 42
+    assert info.queued > 0
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_request():
+    in_flight = {"current": 0, "max": 0}
+
+    @Resolver("Query.items", schema_name="test_max_concurrency_request")
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": i} for i in range(args["count"])]
+
+    @Resolver("Item.name", schema_name="test_max_concurrency_request")
+    async def resolve_item_name(parent, args, ctx, info):
+        in_flight["current"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        await asyncio.sleep(0.001)
+        in_flight["current"] -= 1
+        return "Item %d" % parent["id"]
+
+    engine = await create_engine(
+        _SDL, schema_name="test_max_concurrency_request"
+    )
+
+    assert engine.scheduler_info() is None
+
+    result = await engine.execute(
+        "{ items(count: 20) { name } }", max_concurrency=3
+    )
+
+    assert len(result["data"]["items"]) == 20
+    assert in_flight["max"] == 3
+
+    await engine.execute("{ items(count: 20) { name } }")
+
+    assert in_flight["max"] == 20
@@ -0,0 +1,99 @@
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.engine import persisted_query_id
+from tartiflette.types.exceptions.tartiflette import InvalidPersistedQuery
+
+_SDL = """
+type Query {
+  hello(name: String = "World"): String
+}
+"""
+
+_QUERY = """
+query Hello($name: String) {
+  hello(name: $name)
+}
+"""
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_by_id():
+    @Resolver("Query.hello", schema_name="test_persisted_queries_by_id")
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "Hello " + args["name"]
+
+    engine = await create_engine(
+        _SDL,
+        schema_name="test_persisted_queries_by_id",
+        persisted_queries={"hello": _QUERY},
+    )
+
+    assert await engine.execute_persisted(
+        "hello", variables={"name": "Bob"}
+    ) == {"data": {"hello": "Hello Bob"}}
+    assert await engine.execute_persisted("hello") == {
+        "data": {"hello": "Hello World"}
+    }
+    assert await engine.execute_persisted("unknown") == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Unknown persisted query < unknown >.",
+                "path": None,
+                "locations": [],
+            }
+        ],
+    }
+
+    assert await engine.execute("{ hello }") == {
+        "data": {"hello": "Hello World"}
+    }
+    assert engine.cache_info().misses == 1
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_by_hash():
+    @Resolver("Query.hello", schema_name="test_persisted_queries_by_hash")
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "Hello " + args["name"]
+
+    engine = await create_engine(
+        _SDL,
+        schema_name="test_persisted_queries_by_hash",
+        persisted_queries=[_QUERY],
+        strict_persisted_queries=True,
+    )
+
+    assert await engine.execute_persisted(
+        persisted_query_id(_QUERY), variables={"name": "Bob"}
+    ) == {"data": {"hello": "Hello Bob"}}
+    assert await engine.execute(_QUERY) == {"data": {"hello": "Hello World"}}
+    assert await engine.execute("{ hello }") == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Only persisted queries are allowed.",
+                "path": None,
+                "locations": [],
+            }
+        ],
+    }
+    assert engine.cache_info().misses == 0
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_invalid():
+    @Resolver("Query.hello", schema_name="test_persisted_queries_invalid")
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "Hello " + args["name"]
+
+    with pytest.raises(
+        InvalidPersistedQuery,
+        match="Persisted query < unknown_field > is invalid",
+    ):
+        await create_engine(
+            _SDL,
+            schema_name="test_persisted_queries_invalid",
+            persisted_queries={"unknown_field": "{ unknown }"},
+        )
@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+input Filter {
+  names: [String]
+}
+
+type Node {
+  id: Int
+  name: String
+  viewer: Node
+}
+
+type Query {
+  node(id: Int, filter: Filter): Node
+  viewer: Node
+  failing(id: Int): Node
+}
+"""
+
+
+@pytest.fixture(scope="module")
+async def engine():
+    calls = []
+
+    @Resolver(
+        "Query.node", schema_name="test_resolver_memoization", memoize=True
+    )
+    async def resolve_query_node(_parent, args, *_args, **_kwargs):
+        calls.append(("node", args))
+        await asyncio.sleep(0)
+        return {"id": args.get("id"), "name": "Node"}
+
+    @Resolver(
+        "Query.viewer", schema_name="test_resolver_memoization", memoize=True
+    )
+    @Resolver(
+        "Node.viewer", schema_name="test_resolver_memoization", memoize=True
+    )
+    async def resolve_viewer(*_args, **_kwargs):
+        calls.append(("viewer",))
+        return {"id": 0, "name": "Viewer"}
+
+    @Resolver(
+        "Query.failing", schema_name="test_resolver_memoization", memoize=True
+    )
+    async def resolve_query_failing(_parent, args, *_args, **_kwargs):
+        calls.append(("failing", args))
+        raise ValueError("Failing %d" % args["id"])
+
+    engine = await create_engine(_SDL, schema_name="test_resolver_memoization")
+    engine.calls = calls
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_resolver_memoization(engine):
+    engine.calls.clear()
+
+    assert (
+        await engine.execute("""
+        {
+          a: node(id: 1) { id viewer { id } }
+          b: node(id: 1) { name viewer { name } }
+          c: node(id: 2) { id }
+          ...Nodes
+        }
+
+        fragment Nodes on Query {
+          node(id: 1) { id }
+          viewer { id }
+          d: node(filter: { names: ["a"] }) { id }
+          e: node(filter: { names: ["a"] }) { id }
+          f: node(filter: { names: ["b"] }) { id }
+        }
+        """)
+        == {
+            "data": {
+                "a": {"id": 1, "viewer": {"id": 0}},
+                "b": {"name": "Node", "viewer": {"name": "Viewer"}},
+                "c": {"id": 2},
+                "node": {"id": 1},
+                "viewer": {"id": 0},
+                "d": {"id": None},
+                "e": {"id": None},
+                "f": {"id": None},
+            }
+        }
+    )
+    assert sorted(engine.calls, key=repr) == sorted(
+        [
+            ("node", {"id": 1}),
+            ("node", {"id": 2}),
+            ("node", {"filter": {"names": ["a"]}}),
+            ("node", {"filter": {"names": ["b"]}}),
+            # For the root & for the node 1
+            ("viewer",),
+            ("viewer",),
+        ],
+        key=repr,
+    )
+
+
+@pytest.mark.asyncio
+async def test_resolver_memoization_per_request(engine):
+    engine.calls.clear()
+
+    query = (
+        "query ($id: Int) { a: node(id: $id) { id } b: node(id: $id) { id } }"
+    )
+    assert await engine.execute(query, variables={"id": 1}) == {
+        "data": {"a": {"id": 1}, "b": {"id": 1}}
+    }
+    assert await engine.execute(query, variables={"id": 1}) == {
+        "data": {"a": {"id": 1}, "b": {"id": 1}}
+    }
+    assert engine.calls == [("node", {"id": 1}), ("node", {"id": 1})]
+
+
+@pytest.mark.asyncio
+async def test_resolver_memoization_errors(engine):
+    engine.calls.clear()
+
+    result = await engine.execute(
+        "{ a: failing(id: 1) { id } b: failing(id: 1) { id } }"
+    )
+
+    assert result["data"] == {"a": None, "b": None}
+    assert [
+        (error["message"], error["locations"]) for error in result["errors"]
+    ] == [
+        ("Failing 1", [{"line": 1, "column": 3}]),
+        ("Failing 1", [{"line": 1, "column": 28}]),
+    ]
+    assert engine.calls == [("failing", {"id": 1})]
+
+
+def test_resolver_memoization_batch():
+    with pytest.raises(ImproperlyConfigured):
+        Resolver("Query.node", batch=True, memoize=True)
@@ -0,0 +1,159 @@
+from unittest.mock import patch
+
+import pytest
+
+from tartiflette import Directive, Resolver, Scalar, create_engine
+
+_SDL = """
+directive @upper on FIELD_DEFINITION
+
+scalar Reversed
+
+enum Color {
+  RED
+  BLUE
+}
+
+interface Named {
+  name: String
+}
+
+type Dog implements Named {
+  name: String @upper
+  color: Color
+  nickname: Reversed
+}
+
+type Query {
+  dog(name: String = "rex"): Dog
+  named: Named
+}
+"""
+
+_QUERY = """
+query {
+  dog { name color nickname __typename }
+  named { name }
+  __type(name: "Dog") { fields { name } }
+}
+"""
+
+_EXPECTED = {
+    "data": {
+        "dog": {
+            "name": "REX",
+            "color": "BLUE",
+            "nickname": "xer",
+            "__typename": "Dog",
+        },
+        "named": {"name": "rex"},
+        "__type": {
+            "fields": [
+                {"name": "name"},
+                {"name": "color"},
+                {"name": "nickname"},
+            ]
+        },
+    }
+}
+
+
+def _bind(schema_name):
+    @Directive("upper", schema_name=schema_name)
+    class Upper:
+        @staticmethod
+        async def on_field_execution(
+            directive_args, next_resolver, parent_result, args, ctx, info
+        ):
+            return (
+                await next_resolver(parent_result, args, ctx, info)
+            ).upper()
+
+    @Scalar("Reversed", schema_name=schema_name)
+    class Reversed:
+        @staticmethod
+        def coerce_output(value):
+            return value[::-1]
+
+        @staticmethod
+        def coerce_input(value):
+            return value[::-1]
+
+    @Resolver("Query.dog", schema_name=schema_name)
+    async def resolve_dog(_parent, args, *_args, **_kwargs):
+        return {"name": args["name"], "color": "BLUE", "nickname": "rex"}
+
+    @Resolver("Query.named", schema_name=schema_name)
+    async def resolve_named(*_args, **_kwargs):
+        return {"_typename": "Dog", "name": "rex"}
+
+
+@pytest.mark.asyncio
+async def test_schema_snapshot(tmpdir):
+    snapshot = str(tmpdir.join("schema.snapshot"))
+
+    _bind("test_schema_snapshot_build")
+    engine = await create_engine(
+        _SDL,
+        schema_name="test_schema_snapshot_build",
+        schema_snapshot=snapshot,
+    )
+    assert tmpdir.join("schema.snapshot").check()
+    assert await engine.execute(_QUERY) == _EXPECTED
+
+    _bind("test_schema_snapshot_load")
+    with patch(
+        "tartiflette.schema.bakery.build_graphql_schema_from_sdl"
+    ) as build_mock:
+        engine = await create_engine(
+            _SDL,
+            schema_name="test_schema_snapshot_load",
+            schema_snapshot=snapshot,
+        )
+    assert not build_mock.called
+    assert engine._schema.name == "test_schema_snapshot_load"
+    assert await engine.execute(_QUERY) == _EXPECTED
+
+
+@pytest.mark.asyncio
+async def test_schema_snapshot_sdl_changed(tmpdir):
+    snapshot = tmpdir.join("schema.snapshot")
+
+    _bind("test_schema_snapshot_sdl_changed_a")
+    await create_engine(
+        _SDL,
+        schema_name="test_schema_snapshot_sdl_changed_a",
+        schema_snapshot=str(snapshot),
+    )
+    content = snapshot.read_binary()
+
+    _bind("test_schema_snapshot_sdl_changed_b")
+    engine = await create_engine(
+        _SDL + "\ntype Cat { name: String }",
+        schema_name="test_schema_snapshot_sdl_changed_b",
+        schema_snapshot=str(snapshot),
+    )
+    assert "Cat" in engine._schema.gql_types
+    assert snapshot.read_binary() != content
+    assert await engine.execute(_QUERY) == _EXPECTED
+
+
+@pytest.mark.asyncio
+async def test_schema_snapshot_missing_implementation(tmpdir):
+    from tartiflette.types.exceptions.tartiflette import GraphQLSchemaError
+
+    snapshot = str(tmpdir.join("schema.snapshot"))
+
+    _bind("test_schema_snapshot_missing_implementation_a")
+    await create_engine(
+        _SDL,
+        schema_name="test_schema_snapshot_missing_implementation_a",
+        schema_snapshot=snapshot,
+    )
+
+    with pytest.raises(GraphQLSchemaError, match="Reversed"):
+        await create_engine(
+            _SDL,
+            schema_name="test_schema_snapshot_missing_implementation_b",
+            schema_snapshot=snapshot,
+        )
@@ -0,0 +1,146 @@
+import pytest
+
+from tartiflette import ApolloTracer, Resolver, Tracer, create_engine
+from tartiflette.tracing import Trace
+
+_SDL = """
+type Dog {
+  name: String
+  age: Int
+}
+
+type Query {
+  dogs: [Dog]
+}
+"""
+
+
+class _RecordingTrace(Trace):
+    def __init__(self, events):
+        self.events = events
+
+    def on_parsing(self, start_time, end_time):
+        self.events.append(("parsing",))
+
+    def on_validation(self, start_time, end_time):
+        self.events.append(("validation",))
+
+    def on_execution(self, start_time, end_time):
+        self.events.append(("execution",))
+
+    def on_field(self, info, field_result, start_time, end_time):
+        assert start_time <= end_time
+        self.events.append(("field", tuple(info.path)))
+
+    def on_resolver(self, info, start_time, end_time):
+        assert start_time <= end_time
+        self.events.append(("resolver", tuple(info.path)))
+
+    def extensions(self):
+        return {"events": len(self.events)}
+
+
+class _RecordingTracer(Tracer):
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def create_trace(self, query, operation_name, context):
+        return _RecordingTrace(self.events)
+
+
+@pytest.mark.asyncio
+async def test_tracing_hooks():
+    @Resolver("Query.dogs", schema_name="test_tracing_hooks")
+    async def resolve_query_dogs(parent, args, ctx, info):
+        return [{"name": "Rex", "age": 3}]
+
+    tracer = _RecordingTracer()
+    engine = await create_engine(
+        _SDL, schema_name="test_tracing_hooks", tracer=tracer
+    )
+
+    assert await engine.execute("{ dogs { name } }") == {
+        "data": {"dogs": [{"name": "Rex"}]},
+        "extensions": {"events": 7},
+    }
+    assert sorted(tracer.events) == sorted(
+        [
+            ("parsing",),
+            ("validation",),
+            ("resolver", ("dogs",)),
+            ("field", ("dogs",)),
+            # The default resolver of a leaf is traced as well
+            ("resolver", ("dogs", "name")),
+            ("field", ("dogs", "name")),
+            ("execution",),
+        ]
+    )
+
+    # Cached queries are neither parsed nor validated again
+    del tracer.events[:]
+    await engine.execute("{ dogs { name } }")
+    assert ("parsing",) not in tracer.events
+    assert ("execution",) in tracer.events
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "execution_strategy", ["depth_first", "breadth_first"]
+)
+async def test_tracing_apollo(execution_strategy):
+    schema_name = "test_tracing_apollo_%s" % execution_strategy
+
+    @Resolver("Query.dogs", schema_name=schema_name)
+    async def resolve_query_dogs(parent, args, ctx, info):
+        return [{"name": "Rex", "age": 3}, {"name": "Medor", "age": 5}]
+
+    engine = await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        tracer=ApolloTracer(),
+        execution_strategy=execution_strategy,
+    )
+
+    result = await engine.execute("{ dogs { name age } }")
+    tracing = result["extensions"]["tracing"]
+
+    assert result["data"] == {
+        "dogs": [{"name": "Rex", "age": 3}, {"name": "Medor", "age": 5}]
+    }
+    assert tracing["version"] == 1
+    assert tracing["duration"] > 0
+    assert "parsing" in tracing
+    assert "validation" in tracing
+    assert [
+        (
+            resolver["path"],
+            resolver["parentType"],
+            resolver["fieldName"],
+            resolver["returnType"],
+        )
+        for resolver in tracing["execution"]["resolvers"]
+    ] == [
+        (["dogs"], "Query", "dogs", "[Dog]"),
+        (["dogs", 0, "name"], "Dog", "name", "String"),
+        (["dogs", 0, "age"], "Dog", "age", "Int"),
+        (["dogs", 1, "name"], "Dog", "name", "String"),
+        (["dogs", 1, "age"], "Dog", "age", "Int"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_tracing_not_sampled():
+    @Resolver("Query.dogs", schema_name="test_tracing_not_sampled")
+    async def resolve_query_dogs(parent, args, ctx, info):
+        return [{"name": "Rex", "age": 3}]
+
+    engine = await create_engine(
+        _SDL,
+        schema_name="test_tracing_not_sampled",
+        tracer=ApolloTracer(sample_rate=0),
+    )
+
+    assert await engine.execute("{ dogs { name } }") == {
+        "data": {"dogs": [{"name": "Rex"}]}
+    }
@@ -0,0 +1,152 @@
+import pytest
+
+from tartiflette import Resolver, TypeResolver, create_engine
+
+_SDL = """
+interface Named {
+  name: String
+}
+
+type Cat implements Named {
+  name: String
+  meow: String
+}
+
+type Dog implements Named {
+  name: String
+}
+
+union Pet = Cat | Dog
+
+type Query {
+  pets: [Pet]
+  named: [Named]
+  dog: Dog
+}
+"""
+
+_QUERY = """
+query {
+  pets {
+    __typename
+    ... on Named { name }
+    ... on Cat { meow }
+  }
+  named {
+    __typename
+    name
+  }
+  dog {
+    __typename
+    name
+  }
+}
+"""
+
+
+class Cat:
+    def __init__(self, name, meow):
+        self.name = name
+        self.meow = meow
+
+
+class PersianCat(Cat):
+    pass
+
+
+class Dog:
+    def __init__(self, name):
+        self.name = name
+
+
+@pytest.mark.asyncio
+async def test_type_resolver_default():
+    schema_name = "test_type_resolver_default"
+    pets = [
+        PersianCat("Garfield", "Meow"),
+        {"_typename": "Dog", "name": "Rex"},
+    ]
+    dog = {"name": "Snoopy", "_typename": "Cat"}
+
+    @Resolver("Query.pets", schema_name=schema_name)
+    @Resolver("Query.named", schema_name=schema_name)
+    async def resolve_query_pets(*_args, **_kwargs):
+        return pets
+
+    @Resolver("Query.dog", schema_name=schema_name)
+    async def resolve_query_dog(*_args, **_kwargs):
+        return dog
+
+    engine = await create_engine(_SDL, schema_name=schema_name)
+
+    assert await engine.execute(_QUERY) == {
+        "data": {
+            "pets": [
+                {"__typename": "Cat", "name": "Garfield", "meow": "Meow"},
+                {"__typename": "Dog", "name": "Rex"},
+            ],
+            "named": [
+                {"__typename": "Cat", "name": "Garfield"},
+                {"__typename": "Dog", "name": "Rex"},
+            ],
+            "dog": {"__typename": "Dog", "name": "Snoopy"},
+        }
+    }
+    # The results of the resolvers aren't modified
+    assert not hasattr(pets[0], "_typename")
+    assert dog == {"name": "Snoopy", "_typename": "Cat"}
+
+
+@pytest.mark.asyncio
+async def test_type_resolver():
+    schema_name = "test_type_resolver"
+    calls = []
+
+    @Resolver("Query.pets", schema_name=schema_name)
+    @Resolver("Query.named", schema_name=schema_name)
+    async def resolve_query_pets(*_args, **_kwargs):
+        return [Dog("Garfield"), Cat("Rex", None)]
+
+    @Resolver("Query.dog", schema_name=schema_name)
+    async def resolve_query_dog(*_args, **_kwargs):
+        return Cat("Snoopy", None)
+
+    @TypeResolver("Pet", schema_name=schema_name)
+    @TypeResolver("Named", schema_name=schema_name)
+    def resolve_type(result, ctx, info):
+        calls.append((ctx, info.schema_field.name))
+        return "Cat" if result.name == "Garfield" else "Dog"
+
+    engine = await create_engine(_SDL, schema_name=schema_name)
+
+    assert await engine.execute(_QUERY, context={"a": 1}) == {
+        "data": {
+            "pets": [
+                {"__typename": "Cat", "name": "Garfield", "meow": None},
+                {"__typename": "Dog", "name": "Rex"},
+            ],
+            "named": [
+                {"__typename": "Cat", "name": "Garfield"},
+                {"__typename": "Dog", "name": "Rex"},
+            ],
+            "dog": {"__typename": "Dog", "name": "Snoopy"},
+        }
+    }
+    assert {ctx["a"] for ctx, _ in calls} == {1}
+    # The selection of `named` has no type condition, its children are
+    # executed whatever the type of its values
+    assert {field_name for _, field_name in calls} == {"pets", "__typename"}
+
+
+@pytest.mark.asyncio
+async def test_type_resolver_unknown_type():
+    from tartiflette.types.exceptions.tartiflette import UnknownTypeDefinition
+
+    schema_name = "test_type_resolver_unknown_type"
+
+    @TypeResolver("Cat", schema_name=schema_name)
+    def resolve_type(*_args):
+        return "Cat"
+
+    with pytest.raises(UnknownTypeDefinition):
+        await create_engine(_SDL, schema_name=schema_name)
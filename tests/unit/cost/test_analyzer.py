@@ -0,0 +1,34 @@
+from tartiflette.cost import CostAnalyzer, QueryCost
+from tartiflette.types.exceptions.tartiflette import QueryTooExpensive
+
+
+def test_cost_analyzer_check():
+    query_cost = QueryCost(depth=3, nodes=10, cost=100)
+
+    assert CostAnalyzer().check(query_cost) == []
+    assert (
+        CostAnalyzer(max_depth=3, max_nodes=10, max_cost=100).check(query_cost)
+        == []
+    )
+
+    errors = CostAnalyzer(max_depth=2, max_nodes=9, max_cost=99).check(
+        query_cost
+    )
+    assert all(isinstance(error, QueryTooExpensive) for error in errors)
+    assert [error.message for error in errors] == [
+        "Query depth of 3 exceeds the maximum depth of 2.",
+        "Query selects 10 fields, more than the maximum of 9.",
+        "Query cost of 100 exceeds the maximum cost of 99.",
+    ]
+    assert errors[0].extensions == {
+        "cost": {"depth": 3, "nodes": 10, "cost": 100}
+    }
+
+
+def test_cost_analyzer_extensions():
+    query_cost = QueryCost(depth=3, nodes=10, cost=100)
+
+    assert CostAnalyzer().extensions(query_cost) == {
+        "cost": {"depth": 3, "nodes": 10, "cost": 100}
+    }
+    assert CostAnalyzer(report=False).extensions(query_cost) is None
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from tartiflette.dataloader import DataLoader, DataLoaderInfo
+from tartiflette.executors.types import ExecutionContext
+
+
+def _create_loader(**kwargs):
+    batches = []
+
+    async def batch_load(keys):
+        batches.append(keys)
+        return [
+            ValueError("Unknown < %s >" % key) if key < 0 else key * 2
+            for key in keys
+        ]
+
+    return DataLoader(batch_load, **kwargs), batches
+
+
+@pytest.mark.asyncio
+async def test_dataloader_load():
+    loader, batches = _create_loader()
+
+    assert await asyncio.gather(
+        loader.load(1), loader.load(2), loader.load(1)
+    ) == [2, 4, 2]
+    assert await loader.load(2) == 4
+    assert await loader.load_many([3, 4]) == [6, 8]
+
+    assert batches == [[1, 2], [3, 4]]
+    assert loader.info() == DataLoaderInfo(
+        loads=6, cache_hits=2, dispatches=2, keys=4, max_batch_size=2
+    )
+
+
+@pytest.mark.asyncio
+async def test_dataloader_load_exception():
+    loader, _ = _create_loader()
+
+    results = await asyncio.gather(
+        loader.load(1), loader.load(-1), return_exceptions=True
+    )
+
+    assert results[0] == 2
+    assert isinstance(results[1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_dataloader_max_batch_size():
+    loader, batches = _create_loader(max_batch_size=2)
+
+    assert await loader.load_many([1, 2, 3, 4, 5]) == [2, 4, 6, 8, 10]
+    assert batches == [[1, 2], [3, 4], [5]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_no_cache():
+    loader, batches = _create_loader(cache=False)
+
+    assert await loader.load_many([1, 1]) == [2, 2]
+    assert await loader.load(1) == 2
+    assert batches == [[1, 1], [1]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_prime_and_clear():
+    loader, batches = _create_loader()
+
+    loader.prime(1, "primed")
+
+    assert await loader.load(1) == "primed"
+
+    loader.clear(1)
+
+    assert await loader.load(1) == 2
+    assert batches == [[1]]
+
+
+@pytest.mark.asyncio
+async def test_dataloader_batch_load_failure():
+    async def batch_load(keys):
+        return keys[1:]
+
+    loader = DataLoader(batch_load)
+
+    with pytest.raises(ValueError):
+        await loader.load_many([1, 2])
+
+    with pytest.raises(NotImplementedError):
+        await DataLoader().load(1)
+
+
+@pytest.mark.asyncio
+async def test_dataloader_subclass_from_execution_context():
+    class UserLoader(DataLoader):
+        async def batch_load(self, keys):
+            return ["user_%s" % key for key in keys]
+
+    execution_ctx = ExecutionContext()
+    loader = execution_ctx.get_dataloader(UserLoader, max_batch_size=10)
+
+    assert isinstance(loader, UserLoader)
+    assert execution_ctx.get_dataloader(UserLoader) is loader
+    assert execution_ctx.dataloaders == {UserLoader: loader}
+    assert await loader.load(1) == "user_1"
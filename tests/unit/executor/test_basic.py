@@ -75,7 +75,7 @@ async def test_executor_basic_allow_parallelization(allow_parallelization):
     assert asyncio_gather_mock.called is allow_parallelization
 
 
-def _get_mocked_root_nodes(cbn, marsh, alias):
+def _get_mocked_field_results(cbn, marsh, alias):
     a = Mock()
     a.cant_be_null = cbn
     a.marshalled = marsh
@@ -85,29 +85,32 @@ def _get_mocked_root_nodes(cbn, marsh, alias):
 
 
 @pytest.mark.parametrize(
-    "root_nodes,expected",
+    "field_results,expected",
     [
         (None, TypeError),
-        ([_get_mocked_root_nodes(True, {"b": "c"}, "a")], {"a": {"b": "c"}}),
+        (
+            [_get_mocked_field_results(True, {"b": "c"}, "a")],
+            {"a": {"b": "c"}},
+        ),
         (
             [
-                _get_mocked_root_nodes(True, {"b": "c"}, "a"),
-                _get_mocked_root_nodes(True, {"b": "c"}, "b"),
+                _get_mocked_field_results(True, {"b": "c"}, "a"),
+                _get_mocked_field_results(True, {"b": "c"}, "b"),
             ],
             {"a": {"b": "c"}, "b": {"b": "c"}},
         ),
-        ([_get_mocked_root_nodes(False, None, "v")], {"v": None}),
-        ([_get_mocked_root_nodes(True, None, "v")], None),
+        ([_get_mocked_field_results(False, None, "v")], {"v": None}),
+        ([_get_mocked_field_results(True, None, "v")], None),
     ],
 )
-def test_executor_basic__get_datas(root_nodes, expected):
+def test_executor_basic__get_datas(field_results, expected):
     from tartiflette.executors.basic import _get_datas
 
     if inspect.isclass(expected) and issubclass(expected, Exception):
         with pytest.raises(expected):
-            _get_datas(root_nodes)
+            _get_datas(field_results)
     else:
-        assert _get_datas(root_nodes) == expected
+        assert _get_datas(field_results) == expected
 
 
 def _get_mocked_error():
@@ -130,6 +133,7 @@ async def test_executor_basic_execute(errors, expected, monkeypatch):
     async def my_execute(_, exec_ctx, *__, **___):
         for err in errors:
             exec_ctx.add_error(err)
+        return []
 
     monkeypatch.setattr(basic, "_execute", my_execute)
 
@@ -139,6 +143,9 @@ async def test_executor_basic_execute(errors, expected, monkeypatch):
     operation_mock.name = None
     operation_mock.children = []
     operation_mock.allow_parallelization = True
+    operation_mock.variable_definitions = []
+    operation_mock.variable_usages = set()
+    operation_mock.required_variables = []
 
     a = await execute(
         {None: operation_mock},
@@ -159,6 +166,7 @@ async def test_executor_basic_execute_custom_resolver(monkeypatch):
 
     async def my_execute(_, exec_ctx, *__, **___):
         exec_ctx.add_error(GraphQLError("My error"))
+        return []
 
     def custom_error_coercer(exception, error):
         error["extensions"] = {"code": "custom_error"}
@@ -172,6 +180,9 @@ async def test_executor_basic_execute_custom_resolver(monkeypatch):
     operation_mock.name = None
     operation_mock.children = []
     operation_mock.allow_parallelization = True
+    operation_mock.variable_definitions = []
+    operation_mock.variable_usages = set()
+    operation_mock.required_variables = []
 
     a = await execute(
         {None: operation_mock},
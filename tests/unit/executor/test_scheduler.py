@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from tartiflette.executors.scheduler import Scheduler
+
+
+@pytest.mark.asyncio
+async def test_scheduler_max_concurrency():
+    scheduler = Scheduler(2)
+    in_flight = []
+
+    async def a_resolver(value):
+        in_flight.append(scheduler.info().in_flight)
+        await asyncio.sleep(0.01)
+        return value
+
+    assert await asyncio.gather(
+        *[scheduler.run(a_resolver(i)) for i in range(5)]
+    ) == [0, 1, 2, 3, 4]
+
+    info = scheduler.info()
+
+    assert max(in_flight) == 2
+    assert info.max_concurrency == 2
+    assert info.in_flight == 0
+    assert info.max_in_flight == 2
+    assert info.scheduled == 5
+    assert info.queued == 3
+    assert info.waiting == 0
+    assert info.total_wait_time > 0
+    assert info.max_wait_time <= info.total_wait_time
+
+
+@pytest.mark.asyncio
+async def test_scheduler_parent():
+    parent = Scheduler(1)
+    scheduler = Scheduler(3, parent=parent)
+
+    async def a_resolver():
+        raise ValueError("Failed")
+
+    with pytest.raises(ValueError):
+        await scheduler.run(a_resolver())
+
+    assert scheduler.info().in_flight == 0
+    assert parent.info().scheduled == 1
+    assert parent.info().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_call():
+    scheduler = Scheduler(1, parent=Scheduler(2))
+    called = []
+
+    async def a_resolver(value):
+        called.append(value)
+        await asyncio.sleep(0.01)
+        return value
+
+    calls = [
+        asyncio.ensure_future(scheduler.call(a_resolver, i)) for i in range(3)
+    ]
+    await asyncio.sleep(0)
+
+    # The resolvers waiting for a slot aren't called yet
+    assert called == [0]
+    assert await asyncio.gather(*calls) == [0, 1, 2]
+    assert called == [0, 1, 2]
+    assert scheduler.parent.info().scheduled == 3
+
+
+def test_scheduler_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        Scheduler(0)
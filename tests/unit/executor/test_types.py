@@ -1,3 +1,11 @@
+import asyncio
+
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+
+
 def test_executor_types_ec_instance():
     from tartiflette.executors.types import ExecutionContext
 
@@ -70,3 +78,81 @@ def test_executor_types_info_eq():
 
     assert inf1 == inf2
     assert inf3 != inf2
+
+
+def test_executor_types_field_result():
+    from tartiflette.executors.types import FieldResult
+
+    node = Mock()
+    node.alias = "anAlias"
+    node.cant_be_null = True
+
+    container = {}
+    field_result = FieldResult(node, container=container)
+
+    field_result.set_marshalled("aValue")
+
+    assert field_result.alias == "anAlias"
+    assert field_result.marshalled == "aValue"
+    assert container == {"anAlias": "aValue"}
+    assert not field_result.is_execution_stopped
+
+
+def test_executor_types_field_result_bubble_error():
+    from tartiflette.executors.types import FieldResult
+
+    node = Mock()
+    node.alias = "Rb"
+    node.cant_be_null = False
+
+    field_result = FieldResult(node)
+    field_result.marshalled = {}
+
+    field_result.bubble_error()
+
+    assert field_result.marshalled is None
+
+    parent = Mock()
+    container = {"Rb": "Lol"}
+    field_result = FieldResult(node, parent=parent, container=container)
+
+    field_result.bubble_error()
+
+    assert container["Rb"] is None
+    assert not parent.bubble_error.called
+
+    node.cant_be_null = True
+
+    field_result.bubble_error()
+
+    assert parent.bubble_error.called
+
+    field_result = FieldResult(node)
+    field_result.marshalled = {}
+
+    field_result.bubble_error()
+
+    assert field_result.marshalled is None
+
+
+@pytest.mark.asyncio
+async def test_executor_types_ec_memoize():
+    from tartiflette.executors.types import ExecutionContext
+
+    calls = []
+
+    async def func(value):
+        calls.append(value)
+        await asyncio.sleep(0)
+        return value
+
+    ec = ExecutionContext()
+    parent = object()
+
+    assert await asyncio.gather(
+        ec.memoize(("a",), parent, partial(func, 1)),
+        ec.memoize(("a",), parent, partial(func, 2)),
+        ec.memoize(("b",), parent, partial(func, 3)),
+    ) == [1, 1, 3]
+    assert await ec.fork().memoize(("a",), parent, partial(func, 4)) == 1
+    assert calls == [1, 3]
@@ -3840,3 +3840,44 @@ def test_parse_to_json_ast(query, expected):
 )
 def test_parse_to_document(sdl, expected):
     assert parse_to_document(sdl) == expected
+
+
+def test_parse_to_document_escaped_string():
+    document = parse_to_document(r'{ hello(name: "Bob\n\"Jr\"") }')
+
+    assert document.definitions[0].selection_set.selections[0].arguments[
+        0
+    ].value == StringValueNode(
+        value='Bob\n"Jr"',
+        location=Location(line=1, column=15, line_end=1, column_end=28),
+    )
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        (
+            "type Query { hello: String } { hello }",
+            "Unsupported definition < ObjectTypeDefinition > at line 1, "
+            "column 1",
+        ),
+        (
+            "{ hello }\nscalar Date\nenum Color { RED }",
+            "Unsupported definition < ScalarTypeDefinition > at line 2, "
+            "column 1",
+        ),
+        (
+            "{ hello } extend type Query { bye: String }",
+            "Unsupported definition < TypeExtensionDefinition > at line 1, "
+            "column 11",
+        ),
+        (
+            "directive @auth on FIELD_DEFINITION { hello }",
+            "Unsupported definition < DirectiveDefinition > at line 1, "
+            "column 1",
+        ),
+    ],
+)
+def test_parse_to_document_type_system_definitions(query, expected):
+    with pytest.raises(GraphQLSyntaxError, match=expected):
+        parse_to_document(query)
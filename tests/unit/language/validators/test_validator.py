@@ -0,0 +1,243 @@
+import pytest
+
+from tartiflette import create_engine
+from tartiflette.language.parsers.libgraphqlparser import parse_to_document
+from tartiflette.language.validators import (
+    DocumentValidator,
+    validate_document,
+)
+
+_SDL = """
+interface Pet {
+  name: String
+}
+
+type Dog implements Pet {
+  name: String
+  barks(loud: Boolean!): Boolean
+  owner: Human
+}
+
+type Human {
+  name: String
+  pets: [Pet]
+}
+
+union Thing = Dog | Human
+
+type Query {
+  dog: Dog
+  thing: Thing
+  pets(limit: Int): [Pet]
+  human(id: Int!): Human
+}
+"""
+
+
+@pytest.fixture
+async def schema(request):
+    engine = await create_engine(_SDL, schema_name=request.node.name)
+    return engine._schema
+
+
+def _validate(schema, query):
+    return [
+        (error.__class__.__name__, error.message)
+        for error in validate_document(schema, parse_to_document(query))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_validate_document_valid(schema):
+    assert (
+        _validate(
+            schema,
+            """
+            query Things($limit: Int) {
+              dog { name __typename }
+              thing { ... on Dog { name } ...HumanFields }
+              pets(limit: $limit) { ...PetFields }
+              __schema { types { name } }
+            }
+
+            fragment HumanFields on Human { name pets { ...PetFields } }
+            fragment PetFields on Pet { name ... on Dog { barks(loud: true) } }
+            """,
+        )
+        == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_validate_document_fields(schema):
+    assert (
+        _validate(
+            schema,
+            """
+        {
+          dog { unknown name { a } owner barks @unknown }
+          human { name }
+          pets(nope: 1, limit: 1, limit: 2) { name }
+        }
+        """,
+        )
+        == [
+            (
+                "UnknownSchemaFieldResolver",
+                "field `Dog.unknown` was not found in GraphQL schema.",
+            ),
+            (
+                "NotAnObjectType",
+                "field < name > is a leaf and thus can't have a selection set",
+            ),
+            (
+                "NotALeafType",
+                "field < owner > is not a leaf and thus must have a selection "
+                "set",
+            ),
+            (
+                "MissingRequiredArgument",
+                "Missing required < loud > argument on < barks > field.",
+            ),
+            ("UnknownDirectiveDefinition", "Unknown directive < @unknown >."),
+            (
+                "MissingRequiredArgument",
+                "Missing required < id > argument on < human > field.",
+            ),
+            (
+                "UndefinedFieldArgument",
+                "Undefined argument < nope > on field < pets > of type < Query >.",
+            ),
+            (
+                "UniqueArgumentNames",
+                "There can be only one argument named < limit >.",
+            ),
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_validate_document_operations(schema):
+    assert (
+        _validate(
+            schema,
+            """
+        query A { dog { name } }
+        query A { dog { name } }
+        { dog { name } }
+        subscription B { dog { name } }
+        """,
+        )
+        == [
+            (
+                "NotUniqueOperationName",
+                "Operation name < A > should be unique.",
+            ),
+            (
+                "NotLoneAnonymousOperation",
+                "Anonymous operation must be the only defined operation.",
+            ),
+            (
+                "UnknownTypeDefinition",
+                "Unknown operation type < subscription >.",
+            ),
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_validate_document_fragments(schema):
+    assert (
+        _validate(
+            schema,
+            """
+        query ($limit: Int) {
+          pets(limit: $limit) { ...PetFields ...PetFields ...HumanFields }
+          dog { ...PetFields ...Unknown }
+        }
+
+        fragment PetFields on Pet { name ... on Dog { barks(loud: $loud) } }
+        fragment HumanFields on Human { name }
+        fragment Unused on Dog { unknown }
+        fragment HumanFields on Human { name }
+        """,
+        )
+        == [
+            ("AlreadyDefined", "Fragment < HumanFields > already defined"),
+            (
+                "ImpossibleFragmentSpread",
+                "Fragment < HumanFields > cannot be spread here as objects of "
+                "type < Pet > can never be of type < Human >.",
+            ),
+            ("UndefinedFragment", "Undefined fragment < Unknown >."),
+            ("UnknownVariableException", "< loud > is not known"),
+            ("UnusedFragment", "Fragment < Unused > is never used."),
+            (
+                "UnknownSchemaFieldResolver",
+                "field `Dog.unknown` was not found in GraphQL schema.",
+            ),
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_validate_document_fragment_cycles(schema):
+    assert (
+        _validate(
+            schema,
+            """
+        query { human(id: 1) { ...A ...Self } }
+
+        fragment A on Human { pets { ... on Dog { owner { ...B } } } }
+        fragment B on Human { ...C }
+        fragment C on Human { name ...A }
+        fragment Self on Human { ...Self }
+        """,
+        )
+        == [
+            (
+                "FragmentCycle",
+                "Cannot spread fragment < A > within itself via < B >, < C >.",
+            ),
+            (
+                "FragmentCycle",
+                "Cannot spread fragment < Self > within itself.",
+            ),
+        ]
+    )
+
+    document = parse_to_document(
+        """
+        query { human(id: 1) { ...A } }
+        fragment A on Human { pets { ... on Dog { owner { ...B } } } }
+        fragment B on Human { pets { ... on Dog { owner { ...A } } } }
+        """
+    )
+    (error,) = validate_document(schema, document)
+    assert [
+        (location.line, location.column) for location in error.locations
+    ] == [
+        (3, 59),
+        (4, 59),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_document_validator_fragments_validated_once(schema):
+    validator = DocumentValidator(schema)
+
+    errors = validator.validate(parse_to_document("""
+            {
+              dog { ...DogFields }
+              thing { ...DogFields }
+              pets { ...DogFields }
+            }
+
+            fragment DogFields on Dog { barks }
+            """))
+
+    assert [error.message for error in errors] == [
+        "Missing required < loud > argument on < barks > field."
+    ]
+    assert validator.get_possible_types("Pet") == frozenset(["Dog"])
+    assert validator.get_possible_types("Thing") == frozenset(["Dog", "Human"])
@@ -99,3 +99,51 @@ def test_cffi_libgqlparser_parse_and_visit_default_visitor():
     libgqlparser._lib = Mock()
 
     assert libgqlparser.parse_and_visit("query a { lol }") is None
+
+
+def test_cffi_libgqlparser_parse_and_visit_reuses_elements():
+    from tartiflette.parser.cffi import Visitor
+    from tartiflette.parser.cffi import LibGraphqlParser
+
+    class myVisitor(Visitor):
+        def __init__(self):
+            super().__init__()
+            self.entered = []
+            self.exited = []
+
+        def update(self, event, element):
+            if event == self.IN:
+                self.entered.append(element)
+            else:
+                self.exited.append(element)
+
+    visitor = myVisitor()
+    LibGraphqlParser().parse_and_visit("query a { b(c: 1) { d } }", visitor)
+
+    assert len(visitor.entered) == len(visitor.exited)
+    assert set(map(id, visitor.entered)) == set(map(id, visitor.exited))
+    assert [
+        (element.libgraphql_type, element.name) for element in visitor.entered
+    ] == [
+        ("Document", None),
+        ("OperationDefinition", "a"),
+        ("SelectionSet", None),
+        ("Field", "b"),
+        ("Argument", "c"),
+        ("IntValue", None),
+        ("SelectionSet", None),
+        ("Field", "d"),
+    ]
+
+
+def test_cffi__visitor_element__name_without_name_accessor():
+    from tartiflette.parser.cffi import _VisitorElement
+    from cffi import FFI
+
+    ffi = FFI()
+    lib = Mock()
+
+    ve = _VisitorElement(lib, ffi, "SelectionSet", Mock())
+
+    assert ve.name is None
+    lib.GraphQLAstName_get_value.assert_not_called()
@@ -61,45 +61,6 @@ def test_parser_node_nodefield_shall_produce_list(value):
     assert nf.shall_produce_list == value
 
 
-def test_parser_node_nodefield_bubble_error():
-    from tartiflette.parser.nodes.field import NodeField
-
-    fe = Mock()
-    fe.cant_be_null = False
-
-    nf = NodeField("Rb", None, fe, None, None, None, None)
-
-    nf.marshalled = {}
-    nf.parent = None
-
-    nf.bubble_error()
-
-    assert nf.marshalled is None
-
-    nf.marshalled = {}
-    nf.parent = Mock()
-    nf.parent.marshalled = {"Rb": "Lol"}
-    nf.parent.bubble_error = Mock()
-
-    nf.bubble_error()
-
-    assert "Rb" in nf.parent.marshalled
-    assert nf.parent.marshalled["Rb"] is None
-
-    fe.cant_be_null = True
-
-    nf.bubble_error()
-
-    assert nf.parent.bubble_error.called
-
-    nf.parent = None
-    nf.marshalled = {}
-
-    nf.bubble_error()
-
-    assert nf.marshalled is None
-
-
 def test_parser_node_nodefield__get_coroutz_from_child_no_cond():
     from tartiflette.parser.nodes.field import NodeField
 
@@ -114,22 +75,39 @@ def test_parser_node_nodefield__get_coroutz_from_child_no_cond():
     coerce = Mock()
 
     nf.children = [child, child, child]
+    nf.freeze()
 
-    crtz = nf._get_coroutz_from_child(exectx, reqctx, result, coerce, None)
+    field_result = Mock()
+
+    crtz = nf._get_coroutz_from_child(
+        exectx, reqctx, result, coerce, None, field_result
+    )
 
     assert len(crtz) == 3
-    assert child.call_args_list == [
+    assert child.execute_inline.call_args_list == [
         (
             (exectx, reqctx),
-            {"parent_result": result, "parent_marshalled": coerce},
+            {
+                "parent_result": result,
+                "parent_marshalled": coerce,
+                "parent_field_result": field_result,
+            },
         ),
         (
             (exectx, reqctx),
-            {"parent_result": result, "parent_marshalled": coerce},
+            {
+                "parent_result": result,
+                "parent_marshalled": coerce,
+                "parent_field_result": field_result,
+            },
         ),
         (
             (exectx, reqctx),
-            {"parent_result": result, "parent_marshalled": coerce},
+            {
+                "parent_result": result,
+                "parent_marshalled": coerce,
+                "parent_field_result": field_result,
+            },
         ),
     ]
 
@@ -137,7 +115,10 @@ def test_parser_node_nodefield__get_coroutz_from_child_no_cond():
 def test_parser_node_nodefield__get_coroutz_from_child_cond():
     from tartiflette.parser.nodes.field import NodeField
 
-    nf = NodeField("NtM", None, None, None, None, None, None)
+    schema = Mock()
+    schema.get_possible_types = Mock(return_value=frozenset(["LOL"]))
+
+    nf = NodeField("NtM", schema, Mock(), None, None, None, None)
 
     child = Mock()
     child.type_condition = "LOL"
@@ -148,26 +129,45 @@ def test_parser_node_nodefield__get_coroutz_from_child_cond():
     coerce = Mock()
 
     nf.children = [child, child, child]
+    nf.freeze()
+
+    field_result = Mock()
 
-    crtz = nf._get_coroutz_from_child(exectx, reqctx, result, coerce, "LL")
+    crtz = nf._get_coroutz_from_child(
+        exectx, reqctx, result, coerce, "LL", field_result
+    )
 
     assert crtz == []
 
-    crtz = nf._get_coroutz_from_child(exectx, reqctx, result, coerce, "LOL")
+    crtz = nf._get_coroutz_from_child(
+        exectx, reqctx, result, coerce, "LOL", field_result
+    )
 
     assert len(crtz) == 3
-    assert child.call_args_list == [
+    assert child.execute_inline.call_args_list == [
         (
             (exectx, reqctx),
-            {"parent_result": result, "parent_marshalled": coerce},
+            {
+                "parent_result": result,
+                "parent_marshalled": coerce,
+                "parent_field_result": field_result,
+            },
         ),
         (
             (exectx, reqctx),
-            {"parent_result": result, "parent_marshalled": coerce},
+            {
+                "parent_result": result,
+                "parent_marshalled": coerce,
+                "parent_field_result": field_result,
+            },
         ),
         (
             (exectx, reqctx),
-            {"parent_result": result, "parent_marshalled": coerce},
+            {
+                "parent_result": result,
+                "parent_marshalled": coerce,
+                "parent_field_result": field_result,
+            },
         ),
     ]
 
@@ -185,19 +185,27 @@ async def test_parser_node_nodefield__execute_children_not_a_list():
     fe = Mock()
     fe.shall_produce_list = False
 
-    child = AsyncMock()
+    child = Mock()
     child.type_condition = None
+    child.execute_inline = AsyncMock()
 
     nf = NodeField("NtM", None, fe, None, None, None, None)
 
     nf.children = [child]
+    nf.freeze()
 
-    await nf._execute_children(exectx, reqctx, result, coerce)
+    field_result = Mock()
 
-    assert child.called
-    assert child.call_args == (
+    await nf._execute_children(exectx, reqctx, result, coerce, field_result)
+
+    assert child.execute_inline.called
+    assert child.execute_inline.call_args == (
         (exectx, reqctx),
-        {"parent_result": result, "parent_marshalled": coerce},
+        {
+            "parent_result": result,
+            "parent_marshalled": coerce,
+            "parent_field_result": field_result,
+        },
     )
 
 
@@ -214,24 +222,37 @@ async def test_parser_node_nodefield__execute_children_a_list():
     fe = Mock()
     fe.shall_produce_list = True
 
-    child = AsyncMock()
+    child = Mock()
     child.type_condition = None
+    child.is_batch = False
+    child.execute_inline = AsyncMock()
 
     nf = NodeField("NtM", None, fe, None, None, None, None)
 
     nf.children = [child]
+    nf.freeze()
 
-    await nf._execute_children(exectx, reqctx, result, coerce)
+    field_result = Mock()
 
-    assert child.called
+    await nf._execute_children(exectx, reqctx, result, coerce, field_result)
+
+    assert child.execute_inline.called
     assert (
         (exectx, reqctx),
-        {"parent_result": result[0], "parent_marshalled": coerce[0]},
-    ) in child.call_args_list
+        {
+            "parent_result": result[0],
+            "parent_marshalled": coerce[0],
+            "parent_field_result": field_result,
+        },
+    ) in child.execute_inline.call_args_list
     assert (
         (exectx, reqctx),
-        {"parent_result": result[1], "parent_marshalled": coerce[1]},
-    ) in child.call_args_list
+        {
+            "parent_result": result[1],
+            "parent_marshalled": coerce[1],
+            "parent_field_result": field_result,
+        },
+    ) in child.execute_inline.call_args_list
 
 
 @pytest.mark.asyncio
@@ -242,6 +263,8 @@ async def test_parser_node_nodefield___call__():
     coerced = Mock()
 
     class fex:
+        is_inline = False
+
         async def __call__(self, *_, **__):
             return raw, coerced
 
@@ -249,14 +272,17 @@ async def test_parser_node_nodefield___call__():
     fe.schema_field = Mock()
 
     nf = NodeField("B", None, fe, None, None, None, None)
-    nf.children = None
+    nf.children = []
+    nf.freeze()
 
     exectx = Mock()
     reqctx = Mock()
 
-    await nf(exectx, reqctx)
+    field_result = await nf(exectx, reqctx)
 
-    assert nf.marshalled == coerced
+    assert field_result.node is nf
+    assert field_result.marshalled == coerced
+    assert not field_result.is_execution_stopped
 
 
 @pytest.mark.asyncio
@@ -267,6 +293,8 @@ async def test_parser_node_nodefield___call___with_a_parent():
     coerced = Mock()
 
     class fex:
+        is_inline = False
+
         async def __call__(self, *_, **__):
             return raw, coerced
 
@@ -274,16 +302,17 @@ async def test_parser_node_nodefield___call___with_a_parent():
     fe.schema_field = Mock()
 
     nf = NodeField("B", None, fe, None, None, None, None)
-    nf.children = None
+    nf.children = []
+    nf.freeze()
 
     exectx = Mock()
     reqctx = Mock()
 
     prm = {}
 
-    await nf(exectx, reqctx, parent_marshalled=prm)
+    field_result = await nf(exectx, reqctx, parent_marshalled=prm)
 
-    assert nf.marshalled == {}
+    assert field_result.marshalled == coerced
     assert prm["B"] == coerced
 
 
@@ -296,6 +325,8 @@ async def test_parser_node_nodefield___call___with_children():
     coerced = Mock()
 
     class fex:
+        is_inline = False
+
         async def __call__(self, *_, **__):
             return raw, coerced
 
@@ -303,7 +334,8 @@ async def test_parser_node_nodefield___call___with_children():
     fe.schema_field = Mock()
 
     nf = NodeField("B", None, fe, None, None, None, None)
-    nf.children = [Mock()]
+    nf.children = [Mock(type_condition=None)]
+    nf.freeze()
     nf._execute_children = AsyncMock()
 
     exectx = Mock()
@@ -311,14 +343,14 @@ async def test_parser_node_nodefield___call___with_children():
 
     prm = {}
 
-    await nf(exectx, reqctx, parent_marshalled=prm)
+    field_result = await nf(exectx, reqctx, parent_marshalled=prm)
 
-    assert nf.marshalled == {}
+    assert field_result.marshalled == coerced
     assert prm["B"] == coerced
     assert nf._execute_children.called
     assert nf._execute_children.call_args == (
         (exectx, reqctx),
-        {"result": raw, "coerced": coerced},
+        {"result": raw, "coerced": coerced, "field_result": field_result},
     )
 
 
@@ -331,6 +363,8 @@ async def test_parser_node_nodefield___call___fe_is_excepting():
     coerced = None
 
     class fex:
+        is_inline = False
+
         async def __call__(self, *_, **__):
             return raw, coerced
 
@@ -339,10 +373,11 @@ async def test_parser_node_nodefield___call___fe_is_excepting():
     fe.cant_be_null = True
 
     nf = NodeField("B", None, fe, None, None, None, None)
-    nf.children = [Mock()]
+    nf.children = [Mock(type_condition=None)]
+    nf.freeze()
     nf._execute_children = AsyncMock()
-    nf.parent = Mock()
-    nf.parent.bubble_error = Mock()
+    parent_field_result = Mock()
+    parent_field_result.bubble_error = Mock()
 
     exectx = Mock()
     exectx.add_error = Mock()
@@ -350,11 +385,17 @@ async def test_parser_node_nodefield___call___fe_is_excepting():
 
     prm = {}
 
-    await nf(exectx, reqctx, parent_marshalled=prm)
+    field_result = await nf(
+        exectx,
+        reqctx,
+        parent_marshalled=prm,
+        parent_field_result=parent_field_result,
+    )
 
-    assert nf.marshalled == {}
+    assert field_result.marshalled == coerced
     assert prm["B"] == coerced
-    assert nf.parent.bubble_error.called
+    assert parent_field_result.bubble_error.called
+    assert not nf._execute_children.called
     assert exectx.add_error.called
 
 
@@ -367,6 +408,8 @@ async def test_parser_node_nodefield__call__exception():
     coerced = None
 
     class fex:
+        is_inline = False
+
         async def __call__(self, *_, **__):
             return raw, coerced
 
@@ -377,8 +420,6 @@ async def test_parser_node_nodefield__call__exception():
     nf = NodeField("B", None, fe, None, None, None, None)
     nf.children = [Mock()]
     nf._execute_children = AsyncMock()
-    nf.parent = Mock()
-    nf.parent.bubble_error = Mock()
 
     exectx = ExecutionContext()
     reqctx = Mock()
@@ -413,6 +454,8 @@ async def test_parser_node_nodefield__call__custom_exception():
     coerced = None
 
     class fex:
+        is_inline = False
+
         async def __call__(self, *_, **__):
             return raw, coerced
 
@@ -423,8 +466,6 @@ async def test_parser_node_nodefield__call__custom_exception():
     nf = NodeField("B", None, fe, None, None, None, None)
     nf.children = [Mock()]
     nf._execute_children = AsyncMock()
-    nf.parent = Mock()
-    nf.parent.bubble_error = Mock()
 
     exectx = ExecutionContext()
     reqctx = Mock()
@@ -481,3 +522,170 @@ def test_add_errors_to_execution_context(
         assert isinstance(error, GraphQLError)
         assert error.message == expected_message
         assert type(error.original_error) is expected_original_error
+
+
+@pytest.mark.parametrize("shall_produce_list", [True, False])
+def test_parser_node_nodefield_iter_children(shall_produce_list):
+    from tartiflette.parser.nodes.field import NodeField
+
+    fe = Mock()
+    fe.shall_produce_list = shall_produce_list
+
+    fe.schema_field.gql_type = "Pet"
+
+    pet_type = Mock()
+    pet_type.type_resolver = None
+    pet_type.resolve_type = lambda raw: raw["_typename"]
+
+    schema = Mock()
+    schema.find_type = {"Pet": pet_type}.get
+    schema.get_possible_types = {
+        "Cat": frozenset(["Cat"]),
+        "Named": frozenset(["Cat", "Dog"]),
+    }.get
+
+    nf = NodeField("NtM", schema, fe, None, None, None, None)
+
+    child = Mock()
+    child.type_condition = None
+    conditional_child = Mock()
+    conditional_child.type_condition = "Cat"
+    abstract_child = Mock()
+    abstract_child.type_condition = "Named"
+
+    nf.children = [child, conditional_child, abstract_child]
+    nf.freeze()
+
+    if shall_produce_list:
+        result = [{"_typename": "Cat"}, {"_typename": "Dog"}]
+        coerced = [{}, {}]
+        expected = [
+            (child, result[0], coerced[0]),
+            (conditional_child, result[0], coerced[0]),
+            (abstract_child, result[0], coerced[0]),
+            (child, result[1], coerced[1]),
+            (abstract_child, result[1], coerced[1]),
+        ]
+    else:
+        result = {"_typename": "Dog"}
+        coerced = {}
+        expected = [
+            (child, result, coerced),
+            (abstract_child, result, coerced),
+        ]
+
+    assert list(nf.iter_children(result, coerced, Mock(), None)) == expected
+
+
+def test_parser_node_nodefield_clone():
+    from tartiflette.parser.nodes.field import NodeField
+
+    nf = NodeField("user", None, Mock(), None, ["viewer", "user"], None)
+    nf.execution_directives = [{"name": "skip"}]
+    child = NodeField(
+        "name", None, Mock(), None, ["viewer", "user", "name"], None
+    )
+    child.set_parent(nf)
+    nf.add_child(child)
+
+    parent = Mock()
+    directives = [{"name": "include"}]
+    clone = nf.clone(parent, ["friend", "user"], directives)
+
+    assert clone is not nf
+    assert clone.parent is parent
+    assert clone.path == ["friend", "user"]
+    assert clone.execution_directives is directives
+    assert clone.arguments is nf.arguments
+    assert len(clone.children) == 1
+    assert clone.children[0] is not child
+    assert clone.children[0].parent is clone
+    assert clone.children[0].path == ["friend", "user", "name"]
+    assert clone.children[0].execution_directives is child.execution_directives
+
+    assert nf.path == ["viewer", "user"]
+    assert nf.execution_directives == [{"name": "skip"}]
+    assert nf.children == [child]
+
+
+def test_parser_node_nodefield_freeze():
+    from tartiflette.parser.nodes.field import NodeField
+    from tartiflette.utils.variables import VariableValue
+
+    fe = Mock()
+    fe.schema_field.gql_type = "Pet"
+
+    schema = Mock()
+    schema.find_type = {"Pet": "PetType"}.get
+    schema.get_possible_types = {"Named": frozenset(["Cat", "Dog"])}.get
+
+    defer = {"name": "defer", "incremental": "defer", "args": {}}
+    nf = NodeField("pet", schema, fe, None, ["pet"], None)
+    nf.execution_directives = [defer]
+    child = NodeField("name", schema, Mock(), None, ["pet", "name"], None)
+    child.arguments = {"format": VariableValue("format")}
+    child.execution_directives = [defer]
+    conditional_child = NodeField(
+        "meow", schema, Mock(), None, ["pet", "meow"], "Named"
+    )
+    for node in (child, conditional_child):
+        node.set_parent(nf)
+        nf.add_child(node)
+
+    nf.freeze()
+
+    assert nf.get_children_by_typename() == (
+        {
+            "Named": [child, conditional_child],
+            "Cat": [child, conditional_child],
+            "Dog": [child, conditional_child],
+        },
+        [child],
+    )
+    assert nf._result_type == "PetType"
+    assert nf._get_incremental_directives() == {"defer": defer}
+    assert not nf.has_variables
+    # The directives of an inline fragment only release its outermost field
+    assert child._get_incremental_directives() == {}
+    assert child.has_variables
+    assert child.get_children_by_typename() == ({}, [])
+    assert child._result_type is None
+
+
+def test_parser_node_nodefield_iter_children_type_resolver():
+    from tartiflette.parser.nodes.field import NodeField
+
+    fe = Mock()
+    fe.shall_produce_list = True
+    fe.schema_field.gql_type = "Pet"
+
+    pet_type = Mock()
+    pet_type.type_resolver = Mock(
+        side_effect=lambda raw, ctx, info: "Cat" if "meow" in raw else "Dog"
+    )
+
+    schema = Mock()
+    schema.find_type = {"Pet": pet_type}.get
+    schema.get_possible_types = {"Cat": frozenset(["Cat"])}.get
+
+    nf = NodeField("NtM", schema, fe, None, None, None, None)
+
+    child = Mock()
+    child.type_condition = None
+    conditional_child = Mock()
+    conditional_child.type_condition = "Cat"
+    nf.children = [child, conditional_child]
+    nf.freeze()
+
+    result = [{"meow": "Meow"}, {}]
+    coerced = [{}, {}]
+    request_ctx = {}
+
+    assert list(nf.iter_children(result, coerced, Mock(), request_ctx)) == [
+        (child, result[0], coerced[0]),
+        (conditional_child, result[0], coerced[0]),
+        (child, result[1], coerced[1]),
+    ]
+    assert [
+        call_args[0][:2] for call_args in pet_type.type_resolver.call_args_list
+    ] == [(result[0], request_ctx), (result[1], request_ctx)]
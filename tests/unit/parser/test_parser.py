@@ -9,7 +9,7 @@ def test_tartiflette_request_parser_except(clean_registry, monkeypatch):
     trp = TartifletteRequestParser()
 
     with pytest.raises(Exception):
-        trp.parse_and_tartify(None, "query aq { }} ", variables={})
+        trp.parse_and_tartify(None, "query aq { }} ")
 
     monkeypatch.undo()
 
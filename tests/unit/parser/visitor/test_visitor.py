@@ -6,7 +6,6 @@ from tartiflette.parser.nodes.definition import NodeDefinition
 from tartiflette.parser.nodes.fragment_definition import NodeFragmentDefinition
 from tartiflette.types.exceptions.tartiflette import (
     AlreadyDefined,
-    GraphQLError,
     MissingRequiredArgument,
     MultipleRootNodeOnSubscriptionOperation,
     NotLoneAnonymousOperation,
@@ -17,7 +16,6 @@ from tartiflette.types.exceptions.tartiflette import (
     UnusedFragment,
 )
 from tartiflette.types.location import Location
-from tartiflette.utils.arguments import UNDEFINED_VALUE
 
 
 @pytest.fixture
@@ -49,13 +47,6 @@ def test_parser_visitor(a_schema):
     tv = TartifletteVisitor(a_schema)
 
     assert a_schema == tv.schema
-    assert tv._vars == {}
-
-    a_dict = {"A": "B"}
-
-    tv = TartifletteVisitor(a_schema, a_dict)
-
-    assert tv._vars == a_dict
 
 
 def test_parser_visitor__on_argument(a_visitor, an_element):
@@ -280,41 +271,29 @@ def test_parser_visitor__on_variable_in(a_visitor, an_element):
     assert a_visitor._internal_ctx.node.var_name == "a_name"
 
 
-def test_parser_visitor__on_variable_in_no_var_name_ukn_var(
-    a_visitor, an_element
-):
-    from tartiflette.types.exceptions.tartiflette import (
-        UnknownVariableException,
-    )
-
-    del a_visitor._internal_ctx.node.var_name
-
-    a_visitor._internal_ctx.node.arguments = {}
-    a_visitor._internal_ctx.argument = Mock()
-    a_visitor._internal_ctx.argument.name = "an_argument_name"
-    a_visitor._vars = {}
-
-    a_visitor._on_variable_in(an_element)
-
-    assert a_visitor.continue_child == 0
-    assert a_visitor.exceptions is not None
-    assert isinstance(a_visitor.exceptions[0], UnknownVariableException)
-
-
 def test_parser_visitor__on_variable_in_no_var_name(a_visitor, an_element):
+    from tartiflette.utils.variables import VariableValue
+
     del a_visitor._internal_ctx.node.var_name
 
+    a_visitor._internal_ctx.operation = Mock()
     a_visitor._internal_ctx.directive = None
+    a_visitor._internal_ctx.current_object_value = None
     a_visitor._internal_ctx.node.arguments = {}
     a_visitor._internal_ctx.argument = Mock()
-    a_visitor._internal_ctx.argument.name = "a_name"
-    a_visitor._vars = {"a_name": "a_value"}
+    a_visitor._internal_ctx.argument.name = "an_argument_name"
 
     a_visitor._on_variable_in(an_element)
 
+    assert a_visitor.exceptions == []
+    assert a_visitor._internal_ctx.argument.value == VariableValue("a_name")
     assert a_visitor._internal_ctx.node.arguments == {
-        "a_name": a_visitor._internal_ctx.argument
+        "an_argument_name": a_visitor._internal_ctx.argument
     }
+    assert (
+        a_visitor._internal_ctx.operation.add_variable_usage.call_args_list
+        == [(("a_name",),)]
+    )
 
 
 def test_parser_visitor__on_field_in_first_field(a_visitor, an_element):
@@ -332,7 +311,7 @@ def test_parser_visitor__on_field_in_first_field(a_visitor, an_element):
         return_value="an_operation_type"
     )
     a_visitor.schema.find_type = Mock(return_value="an_operation_type")
-    a_visitor.schema.get_field_by_name = Mock(return_value=a_field)
+    a_visitor.schema.find_field = Mock(return_value=a_field)
     an_element.get_selection_set_size = Mock(return_value=1)
 
     a_visitor._on_field_in(an_element)
@@ -345,8 +324,8 @@ def test_parser_visitor__on_field_in_first_field(a_visitor, an_element):
     assert a_visitor.schema.find_type.call_args_list == [
         (("an_operation_type",),)
     ]
-    assert a_visitor.schema.get_field_by_name.call_args_list == [
-        (("an_operation_type.a_name",),)
+    assert a_visitor.schema.find_field.call_args_list == [
+        (("an_operation_type", "a_name"),)
     ]
     assert a_visitor._internal_ctx.node in a_visitor.operations["Yo"].children
     assert a_visitor._internal_ctx.node.parent is None
@@ -369,7 +348,7 @@ def test_parser_visitor__on_field_in_another_field(a_visitor, an_element):
         "a_gql_type"
     )
     current_node = a_visitor._internal_ctx.node
-    a_visitor.schema.get_field_by_name = Mock(return_value=a_field)
+    a_visitor.schema.find_field = Mock(return_value=a_field)
 
     a_visitor._internal_ctx.operation = Mock()
     a_visitor._internal_ctx.operation.name = "Yo"
@@ -384,8 +363,8 @@ def test_parser_visitor__on_field_in_another_field(a_visitor, an_element):
         "a_parent_path_element",
         "a_name",
     ]
-    assert a_visitor.schema.get_field_by_name.call_args_list == [
-        (("a_gql_type.a_name",),)
+    assert a_visitor.schema.find_field.call_args_list == [
+        (("a_gql_type", "a_name"),)
     ]
     assert (
         a_visitor._internal_ctx.node not in a_visitor.operations["Yo"].children
@@ -397,11 +376,6 @@ def test_parser_visitor__on_field_in_another_field(a_visitor, an_element):
 
 
 def test_parser_visitor__on_field_in_a_fragment(a_visitor, an_element):
-    from tartiflette.types.exceptions.tartiflette import (
-        UnknownSchemaFieldResolver,
-    )
-    from unittest.mock import MagicMock
-
     a_field = Mock()
     a_field.resolver = Mock()
     a_field.is_leaf = False
@@ -431,16 +405,7 @@ def test_parser_visitor__on_field_in_a_fragment(a_visitor, an_element):
     a_visitor._internal_ctx.operation.children = []
     a_visitor.operations = {"Yo": a_visitor._internal_ctx.operation}
 
-    class _get_field_by_name(MagicMock):
-        def __call__(self, aname):
-            super().__call__(aname)
-
-            if aname == "a_gql_type.a_name":
-                raise UnknownSchemaFieldResolver("a_message")
-
-            return a_field
-
-    a_visitor.schema.get_field_by_name = _get_field_by_name()
+    a_visitor.schema.find_field = Mock(side_effect=[None, a_field])
 
     a_visitor._on_field_in(an_element, type_cond_depth=1)
 
@@ -449,9 +414,9 @@ def test_parser_visitor__on_field_in_a_fragment(a_visitor, an_element):
         "a_parent_path_element",
         "a_name",
     ]
-    assert a_visitor.schema.get_field_by_name.call_args_list == [
-        (("a_gql_type.a_name",),),
-        (("an_inline_fragment_type.a_name",),),
+    assert a_visitor.schema.find_field.call_args_list == [
+        (("a_gql_type", "a_name"),),
+        (("an_inline_fragment_type", "a_name"),),
     ]
     assert (
         a_visitor._internal_ctx.node not in a_visitor.operations["Yo"].children
@@ -466,7 +431,6 @@ def test_parser_visitor__on_field_unknow_schema_field(a_visitor, an_element):
     from tartiflette.types.exceptions.tartiflette import (
         UnknownSchemaFieldResolver,
     )
-    from unittest.mock import MagicMock
 
     a_visitor._internal_ctx.field_path = ["a_parent_path_element"]
     a_visitor._internal_ctx.node.field_executor = Mock()
@@ -490,14 +454,7 @@ def test_parser_visitor__on_field_unknow_schema_field(a_visitor, an_element):
     a_visitor._internal_ctx.operation.children = []
     a_visitor.operations = {"Yo": a_visitor._internal_ctx.operation}
 
-    an_exception = UnknownSchemaFieldResolver("a_message")
-
-    class _get_field_by_name(MagicMock):
-        def __call__(self, aname):
-            super().__call__(aname)
-            raise an_exception
-
-    a_visitor.schema.get_field_by_name = _get_field_by_name()
+    a_visitor.schema.find_field = Mock(return_value=None)
 
     a_visitor._on_field_in(an_element)
 
@@ -507,7 +464,12 @@ def test_parser_visitor__on_field_unknow_schema_field(a_visitor, an_element):
         a_visitor._internal_ctx.node not in a_visitor.operations["Yo"].children
     )
     assert a_visitor.continue_child == 0
-    assert a_visitor.exceptions[0] == an_exception
+    assert isinstance(a_visitor.exceptions[0], UnknownSchemaFieldResolver)
+    assert (
+        a_visitor.exceptions[0].message
+        == "field `a_gql_type.a_name` was not found in GraphQL schema."
+    )
+    assert a_visitor.exceptions[0].path == ["a_parent_path_element", "a_name"]
 
 
 def test_parser_visitor__on_field_out(a_visitor, an_element):
@@ -581,147 +543,18 @@ def test_parser_visitor__on_variable_definition_in(a_visitor, an_element):
     assert a_visitor._internal_ctx.node.parent == current_node
 
 
-def test_parser_visitor__validate_type(a_visitor, an_element):
-    a_visitor._validate_type("ninja", "a", str, False)
-
-    assert a_visitor.exceptions == []
-    assert a_visitor.continue_child == 1
-
-    a_visitor._validate_type("ntm", "a", int, False)
-    assert a_visitor.exceptions is not None
-    assert isinstance(a_visitor.exceptions[0], GraphQLError)
-    assert a_visitor.continue_child == 0
-
-
-def test_parser_visitor__validate_type_invalid_type_dont_care(
-    a_visitor, an_element
-):
-    a_visitor._validate_type("ninja", "a", None, False)
-
-    assert a_visitor.exceptions == []
-    assert a_visitor.continue_child == 1
-
-
-def test_parser_visitor__validate_vars_existing_okay_var(
-    a_visitor, an_element
-):
-    a_visitor._internal_ctx.node = Mock()
-    a_visitor._internal_ctx.node.var_name = "LOL"
-    a_visitor._internal_ctx.node.var_type = str
-    a_visitor._internal_ctx.node.is_list = False
-    a_visitor._internal_ctx.node.is_nullable = False
-
-    a_visitor._vars = {"LOL": "a_value"}
-
-    a_visitor._validate_type = Mock()
-
-    a_visitor._validates_vars()
-
-    assert a_visitor._validate_type.call_args_list == [
-        (("LOL", "a_value", str, False),)
-    ]
-
-
-def test_parser_visitor__validate_vars_existing_okay_var_is_list(
-    a_visitor, an_element
-):
-    a_visitor._internal_ctx.node = Mock()
-    a_visitor._internal_ctx.node.var_name = "LOL"
-    a_visitor._internal_ctx.node.var_type = str
-    a_visitor._internal_ctx.node.is_list = True
-    a_visitor._internal_ctx.node.is_nullable = True
-
-    a_visitor._vars = {"LOL": ["a_value_1", "a_value_2"]}
-
-    a_visitor._validate_type = Mock()
-
-    a_visitor._validates_vars()
-
-    assert a_visitor._validate_type.call_args_list == [
-        (("LOL", "a_value_1", str, True),),
-        (("LOL", "a_value_2", str, True),),
-    ]
-
-
-def test_parser_visitor__validate_vars_existing_okay_var_is_list_nok(
-    a_visitor, an_element
-):
-    a_visitor._internal_ctx.node = Mock()
-    a_visitor._internal_ctx.node.var_name = "LOL"
-    a_visitor._internal_ctx.node.var_type = str
-    a_visitor._internal_ctx.node.is_list = True
-
-    a_visitor._vars = {"LOL": "a_value_1"}
-
-    a_visitor._validate_type = Mock()
-
-    a_visitor._validates_vars()
-
-    assert a_visitor.continue_child == 0
-    assert a_visitor.exceptions is not None
-    assert isinstance(a_visitor.exceptions[0], GraphQLError)
-
-
-def test_parser_visitor__validate_vars_existing_okay_var_has_a_dfv(
-    a_visitor, an_element
-):
-    a_visitor._internal_ctx.node = Mock()
-    a_visitor._internal_ctx.node.var_name = "LOL"
-    a_visitor._internal_ctx.node.var_type = str
-    a_visitor._internal_ctx.node.default_value = "a_default_value"
-
-    a_visitor._validate_type = Mock()
-
-    a_visitor._validates_vars()
-
-    assert a_visitor._vars == {"LOL": "a_default_value"}
-
-
-def test_parser_visitor__validate_vars_existing_okay_var_no_dfv_but_nullable(
-    a_visitor, an_element
-):
-    a_visitor._internal_ctx.node = Mock()
-    a_visitor._internal_ctx.node.var_name = "LOL"
-    a_visitor._internal_ctx.node.var_type = str
-    a_visitor._internal_ctx.node.is_nullable = True
-    a_visitor._internal_ctx.node.default_value = UNDEFINED_VALUE
-    a_visitor._validate_type = Mock()
-
-    a_visitor._validates_vars()
-
-    assert a_visitor._vars == {"LOL": UNDEFINED_VALUE}
-
-
-def test_parser_visitor__validate_vars_existing_okay_var_no_dfv_non_nullable(
-    a_visitor, an_element
-):
-    from tartiflette.types.exceptions.tartiflette import (
-        UnknownVariableException,
-    )
-
-    a_visitor._internal_ctx.node = Mock()
-    a_visitor._internal_ctx.node.var_name = "LOL"
-    a_visitor._internal_ctx.node.var_type = str
-    a_visitor._internal_ctx.node.is_nullable = False
-    a_visitor._internal_ctx.node.default_value = None
-    a_visitor._validate_type = Mock()
-
-    a_visitor._validates_vars()
-
-    assert a_visitor.continue_child == 0
-    assert a_visitor.exceptions is not None
-    assert isinstance(a_visitor.exceptions[0], UnknownVariableException)
-
-
 def test_parser_visitor__on_variable_definition_out(a_visitor, an_element):
-    a_visitor._validates_vars = Mock()
+    a_visitor._internal_ctx.operation = Mock()
     a_visitor._internal_ctx.node = Mock()
     current_node = a_visitor._internal_ctx.node
     a_visitor._internal_ctx.node.parent = Mock()
 
     a_visitor._on_variable_definition_out(an_element)
 
-    assert a_visitor._validates_vars.called
+    assert (
+        a_visitor._internal_ctx.operation.add_variable_definition.call_args_list
+        == [((current_node,),)]
+    )
     assert a_visitor._internal_ctx.node != current_node
     assert a_visitor._internal_ctx.node == current_node.parent
 
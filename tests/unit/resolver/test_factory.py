@@ -1,4 +1,5 @@
-from unittest.mock import Mock, patch
+from inspect import iscoroutinefunction
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 
@@ -165,5 +166,12 @@ def test_resolverexecutor_bake(
             wraps_with_directives_mock.assert_called_once_with(
                 directives_definition=schema_field.directives,
                 directive_hook="on_field_execution",
-                func=resolver_executor._raw_func,
+                func=ANY,
             )
+
+            # Resolvers which aren't coroutine functions are adapted to them
+            func = wraps_with_directives_mock.call_args[1]["func"]
+            if custom_default_resolver is None:
+                assert func is resolver_executor._raw_func
+            else:
+                assert iscoroutinefunction(func)
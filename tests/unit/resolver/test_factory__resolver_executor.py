@@ -80,6 +80,7 @@ async def test_resolver_factory__resolver_executor___call__(
     info = Mock()
     info.execution_ctx = Mock()
     info.execution_ctx.is_introspection = False
+    info.execution_ctx.scheduler = None
 
     _resolver_executor_mock._coercer = FakeAsyncMock(return_value="LOL")
     _resolver_executor_mock._introspection = FakeAsyncMock(
@@ -122,6 +123,57 @@ async def test_resolver_factory__resolver_executor___call__(
     assert c is None
 
 
+@pytest.mark.asyncio
+async def test_resolver_factory__resolver_executor___call___sync_func(
+    _resolver_executor_mock
+):
+    from tartiflette.resolver.factory import default_resolver
+
+    info = Mock()
+    info.execution_ctx.is_introspection = False
+    info.schema_field.name = "aField"
+
+    _resolver_executor_mock._raw_func = default_resolver
+    _resolver_executor_mock._directivated_func = default_resolver
+    _resolver_executor_mock._sync_coercer = Mock(return_value="LOL")
+
+    assert _resolver_executor_mock._get_sync_func(default_resolver) is not None
+
+    _resolver_executor_mock._sync_func = (
+        _resolver_executor_mock._get_sync_func(default_resolver)
+    )
+
+    with patch(
+        "tartiflette.resolver.factory.coerce_arguments", new_callable=AsyncMock
+    ) as coerce_arguments_mock:
+        r, c = await _resolver_executor_mock(
+            {"aField": "aResult"}, {}, None, info, []
+        )
+        assert not coerce_arguments_mock.called
+
+    assert r == "aResult"
+    assert c == "LOL"
+
+    def a_sync_func(parent_result, args, ctx, info):
+        return parent_result + 1
+
+    _resolver_executor_mock._raw_func = a_sync_func
+    _resolver_executor_mock._directivated_func = a_sync_func
+
+    assert _resolver_executor_mock._get_sync_func(a_sync_func) is a_sync_func
+
+    _resolver_executor_mock._directivated_func = Mock()
+
+    assert _resolver_executor_mock._get_sync_func(a_sync_func) is None
+
+    _resolver_executor_mock._sync_func = a_sync_func
+    _resolver_executor_mock._schema_field.arguments = {}
+
+    assert _resolver_executor_mock.resolve_inline(
+        1, {}, None, info, []
+    ) == (2, "LOL")
+
+
 def test_resolver_factory__resolver_executor_update_func(
     _resolver_executor_mock
 ):
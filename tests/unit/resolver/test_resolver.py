@@ -46,7 +46,12 @@ def test_resolver_resolver_resolver_bake(a_resolver):
 
     assert a_resolver.bake(sch) is None
     assert sch.get_field_by_name.call_args_list == [(("a_resolver",),)]
-    assert a_field.resolver.update_func.call_args_list == [(("A",),)]
+    assert a_field.resolver.update_func.call_args_list == [
+        (
+            ("A",),
+            {"is_batch": False, "cost": None, "memoize": False},
+        )
+    ]
 
 
 def test_resolver_resolver_resolver___call__(a_resolver):
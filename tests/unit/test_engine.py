@@ -164,6 +164,21 @@ async def test_engine_execute_custom_resolver(clean_registry):
     assert a.called
 
 
+@pytest.mark.asyncio
+async def test_engine_execute_sync_custom_resolver(clean_registry):
+    def custom_default_resolver(*_args, **_kwargs):
+        return "customed!"
+
+    e = await create_engine(
+        "type Query { a:String }",
+        custom_default_resolver=custom_default_resolver,
+    )
+
+    assert await e.execute(
+        "query { a b: a @include(if: true) c: a @skip(if: false) }"
+    ) == {"data": {"a": "customed!", "b": "customed!", "c": "customed!"}}
+
+
 @pytest.mark.asyncio
 async def test_engine_subscribe(clean_registry):
     from tartiflette import Subscription, Resolver
@@ -267,3 +282,45 @@ async def test_engine_subscribe_with_default_resolver_alias(clean_registry):
         "subscription { aliasCounter: counter(startAt: 4) }"
     ):
         assert result == {"data": {"aliasCounter": expected_values.pop()}}
+
+
+@pytest.mark.asyncio
+async def test_engine_gc_freeze(clean_registry):
+    from unittest.mock import patch
+
+    with patch("gc.freeze", create=True) as freeze_mock:
+        e = await create_engine("type Query { a:String }", gc_freeze=True)
+
+    freeze_mock.assert_called_once_with()
+    assert await e.execute("query { a }") == {"data": {"a": None}}
+
+
+@pytest.mark.asyncio
+async def test_engine_shares_coercers(clean_registry):
+    from tartiflette.utils.coercer import get_coercer
+    from tartiflette.utils.coercer_way import CoercerWay
+
+    e = await create_engine(
+        """
+        enum Color { RED BLUE }
+        type Dog { name: String, color: [Color!] }
+        type Query {
+            dog(name: String, colors: [Color!]): Dog
+            cat(name: String, colors: [Color!]): Dog
+            names: String
+        }
+        """
+    )
+
+    query_type = e._schema.find_type("Query")
+    dog, cat = query_type.find_field("dog"), query_type.find_field("cat")
+    assert dog.resolver._coercer is cat.resolver._coercer
+    assert get_coercer(
+        dog.arguments["colors"], way=CoercerWay.INPUT
+    ) is get_coercer(cat.arguments["colors"], way=CoercerWay.INPUT)
+
+    dog_type = e._schema.find_type("Dog")
+    assert (
+        dog_type.find_field("name").resolver._coercer
+        is query_type.find_field("names").resolver._coercer
+    )
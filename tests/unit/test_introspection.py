@@ -37,35 +37,45 @@ async def test_introspection___type_resolver():
     assert info.schema.find_type.called_with("LOL")
 
 
-def _get_parent_results_mock(typename):
-    a = Mock()
-    a._typename = typename
-    return a
+def _get_parent_type(typename, type_resolver=None):
+    parent_type = Mock()
+    parent_type.resolve_type = Mock(return_value=typename)
+    parent_type.type_resolver = type_resolver
+    return parent_type
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "parent_result,expected",
+    "parent_type,expected",
     [
-        (_get_parent_results_mock("LOL"), "LOL2"),
-        (_get_parent_results_mock("dontcare"), "Ninja"),
+        (_get_parent_type("LOL"), "LOL2"),
+        (_get_parent_type("dontcare"), None),
+        (_get_parent_type("dontcare", Mock(return_value="LOL")), "LOL2"),
     ],
 )
-async def test_introspection___typename_resolver(parent_result, expected):
+async def test_introspection___typename_resolver(parent_type, expected):
     from tartiflette.schema.introspection import __typename_resolver
 
     def my_find_type(name):
         if name == "LOL":
             return "LOL2"
 
-        raise AttributeError("Ninja")
+        raise KeyError(name)
 
+    parent_result = Mock()
+    ctx = {}
     info = Mock()
     info.schema_field = Mock()
     info.schema_field.schema = Mock()
     info.schema_field.schema.find_type = my_find_type
-    info.schema_field.parent_type = "Ninja"
+    info.schema_field.parent_type = parent_type
 
-    r = await __typename_resolver(parent_result, None, None, info)
+    r = await __typename_resolver(parent_result, None, ctx, info)
 
-    assert r == expected
+    assert r == (expected or parent_type)
+    if parent_type.type_resolver is None:
+        assert parent_type.resolve_type.call_args_list == [((parent_result,),)]
+    else:
+        assert parent_type.type_resolver.call_args_list == [
+            ((parent_result, ctx, info),)
+        ]
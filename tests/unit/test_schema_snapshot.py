@@ -0,0 +1,96 @@
+import pickle
+
+import pytest
+
+from tartiflette.schema import GraphQLSchema, snapshot as snapshot_module
+from tartiflette.schema.snapshot import SchemaSnapshot
+from tartiflette.sdl.builder import build_graphql_schema_from_sdl
+
+_SDL = """
+type Query {
+  hello(name: String): String
+}
+"""
+
+
+def _build_snapshot(path):
+    schema = GraphQLSchema(name="test_schema_snapshot")
+    build_graphql_schema_from_sdl(_SDL, schema=schema)
+    snapshot = SchemaSnapshot(path)
+    snapshot.prepare(_SDL, schema)
+    snapshot.dump()
+    return snapshot
+
+
+def test_schema_snapshot_load(tmpdir):
+    path = str(tmpdir.join("schema.snapshot"))
+    _build_snapshot(path)
+    assert [entry.basename for entry in tmpdir.listdir()] == [
+        "schema.snapshot"
+    ]
+
+    snapshot = SchemaSnapshot(path)
+    schema = snapshot.load("test_schema_snapshot_loaded", _SDL)
+    assert snapshot.loaded
+    assert schema.name == "test_schema_snapshot_loaded"
+
+    field = schema.find_type("Query").find_field("hello")
+    assert str(field.arguments["name"].gql_type) == "String"
+    assert field.resolver is not None
+    assert field.resolver._schema_field is field
+
+
+def test_schema_snapshot_load_other_sdl(tmpdir):
+    path = str(tmpdir.join("schema.snapshot"))
+    _build_snapshot(path)
+
+    snapshot = SchemaSnapshot(path)
+    assert snapshot.load("test_schema_snapshot", _SDL + " ") is None
+    assert not snapshot.loaded
+
+
+@pytest.mark.parametrize(
+    "name,value",
+    [
+        ("tartiflette.__version__", "0.0.1"),
+        ("tartiflette.schema.snapshot._PYTHON_VERSION", "cpython 3.0.0"),
+    ],
+)
+def test_schema_snapshot_load_other_release(tmpdir, monkeypatch, name, value):
+    path = str(tmpdir.join("schema.snapshot"))
+    with monkeypatch.context() as patch:
+        patch.setattr(name, value)
+        _build_snapshot(path)
+
+    loads = []
+
+    class _Pickle:
+        @staticmethod
+        def load(snapshot_file):
+            loads.append(pickle.load(snapshot_file))
+            return loads[-1]
+
+    monkeypatch.setattr(snapshot_module, "pickle", _Pickle)
+
+    snapshot = SchemaSnapshot(path)
+    assert snapshot.load("test_schema_snapshot", _SDL) is None
+    assert not snapshot.loaded
+    # Only the key is unpickled
+    assert len(loads) == 1
+
+
+def test_schema_snapshot_load_invalid(tmpdir):
+    path = tmpdir.join("schema.snapshot")
+
+    assert SchemaSnapshot(str(path)).load("test_schema_snapshot", _SDL) is None
+
+    path.write_binary(b"not a snapshot")
+    assert SchemaSnapshot(str(path)).load("test_schema_snapshot", _SDL) is None
+
+    path.write_binary(pickle.dumps((0, None, None)))
+    assert SchemaSnapshot(str(path)).load("test_schema_snapshot", _SDL) is None
+
+
+def test_schema_snapshot_dump_without_prepare(tmpdir):
+    SchemaSnapshot(str(tmpdir.join("schema.snapshot"))).dump()
+    assert not tmpdir.listdir()
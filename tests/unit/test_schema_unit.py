@@ -604,6 +604,54 @@ async def test_schema_has_type(clean_registry, type_name, expected):
     assert schema.has_type(type_name) is expected
 
 
+@pytest.mark.asyncio
+async def test_schema_lookup_tables(clean_registry):
+    _, full_sdl = await _import_builtins(
+        [],
+        """
+        interface Named {
+            name: String
+        }
+
+        type Dog implements Named {
+            name: String
+        }
+
+        type Human implements Named {
+            name: String
+        }
+
+        union Pet = Dog
+
+        input Filter {
+            name: String
+        }
+
+        type Query {
+            pets(filter: Filter): [Pet]
+            named: [Named]
+        }
+        """,
+        "a",
+    )
+    clean_registry.register_sdl("a", full_sdl)
+    schema = SchemaBakery.bake("a")
+
+    assert schema.find_field("Dog", "name") is schema.find_type(
+        "Dog"
+    ).find_field("name")
+    assert schema.find_field("Named", "name") is not None
+    assert schema.find_field("Pet", "__typename") is not None
+    assert schema.find_field("Dog", "unknown") is None
+    assert schema.find_field("Filter", "name") is None
+    assert schema.find_field("Unknown", "name") is None
+
+    assert schema.get_possible_types("Dog") == frozenset(["Dog"])
+    assert schema.get_possible_types("Named") == frozenset(["Dog", "Human"])
+    assert schema.get_possible_types("Pet") == frozenset(["Dog"])
+    assert schema.get_possible_types("Filter") == frozenset()
+
+
 @pytest.mark.parametrize(
     "schema_name,where,obj",
     [
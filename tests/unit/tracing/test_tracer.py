@@ -0,0 +1,68 @@
+from unittest.mock import Mock
+
+from tartiflette.executors.types import FieldResult
+from tartiflette.tracing import ApolloTrace, ApolloTracer, Trace, Tracer
+
+
+def test_tracer_create_trace():
+    assert isinstance(Tracer().create_trace("{ a }", None, None), Trace)
+    assert Tracer(sample_rate=0).create_trace("{ a }", None, None) is None
+    assert isinstance(
+        ApolloTracer().create_trace("{ a }", None, None), ApolloTrace
+    )
+
+
+def test_trace_hooks_are_noop():
+    trace = Trace()
+    trace.start()
+    trace.on_parsing(1.0, 2.0)
+    trace.on_field(Mock(), Mock(), 1.0, 2.0)
+    trace.end()
+
+    assert trace.extensions() is None
+
+
+def test_apollo_trace_extensions():
+    trace = ApolloTrace()
+    trace.start()
+    start_time = trace._start_counter  # pylint: disable=protected-access
+
+    info = Mock()
+    info.path = ["dogs", "name"]
+    info.schema_field.parent_type = "Dog"
+    info.schema_field.name = "name"
+    info.schema_field.gql_type = "String"
+
+    dogs = FieldResult(Mock(alias="dogs"))
+    dogs.marshalled = [{"name": "Rex"}, {"name": "Medor"}]
+    name = FieldResult(
+        Mock(alias="name"), parent=dogs, container=dogs.marshalled[1]
+    )
+
+    trace.on_parsing(start_time, start_time + 0.001)
+    trace.on_validation(start_time + 0.001, start_time + 0.003)
+    trace.on_field(info, name, start_time + 0.003, start_time + 0.004)
+    trace.end()
+
+    tracing = trace.extensions()["tracing"]
+
+    assert tracing["version"] == 1
+    assert tracing["startTime"].endswith("Z")
+    assert tracing["endTime"].endswith("Z")
+    assert tracing["parsing"] == {"startOffset": 0, "duration": 1000000}
+    assert tracing["validation"] == {
+        "startOffset": 1000000,
+        "duration": 2000000,
+    }
+    assert tracing["execution"] == {
+        "resolvers": [
+            {
+                "path": ["dogs", 1, "name"],
+                "parentType": "Dog",
+                "fieldName": "name",
+                "returnType": "String",
+                "startOffset": 3000000,
+                "duration": 1000000,
+            }
+        ]
+    }
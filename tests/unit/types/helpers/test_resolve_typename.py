@@ -0,0 +1,59 @@
+from unittest.mock import Mock
+
+import pytest
+
+from tartiflette.types.helpers import resolve_typename
+
+
+class Cat:
+    pass
+
+
+class PersianCat(Cat):
+    pass
+
+
+class Dog:
+    def __init__(self, typename=None):
+        if typename:
+            self._typename = typename
+
+
+def _possible_types(*names):
+    possible_types = []
+    for name in names:
+        possible_type = Mock()
+        possible_type.name = name
+        possible_types.append(possible_type)
+    return possible_types
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ({"_typename": "Dog"}, "Dog"),
+        ({"name": "Dog"}, "dict"),
+        (Dog("Cat"), "Cat"),
+        (Dog(), "Dog"),
+        (Cat(), "Cat"),
+        (PersianCat(), "Cat"),
+    ],
+)
+def test_resolve_typename(raw, expected):
+    assert resolve_typename(raw, _possible_types("Cat", "Dog"), {}) == expected
+
+
+def test_resolve_typename_memoized_per_class():
+    typenames_by_class = {}
+
+    assert (
+        resolve_typename(
+            PersianCat(), _possible_types("Cat"), typenames_by_class
+        )
+        == "Cat"
+    )
+    assert typenames_by_class == {PersianCat: "Cat"}
+
+    # Further values of the class don't walk through its MRO anymore
+    typenames_by_class[PersianCat] = "Persian"
+    assert resolve_typename(PersianCat(), [], typenames_by_class) == "Persian"
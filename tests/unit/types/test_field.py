@@ -87,3 +87,17 @@ def test_graphql_argument_eq(mocked_resolver_factory):
         gql_type="Test",
         arguments=OrderedDict([("test", 42), ("another", 24)]),
     )
+
+
+def test_graphql_field_slots():
+    import pickle
+
+    field = GraphQLField(name="Name", gql_type="Test", description="desc")
+
+    assert not hasattr(field, "__dict__")
+    assert field._typename == "__Field"
+
+    unpickled = pickle.loads(pickle.dumps(field))
+    assert unpickled.name == "Name"
+    assert unpickled.description == "desc"
+    assert not hasattr(unpickled, "resolver")
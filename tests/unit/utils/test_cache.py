@@ -0,0 +1,56 @@
+from tartiflette.utils.cache import CacheInfo, LRUCache
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+
+    assert cache.get("a") is None
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.info() == CacheInfo(
+        hits=1, misses=1, evictions=1, maxsize=2, currsize=2
+    )
+
+    cache.clear()
+
+    assert cache.info() == CacheInfo(
+        hits=0, misses=0, evictions=0, maxsize=2, currsize=0
+    )
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(0)
+
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    assert cache.info() == CacheInfo(
+        hits=0, misses=1, evictions=0, maxsize=0, currsize=0
+    )
+
+
+def test_lru_cache_discard():
+    cache = LRUCache(3)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    assert cache.items() == [("b", 2), ("a", 1)]
+
+    cache.discard("a")
+    cache.discard("c")
+
+    assert cache.items() == [("b", 2)]
+    assert cache.info() == CacheInfo(
+        hits=1, misses=0, evictions=0, maxsize=3, currsize=1
+    )
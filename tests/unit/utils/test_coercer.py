@@ -2,6 +2,9 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from tartiflette.types.exceptions.tartiflette import NullError
+from tartiflette.types.list import GraphQLList
+from tartiflette.types.non_null import GraphQLNonNull
 from tests.unit.utils import AsyncMock
 
 
@@ -9,8 +12,11 @@ from tests.unit.utils import AsyncMock
 async def test_utils_coercers__object_coercer():
     from tartiflette.utils.coercer import _object_coercer
 
-    assert await _object_coercer(None, None, None) == None
-    assert await _object_coercer(None, Mock(), None) == {}
+    val = {"a": 1}
+
+    assert await _object_coercer(None, None) == None
+    assert await _object_coercer(val, None) == {}
+    assert val == {"a": 1}
 
 
 @pytest.mark.asyncio
@@ -306,47 +312,127 @@ def test_utils_coercers__get_coercer_no_schema():
     assert get_coercer(f) is None
 
 
-_A_MOCKED_UNION = Mock()
-_A_MOCKED_UNION.is_union = True
-_A_MOCKED_FIELD = Mock()
-_A_MOCKED_FIELD.is_union = False
+@pytest.mark.parametrize(
+    "field_type,expected",
+    [
+        ("aType", (False,)),
+        (GraphQLNonNull(gql_type="aType"), (True,)),
+        (GraphQLList(gql_type="aType"), (False, False)),
+        (
+            GraphQLNonNull(
+                gql_type=GraphQLList(gql_type=GraphQLNonNull(gql_type="aType"))
+            ),
+            (True, True),
+        ),
+        (
+            GraphQLList(gql_type=GraphQLList(gql_type="aType")),
+            (False, False, False),
+        ),
+    ],
+)
+def test_utils_coercers__get_type_shape(field_type, expected):
+    from tartiflette.utils.coercer import _get_type_shape
+
+    assert _get_type_shape(field_type) == expected
 
 
 @pytest.mark.parametrize(
-    "find_type_mock,expected",
+    "shape,value,expected",
     [
-        (Mock(return_value=_A_MOCKED_UNION), True),
-        (Mock(side_effect=AttributeError), False),
-        (Mock(side_effect=KeyError), False),
-        (Mock(return_value=_A_MOCKED_FIELD), False),
+        ((False,), None, None),
+        ((False,), "a", "A"),
+        ((True,), "a", "A"),
+        ((True,), None, NullError),
+        ((False, False), None, None),
+        ((False, False), "a", ["A"]),
+        ((False, False), ["a", None], ["A", None]),
+        ((True, True), ["a", "b"], ["A", "B"]),
+        ((True, True), ["a", None], NullError),
+        ((True, True), None, NullError),
+        ((False, True, False), [["a", None]], [["A", None]]),
+        ((False, True, False), [["a"], None], NullError),
+        ((False, False, True), [["a", None]], NullError),
     ],
 )
-def test_coercer__is_union(find_type_mock, expected):
-    from tartiflette.utils.coercer import _is_union
+def test_utils_coercers__compile_coercer(shape, value, expected):
+    from tartiflette.utils.coercer import _compile_coercer
 
-    schema = Mock()
-    schema.find_type = find_type_mock
+    coercer = _compile_coercer(shape, str.upper)
 
-    assert _is_union("A", schema) == expected
+    if expected is NullError:
+        with pytest.raises(NullError):
+            coercer(value, None, None, Mock())
+    else:
+        assert coercer(value, None, None, Mock()) == expected
 
 
-_A_MOCKED_FIELD._typename = None
+def test_utils_coercers__compile_coercer_enum():
+    from tartiflette.types.exceptions.tartiflette import InvalidValue
+    from tartiflette.utils.coercer import (
+        _compile_coercer,
+        _get_enum_converter,
+    )
 
+    coercer = _compile_coercer(
+        (False, True),
+        _get_enum_converter(("A", "B"), str.lower),
+        takes_info=True,
+    )
 
-@pytest.mark.parametrize(
-    "res,typename,expected",
-    [
-        (None, "a", "NoneType"),
-        ("a", None, "str"),
-        ({"a": 1}, "A", "A"),
-        ({"a": 1, "_typename": "B"}, "A", "B"),
-        ("A", "B", "str"),
-        (_A_MOCKED_FIELD, "U", "U"),
-    ],
-)
-def test_coercer_factory__set_typename(res, typename, expected):
-    from tartiflette.utils.coercer import _set_typename
-    from tartiflette.types.helpers import get_typename
+    assert coercer(["A", "B"], None, None, Mock()) == ["a", "b"]
+
+    with pytest.raises(InvalidValue):
+        coercer(["A", "C"], None, None, Mock())
+
+
+def test_utils_coercers__get_sync_coercer(field_mock, scalar_mock):
+    from tartiflette.types.list import GraphQLList
+    from tartiflette.types.non_null import GraphQLNonNull
+    from tartiflette.utils.coercer import get_sync_coercer
+
+    field_mock.schema.find_type = Mock(side_effect=KeyError)
+    field_mock.schema.find_enum = Mock(return_value=None)
+    field_mock.gql_type = GraphQLList(gql_type=GraphQLNonNull("aType"))
+    scalar_mock.coerce_output = Mock(return_value="coerced")
+
+    coercer = get_sync_coercer(field_mock)
+
+    assert coercer(["a", "b"], field_mock, {}, Mock()) == [
+        "coerced",
+        "coerced",
+    ]
+    assert scalar_mock.coerce_output.call_args_list == [(("a",),), (("b",),)]
+
+
+def test_utils_coercers__get_sync_coercer_per_schema(field_mock, scalar_mock):
+    from tartiflette.utils.coercer import get_sync_coercer
+
+    field_mock.schema.find_type = Mock(side_effect=KeyError)
+    field_mock.schema.find_enum = Mock(return_value=None)
+    field_mock.schema.coercers = {}
+    other_field = Mock(gql_type="aType", schema=field_mock.schema)
+
+    coercer = get_sync_coercer(field_mock)
+
+    assert get_sync_coercer(other_field) is coercer
+    assert list(field_mock.schema.coercers.values()) == [coercer]
+
+    other_field.schema = Mock(find_type=Mock(side_effect=KeyError))
+    other_field.schema.find_enum = Mock(return_value=None)
+    other_field.schema.coercers = {}
+
+    assert get_sync_coercer(other_field) is not coercer
+
+
+def test_utils_coercers__get_sync_coercer_with_directives(field_mock):
+    from tartiflette.utils.coercer import CoercerWay, get_sync_coercer
+
+    a_type = Mock()
+    a_type.directives = {CoercerWay.OUTPUT: Mock()}
+    field_mock.schema.find_type = Mock(return_value=a_type)
+
+    assert get_sync_coercer(field_mock) is None
+
+    field_mock.schema = None
 
-    assert _set_typename(res, typename) is None
-    assert get_typename(res) == expected
+    assert get_sync_coercer(field_mock) is None
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from tartiflette.utils.json_stream import (
+    ChunkBuffer,
+    iter_encode,
+    iter_encode_members,
+)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        1,
+        'é"\n',
+        [],
+        {},
+        [1, 2, 3],
+        {"a": 1, "b": [1, 2]},
+        [{"a": [{"b": None}, {"c": "d"}]}, [1, [2]], None],
+        {"a": {"b": [{"c": 1}]}, "d": []},
+    ],
+)
+def test_json_stream_iter_encode(value):
+    assert "".join(iter_encode(value)) == json.dumps(
+        value, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def test_json_stream_iter_encode_list_items():
+    assert list(iter_encode([{"a": 1}, {"b": 2}])) == [
+        "[",
+        '{"a":1}',
+        ",",
+        '{"b":2}',
+        "]",
+    ]
+
+
+def test_json_stream_iter_encode_members():
+    assert "".join(iter_encode_members({"a": [{"b": 1}], "c": None})) == (
+        '"a":[{"b":1}],"c":null'
+    )
+
+
+def test_json_stream_chunk_buffer():
+    buffer = ChunkBuffer(4)
+
+    assert buffer.flush() is None
+    assert buffer.write("ab") is None
+    assert buffer.write("é") is None
+    assert buffer.write("cd") == "abécd".encode("utf-8")
+    assert buffer.write("e") is None
+    assert buffer.flush() == b"e"
+    assert buffer.flush() is None
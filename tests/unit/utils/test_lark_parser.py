@@ -0,0 +1,78 @@
+import os
+import shutil
+
+import pytest
+
+from lark import Lark
+
+from tartiflette.utils.lark_parser import (
+    _load_lark_parser,
+    dump_lark_parser,
+    get_lark_parser,
+    get_prebuilt_parser_path,
+)
+
+_GRAMMAR_FILE_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "..",
+    "tartiflette",
+    "sdl",
+    "grammar",
+    "graphql_sdl_grammar.lark",
+)
+
+_SDL = """
+type Query {
+  hello(name: String = "World"): String @deprecated
+}
+"""
+
+
+def _read(path):
+    with open(path) as afile:
+        return afile.read()
+
+
+@pytest.fixture
+def grammar_path(tmpdir):
+    path = str(tmpdir.join("graphql_sdl_grammar.lark"))
+    shutil.copy(_GRAMMAR_FILE_PATH, path)
+    return path
+
+
+def test_get_lark_parser_is_shared(grammar_path):
+    parser = get_lark_parser(grammar_path)
+
+    assert isinstance(parser, Lark)
+    assert get_lark_parser(grammar_path) is parser
+
+
+def test_dump_lark_parser(grammar_path):
+    assert _load_lark_parser(grammar_path, _read(grammar_path)) is None
+
+    assert dump_lark_parser(grammar_path) == get_prebuilt_parser_path(
+        grammar_path
+    )
+    assert os.path.isfile(grammar_path + ".pickle")
+
+    parser = _load_lark_parser(grammar_path, _read(grammar_path))
+    assert isinstance(parser, Lark)
+    assert parser.parse(_SDL) == Lark.open(
+        grammar_path,
+        start="document",
+        parser="lalr",
+        lexer="contextual",
+        propagate_positions=True,
+    ).parse(_SDL)
+
+
+def test_dump_lark_parser_outdated(grammar_path):
+    dump_lark_parser(grammar_path)
+
+    with open(grammar_path, "a") as grammar_file:
+        grammar_file.write("\n// Changed\n")
+
+    assert _load_lark_parser(grammar_path, _read(grammar_path)) is None
+    assert isinstance(get_lark_parser(grammar_path), Lark)
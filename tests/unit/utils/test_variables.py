@@ -0,0 +1,209 @@
+from unittest.mock import Mock
+
+import pytest
+
+from tartiflette.parser.nodes.argument import NodeArgument
+from tartiflette.parser.nodes.operation_definition import (
+    NodeOperationDefinition,
+)
+from tartiflette.parser.nodes.variable_definition import NodeVariableDefinition
+from tartiflette.parser.visitor.object_value import ObjectValue
+from tartiflette.types.exceptions.tartiflette import (
+    InvalidType,
+    MissingRequiredArgument,
+    UnknownVariableException,
+)
+from tartiflette.utils.arguments import UNDEFINED_VALUE
+from tartiflette.utils.variables import (
+    VariableValue,
+    bind_arguments,
+    bind_directives,
+    bind_variables,
+    coerce_variables,
+    has_variables,
+)
+
+
+def _create_variable_definition(
+    name,
+    var_type=str,
+    default_value=UNDEFINED_VALUE,
+    is_nullable=True,
+    is_list=False,
+):
+    variable_definition = NodeVariableDefinition("a_path", "a_location", name)
+    variable_definition.var_name = name
+    variable_definition.var_type = var_type
+    variable_definition.default_value = default_value
+    variable_definition.is_nullable = is_nullable
+    variable_definition.is_list = is_list
+    return variable_definition
+
+
+def _create_operation(*variable_definitions):
+    operation = NodeOperationDefinition("a_path", "a_location", None, "Query")
+    for variable_definition in variable_definitions:
+        operation.add_variable_definition(variable_definition)
+        operation.add_variable_usage(variable_definition.var_name)
+    return operation
+
+
+def _create_argument(name, value):
+    argument = NodeArgument("a_path", "a_location", name)
+    argument.value = value
+    return argument
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (None, False),
+        ("a_value", False),
+        (VariableValue("a"), True),
+        ([1, VariableValue("a")], True),
+        ({"a": {"b": [VariableValue("a")]}}, True),
+        ({"a": {"b": [1]}}, False),
+        (_create_argument("a", VariableValue("a")), True),
+        (_create_argument("a", 1), False),
+    ],
+)
+def test_has_variables(value, expected):
+    assert has_variables(value) is expected
+
+
+def test_bind_variables():
+    value = ObjectValue()
+    value.set_key("a")
+    value.set_value(VariableValue("a"))
+    value.set_key("b")
+    value.set_value([VariableValue("b"), VariableValue("unknown")])
+    value.set_key("c")
+    value.set_value(VariableValue("unknown"))
+
+    assert bind_variables(value, {"a": 1, "b": 2}) == {"a": 1, "b": [2, None]}
+
+
+def test_bind_arguments():
+    static_argument = _create_argument("static", 1)
+    arguments = {
+        "static": static_argument,
+        "bound": _create_argument("bound", VariableValue("a")),
+        "undefined": _create_argument("undefined", VariableValue("b")),
+    }
+
+    bound = bind_arguments(arguments, {"a": "a_value", "b": UNDEFINED_VALUE})
+
+    assert list(bound) == ["static", "bound"]
+    assert bound["static"] is static_argument
+    assert bound["bound"].value == "a_value"
+    assert arguments["bound"].value == VariableValue("a")
+
+
+def test_bind_directives():
+    static_directive = {"callables": Mock(), "args": {"if": True}}
+    directive = {"callables": Mock(), "args": {"if": VariableValue("a")}}
+
+    bound = bind_directives([static_directive, directive], {"a": False})
+
+    assert bound[0] is static_directive
+    assert bound[1] == {
+        "callables": directive["callables"],
+        "args": {"if": False},
+    }
+
+
+def test_coerce_variables():
+    operation = _create_operation(
+        _create_variable_definition("a"),
+        _create_variable_definition("b", default_value="a_default_value"),
+        _create_variable_definition("c"),
+    )
+
+    variables = {"a": "a_value"}
+
+    assert coerce_variables(operation, variables) == (
+        {
+            "a": "a_value",
+            "b": "a_default_value",
+            "c": UNDEFINED_VALUE,
+        },
+        [],
+    )
+    assert variables == {"a": "a_value"}
+
+
+@pytest.mark.parametrize(
+    "variable_definition,variables,expected",
+    [
+        (
+            _create_variable_definition("a", is_nullable=False),
+            {"a": None},
+            InvalidType,
+        ),
+        (_create_variable_definition("a"), {"a": 1}, InvalidType),
+        (
+            _create_variable_definition("a", is_list=True),
+            {"a": "a"},
+            InvalidType,
+        ),
+        (
+            _create_variable_definition("a", is_list=True),
+            {"a": ["a", 1]},
+            InvalidType,
+        ),
+    ],
+)
+def test_coerce_variables_invalid(variable_definition, variables, expected):
+    _, errors = coerce_variables(
+        _create_operation(variable_definition), variables
+    )
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], expected)
+
+
+@pytest.mark.parametrize(
+    "variable_definition,variables",
+    [
+        (_create_variable_definition("a", is_list=True), {"a": ["a", None]}),
+        (_create_variable_definition("a", var_type=None), {"a": "a"}),
+    ],
+)
+def test_coerce_variables_valid(variable_definition, variables):
+    assert coerce_variables(
+        _create_operation(variable_definition), variables
+    ) == (variables, [])
+
+
+def test_coerce_variables_missing_variable():
+    _, errors = coerce_variables(
+        _create_operation(_create_variable_definition("a", is_nullable=False)),
+        {},
+    )
+
+    assert errors
+    assert all(isinstance(error, UnknownVariableException) for error in errors)
+
+
+def test_coerce_variables_undefined_variable():
+    operation = _create_operation()
+    operation.add_variable_usage("a")
+
+    _, errors = coerce_variables(operation, {})
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], UnknownVariableException)
+
+
+def test_coerce_variables_required_variable():
+    operation = _create_operation(_create_variable_definition("a"))
+    operation.add_required_variable(
+        "a", lambda: MissingRequiredArgument("Missing required < a >.")
+    )
+
+    assert coerce_variables(operation, {"a": "a_value"})[1] == []
+
+    _, errors = coerce_variables(operation, {})
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], MissingRequiredArgument)